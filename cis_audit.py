@@ -12,160 +12,1971 @@
 __version__ = '0.20.0-alpha.3'
 
 ### Imports ###
+import configparser  # https://docs.python.org/3/library/configparser.html
+import glob  # https://docs.python.org/3/library/glob.html
+import ipaddress  # https://docs.python.org/3/library/ipaddress.html
 import json  # https://docs.python.org/3/library/json.html
 import logging  # https://docs.python.org/3/library/logging.html
 import os  # https://docs.python.org/3/library/os.html
 import pdb  # noqa https://docs.python.org/3/library/pdb.html
 import re  # https://docs.python.org/3/library/re.html
+import selectors  # https://docs.python.org/3/library/selectors.html
+import shlex  # https://docs.python.org/3/library/shlex.html
+import signal  # https://docs.python.org/3/library/signal.html
 import stat  # https://docs.python.org/3/library/stat.html
 import subprocess  # https://docs.python.org/3/library/subprocess.html
 import sys  # https://docs.python.org/3/library/sys.html
+import threading  # https://docs.python.org/3/library/threading.html
+import time  # https://docs.python.org/3/library/time.html
+import uuid  # https://docs.python.org/3/library/uuid.html
 from argparse import (
     ArgumentParser,  # https://docs.python.org/3/library/argparse.html#argparse.ArgumentParser
 )
 from argparse import (
     RawTextHelpFormatter,  # https://docs.python.org/3/library/argparse.html#argparse.RawTextHelpFormatter
 )
+from concurrent.futures import (
+    ThreadPoolExecutor,  # https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.ThreadPoolExecutor
+)
+from concurrent.futures import (
+    as_completed,  # https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.as_completed
+)
 from datetime import (
     datetime,  # https://docs.python.org/3/library/datetime.html#datetime.datetime
 )
+from grp import getgrall  # https://docs.python.org/3/library/grp.html#grp.getgrall
 from grp import getgrgid  # https://docs.python.org/3/library/grp.html#grp.getgrgid
+from pwd import getpwall  # https://docs.python.org/3/library/pwd.html#pwd.getpwall
 from pwd import getpwuid  # https://docs.python.org/3/library/pwd.html#pwd.getpwuid
 from types import (
     SimpleNamespace,  # https://docs.python.org/3/library/types.html#types.SimpleNamespace
 )
-from typing import Generator
+from typing import (
+    Callable,  # https://docs.python.org/3/library/typing.html#typing.Callable
+)
+from typing import (
+    Generator,  # https://docs.python.org/3/library/typing.html#typing.Generator
+)
+from typing import (
+    Iterable,  # https://docs.python.org/3/library/typing.html#typing.Iterable
+)
+from typing import (
+    NamedTuple,  # https://docs.python.org/3/library/typing.html#typing.NamedTuple
+)
+
+
+### Classes ###
+class BenchmarkEntry(NamedTuple):
+    """A single entry from a benchmark definition, with its type and level resolved for the system type being audited
+
+    Being a NamedTuple, entries are slotted and immutable, so they are cheap to hold in bulk
+    """
+
+    id: str
+    description: str
+    type: str = 'test'
+    function: "Callable" = None
+    kwargs: dict = None
+    level: int = None
+    cache: dict = None
+
+    @classmethod
+    def from_dict(cls, entry: dict, system_type: str) -> "BenchmarkEntry":
+        """Create a BenchmarkEntry from an entry in the benchmarks dict
+
+        Parameters
+        ----------
+        entry : dict, required
+            Benchmark entry, with an '_id' and 'description', and optionally 'type', 'function', 'kwargs', 'levels' and 'cache'.
+            'cache' sets how long the result can be reused for by the result_cache option, with the keys:
+                ttl: Seconds before the result expires. Without a ttl, it only expires when the boot ID or one of the files changes
+                boot: Whether the result is only valid until the host reboots
+                files: Paths, which may be glob patterns, whose modification times the result depends on
+
+        system_type : string, required
+            System type to resolve the entry's level for, e.g. 'server' or 'workstation'
+
+        Returns
+        -------
+        BenchmarkEntry
+        """
+
+        function = entry.get('function')
+        entry_type = entry.get('type', 'test')
+
+        ## If a test doesn't have a function associated with it, we assume it's unimplemented
+        if entry_type == 'test' and function is None:
+            entry_type = 'notimplemented'
+
+        return cls(
+            id=entry['_id'],
+            description=entry['description'],
+            type=entry_type,
+            function=function,
+            kwargs=entry.get('kwargs'),
+            level=entry.get('levels', {}).get(system_type),
+            cache=entry.get('cache'),
+        )
+
+
+class CISAudit:
+    def __init__(self, config=None):
+        if config:
+            self.config = config
+        else:
+            self.config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG')
+
+        ## Logging is only configured by main(), so that embedding the audit doesn't change the host application's logging
+        self.log = logging.getLogger(__name__)
+        self.log.setLevel(self.config.log_level)
+
+        self._reset_run_state()
+
+        ## Results of earlier runs from _load_result_cache(), keyed by test_id. Only used for tests with a cache policy, when the result_cache option is set
+        self._result_cache = {}
+
+        ## Held while scanning, so that tests running in parallel with the jobs option don't each start the same scan. The two scans share nothing, so each has its own lock
+        self._scan_lock = threading.Lock()
+        self._homedirs_lock = threading.Lock()
+
+        self._counters_lock = threading.Lock()
+
+        ## Held while capturing the firewall rules, so each ruleset is only captured once however many checks need it
+        self._firewall_lock = threading.Lock()
+
+        ## Held while reading the SELinux state, so that sestatus is only run once when the SELinux checks run in parallel
+        self._selinux_lock = threading.Lock()
+
+        ## Held while reading the listening sockets, so that /proc/net is only read once when the network service checks run in parallel
+        self._listening_sockets_lock = threading.Lock()
+
+        ## Held while scanning /proc for processes, so that it is only scanned once when the process checks run in parallel
+        self._processes_lock = threading.Lock()
+
+        ## Held while reading the kernel module state, so that it is only read once when the kernel module checks run in parallel
+        self._kernel_modules_lock = threading.Lock()
+
+        ## ID of the test which _run_test() is running in the current thread
+        self._current_test = threading.local()
+
+        ## With the persistent_shell option, each thread runs its shell commands through its own long-lived /bin/sh from _get_coprocess()
+        self._coprocess = threading.local()
+        self._coprocesses = []
+
+    def _check_file_permissions(self, files: "list[str]", expected_mode: str, expected_user: str = None, expected_group: str = None) -> "dict[str, int]":
+        """Check the ownership and permissions of several files at once, sharing the parsed expected_mode and the user/group name lookups between them
+
+        Parameters
+        ----------
+        files : list, required
+            Files to be tested
+
+        expected_mode : string, required
+            The octal file mode that the files should not exceed. e.g. 2750, 664, 0400.
+
+        expected_user : string, optional
+            The expected user for the files
+
+        expected_group : string, optional
+            The expected group membership for the files
+
+        Returns
+        -------
+        dict:
+            State for each file, using the same penalties as audit_file_permissions().
+            With the first_violation option, the files after the first one which fails are not checked, and are left out
+
+        Raises
+        ------
+        ValueError:
+            If the expected_mode is not 3 or 4 characters long
+        """
+
+        if len(expected_mode) not in [3, 4]:
+            raise ValueError(f'The "expected_mode" for {files[0]} should be 3 or 4 characters long, not {len(expected_mode)}')
+
+        expected_mode = int(expected_mode, 8)
+        results = {}
+
+        ## Formatting the failure messages is skipped when nobody would see them
+        debug = self.log.isEnabledFor(logging.DEBUG)
+
+        for file in files:
+            try:
+                file_stat = os.stat(file)
+            except Exception as e:
+                self.log.warning(f'Error trying to stat file {file}: "{e}"')
+                results[file] = -1
+                continue
+
+            state = 0
+
+            if expected_user is not None:
+                file_user = self._get_user_name(file_stat.st_uid)
+
+                ## Set fail state if user does not match expectation
+                if file_user != expected_user:
+                    state += 1
+                    if debug:
+                        self.log.debug(f'Test failure: file_user "{file_user}" for {file} did not match expected_user "{expected_user}"')
+
+            if expected_group is not None:
+                file_group = self._get_group_name(file_stat.st_gid)
+
+                ## Set fail state if group does not match expecation
+                if file_group != expected_group:
+                    state += 2
+                    if debug:
+                        self.log.debug(f'Test failure: file_group "{file_group}" for {file} did not match expected_group "{expected_group}"')
+
+            ## Bits which are set on the file but not in the expected_mode. Each one adds its penalty from the table in audit_file_permissions(), where the
+            ##   most significant bit (SetUID, 0o4000) is worth 4 and the least significant bit (Other Execute, 0o0001) is worth 8192
+            file_mode = stat.S_IMODE(file_stat.st_mode)
+            excess_bits = file_mode & ~expected_mode
+
+            if excess_bits:
+                penalty = 0
+                for bit in range(12):
+                    if excess_bits >> bit & 1:
+                        penalty += 1 << (13 - bit)
+
+                state += penalty
+                if debug:
+                    self.log.debug(f'Test comparison for {file}, {oct(expected_mode)}>={oct(file_mode)} failed on bits {oct(excess_bits)}. Adding {penalty} to state')
+
+            results[file] = state
+
+            if state != 0 and getattr(self.config, 'first_violation', False):
+                break
+
+        return results
+
+    def _close_coprocesses(self) -> None:
+        """Stop the shells started by _get_coprocess(). Threads which need a shell after this start a new one"""
+
+        with self._counters_lock:
+            coprocesses, self._coprocesses = self._coprocesses, []
+
+        for coprocess in coprocesses:
+            try:
+                coprocess.stdin.close()
+            except BrokenPipeError:
+                ## The shell exited with a command still waiting to be written to it
+                pass
+
+            coprocess.wait()
+            coprocess.stdout.close()
+            coprocess.stderr.close()
+
+        self._coprocess = threading.local()
+
+    def _coprocess_exec(self, command: str) -> "SimpleNamespace[bytes, bytes, int]":
+        """Run a shell command in this thread's long-lived shell, instead of starting a new /bin/sh for it
+
+        The command is eval'ed in a subshell, so a syntax error, 'exit' or 'cd' doesn't affect the shell or later commands, and its stdin is /dev/null so it can't read the commands which follow it.
+        Each command's output and exit status are followed by a delimiter which is unique to that command, which is how the end of its output is found.
+
+        Parameters
+        ----------
+        command : string, required
+            Shell command to execute
+
+        Returns
+        -------
+        Namespace:
+            stdout and stderr as bytes, and the returncode, the same as subprocess.run() returns them
+        """
+
+        delimiter = f'cis-audit-{uuid.uuid4().hex}'
+        script = f"""( eval {shlex.quote(command)} ) </dev/null; printf '%s %d\\n' {delimiter} $?; printf '%s\\n' {delimiter} >&2\n"""
+        stdout_end = re.compile(delimiter.encode('UTF-8') + rb' (-?\d+)\n$')
+        stderr_end = delimiter.encode('UTF-8') + b'\n'
+
+        ## Only the end of the output can hold the delimiter, so that's all that is searched after each read. The exit status is at most 3 digits
+        tail = len(delimiter) + 16
+
+        coprocess = self._get_coprocess()
+
+        try:
+            coprocess.stdin.write(script.encode('UTF-8'))
+            coprocess.stdin.flush()
+        except OSError as e:
+            ## The shell had gone before it was given the command, so the command is run the usual way, and the next command starts a new shell
+            self.log.debug(f'Could not run command in shell {coprocess.pid}: "{e}"')
+            self._coprocess.process = None
+            return subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
+
+        ## Both pipes are read at the same time, so a command which writes a lot to one of them can't block while the other is being read
+        output = {coprocess.stdout.fileno(): bytearray(), coprocess.stderr.fileno(): bytearray()}
+
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(coprocess.stdout.fileno(), selectors.EVENT_READ)
+                selector.register(coprocess.stderr.fileno(), selectors.EVENT_READ)
+
+                while selector.get_map():
+                    for key, events in selector.select():
+                        chunk = os.read(key.fd, 65536)
+
+                        if chunk == b'':
+                            raise BrokenPipeError(f'Shell {coprocess.pid} exited')
+
+                        output[key.fd] += chunk
+
+                        if key.fd == coprocess.stdout.fileno() and stdout_end.search(output[key.fd], max(len(output[key.fd]) - tail, 0)) or key.fd == coprocess.stderr.fileno() and output[key.fd].endswith(stderr_end):
+                            selector.unregister(key.fd)
+
+        except OSError as e:
+            ## The shell went while it was running the command, which may have done part of its work already, so it isn't run again
+            self.log.warning(f'Shell {coprocess.pid} exited while running \'{command}\': "{e}"')
+            self._coprocess.process = None
+            coprocess.kill()
+
+            return SimpleNamespace(
+                stdout=bytes(output[coprocess.stdout.fileno()]),
+                stderr=bytes(output[coprocess.stderr.fileno()]) + f'{e}\n'.encode('UTF-8'),
+                returncode=coprocess.wait(),
+            )
+
+        stdout = output[coprocess.stdout.fileno()]
+        match = stdout_end.search(stdout, max(len(stdout) - tail, 0))
+
+        return SimpleNamespace(
+            stdout=bytes(stdout[: match.start()]),
+            stderr=bytes(output[coprocess.stderr.fileno()][: -len(stderr_end)]),
+            returncode=int(match.group(1)),
+        )
+
+    def _count_process(self) -> None:
+        """Count a command started by _shellexec() or _shellexec_lines() against the test running in the current thread"""
+
+        test_id = getattr(self._current_test, 'id', None)
+
+        ## A shell pipeline is counted once, even though the shell starts a process for each command in it
+        with self._counters_lock:
+            self._process_counts[test_id] = self._process_counts.get(test_id, 0) + 1
+
+    def _cut(self, result: "SimpleNamespace[str, str, int]", field: int, separator: str = None) -> "SimpleNamespace[str, str, int]":
+        """Select a single field from each line of a _shellexec() result in Python, in place of piping it through awk(1) or cut(1)
+
+        Parameters
+        ----------
+        result : Namespace, required
+            Result returned from _shellexec()
+
+        field : int, required
+            Field number to select, starting from 1
+
+        separator : string, optional
+            Field separator, equivalent to 'cut -d'. If not set, lines are split on whitespace the same as awk's default
+
+        Returns
+        -------
+        Namespace:
+            Same shape as _shellexec(). Lines without the requested field are returned as empty strings
+        """
+
+        output = []
+
+        for line in result.stdout:
+            fields = line.split(separator)
+            output.append(fields[field - 1] if len(fields) >= field else '')
+
+        return SimpleNamespace(stdout=output, stderr=result.stderr, returncode=result.returncode)
+
+    def _format_nft_rule(self, expr: "list[dict]") -> str:
+        """Format a rule from 'nft -j list ruleset' the way 'nft list ruleset' shows it, so that the nftables checks can compare it with the rules the benchmark describes
+
+        Only the statements those rules use are formatted. Anything else is shown as its JSON, so it can't be mistaken for one of them
+
+        Parameters
+        ----------
+        expr : list, required
+            Statements in the 'expr' of the rule
+
+        Returns
+        -------
+        string:
+            Rule as it would be shown by 'nft list ruleset', e.g. 'ip saddr 127.0.0.0/8 counter packets 0 bytes 0 drop'
+        """
+
+        words = []
+
+        for statement in expr:
+            for key, value in statement.items():
+                if key == 'match':
+                    left = value['left']
+                    right = value['right']
+
+                    if 'payload' in left:
+                        words += [left['payload']['protocol'], left['payload']['field']]
+                    elif 'meta' in left:
+                        words.append(left['meta']['key'])
+                    elif 'ct' in left:
+                        words += ['ct', left['ct']['key']]
+                    else:
+                        words.append(json.dumps(left))
+
+                    ## '==' and 'in' are implied, so 'nft list ruleset' doesn't show them
+                    if value['op'] not in ['==', 'in']:
+                        words.append(value['op'])
+
+                    if isinstance(right, dict) and 'prefix' in right:
+                        words.append(f"{right['prefix']['addr']}/{right['prefix']['len']}")
+                    elif isinstance(right, list):
+                        words.append(','.join(str(item) for item in right))
+                    elif isinstance(right, str) and left.get('meta', {}).get('key') in ['iif', 'oif', 'iifname', 'oifname']:
+                        words.append(f'"{right}"')
+                    elif isinstance(right, (str, int)):
+                        words.append(str(right))
+                    else:
+                        words.append(json.dumps(right))
+
+                elif key == 'counter' and isinstance(value, dict):
+                    words.append(f"counter packets {value['packets']} bytes {value['bytes']}")
+
+                elif value is None:
+                    ## Verdicts, e.g. {"accept": null}
+                    words.append(key)
+
+                else:
+                    words.append(f'{key} {json.dumps(value)}')
+
+        return ' '.join(words)
+
+    def _get_boot_id(self) -> "str | None":
+        """Get the ID the kernel generated for the current boot
+
+        Returns
+        -------
+        string:
+            Boot ID from /proc/sys/kernel/random/boot_id, or None if it could not be read
+        """
+
+        try:
+            return self._read_file('/proc/sys/kernel/random/boot_id')[0]
+        except (OSError, IndexError) as e:
+            self.log.debug(f'Could not read boot ID: "{e}"')
+            return None
+
+    def _get_coprocess(self) -> "subprocess.Popen":
+        """Get this thread's long-lived shell for _coprocess_exec(), starting it if there isn't one yet or it has exited
+
+        Returns
+        -------
+        Popen:
+            /bin/sh reading commands from its stdin
+        """
+
+        coprocess = getattr(self._coprocess, 'process', None)
+
+        if coprocess is None or coprocess.poll() is not None:
+            coprocess = subprocess.Popen(['/bin/sh'], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            self._coprocess.process = coprocess
+            self.log.debug(f'Started shell {coprocess.pid}')
+
+            with self._counters_lock:
+                self._coprocesses.append(coprocess)
+
+        return coprocess
+
+    def _get_group_name(self, gid: int) -> str:
+        """Get the name of a group, caching the lookup for the rest of the run
+
+        Names are taken from /etc/group first, which is only parsed once. Any GIDs not found there are looked up through NSS with getgrgid(), so remote sources such as sssd or LDAP are only queried once per GID.
+
+        Returns
+        -------
+        string:
+            The group name, or the GID as a string if the group does not exist, the same as ls(1) shows it
+        """
+
+        if self._group_names is None:
+            self._group_names = self._parse_id_names('/etc/group')
+
+        cached = gid in self._group_names
+
+        ## Lookups can come from several threads at once, e.g. the filesystem scan's workers
+        with self._counters_lock:
+            self._name_cache_stats['hits' if cached else 'misses'] += 1
+
+        if not cached:
+            self.log.debug(f'GID {gid} is not in /etc/group, looking it up through NSS')
+
+            try:
+                self._group_names[gid] = getgrgid(gid).gr_name
+            except KeyError:
+                self._group_names[gid] = None
+
+        name = self._group_names[gid]
+
+        return name if name is not None else str(gid)
+
+    def _get_homedirs(self) -> "Generator[str, int, str]":
+        ## Equivalent of awk -F: '($1!~/(halt|sync|shutdown|nfsnobody)/ && $7!~/^(\/usr)?\/sbin\/nologin(\/)?$/ && $7!~/(\/usr)?\/bin\/false(\/)?$/) { print $1,$3,$6 }' /etc/passwd
+        ignored_users = re.compile(R'halt|sync|shutdown|nfsnobody')
+        nologin_shell = re.compile(R'^(/usr)?/sbin/nologin/?$')
+        false_shell = re.compile(R'(/usr)?/bin/false/?$')
+
+        for line in self._read_file('/etc/passwd'):
+            fields = line.split(':')
+
+            if len(fields) < 7:
+                continue
+
+            user, uid, homedir, shell = fields[0], fields[2], fields[5], fields[6]
+
+            if not ignored_users.search(user) and not nologin_shell.search(shell) and not false_shell.search(shell):
+                yield user, int(uid), homedir
+
+    def _get_iptables_ruleset(self, ip_version: str) -> "SimpleNamespace":
+        """Get the running iptables or ip6tables rules, from a single run of iptables-save or ip6tables-save which is shared by all of the iptables checks
+
+        Parameters
+        ----------
+        ip_version : string, required
+            'ipv4' for iptables or 'ipv6' for ip6tables
+
+        Returns
+        -------
+        Namespace:
+            returncode: Return code of iptables-save
+            lines: Output of iptables-save, for comparing with the saved rules
+            chains: Chains in the filter table, keyed by name, each with its 'policy' (None for user-defined chains) and its 'rules' in the same format as 'iptables -S', e.g. '-A INPUT -i lo -j ACCEPT'
+        """
+
+        with self._firewall_lock:
+            if ip_version not in self._firewall_rulesets:
+                cmd = ['iptables-save'] if ip_version == 'ipv4' else ['ip6tables-save']
+                r = self._shellexec(cmd)
+                chains = {}
+                table = None
+
+                for line in r.stdout:
+                    if line.startswith('*'):
+                        table = line[1:]
+                    elif table != 'filter':
+                        continue
+                    elif line.startswith(':'):
+                        ## e.g. ':INPUT DROP [0:0]', where user-defined chains have a policy of '-'
+                        name, policy = line[1:].split()[:2]
+                        chains[name] = SimpleNamespace(policy=None if policy == '-' else policy, rules=[])
+                    elif line.startswith('-A '):
+                        chains.setdefault(line.split()[1], SimpleNamespace(policy=None, rules=[])).rules.append(line)
+
+                self._firewall_rulesets[ip_version] = SimpleNamespace(returncode=r.returncode, lines=r.stdout, chains=chains)
+
+        return self._firewall_rulesets[ip_version]
+
+    def _get_jobs(self) -> int:
+        """Get how many tests to run at the same time. With the nice option, this is capped so that the load average stays under the max_load option
+
+        Returns
+        -------
+        int:
+            Value of the jobs option, or fewer if the host is busy. Always at least 1
+        """
+
+        jobs = getattr(self.config, 'jobs', 1)
+        limit = self._limit_by_load(jobs)
+
+        if limit < jobs:
+            jobs = limit
+            self.log.debug(f'Host is busy, so only running {jobs} tests at the same time')
+
+        return jobs
+
+    def _get_kernel_modules(self) -> "SimpleNamespace":
+        """Get which kernel modules are loaded, available and configured, reading /proc/modules, modules.dep and the modprobe.d configuration once per run
+
+        Module names are normalised with '_' in place of '-', the same as modprobe does, so 'usb-storage' matches 'usb_storage' in /proc/modules
+
+        Returns
+        -------
+        Namespace:
+            loaded: Names of the modules in /proc/modules
+            available: Names of the modules in modules.dep or modules.builtin for the running kernel, or None if modules.dep could not be read
+            install: Command of the first 'install' directive for each module, e.g. {'udf': '/bin/true'}
+            blacklist: Names of the modules with a 'blacklist' directive
+        """
+
+        ## Checked again once the lock is held, as another test may have got it first
+        if self._kernel_modules is None:
+            with self._kernel_modules_lock:
+                if self._kernel_modules is None:
+                    loaded = set()
+                    available = set()
+                    install = {}
+                    blacklist = set()
+
+                    try:
+                        for line in self._read_file('/proc/modules'):
+                            loaded.add(line.split()[0])
+                    except OSError as e:
+                        self.log.debug(f'Could not read loaded kernel modules: "{e}"')
+
+                    ## e.g. 'kernel/fs/udf/udf.ko.xz: kernel/lib/crc-itu-t.ko.xz' in modules.dep, or 'kernel/fs/udf/udf.ko' in modules.builtin
+                    release = os.uname().release
+                    for file in [f'/lib/modules/{release}/modules.dep', f'/lib/modules/{release}/modules.builtin']:
+                        try:
+                            for line in self._read_file(file):
+                                available.add(os.path.basename(line.split(':')[0]).split('.ko')[0].replace('-', '_'))
+                        except OSError as e:
+                            self.log.debug(f'Could not read available kernel modules: "{e}"')
+
+                            if file.endswith('modules.dep'):
+                                available = None
+                                break
+
+                    ## Like modprobe, a file in an earlier directory hides any file with the same name in a later one, and the files are read in order of their names
+                    files = {}
+                    for directory in ['/etc/modprobe.d', '/run/modprobe.d', '/lib/modprobe.d']:
+                        for file in sorted(glob.glob(f'{directory}/*.conf')):
+                            files.setdefault(os.path.basename(file), file)
+
+                    for name in sorted(files):
+                        try:
+                            lines = self._read_file(files[name])
+                        except OSError as e:
+                            self.log.debug(f'Could not read {files[name]}: "{e}"')
+                            continue
+
+                        for line in lines:
+                            words = line.split('#')[0].split()
+
+                            if len(words) > 2 and words[0] == 'install':
+                                install.setdefault(words[1].replace('-', '_'), ' '.join(words[2:]))
+                            elif len(words) > 1 and words[0] == 'blacklist':
+                                blacklist.add(words[1].replace('-', '_'))
+
+                    self._kernel_modules = SimpleNamespace(
+                        loaded=frozenset(loaded),
+                        available=frozenset(available) if available is not None else None,
+                        install=install,
+                        blacklist=frozenset(blacklist),
+                    )
+
+        return self._kernel_modules
+
+    def _get_listening_sockets(self) -> "SimpleNamespace":
+        """Get the listening TCP and UDP sockets, parsed once per run from /proc/net in place of 'ss -lntu'
+
+        Returns
+        -------
+        Namespace:
+            by_port: Sockets keyed by local port
+            by_address: Sockets keyed by local address, e.g. '127.0.0.1', '::1' or '0.0.0.0'
+
+            Each socket has its 'protocol', i.e. 'tcp', 'tcp6', 'udp' or 'udp6', and its local 'address' and 'port'
+        """
+
+        ## Checked again once the lock is held, as another test may have got it first
+        if self._listening_sockets is None:
+            with self._listening_sockets_lock:
+                if self._listening_sockets is None:
+                    sockets = SimpleNamespace(by_port={}, by_address={})
+
+                    ## TCP sockets which are listening, and UDP sockets which aren't connected, the same sockets as 'ss -lntu' shows
+                    states = {'tcp': '0A', 'tcp6': '0A', 'udp': '07', 'udp6': '07'}
+
+                    for protocol, listening_state in states.items():
+                        try:
+                            lines = self._read_file(f'/proc/net/{protocol}')
+                        except OSError as e:
+                            self.log.debug(f'Could not read {protocol} sockets: "{e}"')
+                            continue
+
+                        ## e.g. '   0: 0100007F:0019 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 18211 1 ...'
+                        for line in lines[1:]:
+                            fields = line.split()
+
+                            if len(fields) < 4 or fields[3] != listening_state:
+                                continue
+
+                            address, port = fields[1].split(':')
+
+                            ## The address is written as 32-bit words in the kernel's byte order
+                            packed = bytes.fromhex(address)
+                            if sys.byteorder == 'little':
+                                packed = b''.join(packed[i : i + 4][::-1] for i in range(0, len(packed), 4))
+
+                            socket = SimpleNamespace(protocol=protocol, address=str(ipaddress.ip_address(packed)), port=int(port, 16))
+                            sockets.by_port.setdefault(socket.port, []).append(socket)
+                            sockets.by_address.setdefault(socket.address, []).append(socket)
+
+                    self._listening_sockets = sockets
+
+        return self._listening_sockets
+
+    def _get_local_mountpoints(self) -> "list[str]":
+        """Get the mount points of local filesystems, equivalent to 'df --local -P | awk '{print $6}''
+
+        Returns
+        -------
+        list:
+            Mount points in the order they appear in /proc/self/mounts. Remote filesystems, and pseudo filesystems without any blocks (e.g. proc, sysfs) are left out, the same as df(1)
+        """
+
+        remote_filesystems = ['afs', 'ceph', 'cifs', 'coda', 'fuse.sshfs', 'glusterfs', 'gpfs', 'lustre', 'ncpfs', 'nfs', 'nfs4', 'smb3', 'smbfs']
+        mountpoints = []
+
+        for line in self._read_file('/proc/self/mounts'):
+            device, mountpoint, fstype = line.split()[:3]
+
+            ## Spaces and other special characters in mount points are octal-escaped, e.g. '\040'
+            mountpoint = re.sub(R'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), mountpoint)
+
+            if fstype in remote_filesystems or ':' in device or device.startswith('//'):
+                continue
+
+            try:
+                if os.statvfs(mountpoint).f_blocks == 0:
+                    continue
+            except OSError as e:
+                self.log.debug(f'Could not stat filesystem {mountpoint}: "{e}"')
+                continue
+
+            if mountpoint not in mountpoints:
+                mountpoints.append(mountpoint)
+
+        return mountpoints
+
+    def _get_max_load(self) -> float:
+        """Get the highest 1 minute load average at which the nice option still lets tests and scans run at full speed
+
+        Returns
+        -------
+        float:
+            Value of the max_load option, or the number of CPUs if it isn't set
+        """
+
+        return getattr(self.config, 'max_load', None) or float(os.cpu_count() or 1)
+
+    def _get_nftables_ruleset(self) -> "SimpleNamespace":
+        """Get the running nftables ruleset, from a single run of 'nft -j list ruleset' which is shared by all of the nftables checks
+
+        Versions of nft without JSON output, such as 0.8 on CentOS 7, fall back to parsing 'nft list ruleset'
+
+        Returns
+        -------
+        Namespace:
+            tables: (family, name) of each table
+            chains: Each chain in the order they're listed, with its 'family', 'table', 'name', 'type', 'hook', 'priority' and 'policy', which are None for regular chains, and its 'rules' formatted as 'nft list ruleset' shows them
+        """
+
+        with self._firewall_lock:
+            if 'nftables' not in self._firewall_rulesets:
+                tables = []
+                chains = []
+
+                r = self._shellexec(['nft', '-j', 'list', 'ruleset'])
+
+                try:
+                    ruleset = json.loads('\n'.join(r.stdout))['nftables'] if r.returncode == 0 else None
+                except (ValueError, KeyError, TypeError) as e:
+                    self.log.debug(f'Could not parse nftables ruleset: "{e}"')
+                    ruleset = None
+
+                if ruleset is not None:
+                    chains_by_name = {}
+
+                    for item in ruleset:
+                        if 'table' in item:
+                            tables.append((item['table']['family'], item['table']['name']))
+                        elif 'chain' in item:
+                            chain = item['chain']
+                            key = (chain['family'], chain['table'], chain['name'])
+                            chains_by_name[key] = SimpleNamespace(family=chain['family'], table=chain['table'], name=chain['name'], type=chain.get('type'), hook=chain.get('hook'), priority=chain.get('prio'), policy=chain.get('policy'), rules=[])
+                            chains.append(chains_by_name[key])
+                        elif 'rule' in item:
+                            rule = item['rule']
+                            chain = chains_by_name.get((rule['family'], rule['table'], rule['chain']))
+                            if chain is not None:
+                                chain.rules.append(self._format_nft_rule(rule['expr']))
+
+                elif r.returncode != 127:
+                    ## e.g. "type filter hook input priority 0; policy drop;", or "priority filter" in newer versions
+                    base_chain = re.compile(R'type (\S+) hook (\S+) (?:device \S+ )?priority (\S+); policy (\S+);')
+                    table = None
+                    chain = None
+
+                    for line in self._shellexec(['nft', 'list', 'ruleset']).stdout:
+                        line = line.strip()
+                        words = line.split()
+
+                        if chain is None and words[:1] == ['table'] and len(words) > 2:
+                            table = (words[1], words[2])
+                            tables.append(table)
+                        elif table is not None and chain is None and words[:1] == ['chain'] and len(words) > 1:
+                            chain = SimpleNamespace(family=table[0], table=table[1], name=words[1], type=None, hook=None, priority=None, policy=None, rules=[])
+                            chains.append(chain)
+                        elif chain is not None:
+                            match = base_chain.match(line)
+
+                            if line == '}':
+                                chain = None
+                            elif match:
+                                chain.type, chain.hook, priority, chain.policy = match.groups()
+                                chain.priority = int(priority) if priority.lstrip('-').isdigit() else priority
+                            elif line != '':
+                                chain.rules.append(line)
+
+                self._firewall_rulesets['nftables'] = SimpleNamespace(tables=tables, chains=chains)
+
+        return self._firewall_rulesets['nftables']
+
+    def _get_pressure(self, resource: str) -> "float | None":
+        """Get how much of the last 10 seconds some tasks spent stalled waiting for a resource, from Linux pressure stall information (PSI)
+
+        Parameters
+        ----------
+        resource : string, required
+            Resource to check, i.e. 'cpu', 'io' or 'memory'
+
+        Returns
+        -------
+        float:
+            Percentage of time from the 'some avg10' field of /proc/pressure/<resource>, or None if PSI is not available. It needs kernel 4.20 or newer, so it is never available on CentOS 7
+        """
+
+        ## Not read with _read_file(), as the contents change all the time
+        try:
+            with open(f'/proc/pressure/{resource}') as f:
+                for line in f:
+                    if line.startswith('some '):
+                        return float(line.split()[1].split('=')[1])
+        except (OSError, IndexError, ValueError) as e:
+            self.log.debug(f'Could not read {resource} pressure: "{e}"')
+
+        return None
+
+    def _get_processes(self) -> "SimpleNamespace":
+        """Get the running processes, from a single scan of /proc which is shared by every check that looks for a process, in place of 'ps aux | grep'
+
+        Returns
+        -------
+        Namespace:
+            by_name: Processes keyed by executable name, the same name as 'ps -o comm' shows
+            by_user: Processes keyed by the name of their effective user
+            by_selinux_type: Processes keyed by the type in their SELinux context, e.g. 'unconfined_service_t'
+
+            Each process has its 'pid', 'name', 'user', 'args' and 'context', in order of PID. 'context' is None if it could not be read, e.g. because SELinux is disabled
+        """
+
+        ## Checked again once the lock is held, as another test may have got it first
+        if self._processes is None:
+            with self._processes_lock:
+                if self._processes is None:
+                    processes = SimpleNamespace(by_name={}, by_user={}, by_selinux_type={})
+
+                    try:
+                        pids = sorted(int(entry) for entry in os.listdir('/proc') if entry.isdigit())
+                    except OSError as e:
+                        self.log.debug(f'Could not list processes: "{e}"')
+                        pids = []
+
+                    for pid in pids:
+                        ## The Name and Uid lines of status have the same information as stat and 'ps aux', so there's no need to read stat as well
+                        try:
+                            with open(f'/proc/{pid}/status', encoding='UTF-8', errors='replace') as f:
+                                status = dict(line.partition(':')[::2] for line in f.read().splitlines())
+
+                            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                                cmdline = f.read().decode('UTF-8', errors='replace').rstrip('\0')
+                        except OSError as e:
+                            ## Processes which exit while /proc is being scanned are skipped
+                            self.log.debug(f'Could not read process {pid}: "{e}"')
+                            continue
+
+                        try:
+                            with open(f'/proc/{pid}/attr/current', encoding='UTF-8', errors='replace') as f:
+                                context = f.read().strip('\0\n') or None
+                        except OSError:
+                            context = None
+
+                        ## e.g. 'Uid:\t995\t995\t995\t995', of which the second is the effective UID, the one 'ps aux' shows
+                        uids = status.get('Uid', '').split()
+                        user = self._get_user_name(int(uids[1])) if len(uids) > 1 else None
+
+                        ## Kernel threads have no command line
+                        args = cmdline.split('\0') if cmdline != '' else []
+
+                        process = SimpleNamespace(pid=pid, name=status.get('Name', '').strip(), user=user, args=args, context=context)
+                        selinux_type = context.split(':')[2] if context is not None and context.count(':') >= 3 else None
+
+                        processes.by_name.setdefault(process.name, []).append(process)
+                        processes.by_user.setdefault(process.user, []).append(process)
+
+                        if selinux_type is not None:
+                            processes.by_selinux_type.setdefault(selinux_type, []).append(process)
+
+                    self._processes = processes
+
+        return self._processes
+
+    def _get_result_cache_state(self, test: "BenchmarkEntry") -> "dict | None":
+        """Get what a test's cached result depends on, according to its cache policy. A cached result is only reused while this is unchanged
+
+        Parameters
+        ----------
+        test : BenchmarkEntry, required
+            Benchmark entry with a cache policy
+
+        Returns
+        -------
+        dict:
+            The test's function and kwargs, and the boot ID and file modification times if the policy uses them.
+            None if the boot ID is needed but could not be read, in which case the result is not cached
+        """
+
+        state = {'function': test.function.__name__, 'kwargs': test.kwargs}
+
+        if test.cache.get('boot'):
+            state['boot_id'] = self._get_boot_id()
+
+            if state['boot_id'] is None:
+                return None
+
+        if test.cache.get('files'):
+            state['mtimes'] = {}
+
+            for pattern in test.cache['files']:
+                for path in sorted(glob.glob(pattern)) or [pattern]:
+                    try:
+                        state['mtimes'][path] = os.stat(path).st_mtime
+                    except OSError:
+                        state['mtimes'][path] = None
+
+        return state
+
+    def _get_selection_plan(self) -> "SimpleNamespace[frozenset]":
+        """Compile the include and exclude lists into sets, so that _is_test_included() checks each test_id in time proportional to its length, rather than to the length of the lists
+
+        This keeps long include and exclude lists, e.g. from a profile in the config file, cheap to apply to every test
+
+        Returns
+        -------
+        Namespace:
+            includes: The included test_ids
+            include_prefixes: Every leading part of the included test_ids, i.e. the test_ids which are the parent of an included test
+            excludes: The excluded test_ids
+        """
+
+        if self._selection_plan is None:
+            includes = frozenset(self.config.includes or [])
+
+            self._selection_plan = SimpleNamespace(
+                includes=includes,
+                include_prefixes=frozenset(include[:i] for include in includes for i in range(1, len(include) + 1)),
+                excludes=frozenset(self.config.excludes or []),
+            )
+
+        return self._selection_plan
+
+    def _get_selinux_state(self) -> "SimpleNamespace":
+        """Get the SELinux mode and policy, reading selinuxfs and /etc/selinux/config once per run
+
+        If selinuxfs isn't mounted at /sys/fs/selinux, the running mode and policy are taken from a single run of sestatus instead
+
+        Returns
+        -------
+        Namespace:
+            current_mode: 'enforcing' or 'permissive', or None if SELinux is disabled or its state could not be read
+            config_mode: Value of SELINUX in /etc/selinux/config, or None if it isn't set
+            config_policy: Value of SELINUXTYPE in /etc/selinux/config, or None if it isn't set
+            loaded_policy: Name of the loaded policy, or None if SELinux is disabled
+        """
+
+        with self._selinux_lock:
+            if self._selinux_state is None:
+                config = {}
+
+                try:
+                    for line in self._read_file('/etc/selinux/config'):
+                        key, separator, value = line.partition('=')
+                        if separator:
+                            config.setdefault(key.strip(), value.strip())
+                except OSError as e:
+                    self.log.debug(f'Could not read SELinux config: "{e}"')
+
+                try:
+                    enforce = self._read_file('/sys/fs/selinux/enforce')[0]
+                except (OSError, IndexError) as e:
+                    self.log.debug(f'Could not read SELinux mode from selinuxfs, falling back to sestatus: "{e}"')
+                    status = {}
+
+                    ## e.g. 'Current mode:                   enforcing'
+                    for line in self._shellexec(['sestatus']).stdout:
+                        key, separator, value = line.partition(':')
+                        if separator:
+                            status[key.strip()] = value.strip()
+
+                    current_mode = status.get('Current mode')
+                    loaded_policy = status.get('Loaded policy name')
+                else:
+                    current_mode = 'enforcing' if enforce.strip() == '1' else 'permissive'
+
+                    ## selinuxfs doesn't have the policy's name. libselinux takes it from SELINUXTYPE, which is where sestatus gets it from too
+                    loaded_policy = config.get('SELINUXTYPE')
+
+                self._selinux_state = SimpleNamespace(
+                    current_mode=current_mode,
+                    config_mode=config.get('SELINUX'),
+                    config_policy=config.get('SELINUXTYPE'),
+                    loaded_policy=loaded_policy,
+                )
+
+        return self._selinux_state
+
+    def _get_user_name(self, uid: int) -> str:
+        """Get the name of a user, caching the lookup for the rest of the run
+
+        Names are taken from /etc/passwd first, which is only parsed once. Any UIDs not found there are looked up through NSS with getpwuid(), so remote sources such as sssd or LDAP are only queried once per UID.
+
+        Returns
+        -------
+        string:
+            The user name, or the UID as a string if the user does not exist, the same as ls(1) shows it
+        """
+
+        if self._user_names is None:
+            self._user_names = self._parse_id_names('/etc/passwd')
+
+        cached = uid in self._user_names
+
+        ## Lookups can come from several threads at once, e.g. the filesystem scan's workers
+        with self._counters_lock:
+            self._name_cache_stats['hits' if cached else 'misses'] += 1
+
+        if not cached:
+            self.log.debug(f'UID {uid} is not in /etc/passwd, looking it up through NSS')
+
+            try:
+                self._user_names[uid] = getpwuid(uid).pw_name
+            except KeyError:
+                self._user_names[uid] = None
+
+        name = self._user_names[uid]
+
+        return name if name is not None else str(uid)
+
+    def _get_utcnow(self) -> datetime:
+        return datetime.utcnow()
+
+    def _grep(self, result: "SimpleNamespace[str, str, int]", pattern: str, invert: bool = False) -> "SimpleNamespace[str, str, int]":
+        """Filter the stdout of a _shellexec() result in Python, in place of piping it through grep(1)
+
+        Parameters
+        ----------
+        result : Namespace, required
+            Result returned from _shellexec()
+
+        pattern : string, required
+            Regular expression to search each line for, equivalent to 'grep -E'
+
+        invert : bool, optional
+            Keep the lines which do not match the pattern, equivalent to 'grep -v'
+
+        Returns
+        -------
+        Namespace:
+            Same shape as _shellexec(). The returncode is 0 if any lines were selected, otherwise 1
+        """
+
+        regex = re.compile(pattern)
+        lines = result.stdout if result.stdout != [''] else []
+        output = [line for line in lines if bool(regex.search(line)) != invert]
+        returncode = 0 if output else 1
+
+        return SimpleNamespace(stdout=output or [''], stderr=result.stderr, returncode=returncode)
+
+    def _grepfile(self, pattern: "str | re.Pattern", files: "list[str]", invert: bool = False, filename: bool = None, recursive: bool = False) -> "SimpleNamespace[str, str, int]":
+        """Search files for lines matching a regular expression in Python, in place of running grep(1)
+
+        Parameters
+        ----------
+        pattern : string or compiled regex, required
+            Regular expression to search for. Strings are compiled with compile_pattern(), so PCRE's \\h and \\H are supported
+
+        files : list, required
+            Files to search. Shell style globs are expanded the same as they would be on the command line
+
+        invert : bool, optional
+            Keep the lines which do not match the pattern, equivalent to 'grep -v'
+
+        filename : bool, optional
+            Prefix each line with the file it was found in. Defaults to grep's behaviour of doing so when searching more than one file, use False for the equivalent of 'grep -h'
+
+        recursive : bool, optional
+            Search files inside directories, equivalent to 'grep -r'
+
+        Returns
+        -------
+        Namespace:
+            Same shape as _shellexec(). The returncode is 0 if any lines were selected, 1 if none were, or 2 if a file could not be read
+        """
+
+        regex = compile_pattern(pattern) if isinstance(pattern, str) else pattern
+        output = []
+        error = []
+
+        paths = []
+        for file in files:
+            ## As with the shell, a glob which doesn't match anything is passed through as-is
+            paths.extend(sorted(glob.glob(file)) or [file])
+
+        if recursive:
+            expanded_paths = []
+            for path in paths:
+                if os.path.isdir(path):
+                    for dirpath, dirnames, filenames in os.walk(path):
+                        dirnames.sort()
+                        expanded_paths.extend(os.path.join(dirpath, name) for name in sorted(filenames))
+                else:
+                    expanded_paths.append(path)
+            paths = expanded_paths
+
+        if filename is None:
+            filename = recursive or len(paths) > 1
+
+        for path in paths:
+            try:
+                lines = self._read_file(path)
+            except OSError as e:
+                error.append(f'grep: {path}: {e.strerror}')
+                continue
+
+            for line in lines:
+                if bool(regex.search(line)) != invert:
+                    output.append(f'{path}:{line}' if filename else line)
+
+        if error:
+            returncode = 2
+        elif output:
+            returncode = 0
+        else:
+            returncode = 1
+
+        return SimpleNamespace(stdout=output or [''], stderr=error or [''], returncode=returncode)
+
+    def _is_test_included(self, test_id, test_level) -> bool:
+        """Check whether a test_id should be tested or not
+
+        Parameters
+        ----------
+
+        test_id : string, required
+            test_id of be checked
+
+        test_level : int, required
+            Hardening level of the test_id, per the CIS Benchmarks
+
+        config : namespace, required
+            Script configuration from parse_args()
+
+        Returns
+        -------
+        bool
+            Returns a boolean indicating whether a test should be executed (True), or not (False)
+        """
+
+        ## This runs for every entry in the benchmark, so the messages are only formatted when debug logging is enabled
+        debug = self.log.isEnabledFor(logging.DEBUG)
+
+        if debug:
+            self.log.debug(f'Checking whether to run test {test_id}')
+
+        is_test_included = True
+
+        ## Check if the level is one we're going to run
+        if self.config.level != 0:
+            if test_level != self.config.level:
+                if debug:
+                    self.log.debug(f'Excluding level {test_level} test {test_id}')
+                is_test_included = False
+
+        ## Check if there were explicitly included tests:
+        plan = self._get_selection_plan()
+        if plan.includes:
+            ## Check if include starts with test_id
+            is_parent_test = test_id in plan.include_prefixes
+
+            ## Check if test_id starts with include
+            is_child_test = any(test_id[:i] in plan.includes for i in range(1, len(test_id) + 1))
+
+            ## Check if the test_id is in the included tests
+            if test_id in plan.includes:
+                if debug:
+                    self.log.debug(f'Test {test_id} was explicitly included')
+                is_test_included = True
+
+            elif is_parent_test:
+                if debug:
+                    self.log.debug(f'Test {test_id} is the parent of an included test')
+                is_test_included = True
+
+            elif is_child_test:
+                if debug:
+                    self.log.debug(f'Test {test_id} is the child of an included test')
+                is_test_included = True
+
+            elif self.config.level == 0:
+                if debug:
+                    self.log.debug(f'Excluding test {test_id} (Not found in the include list)')
+                is_test_included = False
+
+        ## If this test_id was included in the tests, check it wasn't then excluded
+        if plan.excludes:
+            is_parent_excluded = any(test_id[:i] in plan.excludes for i in range(1, len(test_id) + 1))
+
+            if test_id in plan.excludes:
+                if debug:
+                    self.log.debug(f'Test {test_id} was explicitly excluded')
+                is_test_included = False
+
+            elif is_parent_excluded:
+                if debug:
+                    self.log.debug(f'Test {test_id} is the child of an excluded test')
+                is_test_included = False
+
+        if debug:
+            self.log.debug(f'Including test {test_id}' if is_test_included else f'Not including test {test_id}')
+
+        return is_test_included
+
+    def _iter_results(self, tests: "Iterable[BenchmarkEntry]") -> "Generator[tuple[int, TestResult], None, None]":
+        """Run the tests, yielding each result as soon as it is ready, along with its position in benchmark order
+
+        Parameters
+        ----------
+        tests : iterable, required
+            Benchmark entries, e.g. from get_tests_list()
+
+        Yields
+        ------
+        tuple:
+            Index of the entry amongst the included entries, and its TestResult.
+            With one job these are in benchmark order. With more, entries which aren't run come first, then tests in the order they finish.
+            With the fail_fast option, nothing more is yielded after the first test which fails or errors, and tests which haven't started yet are not run
+        """
+
+        self._reset_run_state()
+        self._result_cache = self._load_result_cache()
+        stats = self._load_test_stats()
+        jobs = self._get_jobs()
+        fail_fast = getattr(self.config, 'fail_fast', False)
+        pending = []
+        has_tests = False
+        index = -1
+
+        try:
+            for test in tests:
+                ## Check whether this test_id is included
+                if not self._is_test_included(test.id, test.level):
+                    continue
+
+                index += 1
+
+                if test.type == 'header':
+                    yield index, TestResult(test.id, test.description)
+
+                elif test.type == 'manual':
+                    yield index, TestResult(test.id, test.description, test.level, 'Manual')
+
+                elif test.type == 'skip':
+                    yield index, TestResult(test.id, test.description, test.level, 'Skipped')
+
+                elif test.type == 'notimplemented':
+                    yield index, TestResult(test.id, test.description, test.level, 'Not Implemented')
+
+                elif test.type == 'test':
+                    has_tests = True
+
+                    if jobs > 1:
+                        ## Tests are queued up, so they can be scheduled once they are all known
+                        pending.append((index, test))
+                    else:
+                        result, elapsed = self._run_test(test)
+                        stats[test.id] = round(elapsed, 3)
+                        yield index, result
+
+                        if fail_fast and result.result in ['Fail', 'Error']:
+                            self.log.info(f'Stopping after test {test.id} with result {result.result}, as fail_fast is set')
+                            return
+
+            if jobs > 1:
+                ## Longest-processing-time first, so that a slow test isn't started last and left running on its own.
+                ## Tests without a recorded duration are started first, as they could be the slowest of all.
+                pending.sort(key=lambda item: -stats.get(item[1].id, float('inf')))
+                self.log.debug(f'Running {len(pending)} tests using {jobs} jobs')
+
+                with ThreadPoolExecutor(max_workers=jobs) as executor:
+                    futures = {executor.submit(self._run_test, test): (index, test) for index, test in pending}
+
+                    try:
+                        for future in as_completed(futures):
+                            index, test = futures[future]
+                            result, elapsed = future.result()
+                            stats[test.id] = round(elapsed, 3)
+                            yield index, result
+
+                            if fail_fast and result.result in ['Fail', 'Error']:
+                                self.log.info(f'Stopping after test {test.id} with result {result.result}, as fail_fast is set')
+                                return
+                    finally:
+                        ## If the caller stops early, tests which haven't started yet are not run
+                        for future in futures:
+                            future.cancel()
+
+        finally:
+            if has_tests:
+                self._save_test_stats(stats)
+                self._save_result_cache()
+
+            self._close_coprocesses()
+
+            self.log.debug(f'User and group name cache: {self._name_cache_stats["hits"]} hits, {self._name_cache_stats["misses"]} misses')
+            self.log.debug(f'Started {sum(self._process_counts.values())} processes')
+
+    def _limit_by_load(self, workers: int) -> int:
+        """Cap how many things are done at the same time, so that with the nice option the load average stays under the max_load option
+
+        Parameters
+        ----------
+        workers : int, required
+            How many would be done at the same time on an idle host
+
+        Returns
+        -------
+        int:
+            The number of workers, or fewer if the host doesn't have that much spare load. Always at least 1
+        """
 
-from tests.integration import (
-    shellexec,  # https://docs.python.org/3/library/typing.html#typing.Generator
-)
+        if workers > 1 and getattr(self.config, 'nice', False):
+            spare = int(self._get_max_load() - os.getloadavg()[0])
+            workers = max(min(workers, spare), 1)
 
+        return workers
 
-### Classes ###
-class CISAudit:
-    def __init__(self, config=None):
-        if config:
-            self.config = config
-        else:
-            self.config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG')
+    def _limit_log_output(self, output: object) -> str:
+        """Format the output of a command or scan for a debug message, truncated to the log_output_limit option so that large outputs don't flood the log
 
-        logging.basicConfig(
-            format='%(asctime)s [%(levelname)s]: %(funcName)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-        )
+        Callers check that debug logging is enabled first, so the output isn't formatted at all otherwise
 
-        self.log = logging.getLogger(__name__)
-        self.log.setLevel(self.config.log_level)
+        Parameters
+        ----------
+        output : object, required
+            Output to format, e.g. the result of _shellexec() or a list of files
 
-    def _get_homedirs(self) -> "Generator[str, int, str]":
-        cmd = R"awk -F: '($1!~/(halt|sync|shutdown|nfsnobody)/ && $7!~/^(\/usr)?\/sbin\/nologin(\/)?$/ && $7!~/(\/usr)?\/bin\/false(\/)?$/) { print $1,$3,$6 }' /etc/passwd"
-        r = self._shellexec(cmd)
+        Returns
+        -------
+        string:
+            The output as a string, followed by how much was left out if it was truncated
+        """
 
-        for row in r.stdout:
-            if row != "":
-                user, uid, homedir = row.split(' ')
+        text = str(output)
+        limit = getattr(self.config, 'log_output_limit', 2048)
 
-                yield user, int(uid), homedir
+        if limit and len(text) > limit:
+            text = f'{text[:limit]}... ({len(text) - limit} more characters)'
 
-    def _get_utcnow(self) -> datetime:
-        return datetime.utcnow()
+        return text
 
-    def _is_test_included(self, test_id, test_level) -> bool:
-        """Check whether a test_id should be tested or not
+    def _load_result_cache(self) -> "dict[str, dict]":
+        """Load the results of earlier runs from the file given by the result_cache option
+
+        Returns
+        -------
+        dict:
+            Cached results keyed by test_id, each with the 'result' state, the 'time' it was recorded, when it 'expires' and the 'state_of' what it depends on.
+            Empty if there is no result cache or it could not be read
+        """
+
+        result_cache = getattr(self.config, 'result_cache', None)
+
+        if result_cache:
+            try:
+                with open(result_cache) as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                self.log.debug(f'Could not load result cache {result_cache}: "{e}"')
+
+        return {}
+
+    def _load_test_stats(self) -> "dict[str, float]":
+        """Load the duration of each test from the last time it ran, from the file given by the stats_file option
+
+        Returns
+        -------
+        dict:
+            Duration in seconds, keyed by test_id. Empty if there is no stats file or it could not be read
+        """
+
+        stats_file = getattr(self.config, 'stats_file', None)
+
+        if stats_file:
+            try:
+                with open(stats_file) as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                self.log.debug(f'Could not load test stats {stats_file}: "{e}"')
+
+        return {}
+
+    def _lower_priority(self) -> None:
+        """Lower the CPU and I/O priority of the audit to the minimum, equivalent to 'nice -n 19 ionice -c 3'. Processes started by the tests inherit both
+
+        On Linux each thread has its own priorities, so this needs to be called before any threads are started
+        """
+
+        niceness = os.nice(19)
+        self.log.debug(f'Set CPU priority to nice {niceness}')
+
+        ## The idle I/O scheduling class only gets disk time when no other process wants it
+        r = self._shellexec(['ionice', '-c', '3', '-p', str(os.getpid())])
+
+        if r.returncode == 0:
+            self.log.debug('Set I/O scheduling class to idle')
+        else:
+            self.log.warning(f'Could not set I/O scheduling class to idle: "{r.stderr[0]}"')
+
+    def _parse_id_names(self, file: str) -> "dict[int, str]":
+        """Parse the ID to name mappings from /etc/passwd or /etc/group
 
         Parameters
         ----------
+        file : string, required
+            Path of the file to parse. Both files have the name in the first field and the UID/GID in the third
 
-        test_id : string, required
-            test_id of be checked
+        Returns
+        -------
+        dict:
+            Names keyed by ID. If an ID appears more than once, the first entry is used, the same as NSS does. If the file can't be read, the dict is empty
+        """
 
-        test_level : int, required
-            Hardening level of the test_id, per the CIS Benchmarks
+        names = {}
 
-        config : namespace, required
-            Script configuration from parse_args()
+        try:
+            lines = self._read_file(file)
+        except OSError as e:
+            self.log.debug(f'Could not read {file}: "{e}"')
+            return names
+
+        for line in lines:
+            fields = line.split(':')
+
+            if len(fields) >= 3 and fields[2].isdigit():
+                names.setdefault(int(fields[2]), fields[0])
+
+        return names
+
+    def _read_file(self, file: str) -> "list[str]":
+        """Read a file's lines, using the contents cached from earlier in the run if the file has already been read
+
+        Parameters
+        ----------
+        file : string, required
+            Path of the file to read
 
         Returns
         -------
-        bool
-            Returns a boolean indicating whether a test should be executed (True), or not (False)
+        list:
+            Lines in the file, without their trailing newlines
+
+        Raises
+        ------
+        OSError:
+            If the file could not be read. Failures are cached as well, so the same error is raised again on later reads
         """
 
-        self.log.debug(f'Checking whether to run test {test_id}')
+        if file not in self._file_cache:
+            try:
+                with open(file, encoding='UTF-8', errors='replace') as f:
+                    lines = f.read().split('\n')
+            except OSError as e:
+                self._file_cache[file] = e
+            else:
+                if lines[-1] == '':
+                    lines.pop(-1)
 
-        is_test_included = True
+                self._file_cache[file] = lines
 
-        ## Check if the level is one we're going to run
-        if self.config.level != 0:
-            if test_level != self.config.level:
-                self.log.debug(f'Excluding level {test_level} test {test_id}')
-                is_test_included = False
+        contents = self._file_cache[file]
 
-        ## Check if there were explicitly included tests:
-        if self.config.includes:
-            is_parent_test = False
-            is_child_test = False
+        if isinstance(contents, OSError):
+            raise contents
 
-            ## Check if include starts with test_id
-            for include in self.config.includes:
-                if include.startswith(test_id):
-                    is_parent_test = True
-                    break
+        return contents
 
-            ## Check if test_id starts with include
-            for include in self.config.includes:
-                if test_id.startswith(include):
-                    is_child_test = True
-                    break
+    def _reset_run_state(self) -> None:
+        """Forget everything which is only valid for a single run, so that an instance can be reused for another run, e.g. by an application calling iter_audit() repeatedly
 
-            ## Check if the test_id is in the included tests
-            if test_id in self.config.includes:
-                self.log.debug(f'Test {test_id} was explicitly included')
-                is_test_included = True
+        Caches which know when they are out of date, i.e. the result_cache and scan_cache options, are kept between runs
+        """
 
-            elif is_parent_test:
-                self.log.debug(f'Test {test_id} is the parent of an included test')
-                is_test_included = True
+        ## Contents of files read by _read_file(), so that each file is only read from disk once per run
+        self._file_cache = {}
 
-            elif is_child_test:
-                self.log.debug(f'Test {test_id} is the child of an included test')
-                is_test_included = True
+        ## Include and exclude lists compiled by _get_selection_plan(). These are compiled again for each run, in case the config has changed since the last one
+        self._selection_plan = None
 
-            elif self.config.level == 0:
-                self.log.debug(f'Excluding test {test_id} (Not found in the include list)')
-                is_test_included = False
+        ## Names of users and groups looked up by _get_user_name() and _get_group_name(). These are populated from /etc/passwd and /etc/group on first use
+        self._user_names = None
+        self._group_names = None
+        self._name_cache_stats = {'hits': 0, 'misses': 0}
 
-        ## If this test_id was included in the tests, check it wasn't then excluded
-        if self.config.excludes:
-            is_parent_excluded = False
+        ## Results of the full filesystem walk from _scan_filesystems(), shared by every check which needs it
+        self._filesystem_scan = None
 
-            for exclude in self.config.excludes:
-                if test_id.startswith(exclude):
-                    is_parent_excluded = True
-                    break
+        ## Results of _scan_homedirs(), shared by the home directory checks
+        self._homedirs_scan = None
 
-            if test_id in self.config.excludes:
-                self.log.debug(f'Test {test_id} was explicitly excluded')
-                is_test_included = False
+        ## Running processes from _get_processes(), shared by the checks which look for a process
+        self._processes = None
 
-            elif is_parent_excluded:
-                self.log.debug(f'Test {test_id} is the child of an excluded test')
-                is_test_included = False
+        ## Listening sockets from _get_listening_sockets(), shared by the checks for network services
+        self._listening_sockets = None
+
+        ## Kernel module state from _get_kernel_modules(), shared by each of the kernel module checks
+        self._kernel_modules = None
+
+        ## SELinux mode and policy from _get_selinux_state(), shared by the SELinux checks
+        self._selinux_state = None
+
+        ## Running firewall rules from _get_iptables_ruleset() and _get_nftables_ruleset(), keyed by 'ipv4', 'ipv6' or 'nftables'
+        self._firewall_rulesets = {}
+
+        ## Number of commands started by _shellexec(), keyed by the ID of the test which started them, or None outside of a test
+        self._process_counts = {}
+
+        ## Seconds spent waiting in _wait_for_idle(), keyed the same way as _process_counts
+        self._throttled_time = {}
+
+    def _run_test(self, test: "BenchmarkEntry") -> "tuple[TestResult, float]":
+        """Run a single test and time it
+
+        Parameters
+        ----------
+        test : BenchmarkEntry, required
+            Benchmark entry with a type of 'test'
+
+        Returns
+        -------
+        tuple:
+            TestResult for the test, and how long it took in seconds
+        """
+
+        start_time = self._get_utcnow()
+        self._current_test.id = test.id
+
+        ## Slow tests whose answer rarely changes can reuse the result from an earlier run, until it expires or what it depends on changes
+        cache_state = self._get_result_cache_state(test) if test.cache and getattr(self.config, 'result_cache', None) else None
+        cached = self._result_cache.get(test.id) if cache_state else None
+        now = time.time()
+
+        if cached and cached.get('state_of') == cache_state and (cached.get('expires') is None or cached['expires'] > now):
+            self.log.debug(f'Using the result of test {test.id} from {int(now - cached["time"])}s ago')
+            state = cached['result']
 
-        if is_test_included:
-            self.log.debug(f'Including test {test_id}')
         else:
-            self.log.debug(f'Not including test {test_id}')
+            try:
+                if self.log.isEnabledFor(logging.DEBUG):
+                    self.log.debug(f'Requesting test {test.id}, {test.function.__name__}' + (f' with kwargs: {test.kwargs}' if test.kwargs else ''))
 
-        return is_test_included
+                if test.kwargs:
+                    state = test.function(self, **test.kwargs)
+                else:
+                    state = test.function(self)
+
+            except Exception as e:
+                self.log.warning(f'Test {test.id} encountered an error: "{e}"')
+                state = -1
+
+            ## Errors aren't cached, so the test is tried again next time
+            if cache_state and state != -1:
+                ttl = test.cache.get('ttl')
+                self._result_cache[test.id] = {'result': state, 'time': now, 'expires': now + ttl if ttl else None, 'state_of': cache_state}
+
+        self._current_test.id = None
+        end_time = self._get_utcnow()
+
+        if test.id in self._throttled_time:
+            self.log.info(f'Test {test.id} was throttled for {self._throttled_time[test.id]}s while the host was busy')
+        elapsed = (end_time - start_time).total_seconds()
+        duration = f'{int(elapsed * 1000)}ms'
+
+        if state == 0:
+            self.log.debug(f'Test {test.id} passed')
+            result = "Pass"
+        elif state == -1:
+            result = "Error"
+        elif state == -2:
+            result = "Skipped"
+        else:
+            self.log.debug(f'Test {test.id} failed with state {state}')
+            result = "Fail"
+
+        return TestResult(test.id, test.description, test.level, result, duration), elapsed
+
+    def _save_result_cache(self) -> None:
+        """Save the cached results to the file given by the result_cache option, for _load_result_cache() to use on the next run"""
+
+        result_cache = getattr(self.config, 'result_cache', None)
+
+        if result_cache:
+            try:
+                with open(f'{result_cache}.tmp', 'w') as f:
+                    json.dump(self._result_cache, f, sort_keys=True)
+                os.replace(f'{result_cache}.tmp', result_cache)
+            except OSError as e:
+                self.log.warning(f'Could not save result cache {result_cache}: "{e}"')
+
+    def _save_test_stats(self, stats: "dict[str, float]") -> None:
+        """Save the duration of each test to the file given by the stats_file option, for _load_test_stats() to use on the next run
+
+        Parameters
+        ----------
+        stats : dict, required
+            Duration in seconds, keyed by test_id
+        """
+
+        stats_file = getattr(self.config, 'stats_file', None)
+
+        if stats_file:
+            try:
+                with open(f'{stats_file}.tmp', 'w') as f:
+                    json.dump(stats, f, sort_keys=True)
+                os.replace(f'{stats_file}.tmp', stats_file)
+            except OSError as e:
+                self.log.warning(f'Could not save test stats {stats_file}: "{e}"')
+
+    def _scan_filesystems(self, paths: "list[str]" = None) -> "SimpleNamespace[list[str]]":
+        """Walk each local filesystem once, evaluating every filesystem-wide check in the same pass instead of running find(1) for each of them
+
+        Parameters
+        ----------
+        paths : list, optional
+            Directories to scan instead of every local filesystem. Results for a full scan are kept for the rest of the run, but scans of specific paths are not
+
+        Returns
+        -------
+        Namespace:
+            Sorted lists of matching paths, with the attributes:
+                log_files: Files under /var/log with any of g+wx,o+rwx set
+                sgid: Files with the SGID bit set
+                suid: Files with the SUID bit set
+                ungrouped: Files and directories whose group does not exist
+                unowned: Files and directories whose owner does not exist
+                world_writable_dirs_without_sticky_bit: World-writable directories without the sticky bit set
+                world_writable_files: World-writable files
+        """
+
+        full_scan = paths is None
+
+        with self._scan_lock:
+            if full_scan and self._filesystem_scan is not None:
+                return self._filesystem_scan
+
+            scan = SimpleNamespace(log_files=[], sgid=[], suid=[], ungrouped=[], unowned=[], world_writable_dirs_without_sticky_bit=[], world_writable_files=[])
+            known_uids = {user.pw_uid for user in getpwall()}
+            known_gids = {group.gr_gid for group in getgrall()}
+
+            ## The inode/mtime cache is only used for full scans, as that's where it saves the most time
+            cache_file = getattr(self.config, 'scan_cache', None) if full_scan else None
+            cached_dirs = {}
+
+            if cache_file:
+                try:
+                    with open(cache_file) as f:
+                        cache = json.load(f)
+                except (OSError, ValueError) as e:
+                    self.log.debug(f'Could not load filesystem scan cache {cache_file}: "{e}"')
+                else:
+                    ## If a user or group has been removed, any file could now be unowned, so the whole cache is discarded.
+                    ## Users and groups which NSS can't enumerate aren't in these lists, so their removal is only seen in directories which have changed since
+                    if cache.get('uids') == sorted(known_uids) and cache.get('gids') == sorted(known_gids):
+                        cached_dirs = cache.get('dirs', {})
+
+            if full_scan:
+                paths = self._get_local_mountpoints()
+
+            ## With the nice option, the scan waits for a quiet moment, and only walks as many filesystems at the same time as there is spare load for
+            self._wait_for_idle()
+            max_workers = self._limit_by_load(max(len(paths), 1))
+
+            if max_workers < len(paths):
+                self.log.debug(f'Host is busy, so only scanning {max_workers} filesystems at the same time')
+
+            self.log.debug(f'Scanning filesystems: {paths}')
+
+            test_id = getattr(self._current_test, 'id', None)
+
+            ## Shared by every filesystem in the scan, so that pacing can't add more than max_scan_wait seconds to the scan as a whole
+            pacing = SimpleNamespace(remaining=getattr(self.config, 'max_scan_wait', 300))
+
+            def scan_tree(path):
+                ## So that any throttling in the worker threads is put down to the test which asked for the scan
+                self._current_test.id = test_id
+                return self._scan_tree(path, known_uids, known_gids, cached_dirs, pacing=pacing)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(scan_tree, paths))
+
+            scanned_dirs = {}
+            for findings, dirs in results:
+                for category, matches in findings.items():
+                    getattr(scan, category).extend(matches)
+
+                scanned_dirs.update(dirs)
+
+            for category in vars(scan).values():
+                category.sort()
+
+            if cache_file:
+                try:
+                    with open(f'{cache_file}.tmp', 'w') as f:
+                        json.dump({'uids': sorted(known_uids), 'gids': sorted(known_gids), 'dirs': scanned_dirs}, f)
+                    os.replace(f'{cache_file}.tmp', cache_file)
+                except OSError as e:
+                    self.log.warning(f'Could not save filesystem scan cache {cache_file}: "{e}"')
+
+            self.log.debug(f'Filesystem scan found: { {category: len(matches) for category, matches in vars(scan).items()} }')
+
+            if full_scan:
+                self._filesystem_scan = scan
+
+            return scan
+
+    def _scan_homedir(self, user: str, uid: int, homedir: str) -> "SimpleNamespace":
+        """Stat a user's home directory and the dot files inside it
+
+        Parameters
+        ----------
+        user : string, required
+            Name of the user
+
+        uid : int, required
+            UID of the user
+
+        homedir : string, required
+            Home directory of the user, as it appears in /etc/passwd
+
+        Returns
+        -------
+        Namespace:
+            The user, uid and homedir, plus:
+                exists: Whether the home directory exists and is a directory
+                stat: Result of os.stat() on the home directory, or None if it could not be stat'ed
+                dotfiles: Results of os.lstat() for each regular file in the home directory whose name starts with '.', keyed by name. Symlinks are not included
+        """
+
+        home = SimpleNamespace(user=user, uid=uid, homedir=homedir, exists=False, stat=None, dotfiles={})
+
+        if homedir == '':
+            return home
+
+        try:
+            home.stat = os.stat(homedir)
+        except OSError as e:
+            self.log.debug(f'Could not stat {homedir}: "{e}"')
+            return home
+
+        home.exists = stat.S_ISDIR(home.stat.st_mode)
+
+        if home.exists:
+            try:
+                with os.scandir(homedir) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.') and entry.is_file(follow_symlinks=False):
+                            home.dotfiles[entry.name] = entry.stat(follow_symlinks=False)
+            except OSError as e:
+                self.log.debug(f'Could not scan {homedir}: "{e}"')
+
+        return home
+
+    def _scan_homedirs(self) -> "list[SimpleNamespace]":
+        """Scan every user's home directory once with _scan_homedir(), so that all of the home directory checks can share the results
+
+        Home directories are scanned in a thread pool if the homedir_threads option is more than 1, which helps when they are on NFS
+
+        Returns
+        -------
+        list:
+            Result of _scan_homedir() for each user from _get_homedirs(), in the same order
+        """
+
+        with self._homedirs_lock:
+            if self._homedirs_scan is None:
+                self._wait_for_idle()
+                homedirs = list(self._get_homedirs())
+                threads = getattr(self.config, 'homedir_threads', 1)
+
+                if threads > 1:
+                    with ThreadPoolExecutor(max_workers=threads) as executor:
+                        self._homedirs_scan = list(executor.map(lambda row: self._scan_homedir(*row), homedirs))
+                else:
+                    self._homedirs_scan = [self._scan_homedir(*row) for row in homedirs]
+
+        return self._homedirs_scan
+
+    def _scan_tree(self, top: str, known_uids: "set[int]", known_gids: "set[int]", cached_dirs: dict, pacing: "SimpleNamespace" = None) -> "tuple[dict, dict]":
+        """Walk a single filesystem with os.scandir(), without crossing into other filesystems, equivalent to 'find <top> -xdev'
+
+        Parameters
+        ----------
+        top : string, required
+            Directory to start the walk from
+
+        known_uids : set, required
+            UIDs listed by getpwall(). Any other UID is looked up with _get_user_name() before its files are reported as unowned
+
+        known_gids : set, required
+            GIDs listed by getgrall(). Any other GID is looked up with _get_group_name() before its files are reported as ungrouped
+
+        cached_dirs : dict, required
+            Directories from a previous scan, keyed by path. A directory whose inode, mtime and ctime have not changed is not listed again, and the results for its entries are reused.
+            Changing the mode or owner of an existing file does not update its directory's mtime, so such changes are not seen until the directory itself changes or the cache is removed.
+
+        pacing : Namespace, optional
+            Seconds the walk may still spend waiting for the host to be idle, as 'remaining', which may be shared with walks of other filesystems. Once it runs out, the walk carries on at full speed.
+            Defaults to the max_scan_wait option for this walk alone
+
+        Returns
+        -------
+        tuple:
+            The findings for this filesystem keyed by category, and the directories which were scanned in the same format as cached_dirs
+        """
+
+        findings = {}
+        scanned_dirs = {}
+
+        try:
+            top_stat = os.lstat(top)
+        except OSError as e:
+            self.log.debug(f'Could not stat {top}: "{e}"')
+            return findings, scanned_dirs
+
+        device = top_stat.st_dev
+        stack = [(top, top_stat)]
+        scanned_count = 0
+
+        if pacing is None:
+            pacing = SimpleNamespace(remaining=getattr(self.config, 'max_scan_wait', 300))
+
+        ## getpwall() and getgrall() only list the users and groups that NSS can enumerate, which with sssd or LDAP is usually just the local ones.
+        ## Like 'find -nouser -nogroup', any other ID is looked up on its own, and _get_user_name() and _get_group_name() remember the result
+        def unowned(uid):
+            if uid in known_uids:
+                return False
+
+            self._get_user_name(uid)
+            return self._user_names[uid] is None
+
+        def ungrouped(gid):
+            if gid in known_gids:
+                return False
+
+            self._get_group_name(gid)
+            return self._group_names[gid] is None
+
+        while stack:
+            path, path_stat = stack.pop()
+            mode = path_stat.st_mode
+
+            ## Pace the walk if the host gets busy part way through, until the scan has waited for max_scan_wait seconds in total, so that a host which stays busy can't hold up a large filesystem indefinitely
+            scanned_count += 1
+            if scanned_count % 1000 == 0 and pacing.remaining > 0:
+                waited = self._wait_for_idle(max_wait=min(1, pacing.remaining), interval=1)
+
+                if waited:
+                    with self._counters_lock:
+                        exhausted = pacing.remaining > 0 >= pacing.remaining - waited
+                        pacing.remaining -= waited
+
+                    if exhausted:
+                        self.log.debug('Host is still busy, but the scan has already waited as long as max_scan_wait allows, so carrying on at full speed')
+
+            ## Checks on the directory itself
+            if mode & stat.S_IWOTH and not mode & stat.S_ISVTX:
+                findings.setdefault('world_writable_dirs_without_sticky_bit', []).append(path)
+            if unowned(path_stat.st_uid):
+                findings.setdefault('unowned', []).append(path)
+            if ungrouped(path_stat.st_gid):
+                findings.setdefault('ungrouped', []).append(path)
+
+            cached = cached_dirs.get(path)
+            if cached and cached[:3] == [path_stat.st_ino, path_stat.st_mtime_ns, path_stat.st_ctime_ns]:
+                subdirs, entry_findings = cached[3], cached[4]
+
+                for name in subdirs:
+                    subdir = os.path.join(path, name)
 
-    def _shellexec(self, command: str) -> "SimpleNamespace[str, str, int]":
+                    try:
+                        subdir_stat = os.lstat(subdir)
+                    except OSError:
+                        continue
+
+                    if stat.S_ISDIR(subdir_stat.st_mode) and subdir_stat.st_dev == device:
+                        stack.append((subdir, subdir_stat))
+
+            else:
+                subdirs = []
+                entry_findings = {}
+
+                try:
+                    with os.scandir(path) as entries:
+                        for entry in entries:
+                            try:
+                                entry_stat = entry.stat(follow_symlinks=False)
+                            except OSError:
+                                continue
+
+                            entry_mode = entry_stat.st_mode
+
+                            if stat.S_ISDIR(entry_mode):
+                                ## Equivalent of 'find -xdev'. Other local filesystems are walked separately
+                                if entry_stat.st_dev == device:
+                                    subdirs.append(entry.name)
+                                    stack.append((entry.path, entry_stat))
+                                continue
+
+                            matches = []
+                            if unowned(entry_stat.st_uid):
+                                matches.append('unowned')
+                            if ungrouped(entry_stat.st_gid):
+                                matches.append('ungrouped')
+
+                            if stat.S_ISREG(entry_mode):
+                                if entry_mode & stat.S_IWOTH:
+                                    matches.append('world_writable_files')
+                                if entry_mode & stat.S_ISUID:
+                                    matches.append('suid')
+                                if entry_mode & stat.S_ISGID:
+                                    matches.append('sgid')
+                                if entry.path.startswith('/var/log/') and entry_mode & (stat.S_IWGRP | stat.S_IXGRP | stat.S_IRWXO):
+                                    matches.append('log_files')
+
+                            for category in matches:
+                                entry_findings.setdefault(category, []).append(entry.path)
+
+                except OSError as e:
+                    self.log.debug(f'Could not scan {path}: "{e}"')
+                    continue
+
+            for category, matches in entry_findings.items():
+                findings.setdefault(category, []).extend(matches)
+
+            scanned_dirs[path] = [path_stat.st_ino, path_stat.st_mtime_ns, path_stat.st_ctime_ns, subdirs, entry_findings]
+
+        return findings, scanned_dirs
+
+    def _shellexec(self, command: "str | list[str]") -> "SimpleNamespace[str, str, int]":
         """Execute shell command on the system. Supports piped commands
 
         Parameters
         ----------
-        command : string, required
-            Shell command to execute
+        command : string or list, required
+            Shell command to execute. If a list is passed, it is executed directly as an argv list without starting a shell, so pipes and globs are not supported
 
         Returns
         -------
@@ -173,7 +1984,18 @@ class CISAudit:
 
         """
 
-        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
+        shell = isinstance(command, str)
+        self._count_process()
+
+        try:
+            if shell and getattr(self.config, 'persistent_shell', False):
+                result = self._coprocess_exec(command)
+            else:
+                result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=shell)
+        except FileNotFoundError as e:
+            ## Without a shell there is nothing to report "command not found", so mimic what /bin/sh would return
+            result = SimpleNamespace(stdout=b'', stderr=f'{e}\n'.encode('UTF-8'), returncode=127)
+
         output = result.stdout.decode('UTF-8').split('\n')
         error = result.stderr.decode('UTF-8').split('\n')
         returncode = result.returncode
@@ -186,15 +2008,104 @@ class CISAudit:
 
         data = SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
 
-        self.log.debug(f"'{command}', {data}")
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"'{command}', {self._limit_log_output(data)}")
 
         return data
 
+    def _shellexec_lines(self, command: "str | list[str]") -> "Generator[str, None, None]":
+        """Execute a command on the system, yielding each line of its stdout as soon as it is written, instead of waiting for all of it like _shellexec()
+
+        This is for checks where the first matching line decides the result. When the caller stops iterating, the command is killed, so the time and
+        memory the check takes doesn't depend on how much output there would have been. stderr is discarded, so use _shellexec() when it or the exit status matter.
+
+        Parameters
+        ----------
+        command : string or list, required
+            Shell command to execute. If a list is passed, it is executed directly as an argv list without starting a shell, the same as _shellexec()
+
+        Yields
+        ------
+        string:
+            Each line of stdout, without its trailing newline
+        """
+
+        self._count_process()
+
+        try:
+            ## In its own session, so that every process in a shell pipeline can be killed together
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, shell=isinstance(command, str), start_new_session=True)
+        except FileNotFoundError as e:
+            self.log.debug(f"'{command}', {e}")
+            return
+
+        lines = 0
+
+        try:
+            for line in process.stdout:
+                lines += 1
+                yield line.decode('UTF-8').rstrip('\n')
+
+        finally:
+            if process.poll() is None:
+                self.log.debug(f"'{command}', stopped after {lines} lines")
+                os.killpg(process.pid, signal.SIGTERM)
+
+            process.stdout.close()
+            process.wait()
+
+    def _wait_for_idle(self, max_wait: float = 60, interval: float = 5) -> float:
+        """With the nice option, wait until the host isn't busy before carrying on. Without it, return straight away
+
+        The host is busy while the 1 minute load average is over the max_load option, or the CPU or I/O pressure is over the max_pressure option.
+        Time spent waiting is put down to the test running in the current thread, and reported by _run_test()
+
+        Parameters
+        ----------
+        max_wait : float, optional
+            Longest time to wait in seconds, after which the caller carries on regardless, so that the audit still finishes on a host which is always busy
+
+        interval : float, optional
+            Time to wait between checks in seconds
+
+        Returns
+        -------
+        float:
+            Seconds spent waiting
+        """
+
+        if not getattr(self.config, 'nice', False):
+            return 0
+
+        max_load = self._get_max_load()
+        max_pressure = getattr(self.config, 'max_pressure', 10.0)
+        waited = 0
+
+        while waited < max_wait:
+            load = os.getloadavg()[0]
+            cpu_pressure = self._get_pressure('cpu') or 0.0
+            io_pressure = self._get_pressure('io') or 0.0
+
+            if load < max_load and cpu_pressure < max_pressure and io_pressure < max_pressure:
+                break
+
+            if waited == 0:
+                self.log.debug(f'Host is busy (load average {load}, CPU pressure {cpu_pressure}%, I/O pressure {io_pressure}%), waiting up to {max_wait}s')
+
+            time.sleep(interval)
+            waited += interval
+
+        if waited:
+            test_id = getattr(self._current_test, 'id', None)
+
+            with self._counters_lock:
+                self._throttled_time[test_id] = self._throttled_time.get(test_id, 0) + waited
+
+        return waited
+
     def audit_access_to_su_command_is_restricted(self) -> int:
         state = 0
-        cmd = R"grep -Pi '^\h*auth\h+(?:required|requisite)\h+pam_wheel\.so\h+(?:[^#\n\r]+\h+)?((?!\2)(use_uid\b|group=\H+\b))\h+(?:[^#\n\r]+\h+)?((?!\1)(use_uid\b|group=\H+\b))(\h+.*)?$' /etc/pam.d/su"
-
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['access_to_su_command_is_restricted'], ['/etc/pam.d/su'])
 
         if r.stdout[0] == '':
             state += 1
@@ -204,8 +2115,7 @@ class CISAudit:
                     group = entry.split('=')[1]
                     break
 
-            cmd = f'grep {group} /etc/group'
-            r = self._shellexec(cmd)
+            r = self._grepfile(group, ['/etc/group'])
             regex = re.compile('^[a-z-]+:x:[0-9]+:$')
 
             if not regex.match(r.stdout[0]):
@@ -225,10 +2135,9 @@ class CISAudit:
         return state
 
     def audit_audit_config_is_immutable(self) -> int:
-        cmd = R'grep -h "^\s*[^#]" /etc/audit/rules.d/*.rules | tail -1'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['audit_config_is_immutable'], ['/etc/audit/rules.d/*.rules'], filename=False)
 
-        if r.stdout[0] == '-e 2':
+        if r.stdout[-1] == '-e 2':
             state = 0
         else:
             state = 1
@@ -236,8 +2145,7 @@ class CISAudit:
         return state
 
     def audit_audit_log_size_is_configured(self) -> int:
-        cmd = R"grep -P '^max_log_file\s*=\s*[0-9]+' /etc/audit/auditd.conf"
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['audit_log_size_is_configured'], ['/etc/audit/auditd.conf'])
 
         if r.returncode == 0:
             state = 0
@@ -247,8 +2155,7 @@ class CISAudit:
         return state
 
     def audit_audit_logs_not_automatically_deleted(self) -> int:
-        cmd = R"grep '^max_log_file_action\s*=\s*keep_logs' /etc/audit/auditd.conf"
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['audit_logs_not_automatically_deleted'], ['/etc/audit/auditd.conf'])
 
         if r.returncode == 0:
             state = 0
@@ -276,16 +2183,19 @@ class CISAudit:
         grubdirfile = self._shellexec(R"find /boot -mindepth 1 -maxdepth 2 -type f -name 'grub.cfg'").stdout[0]
 
         if efidirfile != '':
-            cmd = Rf'grep "^\s*linux" "{efidirfile}" | grep -Evq "audit=1\b" && echo "FAILED" || echo "PASSED"'
-            r = self._shellexec(cmd)
+            grubfile = efidirfile
         elif grubdirfile != '':
-            cmd = Rf'grep "^\s*linux" "{grubdirfile}" | grep -Evq "audit=1\b" && echo "FAILED" || echo "PASSED"'
-            r = self._shellexec(cmd)
+            grubfile = grubdirfile
         else:
-            r = self._shellexec("echo FAILED")
+            grubfile = None
 
-        if r.stdout[0] != 'PASSED':
+        ## Fail if there is no grub.cfg, or if any of its 'linux' lines are missing audit=1
+        if grubfile is None:
             state += 1
+        else:
+            r = self._grepfile(patterns['grub_linux_entry'], [grubfile])
+            if self._grep(r, R'audit=1\b', invert=True).returncode == 0:
+                state += 1
 
         return state
 
@@ -298,13 +2208,11 @@ class CISAudit:
             'ExecStart=-/bin/sh -c "/usr/sbin/sulogin; /usr/bin/systemctl --job-mode=fail --no-block default"',
         ]
 
-        cmd = R"grep ExecStart= /usr/lib/systemd/system/rescue.service"
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['auth_for_single_user_mode'], ['/usr/lib/systemd/system/rescue.service'])
         if r.stdout[0] not in success_strings:
             state += 1
 
-        cmd = R"grep ExecStart= /usr/lib/systemd/system/rescue.service"
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['auth_for_single_user_mode'], ['/usr/lib/systemd/system/rescue.service'])
         if r.stdout[0] not in success_strings:
             state += 2
 
@@ -313,8 +2221,7 @@ class CISAudit:
     def audit_bootloader_password_is_set(self) -> int:
         state = 0
 
-        cmd = R'grep "^\s*GRUB2_PASSWORD" /boot/grub2/user.cfg'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['bootloader_password_is_set'], ['/boot/grub2/user.cfg'])
 
         if not r.stdout[0].startswith('GRUB2_PASSWORD='):
             state += 1
@@ -324,24 +2231,22 @@ class CISAudit:
     def audit_chrony_is_configured(self) -> int:
         state = 0
 
-        cmd = R"systemctl is-enabled chronyd"
+        cmd = ['systemctl', 'is-enabled', 'chronyd']
         r = self._shellexec(cmd)
         if r.stdout[0] != "enabled":
             state += 1
 
-        cmd = R"systemctl is-active chronyd"
+        cmd = ['systemctl', 'is-active', 'chronyd']
         r = self._shellexec(cmd)
         if r.stdout[0] != "active":
             state += 2
 
-        cmd = R'grep -E "^(server|pool)" /etc/chrony.conf'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['ntp_server_or_pool'], ['/etc/chrony.conf'])
         if r.stdout[0] == "":
             state += 4
 
-        cmd = R"ps aux | grep chronyd | grep -Ev 'awk|grep'  | awk '/chronyd/ {print $1}'"
-        r = self._shellexec(cmd)
-        if r.stdout[0] != "chrony":
+        users = {process.user for process in self._get_processes().by_name.get('chronyd', [])}
+        if users != {"chrony"}:
             state += 8
 
         return state
@@ -349,18 +2254,16 @@ class CISAudit:
     def audit_core_dumps_restricted(self) -> int:
         state = 0
 
-        cmd = R'grep -hE "^\s*\*\s+hard\s+core" /etc/security/limits.conf /etc/security/limits.d/*'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['core_dumps_hard_limit'], ['/etc/security/limits.conf', '/etc/security/limits.d/*'], filename=False)
         if not re.match(r'\s*\*\s+hard\s+core\s+0', r.stdout[0]):
             state += 1
 
-        cmd = R"sysctl fs.suid_dumpable"
+        cmd = ['sysctl', 'fs.suid_dumpable']
         r = self._shellexec(cmd)
         if r.stdout[0] != "fs.suid_dumpable = 0":
             state += 2
 
-        cmd = R'grep -h "fs\.suid_dumpable" /etc/sysctl.conf /etc/sysctl.d/*'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['core_dumps_suid_dumpable'], ['/etc/sysctl.conf', '/etc/sysctl.d/*'], filename=False)
         if r.stdout[0] != "fs.suid_dumpable = 0":
             state += 4
 
@@ -381,8 +2284,7 @@ class CISAudit:
         return state
 
     def audit_default_group_for_root(self) -> int:
-        cmd = 'grep "^root:" /etc/passwd | cut -f4 -d:'
-        r = self._shellexec(cmd)
+        r = self._cut(self._grepfile(patterns['root_passwd_entry'], ['/etc/passwd']), field=4, separator=':')
 
         if r.stdout[0] == '0':
             state = 0
@@ -445,8 +2347,7 @@ class CISAudit:
         state = 0
         ## Note: the 'awk' command from the benchmark would be the better/tidier way to do it, but I couldn't get the mixed quote marks to work from Python, so I ended up with the following:
         ## Original - awk -F: '($2 != "x" ) {print $1}' /etc/passwd
-        cmd = R"grep -Ev '^[a-z-]+:x:' /etc/passwd"
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['etc_passwd_accounts_use_shadowed_passwords'], ['/etc/passwd'], invert=True)
 
         if r.stdout[0] != '':
             state += 1
@@ -468,8 +2369,7 @@ class CISAudit:
     def audit_etc_shadow_password_fields_are_not_empty(self) -> int:
         state = 0
 
-        cmd = R"grep -E '^[a-z-]+::' /etc/shadow"
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['etc_shadow_password_fields_are_not_empty'], ['/etc/shadow'])
 
         if r.stdout[0] != '':
             state += 1
@@ -478,16 +2378,15 @@ class CISAudit:
 
     def audit_events_for_changes_to_sysadmin_scope_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h scope /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep scope"
+        cmd2 = ['auditctl', '-l']
 
         expected_output = [
             '-w /etc/sudoers -p wa -k scope',
             '-w /etc/sudoers.d -p wa -k scope',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('scope', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'scope')
 
         if r1.stdout != expected_output:
             state += 1
@@ -499,8 +2398,7 @@ class CISAudit:
 
     def audit_events_for_discretionary_access_control_changes_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h perm_mod /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep perm_mod"
+        cmd2 = ['auditctl', '-l']
 
         expected_file_output = [
             '-a always,exit -F arch=b64 -S chmod -S fchmod -S fchmodat -F auid>=1000 -F auid!=4294967295 -k perm_mod',
@@ -520,8 +2418,8 @@ class CISAudit:
             '-a always,exit -F arch=b32 -S setxattr,lsetxattr,fsetxattr,removexattr,lremovexattr,fremovexattr -F auid>=1000 -F auid!=-1 -F key=perm_mod',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('perm_mod', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'perm_mod')
 
         if r1.stdout != expected_file_output:
             state += 1
@@ -533,8 +2431,7 @@ class CISAudit:
 
     def audit_events_for_file_deletion_by_users_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h delete /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep delete"
+        cmd2 = ['auditctl', '-l']
 
         expected_file_output = [
             '-a always,exit -F arch=b64 -S unlink -S unlinkat -S rename -S renameat -F auid>=1000 -F auid!=4294967295 -k delete',
@@ -546,8 +2443,8 @@ class CISAudit:
             '-a always,exit -F arch=b32 -S unlink,rename,unlinkat,renameat -F auid>=1000 -F auid!=-1 -F key=delete',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('delete', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'delete')
 
         if r1.stdout != expected_file_output:
             state += 1
@@ -559,8 +2456,7 @@ class CISAudit:
 
     def audit_events_for_kernel_module_loading_and_unloading_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h modules /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep modules"
+        cmd2 = ['auditctl', '-l']
 
         expected_file_output = [
             '-w /sbin/insmod -p x -k modules',
@@ -576,8 +2472,8 @@ class CISAudit:
             '-a always,exit -F arch=b64 -S init_module,delete_module -F key=modules',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('modules', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'modules')
 
         if r1.stdout != expected_file_output:
             state += 1
@@ -589,16 +2485,15 @@ class CISAudit:
 
     def audit_events_for_login_and_logout_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h logins /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep logins"
+        cmd2 = ['auditctl', '-l']
 
         expected_output = [
             '-w /var/log/lastlog -p wa -k logins',
             '-w /var/run/faillock -p wa -k logins',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('logins', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'logins')
 
         if r1.stdout != expected_output:
             state += 1
@@ -610,8 +2505,7 @@ class CISAudit:
 
     def audit_events_for_session_initiation_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h '[buw]tmp' /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep '[buw]tmp'"
+        cmd2 = ['auditctl', '-l']
 
         expected_output = [
             '-w /var/run/utmp -p wa -k session',
@@ -619,8 +2513,8 @@ class CISAudit:
             '-w /var/log/btmp -p wa -k logins',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('[buw]tmp', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), '[buw]tmp')
 
         if r1.stdout != expected_output:
             state += 1
@@ -632,8 +2526,7 @@ class CISAudit:
 
     def audit_events_for_successful_file_system_mounts_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h mounts /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep mounts"
+        cmd2 = ['auditctl', '-l']
 
         expected_file_output = [
             '-a always,exit -F arch=b64 -S mount -F auid>=1000 -F auid!=4294967295 -k mounts',
@@ -645,8 +2538,8 @@ class CISAudit:
             '-a always,exit -F arch=b32 -S mount -F auid>=1000 -F auid!=-1 -F key=mounts',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('mounts', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'mounts')
 
         if r1.stdout != expected_file_output:
             state += 1
@@ -658,8 +2551,7 @@ class CISAudit:
 
     def audit_events_for_system_administrator_commands_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h actions /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep actions"
+        cmd2 = ['auditctl', '-l']
 
         expected_file_output = [
             '-a exit,always -F arch=b64 -C euid!=uid -F euid=0 -F auid>=1000 -F auid!=4294967295 -S execve -k actions',
@@ -670,8 +2562,8 @@ class CISAudit:
             '-a always,exit -F arch=b32 -S execve -C uid!=euid -F euid=0 -F auid>=1000 -F auid!=-1 -F key=actions',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('actions', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'actions')
 
         if r1.stdout != expected_file_output:
             state += 1
@@ -683,8 +2575,7 @@ class CISAudit:
 
     def audit_events_for_unsuccessful_file_access_attempts_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h access /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep access"
+        cmd2 = ['auditctl', '-l']
 
         expected_file_output = [
             '-a always,exit -F arch=b64 -S creat -S open -S openat -S truncate -S ftruncate -F exit=-EACCES -F auid>=1000 -F auid!=4294967295 -k access',
@@ -699,8 +2590,8 @@ class CISAudit:
             '-a always,exit -F arch=b32 -S open,creat,truncate,ftruncate,openat -F exit=-EPERM -F auid>=1000 -F auid!=-1 -F key=access',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('access', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'access')
 
         if r1.stdout != expected_file_output:
             state += 1
@@ -712,8 +2603,7 @@ class CISAudit:
 
     def audit_events_that_modify_datetime_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h time-change /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep time-change"
+        cmd2 = ['auditctl', '-l']
 
         expected_file_output = [
             '-a always,exit -F arch=b64 -S adjtimex -S settimeofday -k time-change',
@@ -731,8 +2621,8 @@ class CISAudit:
             '-w /etc/localtime -p wa -k time-change',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('time-change', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'time-change')
 
         if r1.stdout != expected_file_output:
             state += 1
@@ -744,16 +2634,15 @@ class CISAudit:
 
     def audit_events_that_modify_mandatory_access_controls_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h MAC-policy /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep MAC-policy"
+        cmd2 = ['auditctl', '-l']
 
         expected_output = [
             '-w /etc/selinux -p wa -k MAC-policy',
             '-w /usr/share/selinux -p wa -k MAC-policy',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('MAC-policy', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'MAC-policy')
 
         if r1.stdout != expected_output:
             state += 1
@@ -765,8 +2654,7 @@ class CISAudit:
 
     def audit_events_that_modify_network_environment_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h system-locale /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep system-locale"
+        cmd2 = ['auditctl', '-l']
 
         expected_file_output = [
             '-a always,exit -F arch=b64 -S sethostname -S setdomainname -k system-locale',
@@ -786,8 +2674,8 @@ class CISAudit:
             '-w /etc/sysconfig/network -p wa -k system-locale',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('system-locale', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'system-locale')
 
         if r1.stdout != expected_file_output:
             state += 1
@@ -799,8 +2687,7 @@ class CISAudit:
 
     def audit_events_that_modify_usergroup_info_are_collected(self) -> int:
         state = 0
-        cmd1 = R"grep -h identity /etc/audit/rules.d/*.rules"
-        cmd2 = R"auditctl -l | grep identity"
+        cmd2 = ['auditctl', '-l']
 
         expected_file_output = [
             '-w /etc/group -p wa -k identity',
@@ -818,8 +2705,8 @@ class CISAudit:
             '-w /etc/security/opasswd -p wa -k identity',
         ]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile('identity', ['/etc/audit/rules.d/*.rules'], filename=False)
+        r2 = self._grep(self._shellexec(cmd2), 'identity')
 
         if r1.stdout != expected_file_output:
             state += 1
@@ -859,7 +2746,7 @@ class CISAudit:
 
         """
         """
-            When looping over each of the permission bits. If the bits do not match or are not more restrictive, increment the failure state value by a unique amount, per below. This allows us to determine from the return value, which permissions did not match:
+            Each permission bit which is set on the file but not in the expected_mode increments the failure state value by a unique amount, per below. This allows us to determine from the return value, which permissions did not match:
 
               index | penalty | description
              -------|---------|-------------
@@ -878,70 +2765,21 @@ class CISAudit:
                 10  |   4096  | Other Write bit did not match
                 11  |   8192  | Other Execute bit did not match
         """
-        state = 0
-
-        ## Convert expected_mode to binary string
-        if len(expected_mode) in [3, 4]:
-            if expected_mode[0] == '0':
-                expected_mode = expected_mode[-3:]  # Strip leading zero otherwise it can break things, e.g. 0750 -> 750
-        else:
-            raise ValueError(f'The "expected_mode" for {file} should be 3 or 4 characters long, not {len(expected_mode)}')
-        octal_expected_mode = oct(int(expected_mode, 8))  # Convert octal (base8) file mode to decimal (base10)
-        binary_expected_mode = str(format(int(octal_expected_mode, 8), '012b'))  # Convert decimal (base10) to binary (base2) for bit-by-bit comparison
 
-        ## Get file stats and user/group
-        try:
-            file_stat = os.stat(file)
-        except Exception as e:
-            self.log.warning(f'Error trying to stat file {file}: "{e}"')
-            return -1
-
-        file_user = getpwuid(file_stat.st_uid).pw_name
-        file_group = getgrgid(file_stat.st_gid).gr_name
-
-        ## Convert file_mode to binary string
-        file_mode = int(stat.S_IMODE(file_stat.st_mode))
-        octal_file_mode = oct(file_mode)
-        binary_file_mode = str(format(int(file_mode), '012b'))
-
-        if expected_user is not None:
-            ## Set fail state if user does not match expectation
-            if file_user != expected_user:
-                state += 1
-                self.log.debug(f'Test failure: file_user "{file_user}" for {file} did not match expected_user "{expected_user}"')
-
-        if expected_group is not None:
-            ## Set fail state if group does not match expecation
-            if file_group != expected_group:
-                state += 2
-                self.log.debug(f'Test failure: file_group "{file_group}" for {file} did not match expected_group "{expected_group}"')
-
-        ## Iterate over all bits in the binary_file_mode to ensure they're equal to, or more restrictive than, the expected_mode. Refer to the table in the description above for what the individual 'this_failure_score' values refer to.
-        for i in range(len(binary_file_mode)):
-            if binary_expected_mode[i] == '0':
-                if binary_file_mode[i] != '0':
-                    ## Add unique state so we can identify which bit a permission failed on, for debugging
-                    this_failure_score = 2 ** (i + 2)
-                    state += this_failure_score
-                    self.log.debug(f'Test comparison for {file}, {octal_expected_mode}>={octal_file_mode} {binary_expected_mode[i]} == {binary_file_mode[i]}. Failed at index {i}. Adding {this_failure_score} to state')
-                else:
-                    self.log.debug(f'Test comparison for {file}, {octal_expected_mode}>={octal_file_mode} {binary_expected_mode[i]} == {binary_file_mode[i]}. Passed at index {i}')
-
-        return state
+        return self._check_file_permissions(files=[file], expected_mode=expected_mode, expected_user=expected_user, expected_group=expected_group)[file]
 
     def audit_filesystem_integrity_regularly_checked(self) -> int:
         state = 1
 
-        cmd = R"grep -Ers '^([^#]+\s+)?(\/usr\/s?bin\/|^\s*)aide(\.wrapper)?\s(--?\S+\s)*(--(check|update)|\$AIDEARGS)\b' /etc/cron.* /etc/crontab /var/spool/cron/root /etc/anacrontab"
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['filesystem_integrity_regularly_checked'], ['/etc/cron.*', '/etc/crontab', '/var/spool/cron/root', '/etc/anacrontab'], recursive=True)
 
         if r.stdout[0] != '':
             state = 0
 
         else:
-            cmd1 = 'systemctl is-enabled aidecheck.service'
-            cmd2 = 'systemctl is-enabled aidecheck.timer'
-            cmd3 = 'systemctl is-active aidecheck.timer'
+            cmd1 = ['systemctl', 'is-enabled', 'aidecheck.service']
+            cmd2 = ['systemctl', 'is-enabled', 'aidecheck.timer']
+            cmd3 = ['systemctl', 'is-active', 'aidecheck.timer']
 
             r1 = self._shellexec(cmd1)
             r2 = self._shellexec(cmd2)
@@ -959,7 +2797,7 @@ class CISAudit:
         return state
 
     def audit_firewalld_default_zone_is_set(self) -> int:
-        cmd = 'firewall-cmd --get-default-zone'
+        cmd = ['firewall-cmd', '--get-default-zone']
         r = self._shellexec(cmd)
 
         if r.stdout[0] != '':
@@ -1037,76 +2875,99 @@ class CISAudit:
     def audit_gpgcheck_is_activated(self) -> int:
         state = 0
 
-        cmd = R'grep ^\s*gpgcheck /etc/yum.conf'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['gpgcheck_is_activated_globally'], ['/etc/yum.conf'])
         if r.stdout[0] != 'gpgcheck=1':
             state += 1
 
-        cmd = R"grep -P '^\h*gpgcheck=[^1\n\r]+\b(\h+.*)?$' /etc/yum.repos.d/*.repo"
         # cmd = R"awk -v 'RS=[' -F '\n' '/\n\s*name\s*=\s*.*$/ && ! /\n\s*enabled\s*=\s*0(\W.*)?$/ && ! /\n\s*gpgcheck\s*=\s*1(\W.*)?$/ { t=substr($1, 1, index($1, \"]\")-1); print t, \"does not have gpgcheck enabled.\" }' /etc/yum.repos.d/*.repo"
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['gpgcheck_is_activated_for_repos'], ['/etc/yum.repos.d/*.repo'])
 
         if r.stdout[0] != '':
             state += 2
 
         return state
 
+    def audit_homedirs_dot_files_permissions(self) -> int:
+        state = 0
+
+        for home in self._scan_homedirs():
+            for name, file_stat in home.dotfiles.items():
+                if file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                    state = 1
+                    self.log.warning(f'{home.user}({home.uid}) dot file {os.path.join(home.homedir, name)} is group or world writable')
+
+                    if getattr(self.config, 'first_violation', False):
+                        return state
+
+        return state
+
     def audit_homedirs_exist(self) -> int:
         state = 0
 
-        for user, uid, homedir in self._get_homedirs():
-            if homedir != '':
-                if not os.path.isdir(homedir):
-                    self.log.warning(f'The homedir {homedir} does not exist')
+        for home in self._scan_homedirs():
+            if home.homedir != '':
+                if not home.exists:
+                    self.log.warning(f'The homedir {home.homedir} does not exist')
                     state = 1
 
+                    if getattr(self.config, 'first_violation', False):
+                        break
+
         return state
 
-    def audit_homedirs_ownership(self) -> int:
+    def audit_homedirs_file_does_not_exist(self, file: str) -> int:
         state = 0
 
-        for user, uid, homedir in self._get_homedirs():
-            dir = os.stat(homedir)
+        for home in self._scan_homedirs():
+            if file in home.dotfiles:
+                state = 1
+                self.log.warning(f'{home.user}({home.uid}) has a {file} file in {home.homedir}')
+
+                if getattr(self.config, 'first_violation', False):
+                    break
+
+        return state
+
+    def audit_homedirs_ownership(self) -> int:
+        state = 0
 
-            if dir.st_uid != int(uid):
+        ## Missing home directories are reported by audit_homedirs_exist()
+        for home in self._scan_homedirs():
+            if home.exists and home.stat.st_uid != home.uid:
                 state = 1
-                self.log.warning(f'{user}({uid}) does not own {homedir}')
+                self.log.warning(f'{home.user}({home.uid}) does not own {home.homedir}')
+
+                if getattr(self.config, 'first_violation', False):
+                    break
 
         return state
 
     def audit_homedirs_permissions(self) -> int:
         state = 0
 
-        for user, uid, homedir in self._get_homedirs():
-            if self.audit_file_permissions(homedir, '0750') != 0:
+        ## Missing home directories are reported by audit_homedirs_exist()
+        for home in self._scan_homedirs():
+            if home.exists and stat.S_IMODE(home.stat.st_mode) & ~0o750:
                 state = 1
-                self.log.warning(f'Homedir {homedir} is not 0750 or more restrictive')
+                self.log.warning(f'Homedir {home.homedir} is not 0750 or more restrictive')
+
+                if getattr(self.config, 'first_violation', False):
+                    break
 
         return state
 
     def audit_iptables_default_deny_policy(self, ip_version: str) -> int:
         state = 0
 
-        if ip_version == 'ipv4':
-            cmd1 = 'iptables -S INPUT'
-            cmd2 = 'iptables -S FORWARD'
-            cmd3 = 'iptables -S OUTPUT'
-        elif ip_version == 'ipv6':
-            cmd1 = 'ip6tables -S INPUT'
-            cmd2 = 'ip6tables -S FORWARD'
-            cmd3 = 'ip6tables -S OUTPUT'
-
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
-        r3 = self._shellexec(cmd3)
+        chains = self._get_iptables_ruleset(ip_version).chains
 
-        if r1.stdout[0] != '-P INPUT DROP':
+        if 'INPUT' not in chains or chains['INPUT'].policy != 'DROP':
             state += 1
 
-        if r2.stdout[0] != '-P FORWARD DROP':
+        if 'FORWARD' not in chains or chains['FORWARD'].policy != 'DROP':
             state += 2
 
-        if r3.stdout[0] != '-P OUTPUT DROP':
+        if 'OUTPUT' not in chains or chains['OUTPUT'].policy != 'DROP':
             state += 4
 
         return state
@@ -1114,45 +2975,36 @@ class CISAudit:
     def audit_iptables_is_flushed(self) -> int:
         state = 0
 
-        cmd = R"iptables -S | grep -v -- -P"
-        r = self._shellexec(cmd)
-        if r.stdout != ['']:
-            state += 1
+        ## Flushed means there are no rules and no user-defined chains, which are the only chains without a policy
+        for bit, ip_version in [(1, 'ipv4'), (2, 'ipv6')]:
+            chains = self._get_iptables_ruleset(ip_version).chains
 
-        cmd = R"ip6tables -S | grep -v -- -P"
-        r = self._shellexec(cmd)
-        if r.stdout != ['']:
-            state += 2
+            if any(chain.rules or chain.policy is None for chain in chains.values()):
+                state += bit
 
         return state
 
     def audit_iptables_loopback_is_configured(self, ip_version: str) -> int:
         state = 0
 
-        if ip_version == 'ipv4':
-            cmd1 = "iptables -S INPUT"
-            cmd2 = "iptables -S OUTPUT"
-        elif ip_version == 'ipv6':
-            cmd1 = "ip6tables -S INPUT"
-            cmd2 = "ip6tables -S OUTPUT"
+        chains = self._get_iptables_ruleset(ip_version).chains
+        input_rules = chains['INPUT'].rules if 'INPUT' in chains else []
+        output_rules = chains['OUTPUT'].rules if 'OUTPUT' in chains else []
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
-
-        self.log.debug(r1)
-        self.log.debug(r2)
+        self.log.debug(input_rules)
+        self.log.debug(output_rules)
 
-        if len(r1.stdout) < 2 or r1.stdout[1] != '-A INPUT -i lo -j ACCEPT':
+        if len(input_rules) < 1 or input_rules[0] != '-A INPUT -i lo -j ACCEPT':
             state += 1
 
         if ip_version == 'ipv4':
-            if len(r1.stdout) < 3 or r1.stdout[2] != '-A INPUT -s 127.0.0.0/8 -j DROP':
+            if len(input_rules) < 2 or input_rules[1] != '-A INPUT -s 127.0.0.0/8 -j DROP':
                 state += 2
         elif ip_version == 'ipv6':
-            if len(r1.stdout) < 3 or r1.stdout[2] != '-A INPUT -s ::1/128 -j DROP':
+            if len(input_rules) < 2 or input_rules[1] != '-A INPUT -s ::1/128 -j DROP':
                 state += 2
 
-        if len(r2.stdout) < 2 or r2.stdout[1] != '-A OUTPUT -o lo -j ACCEPT':
+        if len(output_rules) < 1 or output_rules[0] != '-A OUTPUT -o lo -j ACCEPT':
             state += 4
 
         return state
@@ -1160,31 +3012,27 @@ class CISAudit:
     def audit_iptables_outbound_and_established_connections(self, ip_version: str) -> int:
         state = 0
 
-        if ip_version == 'ipv4':
-            cmd = R"iptables -S"
-        elif ip_version == 'ipv6':
-            cmd = R"ip6tables -S"
-
-        r = self._shellexec(cmd)
+        chains = self._get_iptables_ruleset(ip_version).chains
+        rules = [rule for chain in chains.values() for rule in chain.rules]
 
-        self.log.debug(r)
+        self.log.debug(rules)
 
-        if '-A INPUT -p tcp -m state --state ESTABLISHED -j ACCEPT' not in r.stdout:
+        if '-A INPUT -p tcp -m state --state ESTABLISHED -j ACCEPT' not in rules:
             state += 1
 
-        if '-A INPUT -p udp -m state --state ESTABLISHED -j ACCEPT' not in r.stdout:
+        if '-A INPUT -p udp -m state --state ESTABLISHED -j ACCEPT' not in rules:
             state += 2
 
-        if '-A INPUT -p icmp -m state --state ESTABLISHED -j ACCEPT' not in r.stdout:
+        if '-A INPUT -p icmp -m state --state ESTABLISHED -j ACCEPT' not in rules:
             state += 4
 
-        if '-A OUTPUT -p tcp -m state --state NEW,ESTABLISHED -j ACCEPT' not in r.stdout:
+        if '-A OUTPUT -p tcp -m state --state NEW,ESTABLISHED -j ACCEPT' not in rules:
             state += 8
 
-        if '-A OUTPUT -p udp -m state --state NEW,ESTABLISHED -j ACCEPT' not in r.stdout:
+        if '-A OUTPUT -p udp -m state --state NEW,ESTABLISHED -j ACCEPT' not in rules:
             state += 16
 
-        if '-A OUTPUT -p icmp -m state --state NEW,ESTABLISHED -j ACCEPT' not in r.stdout:
+        if '-A OUTPUT -p icmp -m state --state NEW,ESTABLISHED -j ACCEPT' not in rules:
             state += 32
 
         return state
@@ -1192,21 +3040,23 @@ class CISAudit:
     def audit_iptables_rules_are_saved(self, ip_version: str) -> int:
         if ip_version == 'ipv4':
             # cmd = R"diff -qs -y <(iptables-save | grep -v '^#' | sed 's/\[[0-9]*:[0-9]*\]//' | sort) <(grep -v '^#' /etc/sysconfig/iptables | sed 's/\[[0-9]*:[0-9]*\]//' | sort)"
-            cmd1 = R"iptables-save | grep -v '^#' | sed 's/\[[0-9]*:[0-9]*\]//' | sort"
-            cmd2 = R"grep -v '^#' /etc/sysconfig/iptables | sed 's/\[[0-9]*:[0-9]*\]//' | sort"
+            file = '/etc/sysconfig/iptables'
         elif ip_version == 'ipv6':
             # cmd = R"diff -qs -y <(ip6tables-save | grep -v '^#' | sed 's/\[[0-9]*:[0-9]*\]//' | sort) <(grep -v '^#' /etc/sysconfig/ip6tables | sed 's/\[[0-9]*:[0-9]*\]//' | sort)"
-            cmd1 = R"ip6tables-save | grep -v '^#' | sed 's/\[[0-9]*:[0-9]*\]//' | sort"
-            cmd2 = R"grep -v '^#' /etc/sysconfig/ip6tables | sed 's/\[[0-9]*:[0-9]*\]//' | sort"
+            file = '/etc/sysconfig/ip6tables'
 
-        # r = self._shellexec(cmd)
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        ## Equivalent of "grep -v '^#' | sed 's/\[[0-9]*:[0-9]*\]//' | sort", applied to both the running and saved rules so they're normalised the same way
+        counters = re.compile(R'\[[0-9]*:[0-9]*\]')
+        ruleset = self._get_iptables_ruleset(ip_version)
+        r1 = self._grep(SimpleNamespace(stdout=ruleset.lines, stderr=[''], returncode=ruleset.returncode), '^#', invert=True)
+        r2 = self._grepfile('^#', [file], invert=True)
+        rules1 = sorted(counters.sub('', line) for line in r1.stdout)
+        rules2 = sorted(counters.sub('', line) for line in r2.stdout)
 
         self.log.debug(r1)
         self.log.debug(r2)
 
-        if r1.returncode == 0 and r2.returncode == 0 and r1.stdout == r2.stdout:
+        if r1.returncode == 0 and r2.returncode == 0 and rules1 == rules2:
             state = 0
         else:
             state = 1
@@ -1214,8 +3064,7 @@ class CISAudit:
         return state
 
     def audit_journald_configured_to_compress_large_logs(self) -> int:
-        cmd = R'grep -E ^\s*Compress= /etc/systemd/journald.conf'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['journald_compress'], ['/etc/systemd/journald.conf'])
 
         if r.stdout[0] == 'Compress=yes':
             state = 0
@@ -1225,8 +3074,7 @@ class CISAudit:
         return state
 
     def audit_journald_configured_to_send_logs_to_rsyslog(self) -> int:
-        cmd = R'grep -E ^\s*ForwardToSyslog= /etc/systemd/journald.conf'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['journald_forward_to_syslog'], ['/etc/systemd/journald.conf'])
 
         if r.stdout[0] == 'ForwardToSyslog=yes':
             state = 0
@@ -1236,8 +3084,7 @@ class CISAudit:
         return state
 
     def audit_journald_configured_to_write_logfiles_to_disk(self) -> int:
-        cmd = R'grep -E ^\s*Storage= /etc/systemd/journald.conf'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['journald_storage'], ['/etc/systemd/journald.conf'])
 
         if r.stdout[0] == 'Storage=persistent':
             state = 0
@@ -1248,20 +3095,19 @@ class CISAudit:
 
     def audit_kernel_module_is_disabled(self, module: str) -> int:
         state = 0
-        cmd1 = f'modprobe -n -v {module}'
-        cmd2 = f'lsmod | grep {module}'
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        ## Equivalent of 'modprobe -n -v <module>' and 'lsmod', without starting either of them
+        modules = self._get_kernel_modules()
+        name = module.replace('-', '_')
 
-        if r1.stdout[0] == 'install /bin/true ':
+        if modules.install.get(name) == '/bin/true':
             pass
-        elif r1.stderr[0] == f'modprobe: FATAL: Module {module} not found.':
+        elif modules.available is not None and name not in modules.available:
             pass
         else:
             state = 1
 
-        if module in r2.stdout[0]:
+        if name in modules.loaded:
             state = 2
 
         return state
@@ -1269,9 +3115,9 @@ class CISAudit:
     def audit_mta_is_localhost_only(self) -> int:
         state = 0
 
-        cmd = R"ss -lntu | grep -E ':25\s' | grep -E -v '\s(127.0.0.1|\[?::1\]?):25\s'"
-        r = self._shellexec(cmd)
-        if r.stdout[0] != "":
+        ## Any socket on port 25 which isn't bound to the loopback address is reachable from other hosts
+        sockets = self._get_listening_sockets().by_port.get(25, [])
+        if any(socket.address not in ['127.0.0.1', '::1'] for socket in sockets):
             state += 1
 
         return state
@@ -1279,21 +3125,15 @@ class CISAudit:
     def audit_nftables_base_chains_exist(self) -> int:
         state = 0
 
-        cmd1 = 'nft list ruleset | grep "hook input"'
-        cmd2 = 'nft list ruleset | grep "hook forward"'
-        cmd3 = 'nft list ruleset | grep "hook output"'
-
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
-        r3 = self._shellexec(cmd3)
+        hooks = [chain.hook for chain in self._get_nftables_ruleset().chains]
 
-        if r1.stdout == ['']:
+        if 'input' not in hooks:
             state += 1
 
-        if r2.stdout == ['']:
+        if 'forward' not in hooks:
             state += 2
 
-        if r3.stdout == ['']:
+        if 'output' not in hooks:
             state += 4
 
         return state
@@ -1301,26 +3141,23 @@ class CISAudit:
     def audit_nftables_outbound_and_established_connections(self) -> int:
         state = 0
 
-        cmd1 = 'nft list ruleset | grep "hook input"'
-        cmd2 = 'nft list ruleset | grep "hook output"'
-
-        cmd1 = R"nft list ruleset | awk '/hook input/,/}/' | grep -E 'ip protocol (tcp|udp|icmp) ct state' | sed 's/^\s*//'"
-        cmd2 = R"nft list ruleset | awk '/hook output/,/}/' | grep -E 'ip protocol (tcp|udp|icmp) ct state' | sed 's/^\s*//'"
-
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        ## Equivalent of "awk '/hook input/,/}/' | grep -E 'ip protocol (tcp|udp|icmp) ct state'" for each hook
+        regex = re.compile(R'ip protocol (tcp|udp|icmp) ct state')
+        chains = self._get_nftables_ruleset().chains
+        input_rules = [rule for chain in chains if chain.hook == 'input' for rule in chain.rules if regex.match(rule)]
+        output_rules = [rule for chain in chains if chain.hook == 'output' for rule in chain.rules if regex.match(rule)]
 
-        self.log.debug(f"'{cmd1}', '{r1}'")
-        self.log.debug(f"'{cmd2}', '{r2}'")
+        self.log.debug(input_rules)
+        self.log.debug(output_rules)
 
-        if r1.stdout != [
+        if input_rules != [
             'ip protocol tcp ct state established accept',
             'ip protocol udp ct state established accept',
             'ip protocol icmp ct state established accept',
         ]:
             state += 1
 
-        if r2.stdout != [
+        if output_rules != [
             'ip protocol tcp ct state established,related,new accept',
             'ip protocol udp ct state established,related,new accept',
             'ip protocol icmp ct state established,related,new accept',
@@ -1332,55 +3169,36 @@ class CISAudit:
     def audit_nftables_default_deny_policy(self) -> int:
         state = 0
 
-        cmd1 = R"nft list ruleset | grep 'hook input' | sed 's/^\s*//'"
-        cmd2 = R"nft list ruleset | grep 'hook forward' | sed 's/^\s*//'"
-        cmd3 = R"nft list ruleset | grep 'hook output' | sed 's/^\s*//'"
+        chains = self._get_nftables_ruleset().chains
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
-        r3 = self._shellexec(cmd3)
+        ## The first base chain for each hook is checked, the same one which 'nft list ruleset | grep "hook <name>"' would have shown first
+        for bit, hook in [(1, 'input'), (2, 'forward'), (4, 'output')]:
+            chain = next((chain for chain in chains if chain.hook == hook), None)
+            self.log.debug(chain)
 
-        self.log.debug(f"'{cmd1}', '{r1}'")
-        self.log.debug(f"'{cmd2}', '{r2}'")
-        self.log.debug(f"'{cmd3}', '{r3}'")
-
-        if r1.stdout[0] != 'type filter hook input priority 0; policy drop;':
-            state += 1
-
-        if r2.stdout[0] != 'type filter hook forward priority 0; policy drop;':
-            state += 2
-
-        if r3.stdout[0] != 'type filter hook output priority 0; policy drop;':
-            state += 4
+            ## Newer versions of nft show priority 0 by its name, 'filter'
+            if chain is None or chain.type != 'filter' or chain.priority not in [0, 'filter'] or chain.policy != 'drop':
+                state += bit
 
         return state
 
     def audit_nftables_loopback_is_configured(self) -> int:
         state = 0
 
-        cmd1 = R"nft list ruleset | awk '/hook input/,/}/' | grep 'iif \"lo\" accept' | sed 's/^\s*//'"
-        cmd2 = R"nft list ruleset | awk '/hook input/,/}/' | grep 'ip saddr 127.0.0.0/8' | sed 's/^\s*//'"
-        cmd3 = R"nft list ruleset | awk '/hook input/,/}/' | grep 'ip6 saddr ::1' | sed 's/^\s*//'"
+        rules = [rule for chain in self._get_nftables_ruleset().chains if chain.hook == 'input' for rule in chain.rules]
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
-        r3 = self._shellexec(cmd3)
+        self.log.debug(rules)
 
-        self.log.debug(f"'{cmd1}', '{r1}'")
-        self.log.debug(f"'{cmd2}', '{r2}'")
-        self.log.debug(f"'{cmd3}', '{r3}'")
-
-        if r1.stdout[0] != 'iif "lo" accept':
+        if 'iif "lo" accept' not in rules:
             state += 1
 
         ## See what these re.search()'s are looking for here https://regex101.com/r/9uHJ4o/1
         regex = re.compile(R'ip6? saddr (127.0.0.0\/8|::1) counter packets [0-9]+ bytes [0-9]+ drop')
-        # if not search(r'ip6? saddr (127.0.0.0\/8|::1) counter packets [0-9]+ bytes [0-9]+ drop', r2.stdout[0]):
-        if not regex.match(r2.stdout[0]):
+
+        if not any(rule.startswith('ip saddr 127.0.0.0/8') and regex.match(rule) for rule in rules):
             state += 2
 
-        # if not search(r'ip6? saddr (127.0.0.0\/8|::1) counter packets [0-9]+ bytes [0-9]+ drop', r3.stdout[0]):
-        if not regex.match(r3.stdout[0]):
+        if not any(rule.startswith('ip6 saddr ::1') and regex.match(rule) for rule in rules):
             state += 4
 
         return state
@@ -1388,9 +3206,7 @@ class CISAudit:
     def audit_nftables_table_exists(self) -> int:
         state = 0
 
-        cmd = R'nft list tables'
-        r = self._shellexec(cmd)
-        if r.stdout == ['']:
+        if self._get_nftables_ruleset().tables == []:
             state += 1
 
         return state
@@ -1398,34 +3214,65 @@ class CISAudit:
     def audit_no_unconfined_services(self) -> int:
         state = 0
 
-        cmd = R"ps -eZ | grep unconfined_service_t"
-        r = self._shellexec(cmd)
-
-        if r.stdout[0] != "":
+        if self._get_processes().by_selinux_type.get('unconfined_service_t'):
             state += 1
 
         return state
 
+    def audit_no_ungrouped_files_or_dirs(self) -> int:
+        scan = self._scan_filesystems()
+
+        if scan.ungrouped == []:
+            state = 0
+        else:
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(f'Ungrouped files or directories: {self._limit_log_output(scan.ungrouped)}')
+            state = 1
+
+        return state
+
+    def audit_no_unowned_files_or_dirs(self) -> int:
+        scan = self._scan_filesystems()
+
+        if scan.unowned == []:
+            state = 0
+        else:
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(f'Unowned files or directories: {self._limit_log_output(scan.unowned)}')
+            state = 1
+
+        return state
+
+    def audit_no_world_writable_files(self) -> int:
+        scan = self._scan_filesystems()
+
+        if scan.world_writable_files == []:
+            state = 0
+        else:
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(f'World-writable files: {self._limit_log_output(scan.world_writable_files)}')
+            state = 1
+
+        return state
+
     def audit_ntp_is_configured(self) -> int:
         state = 0
 
-        cmd = R"systemctl is-enabled ntpd"
+        cmd = ['systemctl', 'is-enabled', 'ntpd']
         r = self._shellexec(cmd)
         if r.stdout[0] != "enabled":
             state += 1
 
-        cmd = R"systemctl is-active ntpd"
+        cmd = ['systemctl', 'is-active', 'ntpd']
         r = self._shellexec(cmd)
         if r.stdout[0] != "active":
             state += 2
 
-        cmd = R'grep -E "^(server|pool)" /etc/ntp.conf'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['ntp_server_or_pool'], ['/etc/ntp.conf'])
         if r.stdout[0] == "":
             state += 4
 
-        cmd = R'grep "^restrict.*default" /etc/ntp.conf'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['ntp_restrict_default'], ['/etc/ntp.conf'])
         options = ["kod", "nomodify", "notrap", "nopeer", "noquery"]
         for option in options:
             for line in r.stdout:
@@ -1437,27 +3284,28 @@ class CISAudit:
                 continue
             break
 
-        cmd = R"ps aux | grep ntpd | grep -v grep"
-        r = self._shellexec(cmd)
-        if "-u ntp:ntp" not in r.stdout[0]:
+        processes = self._get_processes().by_name.get('ntpd', [])
+        if processes == [] or any("-u ntp:ntp" not in ' '.join(process.args) for process in processes):
             state += 16
 
         return state
 
     def audit_nxdx_support_enabled(self) -> int:
-        state = 0
-        cmd = R'dmesg | grep "protection: active"'
-        r = self._shellexec(cmd)
+        state = 1
+        cmd = ['dmesg']
 
-        if "protection: active" not in r.stdout[0]:
-            state += 1
+        ## The message is logged early in boot, so reading stops as soon as it is found
+        for line in self._shellexec_lines(cmd):
+            if 'protection: active' in line:
+                state = 0
+                break
 
         return state
 
     def audit_only_one_package_is_installed(self, packages: str) -> int:
         ### Similar to audit_package_is_installed but requires one of many (xor) package is installed
-        cmd = f'rpm -q {packages} | grep -v "not installed"'
-        r = self._shellexec(cmd)
+        cmd = ['rpm', '-q'] + packages.split()
+        r = self._grep(self._shellexec(cmd), 'not installed', invert=True)
 
         ## e.g. print(r.stdout) will show:
         ##  ['chrony-3.4-1.el7.x86_64']
@@ -1471,7 +3319,7 @@ class CISAudit:
         return state
 
     def audit_package_is_installed(self, package: str) -> int:
-        cmd = f'rpm -q {package}'
+        cmd = ['rpm', '-q', package]
         r = self._shellexec(cmd)
 
         self.log.debug(f"'{cmd}', '{r}'")
@@ -1484,7 +3332,7 @@ class CISAudit:
         return state
 
     def audit_package_not_installed(self, package: str) -> int:
-        cmd = f'rpm -q {package}'
+        cmd = ['rpm', '-q', package]
         r = self._shellexec(cmd)
 
         self.log.debug(f"'{cmd}', '{r}'")
@@ -1513,8 +3361,8 @@ class CISAudit:
 
     def audit_partition_is_separate(self, partition: str) -> int:
         state = 0
-        cmd = Rf'mount | grep -E "\s{partition}\s"'
-        r = self._shellexec(cmd)
+        cmd = ['mount']
+        r = self._grep(self._shellexec(cmd), Rf'\s{partition}\s')
         if partition not in r.stdout[0]:
             state += 1
 
@@ -1522,8 +3370,8 @@ class CISAudit:
 
     def audit_partition_option_is_set(self, partition: str, option: str) -> int:
         state = 1
-        cmd = Rf'mount | grep -E "\s{partition}\s" | grep {option}'
-        r = self._shellexec(cmd)
+        cmd = ['mount']
+        r = self._grep(self._grep(self._shellexec(cmd), Rf'\s{partition}\s'), option)
 
         if partition in r.stdout[0] and option in r.stdout[0]:
             state = 0
@@ -1533,18 +3381,15 @@ class CISAudit:
     def audit_password_change_minimum_delay(self, expected_min_days: int = 1) -> int:
         state = 0
 
-        cmd1 = R"grep ^\s*PASS_MIN_DAYS /etc/login.defs"
-        cmd2 = R"grep -E '^[^:]+:[^!*]' /etc/shadow | cut -d: -f1,4"
-
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile(patterns['password_change_minimum_delay'], ['/etc/login.defs'])
+        r2 = self._grepfile(patterns['shadow_password_is_set'], ['/etc/shadow'])
 
         if not int(r1.stdout[0].split()[1]) >= expected_min_days:
             state += 1
 
         for line in r2.stdout:
             if line != '':
-                days = line.split(':')[1]
+                days = line.split(':')[3]
                 if not int(days) >= expected_min_days:
                     state += 2
                     break
@@ -1554,18 +3399,15 @@ class CISAudit:
     def audit_password_expiration_max_days_is_configured(self, expected_max_days: int = 365) -> int:
         state = 0
 
-        cmd1 = R"grep ^\s*PASS_MAX_DAYS /etc/login.defs"
-        cmd2 = R"grep -E '^[^:]+:[^!*]' /etc/shadow | cut -d: -f1,5"
-
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile(patterns['password_expiration_max_days'], ['/etc/login.defs'])
+        r2 = self._grepfile(patterns['shadow_password_is_set'], ['/etc/shadow'])
 
         if not int(r1.stdout[0].split()[1]) <= expected_max_days:
             state += 1
 
         for line in r2.stdout:
             if line != '':
-                days = line.split(':')[1]
+                days = line.split(':')[4]
                 if not int(days) <= expected_max_days:
                     state += 2
                     break
@@ -1575,18 +3417,15 @@ class CISAudit:
     def audit_password_expiration_warning_is_configured(self, expected_warn_days: int = 7) -> int:
         state = 0
 
-        cmd1 = R"grep ^\s*PASS_WARN_AGE /etc/login.defs"
-        cmd2 = R"grep -E '^[^:]+:[^!*]' /etc/shadow | cut -d: -f1,6"
-
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile(patterns['password_expiration_warning'], ['/etc/login.defs'])
+        r2 = self._grepfile(patterns['shadow_password_is_set'], ['/etc/shadow'])
 
         if not int(r1.stdout[0].split()[1]) >= expected_warn_days:
             state += 1
 
         for line in r2.stdout:
             if line != '':
-                days = line.split(':')[1]
+                days = line.split(':')[5]
                 if not int(days) >= expected_warn_days:
                     state += 2
                     break
@@ -1595,9 +3434,7 @@ class CISAudit:
 
     def audit_password_hashing_algorithm(self) -> int:
         state = 0
-        cmd = R"grep -P '^\h*password\h+(sufficient|requisite|required)\h+pam_unix\.so\h+([^#\n\r]+)?sha512(\h+.*)?$' /etc/pam.d/system-auth /etc/pam.d/password-auth"
-
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['password_hashing_algorithm'], ['/etc/pam.d/system-auth', '/etc/pam.d/password-auth'])
 
         if len(r.stdout) < 2:
             state += 1
@@ -1607,11 +3444,10 @@ class CISAudit:
     def audit_password_inactive_lock_is_configured(self, expected_inactive_days: int = 30) -> int:
         state = 0
 
-        cmd1 = R"useradd -D | grep INACTIVE"
-        cmd2 = R"grep -E '^[^:]+:[^!*]' /etc/shadow | cut -d: -f1,7"
+        cmd1 = ['useradd', '-D']
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grep(self._shellexec(cmd1), 'INACTIVE')
+        r2 = self._grepfile(patterns['shadow_password_is_set'], ['/etc/shadow'])
 
         if r1.stdout[0].split('=')[1]:
             default_inactive_days = int(r1.stdout[0].split('=')[1])
@@ -1620,7 +3456,7 @@ class CISAudit:
             state += 1
 
         for line in r2.stdout:
-            days = line.split(':')[1]
+            days = line.split(':')[6]
 
             if days == '' or int(days) > expected_inactive_days:
                 state += 2
@@ -1630,11 +3466,10 @@ class CISAudit:
 
     def audit_password_reuse_is_limited(self) -> int:
         state = 0
-        cmd1 = R"grep -P '^\s*password\s+(requisite|required)\s+pam_pwhistory\.so\s+([^#]+\s+)*remember=([5-9]|[1-9][0-9]+)\b' /etc/pam.d/system-auth /etc/pam.d/password-auth"
-        cmd2 = R"grep -P '^\s*password\s+(sufficient|requisite|required)\s+pam_unix\.so\s+([^#]+\s+)*remember=([5-9]|[1-9][0-9]+)\b' /etc/pam.d/system-auth /etc/pam.d/password-auth"
+        files = ['/etc/pam.d/system-auth', '/etc/pam.d/password-auth']
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile(patterns['password_reuse_pam_pwhistory'], files)
+        r2 = self._grepfile(patterns['password_reuse_pam_unix'], files)
 
         if len(r1.stdout) < 2 and len(r2.stdout) < 2:
             state += 1
@@ -1642,12 +3477,18 @@ class CISAudit:
         return state
 
     def audit_permissions_on_log_files(self) -> int:
-        cmd = R'find /var/log -type f -perm /g+wx,o+rwx -exec ls -l {} \;'
-        r = self._shellexec(cmd)
+        ## Reuse the full filesystem scan if another check has already run it, otherwise only /var/log needs to be walked.
+        ## Each filesystem is walked without crossing into others, so any mounted under /var/log, such as /var/log/audit, are walked as well
+        if self._filesystem_scan is not None:
+            scan = self._filesystem_scan
+        else:
+            scan = self._scan_filesystems(['/var/log'] + [mountpoint for mountpoint in self._get_local_mountpoints() if mountpoint.startswith('/var/log/')])
 
-        if r.stdout[0] == '':
+        if scan.log_files == []:
             state = 0
         else:
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(f'Log files with excessive permissions: {self._limit_log_output(scan.log_files)}')
             state = 1
 
         return state
@@ -1658,7 +3499,7 @@ class CISAudit:
         files = []
 
         ## Get HostKeys from sshd_config
-        cmd = R"/usr/sbin/sshd -T"
+        cmd = ['/usr/sbin/sshd', '-T']
         r = self._shellexec(cmd)
 
         regex = re.compile(R'^hostkey\s')
@@ -1666,10 +3507,10 @@ class CISAudit:
             if regex.match(line):
                 files.append(line.split()[1])
 
-        ## Check file permissions using audit_file_permissions()
-        for counter, file in enumerate(files):
-            result = self.audit_file_permissions(file=file, expected_user="root", expected_group="root", expected_mode="0600")
+        ## Check file permissions for all of the keys at once using _check_file_permissions()
+        results = self._check_file_permissions(files=files, expected_user="root", expected_group="root", expected_mode="0600")
 
+        for counter, result in enumerate(results.values()):
             if result != 0:
                 state += 2**counter
 
@@ -1681,7 +3522,7 @@ class CISAudit:
         files = []
 
         ## Get HostKeys from sshd_config
-        cmd = R"/usr/sbin/sshd -T"
+        cmd = ['/usr/sbin/sshd', '-T']
         r = self._shellexec(cmd)
 
         regex = re.compile(R'^hostkey\s')
@@ -1689,10 +3530,10 @@ class CISAudit:
             if regex.match(line):
                 files.append(line.split()[1])
 
-        ## Check file permissions using audit_file_permissions()
-        for counter, file in enumerate(files):
-            result = self.audit_file_permissions(file=file + '.pub', expected_user="root", expected_group="root", expected_mode="0644")
+        ## Check file permissions for all of the keys at once using _check_file_permissions()
+        results = self._check_file_permissions(files=[file + '.pub' for file in files], expected_user="root", expected_group="root", expected_mode="0644")
 
+        for counter, result in enumerate(results.values()):
             if result != 0:
                 state += 2**counter
 
@@ -1700,12 +3541,12 @@ class CISAudit:
 
     def audit_removable_partition_option_is_set(self, option: str) -> int:
         state = 0
-        removable_mountpoints = self._shellexec("lsblk -o RM,MOUNTPOINT | awk '/1/ {print $2}'").stdout
+        removable_mountpoints = self._cut(self._grep(self._shellexec(['lsblk', '-o', 'RM,MOUNTPOINT']), '1'), field=2).stdout
 
         for mountpoint in removable_mountpoints:  # pragma: no cover
             if mountpoint != "":
-                cmd = Rf'findmnt -n "{mountpoint}" | grep -Ev "\b{option}\b"'
-                r = self._shellexec(cmd)
+                cmd = ['findmnt', '-n', mountpoint]
+                r = self._grep(self._shellexec(cmd), Rf'\b{option}\b', invert=True)
 
                 if r.stdout[0] != "":
                     state = 1
@@ -1723,8 +3564,7 @@ class CISAudit:
         return state
 
     def audit_rsyslog_default_file_permission_is_configured(self) -> int:
-        cmd = R'grep -h ^\$FileCreateMode /etc/rsyslog.conf /etc/rsyslog.d/*.conf'
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['rsyslog_file_create_mode'], ['/etc/rsyslog.conf', '/etc/rsyslog.d/*.conf'], filename=False)
 
         if r.stdout[0] == '$FileCreateMode 0640':
             state = 0
@@ -1734,11 +3574,10 @@ class CISAudit:
         return state
 
     def audit_rsyslog_sends_logs_to_a_remote_log_host(self) -> int:
-        cmd1 = R'grep -Eh "^\s*([^#]+\s+)?action\(([^#]+\s+)?\btarget=\"?[^#\"]+\"?\b" /etc/rsyslog.conf /etc/rsyslog.d/*.conf'  # https://regex101.com/r/Ud69Ey/4
-        cmd2 = R"grep -Eh '^\s*[^#\s]*\.\*\s+@' /etc/rsyslog.conf /etc/rsyslog.d/*.conf"  # https://regex101.com/r/DMX1lZ/1
+        files = ['/etc/rsyslog.conf', '/etc/rsyslog.d/*.conf']
 
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
+        r1 = self._grepfile(patterns['rsyslog_remote_action'], files, filename=False)
+        r2 = self._grepfile(patterns['rsyslog_remote_legacy'], files, filename=False)
 
         if r1.stdout[0] != '' or r2.stdout[0] != '':
             state = 0
@@ -1750,14 +3589,12 @@ class CISAudit:
     def audit_selinux_mode_is_enforcing(self) -> int:
         state = 0
 
-        cmd = R"sestatus | awk -F: '/^Current mode:/ {print $2}' | sed 's/\s*//'"
-        r = self._shellexec(cmd)
-        if r.stdout[0] != "enforcing":
+        selinux = self._get_selinux_state()
+
+        if selinux.current_mode != "enforcing":
             state += 1
 
-        cmd = R"sestatus | awk -F: '/^Mode from config file:/ {print $2}' | sed 's/\s*//'"
-        r = self._shellexec(cmd)
-        if r.stdout[0] != "enforcing":
+        if selinux.config_mode != "enforcing":
             state += 2
 
         return state
@@ -1765,14 +3602,12 @@ class CISAudit:
     def audit_selinux_mode_not_disabled(self) -> int:
         state = 0
 
-        cmd = R"sestatus | awk -F: '/^Current mode:/ {print $2}' | sed 's/\s*//'"
-        r = self._shellexec(cmd)
-        if r.stdout[0] not in ["permissive", "enforcing"]:
+        selinux = self._get_selinux_state()
+
+        if selinux.current_mode not in ["permissive", "enforcing"]:
             state += 1
 
-        cmd = R"sestatus | awk -F: '/^Mode from config file:/ {print $2}' | sed 's/\s*//'"
-        r = self._shellexec(cmd)
-        if r.stdout[0] not in ["permissive", "enforcing"]:
+        if selinux.config_mode not in ["permissive", "enforcing"]:
             state += 2
 
         return state
@@ -1780,6 +3615,8 @@ class CISAudit:
     def audit_selinux_not_disabled_in_bootloader(self) -> int:
         state = 0
         file_paths = []
+
+        self._wait_for_idle()
         for dirpath, dirnames, filenames in os.walk('/boot/'):
             if "grub.cfg" in filenames:
                 file_paths.append(dirpath)
@@ -1789,8 +3626,8 @@ class CISAudit:
 
         else:
             for i, path in enumerate(file_paths):
-                cmd = Rf'grep "^\s*linux" {path}/grub.cfg | grep -E "selinux=0|enforcing=0"'
-                r = self._shellexec(cmd)
+                r = self._grepfile(patterns['grub_linux_entry'], [f'{path}/grub.cfg'])
+                r = self._grep(r, 'selinux=0|enforcing=0')
 
                 if r.stdout != ['']:
                     state += 2 ** (i + 1)
@@ -1800,14 +3637,12 @@ class CISAudit:
     def audit_selinux_policy_is_configured(self) -> int:
         state = 0
 
-        cmd = R"awk -F= '/^SELINUXTYPE=/ {print $2}' /etc/selinux/config"
-        r = self._shellexec(cmd)
-        if r.stdout[0] != "targeted":
+        selinux = self._get_selinux_state()
+
+        if selinux.config_policy != "targeted":
             state += 1
 
-        cmd = R"sestatus | awk -F: '/Loaded policy/ {print $2}' | sed 's/\s*//'"
-        r = self._shellexec(cmd)
-        if r.stdout[0] != "targeted":
+        if selinux.loaded_policy != "targeted":
             state += 2
 
         return state
@@ -1815,7 +3650,7 @@ class CISAudit:
     def audit_service_is_active(self, service: str) -> int:
         state = 0
 
-        cmd = f'systemctl is-active {service}'
+        cmd = ['systemctl', 'is-active', service]
         r = self._shellexec(cmd)
         if r.stdout[0] != 'active':
             state += 1
@@ -1825,7 +3660,7 @@ class CISAudit:
     def audit_service_is_disabled(self, service: str) -> int:
         state = 0
 
-        cmd = f'systemctl is-enabled {service}'
+        cmd = ['systemctl', 'is-enabled', service]
         r = self._shellexec(cmd)
         if r.stdout[0] != 'disabled':
             state += 1
@@ -1835,7 +3670,7 @@ class CISAudit:
     def audit_service_is_enabled(self, service: str) -> int:
         state = 0
 
-        cmd = f'systemctl is-enabled {service}'
+        cmd = ['systemctl', 'is-enabled', service]
         r = self._shellexec(cmd)
         if r.stdout[0] != 'enabled':
             state += 1
@@ -1845,12 +3680,12 @@ class CISAudit:
     def audit_service_is_enabled_and_is_active(self, service: str) -> int:
         state = 0
 
-        cmd = f'systemctl is-enabled {service}'
+        cmd = ['systemctl', 'is-enabled', service]
         r = self._shellexec(cmd)
         if r.stdout[0] != 'enabled':
             state += 1
 
-        cmd = f'systemctl is-active {service}'
+        cmd = ['systemctl', 'is-active', service]
         r = self._shellexec(cmd)
         if r.stdout[0] != 'active':
             state += 2
@@ -1860,7 +3695,7 @@ class CISAudit:
     def audit_service_is_masked(self, service) -> int:
         state = 0
 
-        cmd = f'systemctl is-enabled {service}'
+        cmd = ['systemctl', 'is-enabled', service]
         r = self._shellexec(cmd)
 
         self.log.debug(f"'{cmd}', '{r}'")
@@ -1878,7 +3713,7 @@ class CISAudit:
         if r.stdout[0] != '':
             state += 1
 
-        gid = shellexec("awk -F: '/^shadow:/ {print $3}' /etc/group").stdout[0]
+        gid = self._shellexec("awk -F: '/^shadow:/ {print $3}' /etc/group").stdout[0]
 
         cmd = f"awk -F: '($4 == \"{gid}\") {{print $1}}' /etc/passwd"
         r = self._shellexec(cmd)
@@ -1889,7 +3724,7 @@ class CISAudit:
 
     def audit_sshd_config_option(self, parameter: str, expected_value: str, comparison: str = "eq") -> int:
         state = 0
-        cmd = R"/usr/sbin/sshd -T"
+        cmd = ['/usr/sbin/sshd', '-T']
         r = self._shellexec(cmd)
 
         ## Fail check if the config test fails because we can't trust the config file is correct
@@ -1930,20 +3765,20 @@ class CISAudit:
         return state
 
     def audit_sticky_bit_on_world_writable_dirs(self) -> int:
-        cmd = R"df --local -P 2> /dev/null | awk '{if (NR!=1) print $6}' | xargs -I '{}' find '{}' -xdev -type d \( -perm -0002 -a ! -perm -1000 \)"
-        r = self._shellexec(cmd)
+        scan = self._scan_filesystems()
 
-        if r.returncode == 0 and r.stdout[0] == '':
+        if scan.world_writable_dirs_without_sticky_bit == []:
             state = 0
-        elif r.returncode == 0 and r.stdout[0] != '':
+        else:
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(f'World-writable directories without the sticky bit: {self._limit_log_output(scan.world_writable_dirs_without_sticky_bit)}')
             state = 1
 
         return state
 
     def audit_sudo_commands_use_pty(self) -> int:
         state = 0
-        cmd = R"grep -hEi '^\s*Defaults\s+([^#]\S+,\s*)?use_pty\b' /etc/sudoers /etc/sudoers.d/*"
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['sudo_commands_use_pty'], ['/etc/sudoers', '/etc/sudoers.d/*'], filename=False)
 
         if r.stdout[0] != 'Defaults use_pty':
             state += 1
@@ -1952,8 +3787,7 @@ class CISAudit:
 
     def audit_sudo_log_exists(self) -> int:
         state = 0
-        cmd = R"grep -hEi '^\s*Defaults\s+([^#;]+,\s*)?logfile\s*=\s*(\")?[^#;]+(\")?' /etc/sudoers /etc/sudoers.d/*"
-        r = self._shellexec(cmd)
+        r = self._grepfile(patterns['sudo_log_exists'], ['/etc/sudoers', '/etc/sudoers.d/*'], filename=False)
 
         if r.stdout[0] != 'Defaults logfile="/var/log/sudo.log"':
             state += 1
@@ -1964,13 +3798,12 @@ class CISAudit:
         state = 0
 
         for i, flag in enumerate(flags):
-            cmd = f'sysctl {flag}'
+            cmd = ['sysctl', flag]
             r = self._shellexec(cmd)
             if r.stdout[0] != f'{flag} = {value}':
                 state += 2 ** (i * 2)
 
-            cmd = f'grep -h "{flag}" /etc/sysctl.conf /etc/sysctl.d/*.conf'
-            r = self._shellexec(cmd)
+            r = self._grepfile(re.escape(flag), ['/etc/sysctl.conf', '/etc/sysctl.d/*.conf'], filename=False)
 
             if r.stdout != [f'{flag} = {value}']:
                 state += 2 ** (i * 2 + 1)
@@ -2003,13 +3836,9 @@ class CISAudit:
     def audit_system_is_disabled_when_audit_logs_are_full(self) -> int:
         state = 0
 
-        cmd1 = R"grep '^space_left_action =' /etc/audit/auditd.conf"
-        cmd2 = R"grep '^action_mail_acct =' /etc/audit/auditd.conf"
-        cmd3 = R"grep '^admin_space_left_action =' /etc/audit/auditd.conf"
-
-        r1 = self._shellexec(cmd1)
-        r2 = self._shellexec(cmd2)
-        r3 = self._shellexec(cmd3)
+        r1 = self._grepfile(patterns['auditd_space_left_action'], ['/etc/audit/auditd.conf'])
+        r2 = self._grepfile(patterns['auditd_action_mail_acct'], ['/etc/audit/auditd.conf'])
+        r3 = self._grepfile(patterns['auditd_admin_space_left_action'], ['/etc/audit/auditd.conf'])
 
         if r1.stdout[0] != 'space_left_action = email':
             state += 1
@@ -2023,7 +3852,7 @@ class CISAudit:
         return state
 
     def audit_updates_installed(self) -> int:
-        cmd = R'yum -q check-update'
+        cmd = ['yum', '-q', 'check-update']
         r = self._shellexec(cmd)
 
         ## From man 8 yum
@@ -2052,7 +3881,72 @@ class CISAudit:
 
         return state
 
-    def output(self, format: str, data: list) -> None:
+    def get_tests_list(self, host_os: str, benchmark_version: str) -> "Generator[BenchmarkEntry]":
+        """Lazily yield the benchmark entries for host_os and benchmark_version, building only the sections which could contain selected tests
+
+        Sections are selected using the same prefix matching as _is_test_included(), which still decides whether each individual test is run
+
+        Parameters
+        ----------
+        host_os : string, required
+            Operating system key in the benchmarks dict, e.g. 'centos7'
+
+        benchmark_version : string, required
+            Benchmark version key in the benchmarks dict, e.g. '3.1.2'
+
+        Returns
+        -------
+        Generator:
+            BenchmarkEntry for each entry in order, for passing to run_tests()
+        """
+
+        ## The include and exclude lists may have changed since the last run or listing
+        self._selection_plan = None
+        plan = self._get_selection_plan()
+
+        for section_id, section in benchmarks[host_os][benchmark_version].items():
+            section_prefixes = [section_id[:i] for i in range(1, len(section_id) + 1)]
+
+            ## With a level set, _is_test_included() doesn't restrict tests to the include list, so neither do we
+            if plan.includes and self.config.level == 0:
+                if section_id not in plan.include_prefixes and plan.includes.isdisjoint(section_prefixes):
+                    self.log.debug(f'Skipping section {section_id} (Not found in the include list)')
+                    continue
+
+            if not plan.excludes.isdisjoint(section_prefixes):
+                self.log.debug(f'Skipping section {section_id} (Excluded)')
+                continue
+
+            for entry in section():
+                yield BenchmarkEntry.from_dict(entry, self.config.system_type)
+
+    def iter_audit(self, tests: "Iterable[BenchmarkEntry]") -> "Generator[TestResult, None, None]":
+        """Run the tests, yielding each result as soon as it is ready. Nothing is printed, so this is the way to embed the audit in another Python application
+
+        Selection, jobs and caching all come from the config the instance was created with, and are read again at the start of each run. The instance can be kept and called again,
+        with the same config or after changing it, which reuses the result and filesystem scan caches, but re-reads anything else which may have changed since the last run.
+
+        e.g.
+            audit = CISAudit(config=SimpleNamespace(includes=['5.2'], excludes=None, level=0, system_type='server', log_level='WARNING', jobs=4, result_cache='/var/cache/cis-audit.json'))
+
+            for result in audit.iter_audit(audit.get_tests_list('centos7', '3.1.2')):
+                print(result.id, result.result)
+
+        Parameters
+        ----------
+        tests : iterable, required
+            Benchmark entries, e.g. from get_tests_list()
+
+        Yields
+        ------
+        TestResult:
+            Result of each included entry. With the jobs option, these are not in benchmark order
+        """
+
+        for index, result in self._iter_results(tests):
+            yield result
+
+    def output(self, format: str, data: "list[TestResult]") -> None:
         if format in ['csv', 'psv', 'tsv']:
             if format == 'csv':
                 sep = ','
@@ -2069,7 +3963,7 @@ class CISAudit:
         elif format == 'text':
             self.output_text(data)
 
-    def output_csv(self, data: list, separator: str):
+    def output_csv(self, data: "list[TestResult]", separator: str):
         ## Shorten the variable name so that it's easier to construct the print's below
         sep = separator
 
@@ -2078,33 +3972,18 @@ class CISAudit:
 
         ## Print Data
         for record in data:
-            if len(record) == 2:
-                print(f'{record[0]}{sep}"{record[1]}"{sep}{sep}{sep}')
-            elif len(record) == 4:
-                print(f'{record[0]}{sep}"{record[1]}"{sep}{record[2]}{sep}{record[3]}{sep}')
-            elif len(record) == 5:
-                print(f'{record[0]}{sep}"{record[1]}"{sep}{record[2]}{sep}{record[3]}{sep}{record[4]}')
-
-    def output_json(self, data):
+            level, result, duration = ('' if value is None else value for value in record[2:])
+            print(f'{record.id}{sep}"{record.description}"{sep}{level}{sep}{result}{sep}{duration}')
+
+    def output_json(self, data: "list[TestResult]"):
         output = {}
 
         for record in data:
-            id = record[0]
-            output[id] = {}
-            output[id]['description'] = record[1]
-
-            if len(record) >= 3:
-                output[id]['level'] = record[2]
-
-            if len(record) >= 4:
-                output[id]['result'] = record[3]
-
-            if len(record) >= 5:
-                output[id]['duration'] = record[4]
+            output[record.id] = {field: value for field, value in zip(record._fields[1:], record[1:]) if value is not None}
 
         print(json.dumps(output))
 
-    def output_text(self, data):
+    def output_text(self, data: "list[TestResult]"):
         ## Set starting/minimum width of columns to fit the column headers
         width_id = len("ID")
         width_description = len("Description")
@@ -2114,33 +3993,11 @@ class CISAudit:
 
         ## Find the max width of each column
         for row in data:
-            row_length = len(row)
-
-            ## In the following section, len_level and len_duration are commented out because the
-            ## headers are wider than the data in the rows, so they currently don't need expanding.
-            ## If I leave them uncommented, then codecov complains about the tests not covering them.
-
-            len_id = len(str(row[0])) if row_length >= 1 else None
-            len_description = len(str(row[1])) if row_length >= 2 else None
-            # len_level = len(str(row[2])) if row_length >= 3 else None
-            len_result = len(str(row[3])) if row_length >= 4 else None
-            # len_duration = len(str(row[4])) if row_length >= 5 else None
-
-            if len_id and len_id > width_id:
-                width_id = len_id
-                # print(f'Width for ID expanded to {width_id}')
-
-            if len_description and len_description > width_description:
-                width_description = len_description
-
-            # if len_level and len_level > width_level:
-            #    width_level = len_level
-
-            if len_result and len_result > width_result:
-                width_result = len_result
-
-            # if len_duration and len_duration > width_duration:
-            #    width_duration = len_duration
+            ## Level and Duration aren't checked because the headers are wider than the data in
+            ## the rows, so they currently don't need expanding.
+            width_id = max(width_id, len(row.id))
+            width_description = max(width_description, len(row.description))
+            width_result = max(width_result, len(row.result or ''))
 
         ## Print column headers
         print(f'{"ID" : <{width_id}}  {"Description" : <{width_description}}  {"Level" : ^{width_level}}  {"Result" : ^{width_result}}  {"Duration" : >{width_duration}}')
@@ -2148,11 +4005,7 @@ class CISAudit:
 
         ## Print Data
         for row in data:
-            id = row[0] if len(row) >= 1 else ""
-            description = row[1] if len(row) >= 2 else ""
-            level = row[2] if len(row) >= 3 else ""
-            result = row[3] if len(row) >= 4 else ""
-            duration = row[4] if len(row) >= 5 else ""
+            id, description, level, result, duration = ('' if value is None else value for value in row)
 
             ## Print blank row before new major sections
             if len(id) == 1:
@@ -2160,411 +4013,653 @@ class CISAudit:
 
             print(f'{id: <{width_id}}  {description: <{width_description}}  {level: ^{width_level}}  {result: ^{width_result}}  {duration: >{width_duration}}')
 
-    def run_tests(self, tests: "list[dict]") -> dict:
-        results = []
+    def run_tests(self, tests: "Iterable[BenchmarkEntry]") -> "list[TestResult]":
+        """Run the tests, and return all of their results in benchmark order
+
+        Parameters
+        ----------
+        tests : iterable, required
+            Benchmark entries, e.g. from get_tests_list()
+
+        Returns
+        -------
+        list:
+            TestResult for each included entry
+        """
 
-        for test in tests:
-            result = ""
+        results = dict(self._iter_results(tests))
 
-            ## Test ID
-            test_id = test['_id']
+        return [results[index] for index in sorted(results)]
 
-            ## Test Description
-            test_description = test['description']
 
-            ## Test Function
-            if "function" in test:
-                test_function = test['function']
-            else:
-                test_function = None
+class TestResult(NamedTuple):
+    """Result of a single benchmark entry from run_tests(). Headers only have an id and description, and untimed results have no duration"""
 
-            ## Test kwargs
-            if 'kwargs' in test:
-                kwargs = test['kwargs']
-            else:
-                kwargs = None
+    ## Stop pytest from trying to collect this class as a test case
+    __test__ = False
 
-            ## Test Level
-            if "levels" in test:
-                if self.config.system_type in test['levels']:
-                    test_level = test['levels'][self.config.system_type]
-            else:
-                test_level = None
+    id: str
+    description: str
+    level: int = None
+    result: str = None
+    duration: str = None
 
-            ## Test Type
-            if "type" in test:
-                test_type = test['type']
-            else:
-                self.log.debug(f'Test {test_id} does not explicitly define a type, so assuming it is a test')
-                test_type = 'test'
 
-            ## If a test doesn't have a function associated with it, we assume it's unimplemented
-            if test_type == 'test' and test_function is None:
-                test_type = 'notimplemented'
+### Patterns ###
+def compile_pattern(pattern: str, flags: int = 0) -> "re.Pattern":
+    r"""Compile a regular expression taken from a grep command for use with Python's re module
+
+    Python's re module does not support PCRE's horizontal whitespace escapes, so \h and \H are translated to [ \t] and [^ \t] respectively.
 
-            ## Check whether this test_id is included
-            if self._is_test_included(test_id, test_level):
-                if test_type == 'header':
-                    results.append((test_id, test_description))
+    Parameters
+    ----------
+    pattern : string, required
+        Regular expression to compile, as would be passed to 'grep -E' or 'grep -P'
 
-                elif test_type == 'manual':
-                    results.append((test_id, test_description, test_level, 'Manual'))
+    flags : int, optional
+        Flags to pass to re.compile(), e.g. re.IGNORECASE for 'grep -i'
 
-                elif test_type == 'skip':
-                    results.append((test_id, test_description, test_level, 'Skipped'))
+    Returns
+    -------
+    re.Pattern:
+        The compiled regular expression
 
-                elif test_type == 'notimplemented':
-                    results.append((test_id, test_description, test_level, 'Not Implemented'))
+    Raises
+    ------
+    ValueError:
+        If \H is used inside a character class, which has no equivalent in Python
+    """
 
-                elif test_type == 'test':
-                    start_time = self._get_utcnow()
+    translated = []
+    in_class = False
+    i = 0
 
-                    try:
-                        if kwargs:
-                            self.log.debug(f'Requesting test {test_id}, {test_function.__name__} with kwargs: {kwargs}')
-                            state = test_function(self, **kwargs)
-                        else:
-                            self.log.debug(f'Requesting test {test_id}, {test_function.__name__}')
-                            state = test_function(self)
-
-                    except Exception as e:
-                        self.log.warning(f'Test {test_id} encountered an error: "{e}"')
-                        state = -1
-
-                    end_time = self._get_utcnow()
-                    duration = f'{int((end_time.microsecond - start_time.microsecond) / 1000)}ms'
-
-                    if state == 0:
-                        self.log.debug(f'Test {test_id} passed')
-                        result = "Pass"
-                    elif state == -1:
-                        result = "Error"
-                    elif state == -2:
-                        result = "Skipped"
-                    else:
-                        self.log.debug(f'Test {test_id} failed with state {state}')
-                        result = "Fail"
+    while i < len(pattern):
+        char = pattern[i]
 
-                    results.append((test_id, test_description, test_level, result, duration))
+        if char == '\\' and i + 1 < len(pattern):
+            escape = pattern[i : i + 2]
 
-        return results
+            if escape == R'\h':
+                translated.append(R' \t' if in_class else R'[ \t]')
+            elif escape == R'\H' and in_class:
+                raise ValueError(f'Cannot translate \\H inside a character class in "{pattern}"')
+            elif escape == R'\H':
+                translated.append(R'[^ \t]')
+            else:
+                translated.append(escape)
+
+            i += 2
+            continue
+
+        if char == '[' and not in_class:
+            in_class = True
+
+            ## A ']' at the start of a class, or straight after the '^', is a literal rather than the end of the class
+            opening = pattern[i : i + 3] if pattern[i + 1 : i + 2] == '^' else pattern[i : i + 2]
+            if opening.endswith(']'):
+                translated.append(opening)
+                i += len(opening)
+                continue
+
+        elif char == ']' and in_class:
+            in_class = False
+
+        translated.append(char)
+        i += 1
+
+    return re.compile(''.join(translated), flags)
+
+
+## Regular expressions for the tests which search files using CISAudit._grepfile(). These are compiled once, when the script is loaded, rather than every time a test is run.
+patterns = {
+    ## Python does not support forward references such as PCRE's (?!\2) before group 2 exists. That lookahead always succeeds on the first option though, so it has been dropped here without changing the meaning.
+    'access_to_su_command_is_restricted': compile_pattern(R'^\h*auth\h+(?:required|requisite)\h+pam_wheel\.so\h+(?:[^#\n\r]+\h+)?((use_uid\b|group=\H+\b))\h+(?:[^#\n\r]+\h+)?((?!\1)(use_uid\b|group=\H+\b))(\h+.*)?$', re.IGNORECASE),
+    'audit_config_is_immutable': compile_pattern(R'^\s*[^#]'),
+    'audit_log_size_is_configured': compile_pattern(R'^max_log_file\s*=\s*[0-9]+'),
+    'audit_logs_not_automatically_deleted': compile_pattern(R'^max_log_file_action\s*=\s*keep_logs'),
+    'auditd_action_mail_acct': compile_pattern(R'^action_mail_acct ='),
+    'auditd_admin_space_left_action': compile_pattern(R'^admin_space_left_action ='),
+    'auditd_space_left_action': compile_pattern(R'^space_left_action ='),
+    'auth_for_single_user_mode': compile_pattern(R'ExecStart='),
+    'bootloader_password_is_set': compile_pattern(R'^\s*GRUB2_PASSWORD'),
+    'core_dumps_hard_limit': compile_pattern(R'^\s*\*\s+hard\s+core'),
+    'core_dumps_suid_dumpable': compile_pattern(R'fs\.suid_dumpable'),
+    'etc_passwd_accounts_use_shadowed_passwords': compile_pattern(R'^[a-z-]+:x:'),
+    'etc_shadow_password_fields_are_not_empty': compile_pattern(R'^[a-z-]+::'),
+    'filesystem_integrity_regularly_checked': compile_pattern(R'^([^#]+\s+)?(\/usr\/s?bin\/|^\s*)aide(\.wrapper)?\s(--?\S+\s)*(--(check|update)|\$AIDEARGS)\b'),
+    'gpgcheck_is_activated_globally': compile_pattern(R'^\s*gpgcheck'),
+    'gpgcheck_is_activated_for_repos': compile_pattern(R'^\h*gpgcheck=[^1\n\r]+\b(\h+.*)?$'),
+    'grub_linux_entry': compile_pattern(R'^\s*linux'),
+    'journald_compress': compile_pattern(R'^\s*Compress='),
+    'journald_forward_to_syslog': compile_pattern(R'^\s*ForwardToSyslog='),
+    'journald_storage': compile_pattern(R'^\s*Storage='),
+    'ntp_server_or_pool': compile_pattern(R'^(server|pool)'),
+    'ntp_restrict_default': compile_pattern(R'^restrict.*default'),
+    'password_change_minimum_delay': compile_pattern(R'^\s*PASS_MIN_DAYS'),
+    'password_expiration_max_days': compile_pattern(R'^\s*PASS_MAX_DAYS'),
+    'password_expiration_warning': compile_pattern(R'^\s*PASS_WARN_AGE'),
+    'password_hashing_algorithm': compile_pattern(R'^\h*password\h+(sufficient|requisite|required)\h+pam_unix\.so\h+([^#\n\r]+)?sha512(\h+.*)?$'),
+    'password_reuse_pam_pwhistory': compile_pattern(R'^\s*password\s+(requisite|required)\s+pam_pwhistory\.so\s+([^#]+\s+)*remember=([5-9]|[1-9][0-9]+)\b'),
+    'password_reuse_pam_unix': compile_pattern(R'^\s*password\s+(sufficient|requisite|required)\s+pam_unix\.so\s+([^#]+\s+)*remember=([5-9]|[1-9][0-9]+)\b'),
+    'root_passwd_entry': compile_pattern(R'^root:'),
+    'rsyslog_file_create_mode': compile_pattern(R'^\$FileCreateMode'),
+    'rsyslog_remote_action': compile_pattern(R'^\s*([^#]+\s+)?action\(([^#]+\s+)?\btarget="?[^#"]+"?\b'),  # https://regex101.com/r/Ud69Ey/4
+    'rsyslog_remote_legacy': compile_pattern(R'^\s*[^#\s]*\.\*\s+@'),  # https://regex101.com/r/DMX1lZ/1
+    'shadow_password_is_set': compile_pattern(R'^[^:]+:[^!*]'),
+    'sudo_commands_use_pty': compile_pattern(R'^\s*Defaults\s+([^#]\S+,\s*)?use_pty\b', re.IGNORECASE),
+    'sudo_log_exists': compile_pattern(R'^\s*Defaults\s+([^#;]+,\s*)?logfile\s*=\s*(")?[^#;]+(")?', re.IGNORECASE),
+}
 
 
 ### Benchmarks ###
+## Each section of a benchmark is defined in its own function, so that the entries (and the CISAudit methods they reference)
+## are only built for the sections which are selected to run. Register new benchmarks in the 'benchmarks' dict below.
+def centos7_3_1_2_section_1() -> "list[dict]":
+    """CIS CentOS Linux 7 Benchmark v3.1.2, section 1: Initial Setup"""
+
+    return [
+        {'_id': "1", 'description': "Initial Setup", 'type': "header"},
+        {'_id': "1.1", 'description': "Filesystem Configuration", 'type': "header"},
+        {'_id': "1.1.1", 'description': "Disable unused filesystems", 'type': "header"},
+        {'_id': "1.1.1.1", 'description': "Ensure mounting of cramfs is disabled", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'cramfs'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.1.2", 'description': "Ensure mounting of squashfs is disabled", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'squashfs'}, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "1.1.1.3", 'description': "Ensure mounting of udf is disabled", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'udf'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.2", 'description': 'Ensure /tmp is configured', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.3", 'description': 'Ensure noexec option set on /tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'noexec', 'partition': '/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.4", 'description': 'Ensure nodev option set on /tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nodev', 'partition': '/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.5", 'description': 'Ensure nosuid option set on /tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nosuid', 'partition': '/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.6", 'description': 'Ensure /dev/shm is configured', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/dev/shm'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.7", 'description': 'Ensure noexec option set on /dev/shm partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'noexec', 'partition': '/dev/shm'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.8", 'description': 'Ensure nodev option set on /dev/shm partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nodev', 'partition': '/dev/shm'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.9", 'description': 'Ensure nosuid option set on /dev/shm partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nosuid', 'partition': '/dev/shm'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.10", 'description': 'Ensure separate partition exists for /var', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/var'}, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "1.1.11", 'description': 'Ensure separate partition exists for /var/tmp', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/var/tmp'}, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "1.1.12", 'description': 'Ensure noexec option set on /var/tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'noexec', 'partition': '/var/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.13", 'description': 'Ensure nodev option set on /var/tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nodev', 'partition': '/var/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.14", 'description': 'Ensure nosuid option set on /var/tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nosuid', 'partition': '/var/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.15", 'description': 'Ensure separate partition exists for /var/log', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/var/log'}, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "1.1.16", 'description': 'Ensure separate partition exists for /var/log/audit', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/var/log/audit'}, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "1.1.17", 'description': 'Ensure separate partition exists for /home', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/home'}, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "1.1.18", 'description': 'Ensure nodev option set on /home partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nodev', 'partition': '/home'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.19", 'description': "Ensure noexec option set on removable media partitions", 'function': CISAudit.audit_removable_partition_option_is_set, 'kwargs': {'option': 'noexec'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.20", 'description': "Ensure nodev option set on removable media partitions", 'function': CISAudit.audit_removable_partition_option_is_set, 'kwargs': {'option': 'nodev'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.21", 'description': "Ensure nosuid option set on removable media partitions", 'function': CISAudit.audit_removable_partition_option_is_set, 'kwargs': {'option': 'nosuid'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.1.22", 'description': 'Ensure sticky bit is set on all world-writable directories', 'function': CISAudit.audit_sticky_bit_on_world_writable_dirs, 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
+        {'_id': "1.1.23", 'description': "Disable Automounting", 'function': CISAudit.audit_service_is_disabled, 'kwargs': {'service': 'autofs'}, 'levels': {'server': 1, 'workstation': 2}},
+        {'_id': "1.1.24", 'description': "Disable USB Storage", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'usb-storage'}, 'levels': {'server': 1, 'workstation': 2}},
+        {'_id': "1.2", 'description': "Configure Software Updates", 'type': "header"},
+        {'_id': "1.2.1", 'description': "Ensure GPG keys are configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.2.2", 'description': "Ensure package manager repositories are configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.2.3", 'description': "Ensure gpgcheck is globally activated", 'function': CISAudit.audit_gpgcheck_is_activated, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.3", 'description': "Filesystem Integrity Checking", 'type': "header"},
+        {'_id': "1.3.1", 'description': "Ensure AIDE is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': 'aide'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.3.2", 'description': "Ensure filesystem integrity is regularly checked", 'function': CISAudit.audit_filesystem_integrity_regularly_checked, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.4", 'description': "Secure Boot Settings", 'type': "header"},
+        {'_id': "1.4.1", 'description': "Ensure bootloader password is set", 'function': CISAudit.audit_bootloader_password_is_set, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.4.2", 'description': "Ensure permissions on bootloader config are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': '/boot/grub2/grub.cfg', 'expected_user': 'root', 'expected_group': 'root', 'expected_mode': '0600'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.4.3", 'description': "Ensure authentication required for single user mode", 'function': CISAudit.audit_auth_for_single_user_mode, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.5", 'description': "Additional Process Hardening", 'type': "header"},
+        {'_id': "1.5.1", 'description': "Ensure core dumps are restricted", 'function': CISAudit.audit_core_dumps_restricted, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.5.2", 'description': 'Ensure XD/NX support is enabled', 'function': CISAudit.audit_nxdx_support_enabled, 'levels': {'server': 1, 'workstation': 1}, 'cache': {'boot': True}},
+        {'_id': "1.5.3", 'description': "Ensure address space layout randomization (ASLR) is enabled", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["kernel.randomize_va_space"], 'value': 2}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.5.4", 'description': "Ensure prelink is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'prelink'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.6", 'description': "Mandatory Access Control", 'type': "header"},
+        {'_id': "1.6.1", 'description': "Configure SELinux", 'type': "header"},
+        {'_id': "1.6.1.1", 'description': "Ensure SELinux is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': 'libselinux'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.6.1.2", 'description': "Ensure SELinux is not disabled in bootloader configuration", 'function': CISAudit.audit_selinux_not_disabled_in_bootloader, 'levels': {'server': 1, 'workstation': 1}, 'cache': {'ttl': 86400, 'files': ['/boot/grub2/grub.cfg', '/boot/efi/EFI/*/grub.cfg']}},
+        {'_id': "1.6.1.3", 'description': "Ensure SELinux policy is configured", 'function': CISAudit.audit_selinux_policy_is_configured, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.6.1.4", 'description': "Ensure the SELinux mode is enforcing or permissive", 'function': CISAudit.audit_selinux_mode_not_disabled, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.6.1.5", 'description': "Ensure the SELinux mode is enforcing", 'function': CISAudit.audit_selinux_mode_is_enforcing, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "1.6.1.6", 'description': "Ensure no unconfined services exist", 'function': CISAudit.audit_no_unconfined_services, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.6.1.7", 'description': "Ensure SETroubleshoot is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'setroubleshoot'}, 'levels': {'server': 1, 'workstation': None}},
+        {'_id': "1.6.1.8", 'description': 'Ensure the MCS Translation Service (mcstrans) is not installed', 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'mcstrans'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.7", 'description': "Command Line Warning Banners", 'type': "header"},
+        {'_id': "1.7.1", 'description': "Ensure message of the day is configured properly", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.7.2", 'description': "Ensure local login warning banner is configured properly", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.7.3", 'description': "Ensure remote login warning banner is configured properly", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.7.4", 'description': 'Ensure permissions on /etc/motd are conigured', 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': '/etc/motd', 'expected_user': 'root', 'expected_group': 'root', 'expected_mode': '0644'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.7.5", 'description': 'Ensure permissions on /etc/issue are conigured', 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': '/etc/issue', 'expected_user': 'root', 'expected_group': 'root', 'expected_mode': '0644'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.7.6", 'description': 'Ensure permissions on /etc/issue.net are conigured', 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': '/etc/issue.net', 'expected_user': 'root', 'expected_group': 'root', 'expected_mode': '0644'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.8", 'description': "Gnome Display Manager", 'type': "header"},
+        {'_id': "1.8.1", 'description': "Ensure GNOME Display Manager is removed", 'function': CISAudit.audit_package_not_installed, 'levels': {'server': 2, 'workstation': None}, 'kwargs': {'package': 'gdm'}},
+        {'_id': "1.8.2", 'description': "Ensure GDM login banner is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.8.3", 'description': "Ensure last logged in user display is disabled", 'function': CISAudit.audit_gdm_last_user_logged_in_disabled, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.8.4", 'description': "Ensure XDCMP is not enabled", 'function': CISAudit.audit_xdmcp_not_enabled, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "1.9", 'description': 'Ensure updates, patches, and additional security software are installed', 'function': CISAudit.audit_updates_installed, 'levels': {'server': 1, 'workstation': 1}, 'type': "manual", 'cache': {'ttl': 21600, 'files': ['/var/lib/rpm/Packages']}},
+    ]
+
+
+def centos7_3_1_2_section_2() -> "list[dict]":
+    """CIS CentOS Linux 7 Benchmark v3.1.2, section 2: Services"""
+
+    return [
+        {'_id': "2", 'description': "Services", 'type': "header"},
+        {'_id': "2.1", 'description': "inetd Services", 'type': "header"},
+        {'_id': "2.1.1", 'description': "Ensure xinetd is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'xinetd'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2", 'description': "Special Purpose Services", 'type': "header"},
+        {'_id': "2.2.1", 'description': "Time Synchronization", 'type': "header"},
+        {'_id': "2.2.1.1", 'description': "Ensure time synchronisation is in use", 'function': CISAudit.audit_only_one_package_is_installed, 'kwargs': {'packages': "chrony ntp"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.1.2", 'description': "Ensure chrony is configured", 'function': CISAudit.audit_chrony_is_configured, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.1.3", 'description': "Ensure ntp is configured", 'function': CISAudit.audit_ntp_is_configured, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.2", 'description': 'Ensure X11 Server components are not installed', 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'xorg-x11-server*'}, 'levels': {'server': 1, 'workstation': None}},
+        {'_id': "2.2.3", 'description': "Ensure Avahi Server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'avahi*'}, 'levels': {'server': 1, 'workstation': 2}},
+        {'_id': "2.2.4", 'description': "Ensure CUPS is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'cups'}, 'levels': {'server': 1, 'workstation': None}},
+        {'_id': "2.2.5", 'description': "Ensure DHCP Server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'dhcp'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.6", 'description': "Ensure LDAP server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'openldap-servers'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.7", 'description': "Ensure DNS server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'bind'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.8", 'description': "Ensure FTP server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'vsftpd'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.9", 'description': "Ensure HTTP server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'httpd'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.10", 'description': 'Ensure IMAP and POP3 server is not installed', 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'dovecot'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.11", 'description': "Ensure Samba is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'samba'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.12", 'description': "Ensure HTTP Proxy server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'squid'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.13", 'description': 'Ensure net-snmp is not installed', 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'net-snmp'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.14", 'description': "Ensure NIS server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'ypserv'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.15", 'description': 'Ensure telnet-server is not installed', 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'telnet-server'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.16", 'description': 'Ensure mail transfer agent is configured for local-only mode', 'function': CISAudit.audit_mta_is_localhost_only, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.17", 'description': 'Ensure nfs-utils is not installed or the nfs-server service is masked', 'function': CISAudit.audit_package_not_installed_or_service_is_masked, 'kwargs': {'package': "nfsutils", 'service': "nfs-server"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.18", 'description': "Ensure rpcbind is not installed or the rpcbind service is masked", 'function': CISAudit.audit_package_not_installed_or_service_is_masked, 'kwargs': {'package': "rpcbind", 'service': "rpcbind"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.2.19", 'description': "Ensure rsync is not installed or the rsyncd service is masked", 'function': CISAudit.audit_package_not_installed_or_service_is_masked, 'kwargs': {'package': "rsync", 'service': "rsyncd"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.3", 'description': "Service Clients", 'type': "header"},
+        {'_id': "2.3.1", 'description': "Ensure NIS client is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'ypcbind'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.3.2", 'description': "Ensure rsh client is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'rsh'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.3.3", 'description': "Ensure talk client is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'talk'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.3.4", 'description': "Ensure telnet client is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'telnet'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.3.5", 'description': "Ensure LDAP client is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'openldap-clients'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "2.4", 'description': 'Ensure non-essential services are removed or masked', 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
+    ]
+
+
+def centos7_3_1_2_section_3() -> "list[dict]":
+    """CIS CentOS Linux 7 Benchmark v3.1.2, section 3: Network Configuration"""
+
+    return [
+        {'_id': "3", 'description': "Network Configuration", 'type': "header"},
+        {'_id': "3.1", 'description': "Disable unused network protocols and devices", 'type': "header"},
+        {'_id': "3.1.1", 'description': "Disable IPv6", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv6.conf.all.disaable_ipv6", "net.ipv6.conf.default.disable_ipv6"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.1.2", 'description': "Ensure wireless interfaces are disabled", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'wireless-tools'}, 'levels': {'server': 1, 'workstation': 2}},
+        {'_id': "3.2", 'description': 'Network Parameters (Host Only)', 'type': "header"},
+        {'_id': "3.2.1", 'description': "Ensure IP forwarding is disabled", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.ip_forward", "net.ipv6.conf.all.forwarding", "net.ipv6.conf.default.forwarding"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.2.2", 'description': "Ensure packet redirect sending is disabled", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.send_redirects", "net.ipv4.conf.default.send_redirects"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.3", 'description': "Network Parameters (Host and Router", 'type': "header"},
+        {'_id': "3.3.1", 'description': "Ensure source routed packets are not accepted", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.accept_source_route", "net.ipv4.conf.default.accept_source_route", "net.ipv6.conf.all.accept_source_route", "net.ipv6.conf.default.accept_source_route"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.3.2", 'description': "Ensure ICMP redirects are not accepted", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.accept_redirects", "net.ipv4.conf.default.accept_redirects", "net.ipv6.conf.all.accept_redirects", "net.ipv6.conf.default.accept_redirects"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.3.3", 'description': "Ensure secure ICMP redirects are not accepted", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.secure_redirects", "net.ipv4.conf.default.secure_redirects"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.3.4", 'description': "Ensure suspicious packets are logged", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.log_martians", "net.ipv4.conf.default.log_martians"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.3.5", 'description': "Ensure broadcast ICMP requests are ignored", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.icmp_echo_ignore_broadcasts"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.3.6", 'description': "Ensure bogus ICMP responses are ignored", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.icmp_ignore_bogus_error_responses"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.3.7", 'description': "Ensure Reverse Path Filtering is enabled", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.rp_filter", "net.ipv4.conf.default.rp_filter"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.3.8", 'description': "Ensure TCP SYN Cookies is enabled", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.tcp_syncookies"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.3.9", 'description': "Ensure IPv6 router advertisments are not accepted", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv6.conf.all.accept_ra", "net.ipv6.conf.default.accept_ra"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.4", 'description': "Uncommon Network Protocols", 'type': "header"},
+        {'_id': "3.4.1", 'description': "Ensure DCCP is disabled", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'dccp'}, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "3.4.1", 'description': "Ensure SCTP is disabled", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'sctp'}, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "3.5", 'description': "Firewall Configuration", 'type': "header"},
+        {'_id': "3.5.1", 'description': "Configure firewalld", 'type': "header"},
+        {'_id': "3.5.1.1", 'description': "Ensure firewalld is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': "firewalld"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.1.2", 'description': "Ensure iptables-services not installed with firewalld", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "iptables-services"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.1.3", 'description': "Ensure nftables not installed with firewalld", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "nftables"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.1.4", 'description': "Ensure firewalld service enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'kwargs': {'service': "firewalld"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.1.5", 'description': "Ensure firewalld default zone is set", 'function': CISAudit.audit_firewalld_default_zone_is_set, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.1.6", 'description': "Ensure network interfaces are assigned to appropriate zone", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
+        {'_id': "3.5.1.7", 'description': "Ensure firewalld drops unnecessary services and ports", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
+        {'_id': "3.5.2", 'description': "Configure nftables", 'type': "header"},
+        {'_id': "3.5.2.1", 'description': "Ensure nftables is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': "nftables"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.2.2", 'description': "Ensure firewalld is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "firewalld"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.2.3", 'description': "Ensure iptables-services not installed with nftables", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "iptables-services"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.2.4", 'description': "Ensure iptables are flushed with nftables", 'function': CISAudit.audit_iptables_is_flushed, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.2.5", 'description': "Ensure an nftables table exists", 'function': CISAudit.audit_nftables_table_exists, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.2.6", 'description': "Ensure nftables base chains exist", 'function': CISAudit.audit_nftables_base_chains_exist, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.2.7", 'description': "Ensure nftables loopback traffic is configured", 'function': CISAudit.audit_nftables_loopback_is_configured, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.2.8", 'description': "Ensure nftables outbound and establishe dconnections are configured", 'function': CISAudit.audit_nftables_outbound_and_established_connections, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.2.9", 'description': "Ensure nftables default deny firewall policy exists", 'function': CISAudit.audit_nftables_default_deny_policy, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.2.10", 'description': "Ensure nftables service is enabled", 'function': CISAudit.audit_service_is_enabled, 'kwargs': {'service': "nftables"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.2.11", 'description': "Ensure nftables rules are permanent", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3", 'description': "Configure iptables", 'type': "header"},
+        {'_id': "3.5.3.1", 'description': "Configure iptables software", 'type': "header"},
+        {'_id': "3.5.3.1.1", 'description': "Ensure iptables-services is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': "iptables-services"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.1.2", 'description': "Ensure nftables is not installed with iptables", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "nftables"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.1.3", 'description': "Ensure firewalld is not installed with iptables", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "firewalld"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.2", 'description': "Configure IPv4 iptables", 'type': "header"},
+        {'_id': "3.5.3.2.1", 'description': "Ensure iptables loopback traffic is configured", 'function': CISAudit.audit_iptables_loopback_is_configured, 'kwargs': {'ip_version': 'ipv4'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.2.2", 'description': "Ensure iptables outbound and established connections are configured", 'function': CISAudit.audit_iptables_outbound_and_established_connections, 'kwargs': {'ip_version': 'ipv4'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.2.2", 'description': "Ensure iptables rules exist for all open ports", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
+        {'_id': "3.5.3.2.4", 'description': "Ensure iptables default deny firewall policy", 'function': CISAudit.audit_iptables_default_deny_policy, 'kwargs': {'ip_version': 'ipv4'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.2.5", 'description': "Ensure iptables rules are saved", 'function': CISAudit.audit_iptables_rules_are_saved, 'kwargs': {'ip_version': 'ipv4'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.2.6", 'description': "Ensure iptables is enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'kwargs': {'service': 'iptables'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.3", 'description': "Configure IPv6 ip6tables", 'type': "header"},
+        {'_id': "3.5.3.3.1", 'description': "Ensure ip6tables loopback traffic is configured", 'function': CISAudit.audit_iptables_loopback_is_configured, 'kwargs': {'ip_version': 'ipv6'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.3.2", 'description': "Ensure ip6tables outbound and established connections are configured", 'function': CISAudit.audit_iptables_outbound_and_established_connections, 'kwargs': {'ip_version': 'ipv6'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.3.2", 'description': "Ensure ip6tables rules exist for all open ports", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
+        {'_id': "3.5.3.3.4", 'description': "Ensure ip6tables default deny firewall policy", 'function': CISAudit.audit_iptables_default_deny_policy, 'kwargs': {'ip_version': 'ipv6'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.3.5", 'description': "Ensure ip6tables rules are saved", 'function': CISAudit.audit_iptables_rules_are_saved, 'kwargs': {'ip_version': 'ipv6'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "3.5.3.3.6", 'description': "Ensure ip6tables is enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'kwargs': {'service': 'ip6tables'}, 'levels': {'server': 1, 'workstation': 1}},
+    ]
+
+
+def centos7_3_1_2_section_4() -> "list[dict]":
+    """CIS CentOS Linux 7 Benchmark v3.1.2, section 4: Logging and Auditing"""
+
+    return [
+        {'_id': "4", 'description': "Logging and Auditing", 'type': "header"},
+        {'_id': "4.1", 'description': "Configure System Accounting (auditd)", 'type': "header"},
+        {'_id': "4.1.1", 'description': "Ensure auditing is enabled", 'type': "header"},
+        {'_id': "4.1.1.1", 'description': "Ensure auditd is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': 'audit'}, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.1.2", 'description': "Ensure auditd service is enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'kwargs': {'service': "auditd"}, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.1.3", 'description': "Ensure auditing for processes that start prior to auditd is enabled", 'function': CISAudit.audit_auditing_for_processes_prior_to_start_is_enabled, 'levels': {'server': 2, 'workstation': 2}, 'cache': {'ttl': 86400, 'files': ['/boot/grub2/grub.cfg', '/boot/efi/EFI/*/grub.cfg']}},
+        {'_id': "4.1.2", 'description': "Configure Data Retention", 'type': "header"},
+        {'_id': "4.1.2.1", 'description': "Ensure audit log storage size is configured", 'function': CISAudit.audit_audit_log_size_is_configured, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.2.2", 'description': "Ensure audit logs are not automatically deleted", 'function': CISAudit.audit_audit_logs_not_automatically_deleted, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.2.3", 'description': "Ensure system is disabled when audit logs are full", 'function': CISAudit.audit_system_is_disabled_when_audit_logs_are_full, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.2.4", 'description': "Ensure audit_backlog_limit is sufficient", 'function': None, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.3", 'description': "Ensure events that modify date and time information are collected", 'function': CISAudit.audit_events_that_modify_datetime_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.4", 'description': "Ensure events that modify user/group information are collected", 'function': CISAudit.audit_events_that_modify_usergroup_info_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.5", 'description': "Ensure events that modify the system's network environment are collected", 'function': CISAudit.audit_events_that_modify_network_environment_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.6", 'description': "Ensure events tat modify the system's Mandatory Access Controls are collected", 'function': CISAudit.audit_events_that_modify_mandatory_access_controls_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.7", 'description': "Ensure login and logout events are collected", 'function': CISAudit.audit_events_for_login_and_logout_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.8", 'description': "Ensure session initiation information is collected", 'function': CISAudit.audit_events_for_discretionary_access_control_changes_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.9", 'description': "Ensure discretionary access control permissions modification events are collected", 'function': CISAudit.audit_events_for_discretionary_access_control_changes_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.10", 'description': "Ensure unsuccessful unauthorized file access attempts are collected", 'function': CISAudit.audit_events_for_unsuccessful_file_access_attempts_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.11", 'description': "Ensure use of privileged commands is collected", 'function': None, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.12", 'description': "Ensure successful file system mounts are collected", 'function': CISAudit.audit_events_for_successful_file_system_mounts_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.13", 'description': "Ensure file deletion events by users are collected", 'function': CISAudit.audit_events_for_file_deletion_by_users_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.14", 'description': "Ensure changes to system administration scope (sudoers) is collected", 'function': CISAudit.audit_events_for_changes_to_sysadmin_scope_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.15", 'description': "Ensure system administrator command executions (sudo)are collected", 'function': CISAudit.audit_events_for_system_administrator_commands_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.16", 'description': "Ensure kernel module loading and unloading is collected", 'function': CISAudit.audit_events_for_kernel_module_loading_and_unloading_are_collected, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.1.17", 'description': "Ensure the audit configuration is immutable", 'function': CISAudit.audit_audit_config_is_immutable, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "4.2", 'description': "Configure Logging", 'type': "header"},
+        {'_id': "4.2.1", 'description': "Configure rsyslog", 'type': "header"},
+        {'_id': "4.2.1.1", 'description': "Ensure rsyslog is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': "rsyslog"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "4.2.1.2", 'description': "Ensure rsyslog service is enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'levels': {'server': 1, 'workstation': 1}, 'kwargs': {'service': 'rsyslog'}},
+        {'_id': "4.2.1.3", 'description': "Ensure rsyslog default file permissions configured", 'function': CISAudit.audit_rsyslog_default_file_permission_is_configured, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "4.2.1.4", 'description': "Ensure logging is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "4.2.1.5", 'description': "Ensure rsyslog is configured to send logs to a remote log host", 'function': CISAudit.audit_rsyslog_sends_logs_to_a_remote_log_host, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "4.2.1.6", 'description': "Ensure remote rsyslog messages are only accepted on designated log hosts", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "4.2.2", 'description': "Configure journald", 'type': "header"},
+        {'_id': "4.2.2.1", 'description': "Ensure journald is configured to send logs to rsyslog", 'function': CISAudit.audit_journald_configured_to_send_logs_to_rsyslog, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "4.2.2.2", 'description': "Ensure journald is configured to compress large log files", 'function': CISAudit.audit_journald_configured_to_compress_large_logs, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "4.2.2.3", 'description': "Ensure journald is configured to write logfiles to persistent disk", 'function': CISAudit.audit_journald_configured_to_write_logfiles_to_disk, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "4.2.3", 'description': "Ensure permissions on all logfiles are configured", 'function': CISAudit.audit_permissions_on_log_files, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "4.2.4", 'description': "Ensure logrotate is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+    ]
+
+
+def centos7_3_1_2_section_5() -> "list[dict]":
+    """CIS CentOS Linux 7 Benchmark v3.1.2, section 5: Access, Authentication and Authorization"""
+
+    return [
+        {'_id': "5", 'description': "Access, Authentication and Authorization", 'type': "header"},
+        {'_id': "5.1", 'description': "Configure time-based job schedulers", 'type': "header"},
+        {'_id': "5.1.1", 'description': "Ensure cron daemon is enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'kwargs': {'service': 'crond'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.1.2", 'description': "Ensure permissions on /etc/crontab are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/crontab", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0600"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.1.3", 'description': "Ensure permissions on /etc/cron.hourly are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/cron.hourly", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0700"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.1.4", 'description': "Ensure permissions on /etc/cron.daily are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/cron.daily", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0700"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.1.5", 'description': "Ensure permissions on /etc/cron.weekly are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/cron.weekly", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0700"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.1.6", 'description': "Ensure permissions on /etc/cron.monthly are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/cron.monthly", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0700"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.1.7", 'description': "Ensure permissions on /etc/cron.d are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/cron.d", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0700"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.1.8", 'description': "Ensure cron is restricted to authorized users", 'function': CISAudit.audit_cron_is_restricted_to_authorized_users, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.1.9", 'description': "Ensure at is restricted to authorized users", 'function': CISAudit.audit_at_is_restricted_to_authorized_users, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.2", 'description': "Configure sudo", 'type': "header"},
+        {'_id': "5.2.1", 'description': "Ensure sudo is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': 'sudo'}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.2.2", 'description': "Ensure sudo commands use pty", 'function': CISAudit.audit_sudo_commands_use_pty, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.2.3", 'description': "Ensure sudo log file exists", 'function': CISAudit.audit_sudo_log_exists, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3", 'description': "Configure SSH Server", 'type': "header"},
+        {'_id': "5.3.1", 'description': "Ensure permissions on /etc.ssh/sshd_config are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/ssh/sshd_config", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0600"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.2", 'description': "Ensure permissions on SSH private host key files are configured", 'function': CISAudit.audit_permissions_on_private_host_key_files, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.3", 'description': "Ensure permissions on SSH public host key files are configures", 'function': CISAudit.audit_permissions_on_public_host_key_files, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.4", 'description': "Ensure SSH access is limited", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.5", 'description': "Ensure SSH LogLevel is appropriate", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.6", 'description': "Ensure SSH X11 forwarding is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "x11forwarding", 'expected_value': "no"}, 'levels': {'server': 2, 'workstation': 1}},
+        {'_id': "5.3.7", 'description': "Ensure SSH MaxAuthTries is set to 4 or less", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "maxauthtries", 'expected_value': "4", 'comparison': "le"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.8", 'description': "Ensure SSH IgnoreRhosts is enabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "ignorerhosts", 'expected_value': "yes"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.9", 'description': "Ensure SSH HostbasedAuthentication is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "hostbasedauthentication", 'expected_value': "no"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.10", 'description': "Ensure SSH root login is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "permitrootlogin", 'expected_value': "no"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.11", 'description': "Ensure SSH PermitEmptyPasswords is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "permitemptypasswords", 'expected_value': "no"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.12", 'description': "Ensure SSH PermitUserEnvironment is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "permituserenvironment", 'expected_value': "no"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.13", 'description': "Ensure only strong Ciphers are used", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.14", 'description': "Ensure only strong MAC algorithms are used", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.15", 'description': "Ensure only strong Key Exchange algorithms are used", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.12", 'description': "Ensure SSH Idle Timeout Interval is configured", 'type': "header"},
+        {'_id': "5.3.12.1", 'description': "Ensure SSH ClientAliveInterval is 900 or less", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "clientaliveinterval", 'expected_value': "900", 'comparison': "le"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.12.2", 'description': "Ensure SSH ClientAliveCountMax is 0", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "clientalivecountmax", 'expected_value': "0"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.17", 'description': "Ensure SSH LoginGraceTime is set to one minute or less", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "logingracetime", 'expected_value': "60", 'comparison': "le"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.18", 'description': "Ensure SSH warning banner is configured", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "banner", 'expected_value': "/etc/issue.net"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.19", 'description': "Ensure SSH PAM is enabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "usepam", 'expected_value': "yes"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.20", 'description': "Ensure SSH AllowTcpForwarding is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "allowtcpforwarding", 'expected_value': "no"}, 'levels': {'server': 2, 'workstation': 2}},
+        {'_id': "5.3.21", 'description': "Ensure SSH MaxStartups is configured", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "maxstartups", 'expected_value': "10:30:60"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.3.22", 'description': "Ensure SSH MaxSessions is limited", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "maxsessions", 'expected_value': "10", 'comparison': "le"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.4", 'description': "Configure PAM", 'type': "header"},
+        {'_id': "5.4.1", 'description': "Ensure password creation requirements are configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.4.2", 'description': "Ensure lockout for failed password attempts is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.4.3", 'description': "Ensure password hashing algorithm is SHA512", 'function': CISAudit.audit_password_hashing_algorithm, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.4.4", 'description': "Ensure password reuse is limited", 'function': CISAudit.audit_password_reuse_is_limited, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.5", 'description': "User Accounts and Environment", 'type': "header"},
+        {'_id': "5.5.1", 'description': "Set Shadow Password Suite Parameters", 'type': "header"},
+        {'_id': "5.5.1.1", 'description': "Ensure password expiration is 365 days or less", 'function': CISAudit.audit_password_expiration_max_days_is_configured, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.5.1.2", 'description': "Ensure minimum days between password changes is configured", 'function': CISAudit.audit_password_change_minimum_delay, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.5.1.3", 'description': "Ensure password expiration warning days is 7 or more", 'function': CISAudit.audit_password_expiration_warning_is_configured, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.5.1.4", 'description': "Ensure inactive password lock is 30 days or less", 'function': CISAudit.audit_password_inactive_lock_is_configured, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.5.1.5", 'description': "Ensure all users last password change date is in the past", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.5.2", 'description': "Ensure system accounts are secured", 'function': CISAudit.audit_system_accounts_are_secured, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.5.3", 'description': "Ensure default group for the root account is GID 0", 'function': CISAudit.audit_default_group_for_root, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.5.4", 'description': "Ensure default shell timeout is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.5.5", 'description': "Ensure default user umask is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "5.6", 'description': "Ensure root login is restricted to system console", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
+        {'_id': "5.7", 'description': "Ensure access to the su command is restricted", 'function': CISAudit.audit_access_to_su_command_is_restricted, 'levels': {'server': 1, 'workstation': 1}},
+    ]
+
+
+def centos7_3_1_2_section_6() -> "list[dict]":
+    """CIS CentOS Linux 7 Benchmark v3.1.2, section 6: System Maintenance"""
+
+    return [
+        {'_id': "6", 'description': "System Maintenance", 'type': "header"},
+        {'_id': "6.1", 'description': "System File Permissions", 'type': "header"},
+        {'_id': "6.1.1", 'description': "Audit system file permissions", 'levels': {'server': 2, 'workstation': 2}, 'type': "manual"},
+        {'_id': "6.1.2", 'description': "Ensure permissions on /etc/passwd are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/passwd", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0644"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.1.3", 'description': "Ensure permissions on /etc/passwd- are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/passwd-", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0644"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.1.4", 'description': "Ensure permissions on /etc/shadow are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/shadow", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0000"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.1.5", 'description': "Ensure permissions on /etc/shadow- are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/shadow-", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0000"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.1.6", 'description': "Ensure permissions on /etc/gshadow- are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/gshadow-", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0000"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.1.7", 'description': "Ensure permissions on /etc/gshadow are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/gshadow", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0000"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.1.8", 'description': "Ensure permissions on /etc/group are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/group", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0644"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.1.9", 'description': "Ensure permissions on /etc/group- are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/group-", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0644"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.1.10", 'description': "Ensure no world writable files exist", 'function': CISAudit.audit_no_world_writable_files, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.1.11", 'description': "Ensure no unowned files or directories exist", 'function': CISAudit.audit_no_unowned_files_or_dirs, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.1.12", 'description': "Ensure no ungrouped files or directories exist", 'function': CISAudit.audit_no_ungrouped_files_or_dirs, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.1.13", 'description': "Audit SUID executables", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
+        {'_id': "6.1.14", 'description': "Audit SGID executables", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
+        {'_id': "6.2", 'description': "User and Group Settings", 'type': "header"},
+        {'_id': "6.2.1", 'description': "Ensure accounts in /etc/passwd use shadowed passwords", 'function': CISAudit.audit_etc_passwd_accounts_use_shadowed_passwords, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.2", 'description': "Ensure /etc/shadow password fields are not empty", 'function': CISAudit.audit_etc_shadow_password_fields_are_not_empty, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.3", 'description': "Ensure all groups in /etc/passwd exist in /etc/group", 'function': CISAudit.audit_etc_passwd_gids_exist_in_etc_group, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.4", 'description': "Ensure shadow group is empty", 'function': CISAudit.audit_shadow_group_is_empty, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.5", 'description': "Ensure no duplicate user names exist", 'function': CISAudit.audit_duplicate_user_names, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.6", 'description': "Ensure no duplicate group names exist", 'function': CISAudit.audit_duplicate_group_names, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.7", 'description': "Ensure no duplicate UIDs exist", 'function': CISAudit.audit_duplicate_uids, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.8", 'description': "Ensure no duplicate GIDs exist", 'function': CISAudit.audit_duplicate_gids, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.9", 'description': "Ensure root is the only UID 0 account", 'function': CISAudit.audit_root_is_only_uid_0_account, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.10", 'description': "Ensure root PATH integrity", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
+        {'_id': "6.2.11", 'description': "Ensure all users' home directories exist", 'function': CISAudit.audit_homedirs_exist, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.12", 'description': "Ensure users own their home directories", 'function': CISAudit.audit_homedirs_ownership, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.13", 'description': "Ensure users' home directory permissions are 750 or more restrictive", 'function': CISAudit.audit_homedirs_permissions, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.14", 'description': "Ensure users' dot files are not group or world writable", 'function': CISAudit.audit_homedirs_dot_files_permissions, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.15", 'description': "Ensure no users have .forward files", 'function': CISAudit.audit_homedirs_file_does_not_exist, 'kwargs': {'file': ".forward"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.16", 'description': "Ensure no users have .netrc files", 'function': CISAudit.audit_homedirs_file_does_not_exist, 'kwargs': {'file': ".netrc"}, 'levels': {'server': 1, 'workstation': 1}},
+        {'_id': "6.2.17", 'description': "Ensure no users have .rhosts files", 'function': CISAudit.audit_homedirs_file_does_not_exist, 'kwargs': {'file': ".rhosts"}, 'levels': {'server': 1, 'workstation': 1}},
+    ]
+
+
 benchmarks = {
     'centos7': {
-        '3.1.2': [
-            {'_id': "1", 'description': "Initial Setup", 'type': "header"},
-            {'_id': "1.1", 'description': "Filesystem Configuration", 'type': "header"},
-            {'_id': "1.1.1", 'description': "Disable unused filesystems", 'type': "header"},
-            {'_id': "1.1.1.1", 'description': "Ensure mounting of cramfs is disabled", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'cramfs'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.1.2", 'description': "Ensure mounting of squashfs is disabled", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'squashfs'}, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "1.1.1.3", 'description': "Ensure mounting of udf is disabled", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'udf'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.2", 'description': 'Ensure /tmp is configured', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.3", 'description': 'Ensure noexec option set on /tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'noexec', 'partition': '/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.4", 'description': 'Ensure nodev option set on /tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nodev', 'partition': '/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.5", 'description': 'Ensure nosuid option set on /tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nosuid', 'partition': '/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.6", 'description': 'Ensure /dev/shm is configured', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/dev/shm'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.7", 'description': 'Ensure noexec option set on /dev/shm partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'noexec', 'partition': '/dev/shm'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.8", 'description': 'Ensure nodev option set on /dev/shm partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nodev', 'partition': '/dev/shm'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.9", 'description': 'Ensure nosuid option set on /dev/shm partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nosuid', 'partition': '/dev/shm'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.10", 'description': 'Ensure separate partition exists for /var', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/var'}, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "1.1.11", 'description': 'Ensure separate partition exists for /var/tmp', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/var/tmp'}, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "1.1.12", 'description': 'Ensure noexec option set on /var/tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'noexec', 'partition': '/var/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.13", 'description': 'Ensure nodev option set on /var/tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nodev', 'partition': '/var/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.14", 'description': 'Ensure nosuid option set on /var/tmp partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nosuid', 'partition': '/var/tmp'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.15", 'description': 'Ensure separate partition exists for /var/log', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/var/log'}, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "1.1.16", 'description': 'Ensure separate partition exists for /var/log/audit', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/var/log/audit'}, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "1.1.17", 'description': 'Ensure separate partition exists for /home', 'function': CISAudit.audit_partition_is_separate, 'kwargs': {'partition': '/home'}, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "1.1.18", 'description': 'Ensure nodev option set on /home partition', 'function': CISAudit.audit_partition_option_is_set, 'kwargs': {'option': 'nodev', 'partition': '/home'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.19", 'description': "Ensure noexec option set on removable media partitions", 'function': CISAudit.audit_removable_partition_option_is_set, 'kwargs': {'option': 'noexec'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.20", 'description': "Ensure nodev option set on removable media partitions", 'function': CISAudit.audit_removable_partition_option_is_set, 'kwargs': {'option': 'nodev'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.21", 'description': "Ensure nosuid option set on removable media partitions", 'function': CISAudit.audit_removable_partition_option_is_set, 'kwargs': {'option': 'nosuid'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.1.22", 'description': 'Ensure sticky bit is set on all world-writable directories', 'function': CISAudit.audit_sticky_bit_on_world_writable_dirs, 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
-            {'_id': "1.1.23", 'description': "Disable Automounting", 'function': CISAudit.audit_service_is_disabled, 'kwargs': {'service': 'autofs'}, 'levels': {'server': 1, 'workstation': 2}},
-            {'_id': "1.1.24", 'description': "Disable USB Storage", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'usb-storage'}, 'levels': {'server': 1, 'workstation': 2}},
-            {'_id': "1.2", 'description': "Configure Software Updates", 'type': "header"},
-            {'_id': "1.2.1", 'description': "Ensure GPG keys are configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.2.2", 'description': "Ensure package manager repositories are configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.2.3", 'description': "Ensure gpgcheck is globally activated", 'function': CISAudit.audit_gpgcheck_is_activated, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.3", 'description': "Filesystem Integrity Checking", 'type': "header"},
-            {'_id': "1.3.1", 'description': "Ensure AIDE is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': 'aide'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.3.2", 'description': "Ensure filesystem integrity is regularly checked", 'function': CISAudit.audit_filesystem_integrity_regularly_checked, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.4", 'description': "Secure Boot Settings", 'type': "header"},
-            {'_id': "1.4.1", 'description': "Ensure bootloader password is set", 'function': CISAudit.audit_bootloader_password_is_set, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.4.2", 'description': "Ensure permissions on bootloader config are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': '/boot/grub2/grub.cfg', 'expected_user': 'root', 'expected_group': 'root', 'expected_mode': '0600'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.4.3", 'description': "Ensure authentication required for single user mode", 'function': CISAudit.audit_auth_for_single_user_mode, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.5", 'description': "Additional Process Hardening", 'type': "header"},
-            {'_id': "1.5.1", 'description': "Ensure core dumps are restricted", 'function': CISAudit.audit_core_dumps_restricted, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.5.2", 'description': 'Ensure XD/NX support is enabled', 'function': CISAudit.audit_nxdx_support_enabled, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.5.3", 'description': "Ensure address space layout randomization (ASLR) is enabled", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["kernel.randomize_va_space"], 'value': 2}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.5.4", 'description': "Ensure prelink is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'prelink'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.6", 'description': "Mandatory Access Control", 'type': "header"},
-            {'_id': "1.6.1", 'description': "Configure SELinux", 'type': "header"},
-            {'_id': "1.6.1.1", 'description': "Ensure SELinux is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': 'libselinux'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.6.1.2", 'description': "Ensure SELinux is not disabled in bootloader configuration", 'function': CISAudit.audit_selinux_not_disabled_in_bootloader, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.6.1.3", 'description': "Ensure SELinux policy is configured", 'function': CISAudit.audit_selinux_policy_is_configured, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.6.1.4", 'description': "Ensure the SELinux mode is enforcing or permissive", 'function': CISAudit.audit_selinux_mode_not_disabled, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.6.1.5", 'description': "Ensure the SELinux mode is enforcing", 'function': CISAudit.audit_selinux_mode_is_enforcing, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "1.6.1.6", 'description': "Ensure no unconfined services exist", 'function': CISAudit.audit_no_unconfined_services, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.6.1.7", 'description': "Ensure SETroubleshoot is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'setroubleshoot'}, 'levels': {'server': 1, 'workstation': None}},
-            {'_id': "1.6.1.8", 'description': 'Ensure the MCS Translation Service (mcstrans) is not installed', 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'mcstrans'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.7", 'description': "Command Line Warning Banners", 'type': "header"},
-            {'_id': "1.7.1", 'description': "Ensure message of the day is configured properly", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.7.2", 'description': "Ensure local login warning banner is configured properly", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.7.3", 'description': "Ensure remote login warning banner is configured properly", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.7.4", 'description': 'Ensure permissions on /etc/motd are conigured', 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': '/etc/motd', 'expected_user': 'root', 'expected_group': 'root', 'expected_mode': '0644'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.7.5", 'description': 'Ensure permissions on /etc/issue are conigured', 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': '/etc/issue', 'expected_user': 'root', 'expected_group': 'root', 'expected_mode': '0644'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.7.6", 'description': 'Ensure permissions on /etc/issue.net are conigured', 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': '/etc/issue.net', 'expected_user': 'root', 'expected_group': 'root', 'expected_mode': '0644'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.8", 'description': "Gnome Display Manager", 'type': "header"},
-            {'_id': "1.8.1", 'description': "Ensure GNOME Display Manager is removed", 'function': CISAudit.audit_package_not_installed, 'levels': {'server': 2, 'workstation': None}, 'kwargs': {'package': 'gdm'}},
-            {'_id': "1.8.2", 'description': "Ensure GDM login banner is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.8.3", 'description': "Ensure last logged in user display is disabled", 'function': CISAudit.audit_gdm_last_user_logged_in_disabled, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.8.4", 'description': "Ensure XDCMP is not enabled", 'function': CISAudit.audit_xdmcp_not_enabled, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "1.9", 'description': 'Ensure updates, patches, and additional security software are installed', 'function': CISAudit.audit_updates_installed, 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
-            {'_id': "2", 'description': "Services", 'type': "header"},
-            {'_id': "2.1", 'description': "inetd Services", 'type': "header"},
-            {'_id': "2.1.1", 'description': "Ensure xinetd is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'xinetd'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2", 'description': "Special Purpose Services", 'type': "header"},
-            {'_id': "2.2.1", 'description': "Time Synchronization", 'type': "header"},
-            {'_id': "2.2.1.1", 'description': "Ensure time synchronisation is in use", 'function': CISAudit.audit_only_one_package_is_installed, 'kwargs': {'packages': "chrony ntp"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.1.2", 'description': "Ensure chrony is configured", 'function': CISAudit.audit_chrony_is_configured, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.1.3", 'description': "Ensure ntp is configured", 'function': CISAudit.audit_ntp_is_configured, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.2", 'description': 'Ensure X11 Server components are not installed', 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'xorg-x11-server*'}, 'levels': {'server': 1, 'workstation': None}},
-            {'_id': "2.2.3", 'description': "Ensure Avahi Server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'avahi*'}, 'levels': {'server': 1, 'workstation': 2}},
-            {'_id': "2.2.4", 'description': "Ensure CUPS is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'cups'}, 'levels': {'server': 1, 'workstation': None}},
-            {'_id': "2.2.5", 'description': "Ensure DHCP Server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'dhcp'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.6", 'description': "Ensure LDAP server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'openldap-servers'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.7", 'description': "Ensure DNS server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'bind'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.8", 'description': "Ensure FTP server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'vsftpd'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.9", 'description': "Ensure HTTP server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'httpd'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.10", 'description': 'Ensure IMAP and POP3 server is not installed', 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'dovecot'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.11", 'description': "Ensure Samba is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'samba'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.12", 'description': "Ensure HTTP Proxy server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'squid'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.13", 'description': 'Ensure net-snmp is not installed', 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'net-snmp'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.14", 'description': "Ensure NIS server is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'ypserv'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.15", 'description': 'Ensure telnet-server is not installed', 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'telnet-server'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.16", 'description': 'Ensure mail transfer agent is configured for local-only mode', 'function': CISAudit.audit_mta_is_localhost_only, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.17", 'description': 'Ensure nfs-utils is not installed or the nfs-server service is masked', 'function': CISAudit.audit_package_not_installed_or_service_is_masked, 'kwargs': {'package': "nfsutils", 'service': "nfs-server"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.18", 'description': "Ensure rpcbind is not installed or the rpcbind service is masked", 'function': CISAudit.audit_package_not_installed_or_service_is_masked, 'kwargs': {'package': "rpcbind", 'service': "rpcbind"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.2.19", 'description': "Ensure rsync is not installed or the rsyncd service is masked", 'function': CISAudit.audit_package_not_installed_or_service_is_masked, 'kwargs': {'package': "rsync", 'service': "rsyncd"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.3", 'description': "Service Clients", 'type': "header"},
-            {'_id': "2.3.1", 'description': "Ensure NIS client is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'ypcbind'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.3.2", 'description': "Ensure rsh client is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'rsh'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.3.3", 'description': "Ensure talk client is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'talk'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.3.4", 'description': "Ensure telnet client is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'telnet'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.3.5", 'description': "Ensure LDAP client is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'openldap-clients'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "2.4", 'description': 'Ensure non-essential services are removed or masked', 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
-            {'_id': "3", 'description': "Network Configuration", 'type': "header"},
-            {'_id': "3.1", 'description': "Disable unused network protocols and devices", 'type': "header"},
-            {'_id': "3.1.1", 'description': "Disable IPv6", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv6.conf.all.disaable_ipv6", "net.ipv6.conf.default.disable_ipv6"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.1.2", 'description': "Ensure wireless interfaces are disabled", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': 'wireless-tools'}, 'levels': {'server': 1, 'workstation': 2}},
-            {'_id': "3.2", 'description': 'Network Parameters (Host Only)', 'type': "header"},
-            {'_id': "3.2.1", 'description': "Ensure IP forwarding is disabled", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.ip_forward", "net.ipv6.conf.all.forwarding", "net.ipv6.conf.default.forwarding"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.2.2", 'description': "Ensure packet redirect sending is disabled", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.send_redirects", "net.ipv4.conf.default.send_redirects"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.3", 'description': "Network Parameters (Host and Router", 'type': "header"},
-            {'_id': "3.3.1", 'description': "Ensure source routed packets are not accepted", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.accept_source_route", "net.ipv4.conf.default.accept_source_route", "net.ipv6.conf.all.accept_source_route", "net.ipv6.conf.default.accept_source_route"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.3.2", 'description': "Ensure ICMP redirects are not accepted", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.accept_redirects", "net.ipv4.conf.default.accept_redirects", "net.ipv6.conf.all.accept_redirects", "net.ipv6.conf.default.accept_redirects"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.3.3", 'description': "Ensure secure ICMP redirects are not accepted", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.secure_redirects", "net.ipv4.conf.default.secure_redirects"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.3.4", 'description': "Ensure suspicious packets are logged", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.log_martians", "net.ipv4.conf.default.log_martians"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.3.5", 'description': "Ensure broadcast ICMP requests are ignored", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.icmp_echo_ignore_broadcasts"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.3.6", 'description': "Ensure bogus ICMP responses are ignored", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.icmp_ignore_bogus_error_responses"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.3.7", 'description': "Ensure Reverse Path Filtering is enabled", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.conf.all.rp_filter", "net.ipv4.conf.default.rp_filter"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.3.8", 'description': "Ensure TCP SYN Cookies is enabled", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv4.tcp_syncookies"], 'value': 1}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.3.9", 'description': "Ensure IPv6 router advertisments are not accepted", 'function': CISAudit.audit_sysctl_flags_are_set, 'kwargs': {'flags': ["net.ipv6.conf.all.accept_ra", "net.ipv6.conf.default.accept_ra"], 'value': 0}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.4", 'description': "Uncommon Network Protocols", 'type': "header"},
-            {'_id': "3.4.1", 'description': "Ensure DCCP is disabled", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'dccp'}, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "3.4.1", 'description': "Ensure SCTP is disabled", 'function': CISAudit.audit_kernel_module_is_disabled, 'kwargs': {'module': 'sctp'}, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "3.5", 'description': "Firewall Configuration", 'type': "header"},
-            {'_id': "3.5.1", 'description': "Configure firewalld", 'type': "header"},
-            {'_id': "3.5.1.1", 'description': "Ensure firewalld is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': "firewalld"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.1.2", 'description': "Ensure iptables-services not installed with firewalld", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "iptables-services"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.1.3", 'description': "Ensure nftables not installed with firewalld", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "nftables"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.1.4", 'description': "Ensure firewalld service enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'kwargs': {'service': "firewalld"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.1.5", 'description': "Ensure firewalld default zone is set", 'function': CISAudit.audit_firewalld_default_zone_is_set, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.1.6", 'description': "Ensure network interfaces are assigned to appropriate zone", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
-            {'_id': "3.5.1.7", 'description': "Ensure firewalld drops unnecessary services and ports", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
-            {'_id': "3.5.2", 'description': "Configure nftables", 'type': "header"},
-            {'_id': "3.5.2.1", 'description': "Ensure nftables is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': "nftables"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.2.2", 'description': "Ensure firewalld is not installed", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "firewalld"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.2.3", 'description': "Ensure iptables-services not installed with nftables", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "iptables-services"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.2.4", 'description': "Ensure iptables are flushed with nftables", 'function': CISAudit.audit_iptables_is_flushed, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.2.5", 'description': "Ensure an nftables table exists", 'function': CISAudit.audit_nftables_table_exists, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.2.6", 'description': "Ensure nftables base chains exist", 'function': CISAudit.audit_nftables_base_chains_exist, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.2.7", 'description': "Ensure nftables loopback traffic is configured", 'function': CISAudit.audit_nftables_loopback_is_configured, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.2.8", 'description': "Ensure nftables outbound and establishe dconnections are configured", 'function': CISAudit.audit_nftables_outbound_and_established_connections, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.2.9", 'description': "Ensure nftables default deny firewall policy exists", 'function': CISAudit.audit_nftables_default_deny_policy, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.2.10", 'description': "Ensure nftables service is enabled", 'function': CISAudit.audit_service_is_enabled, 'kwargs': {'service': "nftables"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.2.11", 'description': "Ensure nftables rules are permanent", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3", 'description': "Configure iptables", 'type': "header"},
-            {'_id': "3.5.3.1", 'description': "Configure iptables software", 'type': "header"},
-            {'_id': "3.5.3.1.1", 'description': "Ensure iptables-services is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': "iptables-services"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.1.2", 'description': "Ensure nftables is not installed with iptables", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "nftables"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.1.3", 'description': "Ensure firewalld is not installed with iptables", 'function': CISAudit.audit_package_not_installed, 'kwargs': {'package': "firewalld"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.2", 'description': "Configure IPv4 iptables", 'type': "header"},
-            {'_id': "3.5.3.2.1", 'description': "Ensure iptables loopback traffic is configured", 'function': CISAudit.audit_iptables_loopback_is_configured, 'kwargs': {'ip_version': 'ipv4'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.2.2", 'description': "Ensure iptables outbound and established connections are configured", 'function': CISAudit.audit_iptables_outbound_and_established_connections, 'kwargs': {'ip_version': 'ipv4'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.2.2", 'description': "Ensure iptables rules exist for all open ports", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
-            {'_id': "3.5.3.2.4", 'description': "Ensure iptables default deny firewall policy", 'function': CISAudit.audit_iptables_default_deny_policy, 'kwargs': {'ip_version': 'ipv4'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.2.5", 'description': "Ensure iptables rules are saved", 'function': CISAudit.audit_iptables_rules_are_saved, 'kwargs': {'ip_version': 'ipv4'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.2.6", 'description': "Ensure iptables is enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'kwargs': {'service': 'iptables'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.3", 'description': "Configure IPv6 ip6tables", 'type': "header"},
-            {'_id': "3.5.3.3.1", 'description': "Ensure ip6tables loopback traffic is configured", 'function': CISAudit.audit_iptables_loopback_is_configured, 'kwargs': {'ip_version': 'ipv6'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.3.2", 'description': "Ensure ip6tables outbound and established connections are configured", 'function': CISAudit.audit_iptables_outbound_and_established_connections, 'kwargs': {'ip_version': 'ipv6'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.3.2", 'description': "Ensure ip6tables rules exist for all open ports", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
-            {'_id': "3.5.3.3.4", 'description': "Ensure ip6tables default deny firewall policy", 'function': CISAudit.audit_iptables_default_deny_policy, 'kwargs': {'ip_version': 'ipv6'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.3.5", 'description': "Ensure ip6tables rules are saved", 'function': CISAudit.audit_iptables_rules_are_saved, 'kwargs': {'ip_version': 'ipv6'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "3.5.3.3.6", 'description': "Ensure ip6tables is enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'kwargs': {'service': 'ip6tables'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "4", 'description': "Logging and Auditing", 'type': "header"},
-            {'_id': "4.1", 'description': "Configure System Accounting (auditd)", 'type': "header"},
-            {'_id': "4.1.1", 'description': "Ensure auditing is enabled", 'type': "header"},
-            {'_id': "4.1.1.1", 'description': "Ensure auditd is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': 'audit'}, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.1.2", 'description': "Ensure auditd service is enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'kwargs': {'service': "auditd"}, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.1.3", 'description': "Ensure auditing for processes that start prior to auditd is enabled", 'function': CISAudit.audit_auditing_for_processes_prior_to_start_is_enabled, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.2", 'description': "Configure Data Retention", 'type': "header"},
-            {'_id': "4.1.2.1", 'description': "Ensure audit log storage size is configured", 'function': CISAudit.audit_audit_log_size_is_configured, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.2.2", 'description': "Ensure audit logs are not automatically deleted", 'function': CISAudit.audit_audit_logs_not_automatically_deleted, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.2.3", 'description': "Ensure system is disabled when audit logs are full", 'function': CISAudit.audit_system_is_disabled_when_audit_logs_are_full, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.2.4", 'description': "Ensure audit_backlog_limit is sufficient", 'function': None, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.3", 'description': "Ensure events that modify date and time information are collected", 'function': CISAudit.audit_events_that_modify_datetime_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.4", 'description': "Ensure events that modify user/group information are collected", 'function': CISAudit.audit_events_that_modify_usergroup_info_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.5", 'description': "Ensure events that modify the system's network environment are collected", 'function': CISAudit.audit_events_that_modify_network_environment_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.6", 'description': "Ensure events tat modify the system's Mandatory Access Controls are collected", 'function': CISAudit.audit_events_that_modify_mandatory_access_controls_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.7", 'description': "Ensure login and logout events are collected", 'function': CISAudit.audit_events_for_login_and_logout_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.8", 'description': "Ensure session initiation information is collected", 'function': CISAudit.audit_events_for_discretionary_access_control_changes_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.9", 'description': "Ensure discretionary access control permissions modification events are collected", 'function': CISAudit.audit_events_for_discretionary_access_control_changes_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.10", 'description': "Ensure unsuccessful unauthorized file access attempts are collected", 'function': CISAudit.audit_events_for_unsuccessful_file_access_attempts_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.11", 'description': "Ensure use of privileged commands is collected", 'function': None, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.12", 'description': "Ensure successful file system mounts are collected", 'function': CISAudit.audit_events_for_successful_file_system_mounts_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.13", 'description': "Ensure file deletion events by users are collected", 'function': CISAudit.audit_events_for_file_deletion_by_users_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.14", 'description': "Ensure changes to system administration scope (sudoers) is collected", 'function': CISAudit.audit_events_for_changes_to_sysadmin_scope_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.15", 'description': "Ensure system administrator command executions (sudo)are collected", 'function': CISAudit.audit_events_for_system_administrator_commands_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.16", 'description': "Ensure kernel module loading and unloading is collected", 'function': CISAudit.audit_events_for_kernel_module_loading_and_unloading_are_collected, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.1.17", 'description': "Ensure the audit configuration is immutable", 'function': CISAudit.audit_audit_config_is_immutable, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "4.2", 'description': "Configure Logging", 'type': "header"},
-            {'_id': "4.2.1", 'description': "Configure rsyslog", 'type': "header"},
-            {'_id': "4.2.1.1", 'description': "Ensure rsyslog is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': "rsyslog"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "4.2.1.2", 'description': "Ensure rsyslog service is enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'levels': {'server': 1, 'workstation': 1}, 'kwargs': {'service': 'rsyslog'}},
-            {'_id': "4.2.1.3", 'description': "Ensure rsyslog default file permissions configured", 'function': CISAudit.audit_rsyslog_default_file_permission_is_configured, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "4.2.1.4", 'description': "Ensure logging is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "4.2.1.5", 'description': "Ensure rsyslog is configured to send logs to a remote log host", 'function': CISAudit.audit_rsyslog_sends_logs_to_a_remote_log_host, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "4.2.1.6", 'description': "Ensure remote rsyslog messages are only accepted on designated log hosts", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "4.2.2", 'description': "Configure journald", 'type': "header"},
-            {'_id': "4.2.2.1", 'description': "Ensure journald is configured to send logs to rsyslog", 'function': CISAudit.audit_journald_configured_to_send_logs_to_rsyslog, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "4.2.2.2", 'description': "Ensure journald is configured to compress large log files", 'function': CISAudit.audit_journald_configured_to_compress_large_logs, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "4.2.2.3", 'description': "Ensure journald is configured to write logfiles to persistent disk", 'function': CISAudit.audit_journald_configured_to_write_logfiles_to_disk, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "4.2.3", 'description': "Ensure permissions on all logfiles are configured", 'function': CISAudit.audit_permissions_on_log_files, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "4.2.4", 'description': "Ensure logrotate is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5", 'description': "Access, Authentication and Authorization", 'type': "header"},
-            {'_id': "5.1", 'description': "Configure time-based job schedulers", 'type': "header"},
-            {'_id': "5.1.1", 'description': "Ensure cron daemon is enabled and running", 'function': CISAudit.audit_service_is_enabled_and_is_active, 'kwargs': {'service': 'crond'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.1.2", 'description': "Ensure permissions on /etc/crontab are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/crontab", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0600"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.1.3", 'description': "Ensure permissions on /etc/cron.hourly are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/cron.hourly", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0700"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.1.4", 'description': "Ensure permissions on /etc/cron.daily are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/cron.daily", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0700"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.1.5", 'description': "Ensure permissions on /etc/cron.weekly are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/cron.weekly", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0700"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.1.6", 'description': "Ensure permissions on /etc/cron.monthly are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/cron.monthly", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0700"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.1.7", 'description': "Ensure permissions on /etc/cron.d are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/cron.d", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0700"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.1.8", 'description': "Ensure cron is restricted to authorized users", 'function': CISAudit.audit_cron_is_restricted_to_authorized_users, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.1.9", 'description': "Ensure at is restricted to authorized users", 'function': CISAudit.audit_at_is_restricted_to_authorized_users, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.2", 'description': "Configure sudo", 'type': "header"},
-            {'_id': "5.2.1", 'description': "Ensure sudo is installed", 'function': CISAudit.audit_package_is_installed, 'kwargs': {'package': 'sudo'}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.2.2", 'description': "Ensure sudo commands use pty", 'function': CISAudit.audit_sudo_commands_use_pty, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.2.3", 'description': "Ensure sudo log file exists", 'function': CISAudit.audit_sudo_log_exists, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3", 'description': "Configure SSH Server", 'type': "header"},
-            {'_id': "5.3.1", 'description': "Ensure permissions on /etc.ssh/sshd_config are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/ssh/sshd_config", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0600"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.2", 'description': "Ensure permissions on SSH private host key files are configured", 'function': CISAudit.audit_permissions_on_private_host_key_files, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.3", 'description': "Ensure permissions on SSH public host key files are configures", 'function': CISAudit.audit_permissions_on_public_host_key_files, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.4", 'description': "Ensure SSH access is limited", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.5", 'description': "Ensure SSH LogLevel is appropriate", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.6", 'description': "Ensure SSH X11 forwarding is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "x11forwarding", 'expected_value': "no"}, 'levels': {'server': 2, 'workstation': 1}},
-            {'_id': "5.3.7", 'description': "Ensure SSH MaxAuthTries is set to 4 or less", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "maxauthtries", 'expected_value': "4", 'comparison': "le"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.8", 'description': "Ensure SSH IgnoreRhosts is enabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "ignorerhosts", 'expected_value': "yes"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.9", 'description': "Ensure SSH HostbasedAuthentication is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "hostbasedauthentication", 'expected_value': "no"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.10", 'description': "Ensure SSH root login is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "permitrootlogin", 'expected_value': "no"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.11", 'description': "Ensure SSH PermitEmptyPasswords is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "permitemptypasswords", 'expected_value': "no"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.12", 'description': "Ensure SSH PermitUserEnvironment is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "permituserenvironment", 'expected_value': "no"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.13", 'description': "Ensure only strong Ciphers are used", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.14", 'description': "Ensure only strong MAC algorithms are used", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.15", 'description': "Ensure only strong Key Exchange algorithms are used", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.12", 'description': "Ensure SSH Idle Timeout Interval is configured", 'type': "header"},
-            {'_id': "5.3.12.1", 'description': "Ensure SSH ClientAliveInterval is 900 or less", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "clientaliveinterval", 'expected_value': "900", 'comparison': "le"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.12.2", 'description': "Ensure SSH ClientAliveCountMax is 0", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "clientalivecountmax", 'expected_value': "0"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.17", 'description': "Ensure SSH LoginGraceTime is set to one minute or less", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "logingracetime", 'expected_value': "60", 'comparison': "le"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.18", 'description': "Ensure SSH warning banner is configured", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "banner", 'expected_value': "/etc/issue.net"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.19", 'description': "Ensure SSH PAM is enabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "usepam", 'expected_value': "yes"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.20", 'description': "Ensure SSH AllowTcpForwarding is disabled", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "allowtcpforwarding", 'expected_value': "no"}, 'levels': {'server': 2, 'workstation': 2}},
-            {'_id': "5.3.21", 'description': "Ensure SSH MaxStartups is configured", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "maxstartups", 'expected_value': "10:30:60"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.3.22", 'description': "Ensure SSH MaxSessions is limited", 'function': CISAudit.audit_sshd_config_option, 'kwargs': {'parameter': "maxsessions", 'expected_value': "10", 'comparison': "le"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.4", 'description': "Configure PAM", 'type': "header"},
-            {'_id': "5.4.1", 'description': "Ensure password creation requirements are configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.4.2", 'description': "Ensure lockout for failed password attempts is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.4.3", 'description': "Ensure password hashing algorithm is SHA512", 'function': CISAudit.audit_password_hashing_algorithm, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.4.4", 'description': "Ensure password reuse is limited", 'function': CISAudit.audit_password_reuse_is_limited, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.5", 'description': "User Accounts and Environment", 'type': "header"},
-            {'_id': "5.5.1", 'description': "Set Shadow Password Suite Parameters", 'type': "header"},
-            {'_id': "5.5.1.1", 'description': "Ensure password expiration is 365 days or less", 'function': CISAudit.audit_password_expiration_max_days_is_configured, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.5.1.2", 'description': "Ensure minimum days between password changes is configured", 'function': CISAudit.audit_password_change_minimum_delay, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.5.1.3", 'description': "Ensure password expiration warning days is 7 or more", 'function': CISAudit.audit_password_expiration_warning_is_configured, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.5.1.4", 'description': "Ensure inactive password lock is 30 days or less", 'function': CISAudit.audit_password_inactive_lock_is_configured, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.5.1.5", 'description': "Ensure all users last password change date is in the past", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.5.2", 'description': "Ensure system accounts are secured", 'function': CISAudit.audit_system_accounts_are_secured, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.5.3", 'description': "Ensure default group for the root account is GID 0", 'function': CISAudit.audit_default_group_for_root, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.5.4", 'description': "Ensure default shell timeout is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.5.5", 'description': "Ensure default user umask is configured", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "5.6", 'description': "Ensure root login is restricted to system console", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
-            {'_id': "5.7", 'description': "Ensure access to the su command is restricted", 'function': CISAudit.audit_access_to_su_command_is_restricted, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6", 'description': "System Maintenance", 'type': "header"},
-            {'_id': "6.1", 'description': "System File Permissions", 'type': "header"},
-            {'_id': "6.1.1", 'description': "Audit system file permissions", 'levels': {'server': 2, 'workstation': 2}, 'type': "manual"},
-            {'_id': "6.1.2", 'description': "Ensure permissions on /etc/passwd are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/passwd", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0644"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.1.3", 'description': "Ensure permissions on /etc/passwd- are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/passwd-", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0644"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.1.4", 'description': "Ensure permissions on /etc/shadow are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/shadow", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0000"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.1.5", 'description': "Ensure permissions on /etc/shadow- are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/shadow-", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0000"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.1.6", 'description': "Ensure permissions on /etc/gshadow- are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/gshadow-", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0000"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.1.7", 'description': "Ensure permissions on /etc/gshadow are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/gshadow", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0000"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.1.8", 'description': "Ensure permissions on /etc/group are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/group", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0644"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.1.9", 'description': "Ensure permissions on /etc/group- are configured", 'function': CISAudit.audit_file_permissions, 'kwargs': {'file': "/etc/group-", 'expected_user': "root", 'expected_group': "root", 'expected_mode': "0644"}, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.1.10", 'description': "Ensure no world writable files exist", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.1.11", 'description': "Ensure no unowned files or directories exist", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.1.12", 'description': "Ensure no ungrouped files or directories exist", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.1.13", 'description': "Audit SUID executables", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
-            {'_id': "6.1.14", 'description': "Audit SGID executables", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
-            {'_id': "6.2", 'description': "User and Group Settings", 'type': "header"},
-            {'_id': "6.2.1", 'description': "Ensure accounts in /etc/passwd use shadowed passwords", 'function': CISAudit.audit_etc_passwd_accounts_use_shadowed_passwords, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.2", 'description': "Ensure /etc/shadow password fields are not empty", 'function': CISAudit.audit_etc_shadow_password_fields_are_not_empty, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.3", 'description': "Ensure all groups in /etc/passwd exist in /etc/group", 'function': CISAudit.audit_etc_passwd_gids_exist_in_etc_group, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.4", 'description': "Ensure shadow group is empty", 'function': CISAudit.audit_shadow_group_is_empty, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.5", 'description': "Ensure no duplicate user names exist", 'function': CISAudit.audit_duplicate_user_names, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.6", 'description': "Ensure no duplicate group names exist", 'function': CISAudit.audit_duplicate_group_names, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.7", 'description': "Ensure no duplicate UIDs exist", 'function': CISAudit.audit_duplicate_uids, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.8", 'description': "Ensure no duplicate GIDs exist", 'function': CISAudit.audit_duplicate_gids, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.9", 'description': "Ensure root is the only UID 0 account", 'function': CISAudit.audit_root_is_only_uid_0_account, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.10", 'description': "Ensure root PATH integrity", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"},
-            {'_id': "6.2.11", 'description': "Ensure all users' home directories exist", 'function': CISAudit.audit_homedirs_exist, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.12", 'description': "Ensure users own their home directories", 'function': CISAudit.audit_homedirs_ownership, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.13", 'description': "Ensure users' home directory permissions are 750 or more restrictive", 'function': CISAudit.audit_homedirs_permissions, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.14", 'description': "Ensure users' dot files are not group or world writable", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.15", 'description': "Ensure no users have .forward files", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.16", 'description': "Ensure no users have .netrc files", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-            {'_id': "6.2.17", 'description': "Ensure no users have .rhosts files", 'function': None, 'levels': {'server': 1, 'workstation': 1}},
-        ],
-    }
+        '3.1.2': {
+            '1': centos7_3_1_2_section_1,
+            '2': centos7_3_1_2_section_2,
+            '3': centos7_3_1_2_section_3,
+            '4': centos7_3_1_2_section_4,
+            '5': centos7_3_1_2_section_5,
+            '6': centos7_3_1_2_section_6,
+        },
+    },
 }
 
 
 ## Script Functions ##
+def get_exit_code(results: "Iterable[TestResult]") -> int:
+    """Exit code for the script, so that callers can tell the outcome without parsing the output
+
+    Parameters
+    ----------
+    results : iterable, required
+        Results from run_tests()
+
+    Returns
+    -------
+    int:
+        0 if nothing failed or errored, 1 if any test failed, or 3 if none failed but any errored. 2 is left for argparse's usage errors
+    """
+
+    outcomes = {result.result for result in results}
+
+    if 'Fail' in outcomes:
+        return 1
+    elif 'Error' in outcomes:
+        return 3
+    else:
+        return 0
+
+
+def load_config(file: str, parser: "ArgumentParser", profile_name: str = None) -> "dict":
+    """Load option defaults from a config file, so they don't need to be given on the command line on every host
+
+    The config file is JSON if its name ends in '.json', otherwise INI. Keys are the long option names, with or without the leading '--', e.g. 'exclude', 'system-type' or 'jobs'.
+    Settings from a named profile override the general settings, and anything given on the command line overrides both.
+
+        INI:
+            [settings]
+            jobs = 4
+            exclude = 1.1 1.3.2
+
+            [profile db-servers]
+            level = 1
+            include = 2.2, 5.2
+
+        JSON:
+            {"settings": {"jobs": 4, "exclude": ["1.1", "1.3.2"]}, "profiles": {"db-servers": {"level": 1, "include": ["2.2", "5.2"]}}}
+
+    Parameters
+    ----------
+    file : string, required
+        Location of the config file
+
+    parser : ArgumentParser, required
+        Parser whose options the config file sets. Any problem with the config file is reported through parser.error()
+
+    profile_name : string, optional
+        Name of the profile to load from the config file
+
+    Returns
+    -------
+    dict:
+        Option defaults, keyed by their argparse 'dest', for parser.set_defaults()
+    """
+
+    try:
+        if file.endswith('.json'):
+            with open(file) as f:
+                data = json.load(f)
+
+            settings = data.get('settings', {})
+            profiles = data.get('profiles', {})
+
+        else:
+            ini = configparser.ConfigParser(interpolation=None)
+            with open(file) as f:
+                ini.read_file(f)
+
+            settings = dict(ini['settings']) if ini.has_section('settings') else {}
+            profiles = {section[len('profile ') :].strip(): dict(ini[section]) for section in ini.sections() if section.startswith('profile ')}
+
+    except (OSError, ValueError, AttributeError, configparser.Error) as e:
+        parser.error(f'Could not load config file "{file}": {e}')
+
+    options = dict(settings)
+    if profile_name is not None:
+        if profile_name not in profiles:
+            parser.error(f'Profile "{profile_name}" not found in config file "{file}"')
+
+        options.update(profiles[profile_name])
+
+    ## Options are looked up by their long option name first, so e.g. 'nice' is --nice rather than --no-nice, which shares its dest
+    actions = {}
+    for action in parser._actions:
+        for option_string in action.option_strings:
+            if option_string.startswith('--'):
+                actions[option_string[2:].replace('-', '_')] = action
+
+    for action in parser._actions:
+        actions.setdefault(action.dest, action)
+
+    defaults = {}
+    for key, value in options.items():
+        action = actions.get(key.lstrip('-').replace('-', '_'))
+
+        if action is None or action.dest in ['help', 'version', 'config', 'profile_name']:
+            parser.error(f'Unknown option "{key}" in config file "{file}"')
+
+        try:
+            ## Flags like --nice and --debug take a boolean, which is the same as whether the flag was given
+            if action.nargs == 0:
+                if not isinstance(value, bool):
+                    value = configparser.ConfigParser.BOOLEAN_STATES[str(value).lower()]
+
+                if value:
+                    value = action.const
+                elif isinstance(action.const, bool):
+                    value = not action.const
+                else:
+                    continue
+
+            elif action.nargs == '+':
+                values = value if isinstance(value, list) else re.split(r'[\s,]+', str(value).strip())
+                value = [action.type(v) if action.type else str(v) for v in values]
+
+            else:
+                value = action.type(value) if action.type else str(value)
+
+            for v in value if isinstance(value, list) else [value]:
+                if action.choices and v not in action.choices:
+                    raise ValueError(v)
+
+        except (KeyError, TypeError, ValueError):
+            parser.error(f'Invalid value "{options[key]}" for "{key}" in config file "{file}"')
+
+        defaults[action.dest] = value
+
+    return defaults
+
+
 def main():  # pragma: no cover
+    logging.basicConfig(
+        format='%(asctime)s [%(levelname)s]: %(funcName)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+    )
+
     config = parse_arguments()
     audit = CISAudit(config=config)
 
+    if config.nice:
+        audit._lower_priority()
+
     host_os = 'centos7'
     benchmark_version = '3.1.2'
 
-    # test_list = audit.get_tests_list(host_os, benchmarks_version)
-    test_list = benchmarks[host_os][benchmark_version]
+    test_list = audit.get_tests_list(host_os, benchmark_version)
     results = audit.run_tests(test_list)
     audit.output(config.outformat, results)
 
+    sys.exit(get_exit_code(results))
+
 
 def parse_arguments(argv=sys.argv):
     description = "This script runs tests on the system to check for compliance against the CIS Benchmarks. No changes are made to system files by this script."
@@ -2600,7 +4695,7 @@ Examples:
     parser.add_argument('--exclude', action='store', nargs='+', dest='excludes', help='Space delimited list of tests to exclude')
     parser.add_argument('-l', '--log-level', action='store', choices=log_level_choices, default='INFO', help='Set log output level')
     parser.add_argument('--debug', action='store_const', const='DEBUG', dest='log_level', help='Run script with debug output turned on. Equivalent to --log-level DEBUG')
-    parser.add_argument('--nice', action='store_true', default=True, help='Lower the CPU priority for test execution. This is the default behaviour.')
+    parser.add_argument('--nice', action='store_true', default=True, help='Lower the CPU and I/O priority for test execution, and hold back scans and parallel tests while the load average is over --max-load or CPU/IO pressure is over --max-pressure. This is the default behaviour.')
     parser.add_argument('--no-nice', action='store_false', dest='nice', help='Do not lower CPU priority for test execution. This may make the tests complete faster but at the cost of putting a higher load on the server. Setting this overrides the --nice option.')
     parser.add_argument('--no-colour', '--no-color', action='store_true', help='Disable colouring for STDOUT. Output redirected to a file/pipe is never coloured.')
     parser.add_argument('--system-type', action='store', choices=system_type_choices, default='server', help='Set which test level to reference')
@@ -2613,10 +4708,30 @@ Examples:
     parser.add_argument('--psv', action='store_const', const='psv', dest='outformat', help='Output results as pipe-separated values. Equivalent to --output psv')
     parser.add_argument('--tsv', action='store_const', const='tsv', dest='outformat', help='Output results as tab-separated values. Equivalent to --output tsv')
     parser.add_argument('-V', '--version', action='version', version=version_str, help='Print version and exit')
-    parser.add_argument('-c', '--config', action='store', help='Location of config file to load')
+    parser.add_argument('-c', '--config', action='store', help='Location of config file to load settings from, in INI or JSON format. Options given on the command line override the config file')
+    parser.add_argument('--profile-name', action='store', metavar='NAME', help='Load the named profile from the config file, e.g. the include and exclude lists for a group of hosts')
+    parser.add_argument('--homedir-threads', action='store', default=1, type=int, metavar='N', help='Scan users\' home directories using N threads. This can speed up the home directory checks when they are on NFS [Default: 1]')
+    parser.add_argument('--max-load', action='store', type=float, metavar='LOAD', help='1 minute load average above which --nice holds back scans and parallel tests [Default: number of CPUs]')
+    parser.add_argument('--max-pressure', action='store', default=10.0, type=float, metavar='PCT', help='CPU or I/O pressure (PSI, kernel 4.20+) as a percentage, above which --nice holds back scans [Default: 10]')
+    parser.add_argument('--max-scan-wait', action='store', default=300, type=float, metavar='SECONDS', help='Longest time in total that --nice may pause a filesystem scan for while the host is busy, after which the scan carries on at full speed [Default: 300]')
+    parser.add_argument('-j', '--jobs', action='store', default=1, type=int, metavar='N', help='Run up to N tests at the same time, starting the slowest tests first when --stats-file has their durations. Results are still reported in benchmark order [Default: 1]')
+    parser.add_argument('--stats-file', action='store', metavar='FILE', help='Record how long each test takes in FILE, so that --jobs can start the slowest tests first on the next run')
+    parser.add_argument('--fail-fast', action='store_true', help='Stop at the first test which fails or errors. The exit code is 1 if a test failed, 3 if a test errored, otherwise 0')
+    parser.add_argument('--first-violation', action='store_true', help='Checks which look at many files or users stop at the first one which fails, instead of reporting all of them')
+    parser.add_argument('--log-output-limit', action='store', default=2048, type=int, metavar='N', help='Truncate command output and file lists in debug messages to N characters, or 0 for no limit [Default: 2048]')
+    parser.add_argument('--persistent-shell', action='store_true', help='Run shell commands through one long-lived shell per job, instead of starting a new shell for each of them')
+    parser.add_argument('--result-cache', action='store', metavar='FILE', help='Reuse the results of slow tests whose answer rarely changes from FILE, until they expire or the host reboots or the files they check change')
+    parser.add_argument('--scan-cache', action='store', metavar='FILE', help='Cache the filesystem scan in FILE between runs, so unchanged directories are not listed again.\nChanges to the mode or owner of existing files are not picked up until their directory changes or FILE is removed.')
 
     args = parser.parse_args(argv[1:])
 
+    ## Options from the config file become defaults, so anything on the command line still takes precedence
+    if args.config:
+        parser.set_defaults(**load_config(args.config, parser, args.profile_name))
+        args = parser.parse_args(argv[1:])
+    elif args.profile_name:
+        parser.error('--profile-name requires --config')
+
     logger = logging.getLogger(__name__)
 
     ## --log-level
@@ -2624,10 +4739,66 @@ Examples:
         logger.setLevel(level=args.log_level)
         logger.debug('Debugging enabled')
 
+    ## --config
+    if args.config:
+        logger.debug(f'Loaded settings from config file "{args.config}"')
+
+    ## --profile-name
+    if args.profile_name:
+        logger.debug(f'Loaded profile "{args.profile_name}" from config file')
+
     ## --nice
     if args.nice:
         logger.debug('Tests will run with reduced CPU priority')
 
+    ## --max-load
+    if args.max_load:
+        logger.debug(f'Scans and parallel tests will be held back while the load average is over {args.max_load}')
+
+    ## --homedir-threads
+    if args.homedir_threads > 1:
+        logger.debug(f'Home directories will be scanned using {args.homedir_threads} threads')
+
+    ## --max-pressure
+    if args.nice:
+        logger.debug(f'Scans will be held back while CPU or I/O pressure is over {args.max_pressure}%')
+
+    ## --max-scan-wait
+    if args.nice:
+        logger.debug(f'Filesystem scans will be held back for at most {args.max_scan_wait}s in total')
+
+    ## --jobs
+    if args.jobs > 1:
+        logger.debug(f'Tests will be run using {args.jobs} jobs')
+
+    ## --stats-file
+    if args.stats_file:
+        logger.debug(f'Test durations will be recorded in "{args.stats_file}"')
+
+    ## --fail-fast
+    if args.fail_fast:
+        logger.debug('Tests will stop at the first failure or error')
+
+    ## --first-violation
+    if args.first_violation:
+        logger.debug('Checks will stop at the first violation')
+
+    ## --log-output-limit
+    if args.log_level == 'DEBUG' and args.log_output_limit:
+        logger.debug(f'Command output in debug messages will be truncated to {args.log_output_limit} characters')
+
+    ## --persistent-shell
+    if args.persistent_shell:
+        logger.debug('Shell commands will be run through a persistent shell')
+
+    ## --result-cache
+    if args.result_cache:
+        logger.debug(f'Results of slow tests will be cached in "{args.result_cache}"')
+
+    ## --scan-cache
+    if args.scan_cache:
+        logger.debug(f'Filesystem scan will be cached in "{args.scan_cache}"')
+
     ## --no-colour
     if args.no_colour:
         logger.debug('Coloured output will be disabled')
@@ -0,0 +1,213 @@
+import io
+import os
+import stat
+from types import SimpleNamespace
+
+
+def get_scale() -> SimpleNamespace:
+    """Size of the synthetic host, taken from CIS_BENCHMARK_* environment variables so it can be scaled up without editing the tests"""
+
+    users = int(os.environ.get('CIS_BENCHMARK_USERS', 500))
+
+    return SimpleNamespace(
+        users=users,
+        homedirs=min(int(os.environ.get('CIS_BENCHMARK_HOMEDIRS', users)), users),
+        audit_rules=int(os.environ.get('CIS_BENCHMARK_AUDIT_RULES', 500)),
+        log_files=int(os.environ.get('CIS_BENCHMARK_LOG_FILES', 2000)),
+        mounts=int(os.environ.get('CIS_BENCHMARK_MOUNTS', 4)),
+    )
+
+
+def get_jobs() -> "list[int]":
+    """Values of the jobs option to benchmark, from CIS_BENCHMARK_JOBS, e.g. '1,4'"""
+
+    return [int(jobs) for jobs in os.environ.get('CIS_BENCHMARK_JOBS', '1,4').split(',')]
+
+
+def run(command, **kwargs):
+    """Stand-in for subprocess.run(). The benchmark measures the script, not the commands it runs, which vary from host to host"""
+
+    return SimpleNamespace(stdout=b'', stderr=b'', returncode=0)
+
+
+class Popen:
+    """Stand-in for subprocess.Popen(), as used by _shellexec_lines(), for the same reason as run()"""
+
+    def __init__(self, command, **kwargs):
+        self.pid = 0
+        self.stdout = io.BytesIO(b'')
+
+    def poll(self):
+        return 0
+
+    def wait(self):
+        return 0
+
+
+def build_fake_host(fs, scale: SimpleNamespace) -> SimpleNamespace:
+    """Populate a pyfakefs filesystem with a synthetic CentOS 7 host of the given scale
+
+    Everything is derived from the scale, so the same scale always builds the same host
+
+    Parameters
+    ----------
+    fs : FakeFilesystem, required
+        pyfakefs 'fs' fixture
+
+    scale : Namespace, required
+        Result of get_scale()
+
+    Returns
+    -------
+    Namespace:
+        uids: UIDs in the fake /etc/passwd
+        gids: GIDs in the fake /etc/group
+        mountpoints: Mount points of the fake local filesystems, as _get_local_mountpoints() would return them
+    """
+
+    passwd = ['root:x:0:0:root:/root:/bin/bash', 'bin:x:1:1:bin:/bin:/sbin/nologin', 'nobody:x:99:99:Nobody:/:/sbin/nologin']
+    shadow = ['root:$6$hash:19000:1:90:7:30::', 'bin:*:19000:0:99999:7:::', 'nobody:*:19000:0:99999:7:::']
+    group = ['root:x:0:', 'bin:x:1:', 'wheel:x:10:', 'nobody:x:99:']
+    gshadow = ['root:::', 'bin:::', 'wheel:::', 'nobody:::']
+
+    ## Mount points have to exist before anything is created under them
+    mountpoints = ['/', '/home', '/var/log'] + [f'/srv/data{i}' for i in range(max(scale.mounts - 3, 0))]
+    for mountpoint in mountpoints[1:]:
+        fs.create_dir(mountpoint)
+        fs.add_mount_point(mountpoint)
+
+    fs.create_file('/proc/self/mounts', contents=''.join(f'/dev/sda{i + 1} {mountpoint} xfs rw,relatime 0 0\n' for i, mountpoint in enumerate(mountpoints)))
+
+    ## Users, with a home directory for the first scale.homedirs of them. Some of them have problems for the checks to find
+    for i in range(scale.users):
+        name = f'user{i:05d}'
+        uid = 1000 + i
+        homedir = f'/home/{name}'
+
+        passwd.append(f'{name}:x:{uid}:{uid}::{homedir}:/bin/bash')
+        shadow.append(f'{name}:$6$hash:19000:1:90:7:30::')
+        group.append(f'{name}:x:{uid}:')
+        gshadow.append(f'{name}:!::')
+
+        if i < scale.homedirs:
+            fs.create_dir(homedir, perm_bits=0o755 if i % 10 == 0 else 0o700).st_uid = uid
+
+            for dotfile in ['.bash_logout', '.bash_profile', '.bashrc']:
+                fs.create_file(f'{homedir}/{dotfile}', st_mode=stat.S_IFREG | (0o664 if i % 25 == 0 else 0o644)).st_uid = uid
+
+            if i % 50 == 0:
+                fs.create_file(f'{homedir}/.netrc', st_mode=stat.S_IFREG | 0o600).st_uid = uid
+
+            fs.create_file(f'{homedir}/notes.txt', st_mode=stat.S_IFREG | 0o600).st_uid = uid
+
+    fs.create_file('/etc/passwd', st_mode=stat.S_IFREG | 0o644, contents='\n'.join(passwd) + '\n')
+    fs.create_file('/etc/shadow', st_mode=stat.S_IFREG | 0o000, contents='\n'.join(shadow) + '\n')
+    fs.create_file('/etc/group', st_mode=stat.S_IFREG | 0o644, contents='\n'.join(group) + '\n')
+    fs.create_file('/etc/gshadow', st_mode=stat.S_IFREG | 0o000, contents='\n'.join(gshadow) + '\n')
+
+    for file in ['passwd', 'shadow', 'group', 'gshadow']:
+        fs.create_file(f'/etc/{file}-', st_mode=stat.S_IFREG | 0o000)
+
+    ## Audit rules, split across a few files the way augenrules expects them
+    rules = [f'-w /etc/watched/file{i} -p wa -k watched_{i % 20}' for i in range(scale.audit_rules)]
+    for i in range(4):
+        fs.create_file(f'/etc/audit/rules.d/{i}0-pytest.rules', contents='\n'.join(rules[i::4]) + '\n')
+
+    fs.create_file('/etc/audit/auditd.conf', contents='max_log_file = 8\nmax_log_file_action = keep_logs\nspace_left_action = email\naction_mail_acct = root\nadmin_space_left_action = halt\n')
+
+    ## Log files under /var/log, a few of which are too permissive
+    for i in range(scale.log_files):
+        fs.create_file(f'/var/log/app{i % 50}/log{i}.log', st_mode=stat.S_IFREG | (0o644 if i % 20 == 0 else 0o640))
+
+    ## Files on the extra filesystems, including some world-writable and SUID ones for the filesystem checks
+    for mountpoint in mountpoints[3:]:
+        for i in range(200):
+            fs.create_file(f'{mountpoint}/dir{i % 10}/file{i}', st_mode=stat.S_IFREG | (0o4755 if i % 100 == 0 else 0o666 if i % 40 == 0 else 0o644))
+
+    ## The most commonly read configuration files
+    config_files = {
+        '/etc/login.defs': 'PASS_MAX_DAYS   90\nPASS_MIN_DAYS   1\nPASS_WARN_AGE   7\n',
+        '/etc/ssh/sshd_config': 'Protocol 2\nLogLevel INFO\nX11Forwarding no\nMaxAuthTries 4\nPermitRootLogin no\n',
+        '/etc/sysctl.conf': 'net.ipv4.ip_forward = 0\nnet.ipv4.conf.all.send_redirects = 0\n',
+        '/etc/sudoers': 'Defaults use_pty\nDefaults logfile="/var/log/sudo.log"\nroot ALL=(ALL) ALL\n',
+        '/etc/rsyslog.conf': '$FileCreateMode 0640\n*.* @@loghost.example.com\n',
+        '/etc/systemd/journald.conf': '[Journal]\nCompress=yes\nStorage=persistent\nForwardToSyslog=yes\n',
+        '/etc/security/limits.conf': '* hard core 0\n',
+        '/etc/pam.d/system-auth': 'password requisite pam_pwquality.so try_first_pass retry=3\n',
+        '/etc/pam.d/password-auth': 'password requisite pam_pwquality.so try_first_pass retry=3\n',
+        '/etc/pam.d/su': 'auth required pam_wheel.so use_uid\n',
+        '/etc/selinux/config': 'SELINUX=enforcing\nSELINUXTYPE=targeted\n',
+        '/etc/yum.conf': '[main]\ngpgcheck=1\n',
+        '/etc/yum.repos.d/CentOS-Base.repo': '[base]\nname=CentOS-$releasever - Base\ngpgcheck=1\n',
+        '/etc/crontab': 'SHELL=/bin/bash\n',
+        '/etc/chrony.conf': 'server 0.centos.pool.ntp.org iburst\n',
+    }
+
+    for path, contents in config_files.items():
+        fs.create_file(path, st_mode=stat.S_IFREG | 0o600, contents=contents)
+
+    for path in ['/etc/motd', '/etc/issue', '/etc/issue.net']:
+        fs.create_file(path, st_mode=stat.S_IFREG | 0o644, contents='Authorized uses only. All activity may be monitored and reported.\n')
+
+    fs.create_file('/boot/grub2/grub.cfg', st_mode=stat.S_IFREG | 0o600)
+    fs.create_file('/boot/grub2/user.cfg', st_mode=stat.S_IFREG | 0o600, contents='GRUB2_PASSWORD=grub.pbkdf2.sha512.10000.hash\n')
+
+    for directory in ['/etc/cron.hourly', '/etc/cron.daily', '/etc/cron.weekly', '/etc/cron.monthly', '/etc/cron.d']:
+        fs.create_dir(directory, perm_bits=0o700)
+
+    ## pyfakefs creates directories as 0o777, which would make every one of them a finding for the sticky bit check
+    for directory, subdirs, files in os.walk('/'):
+        if not directory.startswith(('/home/user', '/etc/cron.')):
+            os.chmod(directory, 0o755)
+
+    os.chmod('/tmp', 0o1777)
+
+    return SimpleNamespace(
+        uids=[int(line.split(':')[2]) for line in passwd],
+        gids=[int(line.split(':')[2]) for line in group],
+        mountpoints=mountpoints,
+    )
+
+
+def compare_to_baseline(mode: str, result: dict, baseline: dict, tolerance: float, floor: float) -> "list[str]":
+    """Compare a benchmark result with the same mode in a previous report
+
+    Parameters
+    ----------
+    mode : string, required
+        Key of the result in the report, e.g. 'jobs=1'
+
+    result : dict, required
+        'total' time for run_tests() and the time for each of the 'checks', in seconds
+
+    baseline : dict, required
+        Previous report, keyed by mode
+
+    tolerance : float, required
+        How much slower than the baseline a time can be before it is a regression, e.g. 0.25 for 25%
+
+    floor : float, required
+        Checks which took less than this many seconds in the baseline are not compared, as they are mostly noise
+
+    Returns
+    -------
+    list:
+        Description of each regression. Empty if there were none, or the baseline has no results for this mode
+    """
+
+    regressions = []
+    previous = baseline.get(mode)
+
+    if previous is None:
+        return regressions
+
+    if result['total'] > previous['total'] * (1 + tolerance):
+        regressions.append(f'{mode} run_tests took {result["total"]:.3f}s, baseline was {previous["total"]:.3f}s')
+
+    for test_id, seconds in sorted(result['checks'].items()):
+        previous_seconds = previous['checks'].get(test_id)
+
+        if previous_seconds is not None and previous_seconds >= floor and seconds > previous_seconds * (1 + tolerance):
+            regressions.append(f'{mode} {test_id} took {seconds:.3f}s, baseline was {previous_seconds:.3f}s')
+
+    return regressions
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+## https://docs.pytest.org/en/latest/reference/fixtures.html#conftest-py-sharing-fixtures-across-multiple-files
+
+import json
+import os
+
+import pytest
+
+from tests.benchmark import get_scale
+
+## Results of each benchmark, keyed by mode, e.g. 'jobs=1'
+results = {}
+
+
+@pytest.fixture(scope='session')
+def scale():
+    return get_scale()
+
+
+@pytest.fixture(scope='session')
+def baseline():
+    ## Loaded before any fake filesystem is set up, as the baseline is on the real one
+    path = os.environ.get('CIS_BENCHMARK_BASELINE')
+
+    if path:
+        with open(path) as f:
+            return json.load(f)
+
+    return {}
+
+
+@pytest.fixture(scope='session')
+def report():
+    yield results
+
+    ## Written after the fake filesystems have been torn down, so it ends up on the real one
+    path = os.environ.get('CIS_BENCHMARK_REPORT')
+
+    if path:
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not results:
+        return
+
+    terminalreporter.section('cis_audit benchmark')
+    terminalreporter.write_line(f'Scale: {vars(get_scale())}')
+
+    for mode, result in sorted(results.items()):
+        slowest = sorted(result['checks'].items(), key=lambda item: item[1], reverse=True)[:5]
+        terminalreporter.write_line(f'{mode}: run_tests took {result["total"]:.3f}s and started {sum(result["processes"].values())} processes. Slowest checks: {", ".join(f"{test_id} ({seconds:.3f}s)" for test_id, seconds in slowest)}')
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import json
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import cis_audit
+from tests.benchmark import Popen, build_fake_host, compare_to_baseline, get_jobs, run
+
+stats_file = '/var/cache/cis_audit_stats.json'
+
+## Most processes a full audit may start, and most any one check may start. Keep the total at the current count, so lower it in the same change that brings the count down, and don't raise either without a good reason
+process_budget_total = 167
+process_budget_per_test = 4
+
+
+@pytest.mark.parametrize('jobs', get_jobs())
+def test_benchmark_run_tests(fs, scale, baseline, report, process_budget, jobs):
+    host = build_fake_host(fs, scale)
+    fs.create_dir('/var/cache')
+
+    config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='CRITICAL', jobs=jobs, stats_file=stats_file)
+    audit = cis_audit.CISAudit(config=config)
+
+    with patch.object(cis_audit.subprocess, 'run', run), patch.object(cis_audit.subprocess, 'Popen', Popen), patch.object(cis_audit.CISAudit, '_get_local_mountpoints', lambda self: host.mountpoints), patch.object(cis_audit, 'getpwall', lambda: [SimpleNamespace(pw_uid=uid) for uid in host.uids]), patch.object(cis_audit, 'getgrall', lambda: [SimpleNamespace(gr_gid=gid) for gid in host.gids]):
+        start_time = time.perf_counter()
+        results = audit.run_tests(audit.get_tests_list('centos7', '3.1.2'))
+        total = time.perf_counter() - start_time
+
+    with open(stats_file) as f:
+        checks = json.load(f)
+
+    mode = f'jobs={jobs}'
+    report[mode] = {'total': round(total, 3), 'checks': checks, 'processes': audit._process_counts.copy()}
+
+    ## Results are reported in benchmark order, whatever order the tests ran in
+    assert [result.id for result in results] == [entry.id for entry in cis_audit.CISAudit(config=config).get_tests_list('centos7', '3.1.2')]
+    assert set(checks) == {result.id for result in results if result.duration is not None}
+
+    process_budget(audit, total=process_budget_total, per_test=process_budget_per_test)
+
+    tolerance = float(os.environ.get('CIS_BENCHMARK_TOLERANCE', 0.25))
+    floor = float(os.environ.get('CIS_BENCHMARK_FLOOR', 0.01))
+    assert compare_to_baseline(mode, report[mode], baseline, tolerance, floor) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
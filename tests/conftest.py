@@ -0,0 +1,37 @@
+#!/usr/bin/python3
+## https://docs.pytest.org/en/latest/reference/fixtures.html#conftest-py-sharing-fixtures-across-multiple-files
+
+import pytest
+
+
+def assert_process_budget(audit, total: int = None, per_test: int = None) -> None:
+    """Assert that a CISAudit instance hasn't started more processes through _shellexec() than it is allowed
+
+    Parameters
+    ----------
+    audit : CISAudit, required
+        Instance which has run some tests
+
+    total : int, optional
+        Most processes the whole run may start
+
+    per_test : int, optional
+        Most processes any single test may start
+    """
+
+    counts = audit._process_counts
+    spawned = sum(counts.values())
+
+    if total is not None:
+        assert spawned <= total, f'{spawned} processes were started, the budget is {total}. Most by: {sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]}'
+
+    if per_test is not None:
+        over_budget = {test_id: count for test_id, count in counts.items() if test_id is not None and count > per_test}
+        assert over_budget == {}, f'Tests started more than {per_test} processes: {over_budget}'
+
+
+@pytest.fixture
+def process_budget():
+    """Provides assert_process_budget(), e.g. process_budget(audit, total=40, per_test=3)"""
+
+    return assert_process_budget
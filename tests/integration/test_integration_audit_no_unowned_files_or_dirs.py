@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+import os
+
+import pytest
+
+from cis_audit import CISAudit
+
+
+@pytest.fixture
+def setup_to_fail():
+    ## Setup
+    os.mkdir('/tmp/pytest')
+    os.chown('/tmp/pytest', 99999, 0)
+
+    yield None
+
+    ## Tear-down
+    os.rmdir('/tmp/pytest')
+
+
+def test_integration_audit_no_unowned_files_or_dirs_pass():
+    state = CISAudit().audit_no_unowned_files_or_dirs()
+    assert state == 0
+
+
+def test_integration_audit_no_unowned_files_or_dirs_fail(setup_to_fail):
+    state = CISAudit().audit_no_unowned_files_or_dirs()
+    assert state == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+import os
+
+import pytest
+
+from cis_audit import CISAudit
+
+
+@pytest.fixture
+def setup_to_fail():
+    ## Setup
+    # We have to update the umask first, otherwise the file is only created with 644 permissions
+    old_umask = os.umask(0o000)
+    with open('/tmp/pytest', 'w'):
+        pass
+    os.chmod('/tmp/pytest', 0o666)
+
+    yield None
+
+    ## Tear-down
+    os.remove('/tmp/pytest')
+    os.umask(old_umask)
+
+
+def test_integration_audit_no_world_writable_files_pass():
+    state = CISAudit().audit_no_world_writable_files()
+    assert state == 0
+
+
+def test_integration_audit_no_world_writable_files_fail(setup_to_fail):
+    state = CISAudit().audit_no_world_writable_files()
+    assert state == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
@@ -10,55 +10,55 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_access_to_su_command_is_restricted_pass(self, cmd):
+def mock_access_to_su_command_is_restricted_pass(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if '/etc/pam.d/su' in cmd:
+    if '/etc/pam.d/su' in files:
         stdout = ['auth required pam_wheel.so use_uid group=<group_name>']
-    elif '/etc/group' in cmd:
+    elif '/etc/group' in files:
         stdout = ['pytest:x:1000:']
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_access_to_su_command_not_restricted_fail(self, cmd):
+def mock_access_to_su_command_not_restricted_fail(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if '/etc/pam.d/su' in cmd:
+    if '/etc/pam.d/su' in files:
         stdout = ['']
-    elif '/etc/group' in cmd:
+    elif '/etc/group' in files:
         stdout = ['pytest:x:1000:pyuser']
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_access_to_su_command_is_restricted_fail_with_users_in_group(self, cmd):
+def mock_access_to_su_command_is_restricted_fail_with_users_in_group(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if '/etc/pam.d/su' in cmd:
+    if '/etc/pam.d/su' in files:
         stdout = ['auth required pam_wheel.so use_uid group=<group_name>']
-    elif '/etc/group' in cmd:
+    elif '/etc/group' in files:
         stdout = ['pytest:x:1000:pyuser']
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_access_to_su_command_is_restricted_pass)
+@patch.object(CISAudit, "_grepfile", mock_access_to_su_command_is_restricted_pass)
 def test_audit_access_to_su_command_is_restricted_pass():
     state = test.audit_access_to_su_command_is_restricted()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_access_to_su_command_not_restricted_fail)
+@patch.object(CISAudit, "_grepfile", mock_access_to_su_command_not_restricted_fail)
 def test_audit_access_to_su_command_is_restricted_fail():
     state = test.audit_access_to_su_command_is_restricted()
     assert state == 1
 
 
-@patch.object(CISAudit, "_shellexec", mock_access_to_su_command_is_restricted_fail_with_users_in_group)
+@patch.object(CISAudit, "_grepfile", mock_access_to_su_command_is_restricted_fail_with_users_in_group)
 def test_audit_access_to_su_command_is_restricted_fail_with_users_in_group():
     state = test.audit_access_to_su_command_is_restricted()
     assert state == 2
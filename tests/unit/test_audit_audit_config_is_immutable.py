@@ -10,10 +10,10 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_audit_audit_config_is_immutable_pass(self, cmd):
+def mock_audit_audit_config_is_immutable_pass(self, pattern, files, **kwargs):
     stdout = [
+        '-w /etc/sudoers -p wa -k scope',
         '-e 2',
-        '',
     ]
     stderr = ['']
     returncode = 0
@@ -21,7 +21,7 @@ def mock_audit_audit_config_is_immutable_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_audit_config_is_immutable_fail(self, cmd):
+def mock_audit_audit_config_is_immutable_fail(self, pattern, files, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -29,13 +29,13 @@ def mock_audit_audit_config_is_immutable_fail(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_audit_config_is_immutable_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_audit_config_is_immutable_pass)
 def test_audit_audit_config_is_immutable_pass():
     state = test.audit_audit_config_is_immutable()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_audit_config_is_immutable_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_audit_config_is_immutable_fail)
 def test_audit_audit_config_is_immutable_fail():
     state = test.audit_audit_config_is_immutable()
     assert state == 1
@@ -8,7 +8,7 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_audit_log_size_is_configured_pass(self, cmd):
+def mock_audit_log_size_is_configured_pass(self, pattern, files, **kwargs):
     stdout = ['max_log_file = 8', '']
     stderr = ['']
     returncode = 0
@@ -16,7 +16,7 @@ def mock_audit_log_size_is_configured_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_log_size_is_configured_fail(self, cmd):
+def mock_audit_log_size_is_configured_fail(self, pattern, files, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -27,13 +27,13 @@ def mock_audit_log_size_is_configured_fail(self, cmd):
 test = CISAudit()
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_log_size_is_configured_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_log_size_is_configured_pass)
 def test_audit_audit_log_size_is_configured_pass():
     state = test.audit_audit_log_size_is_configured()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_log_size_is_configured_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_log_size_is_configured_fail)
 def test_audit_audit_log_size_is_configured_fail():
     state = test.audit_audit_log_size_is_configured()
     assert state == 1
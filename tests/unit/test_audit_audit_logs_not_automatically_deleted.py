@@ -8,7 +8,7 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_audit_logs_not_automatically_deleted_pass(self, cmd):
+def mock_audit_logs_not_automatically_deleted_pass(self, pattern, files, **kwargs):
     stdout = ['max_log_file = keep_logs', '']
     stderr = ['']
     returncode = 0
@@ -16,7 +16,7 @@ def mock_audit_logs_not_automatically_deleted_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_logs_not_automatically_deleted_fail(self, cmd):
+def mock_audit_logs_not_automatically_deleted_fail(self, pattern, files, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -27,13 +27,13 @@ def mock_audit_logs_not_automatically_deleted_fail(self, cmd):
 test = CISAudit()
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_logs_not_automatically_deleted_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_logs_not_automatically_deleted_pass)
 def test_audit_audit_logs_not_automatically_deleted_pass():
     state = test.audit_audit_logs_not_automatically_deleted()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_logs_not_automatically_deleted_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_logs_not_automatically_deleted_fail)
 def test_audit_audit_logs_not_automatically_deleted_fail():
     state = test.audit_audit_logs_not_automatically_deleted()
     assert state == 1
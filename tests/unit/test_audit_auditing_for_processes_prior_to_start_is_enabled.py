@@ -11,8 +11,6 @@ from cis_audit import CISAudit
 def mock_auditing_for_processes_prior_to_start_is_enabled_pass_efidir(self, cmd):
     if 'find /boot/efi/EFI' in cmd:
         stdout = ['/boot/efi/EFI/centos/grub.cfg', '']
-    elif R'grep "^\s*linux"' in cmd:
-        stdout = ['PASSED', '']
     else:
         stdout = ['']
 
@@ -25,8 +23,6 @@ def mock_auditing_for_processes_prior_to_start_is_enabled_pass_efidir(self, cmd)
 def mock_auditing_for_processes_prior_to_start_is_enabled_pass_grubdir(self, cmd):
     if 'find /boot ' in cmd:
         stdout = ['/boot/grub2/grub.cfg', '']
-    elif R'grep "^\s*linux"' in cmd:
-        stdout = ['PASSED', '']
     else:
         stdout = ['']
 
@@ -37,11 +33,30 @@ def mock_auditing_for_processes_prior_to_start_is_enabled_pass_grubdir(self, cmd
 
 
 def mock_auditing_for_processes_prior_to_start_is_enabled_fail(self, cmd):
-    if R'grep "^\s*linux"' in cmd:
-        stdout = ['FAILED', '']
-    else:
-        stdout = ['']
+    stdout = ['']
+
+    stderr = ['']
+    returncode = 0
 
+    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+
+
+def mock_grub_cfg_pass(self, pattern, files, **kwargs):
+    stdout = [
+        '\tlinux16 /vmlinuz-3.10.0-1160.el7.x86_64 root=/dev/mapper/centos-root ro crashkernel=auto audit=1',
+        '\tlinux16 /vmlinuz-0-rescue root=/dev/mapper/centos-root ro crashkernel=auto audit=1',
+    ]
+    stderr = ['']
+    returncode = 0
+
+    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+
+
+def mock_grub_cfg_fail(self, pattern, files, **kwargs):
+    stdout = [
+        '\tlinux16 /vmlinuz-3.10.0-1160.el7.x86_64 root=/dev/mapper/centos-root ro crashkernel=auto audit=1',
+        '\tlinux16 /vmlinuz-0-rescue root=/dev/mapper/centos-root ro crashkernel=auto',
+    ]
     stderr = ['']
     returncode = 0
 
@@ -52,12 +67,14 @@ test = CISAudit()
 
 
 @patch.object(CISAudit, "_shellexec", mock_auditing_for_processes_prior_to_start_is_enabled_pass_efidir)
+@patch.object(CISAudit, "_grepfile", mock_grub_cfg_pass)
 def test_audit_auditing_for_processes_prior_to_start_is_enabled_pass_efidir():
     state = test.audit_auditing_for_processes_prior_to_start_is_enabled()
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_auditing_for_processes_prior_to_start_is_enabled_pass_grubdir)
+@patch.object(CISAudit, "_grepfile", mock_grub_cfg_pass)
 def test_audit_auditing_for_processes_prior_to_start_is_enabled_pass_grubdir():
     state = test.audit_auditing_for_processes_prior_to_start_is_enabled()
     assert state == 0
@@ -69,5 +86,12 @@ def test_audit_auditing_for_processes_prior_to_start_is_enabled_fail():
     assert state == 1
 
 
+@patch.object(CISAudit, "_shellexec", mock_auditing_for_processes_prior_to_start_is_enabled_pass_grubdir)
+@patch.object(CISAudit, "_grepfile", mock_grub_cfg_fail)
+def test_audit_auditing_for_processes_prior_to_start_is_enabled_fail_missing_option():
+    state = test.audit_auditing_for_processes_prior_to_start_is_enabled()
+    assert state == 1
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '--no-cov'])
@@ -27,12 +27,12 @@ def mock_command_fail(*args, **kwargs):
 class TestAuthForSingleUserMode:
     test = CISAudit()
 
-    @patch.object(CISAudit, "_shellexec", mock_command_pass)
+    @patch.object(CISAudit, "_grepfile", mock_command_pass)
     def test_auth_for_single_user_pass(self):
         state = self.test.audit_auth_for_single_user_mode()
         assert state == 0
 
-    @patch.object(CISAudit, "_shellexec", mock_command_fail)
+    @patch.object(CISAudit, "_grepfile", mock_command_fail)
     def test_auth_for_single_user_fail(self):
         state = self.test.audit_auth_for_single_user_mode()
         assert state == 3
@@ -8,7 +8,7 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_bootloader_password_pass(self, cmd):
+def mock_bootloader_password_pass(self, pattern, files, **kwargs):
     output = ['GRUB2_PASSWORD=supersecret']
     error = ['']
     returncode = 0
@@ -16,7 +16,7 @@ def mock_bootloader_password_pass(self, cmd):
     return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
 
 
-def mock_bootloader_password_fail_blank(self, cmd):
+def mock_bootloader_password_fail_blank(self, pattern, files, **kwargs):
     output = ['']
     error = ['']
     returncode = 1
@@ -24,7 +24,7 @@ def mock_bootloader_password_fail_blank(self, cmd):
     return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
 
 
-def mock_bootloader_password_fail_commented(self, cmd):
+def mock_bootloader_password_fail_commented(self, pattern, files, **kwargs):
     output = ['#GRUB2_PASSWORD=supersecret']
     error = ['']
     returncode = 0
@@ -32,24 +32,24 @@ def mock_bootloader_password_fail_commented(self, cmd):
     return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
 
 
-def mock_bootloader_password_error(self, cmd):
+def mock_bootloader_password_error(self, pattern, files, **kwargs):
     raise Exception
 
 
 class TestBootloaderPasswordSet:
     test = CISAudit()
 
-    @patch.object(CISAudit, "_shellexec", mock_bootloader_password_pass)
+    @patch.object(CISAudit, "_grepfile", mock_bootloader_password_pass)
     def test_bootloader_password_set_pass(self):
         state = self.test.audit_bootloader_password_is_set()
         assert state == 0
 
-    @patch.object(CISAudit, "_shellexec", mock_bootloader_password_fail_blank)
+    @patch.object(CISAudit, "_grepfile", mock_bootloader_password_fail_blank)
     def test_bootloader_password_set_fail_blank(self):
         state = self.test.audit_bootloader_password_is_set()
         assert state == 1
 
-    @patch.object(CISAudit, "_shellexec", mock_bootloader_password_fail_commented)
+    @patch.object(CISAudit, "_grepfile", mock_bootloader_password_fail_commented)
     def test_bootloader_password_set_fail_commented(self):
         state = self.test.audit_bootloader_password_is_set()
         assert state == 1
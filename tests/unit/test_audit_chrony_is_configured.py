@@ -16,10 +16,6 @@ def mock_chrony_configured_pass(self, cmd):
         stdout = ['enabled']
     elif 'is-active' in cmd:
         stdout = ['active']
-    elif 'server' in cmd:
-        stdout = ['server 0.centos.pool.ntp.org iburst', 'server 1.centos.pool.ntp.org iburst', 'server 2.centos.pool.ntp.org iburst', 'server 3.centos.pool.ntp.org iburst']
-    elif 'ps aux' in cmd:
-        stdout = ['chrony']
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
@@ -33,10 +29,34 @@ def mock_chrony_configured_fail(self, cmd):
         stdout = ['disabled']
     elif 'is-active' in cmd:
         stdout = ['inactive']
-    elif 'server' in cmd:
-        returncode = 1
-    elif 'ps aux' in cmd:
-        returncode = 1
+
+    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+
+
+def mock_chrony_processes_pass(self):
+    chronyd = SimpleNamespace(pid=634, name='chronyd', user='chrony', args=['/usr/sbin/chronyd'], context=None)
+
+    return SimpleNamespace(by_name={'chronyd': [chronyd]}, by_user={'chrony': [chronyd]}, by_selinux_type={})
+
+
+def mock_chrony_processes_fail(self):
+    chronyd = SimpleNamespace(pid=634, name='chronyd', user='root', args=['/usr/sbin/chronyd'], context=None)
+
+    return SimpleNamespace(by_name={'chronyd': [chronyd]}, by_user={'root': [chronyd]}, by_selinux_type={})
+
+
+def mock_chrony_conf_pass(self, pattern, files, **kwargs):
+    stdout = ['server 0.centos.pool.ntp.org iburst', 'server 1.centos.pool.ntp.org iburst', 'server 2.centos.pool.ntp.org iburst', 'server 3.centos.pool.ntp.org iburst']
+    stderr = ['']
+    returncode = 0
+
+    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+
+
+def mock_chrony_conf_fail(self, pattern, files, **kwargs):
+    stdout = ['']
+    stderr = ['']
+    returncode = 1
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
@@ -46,11 +66,15 @@ test = CISAudit()
 
 class TestChronyIsConfigured:
     @patch.object(CISAudit, "_shellexec", mock_chrony_configured_pass)
+    @patch.object(CISAudit, "_grepfile", mock_chrony_conf_pass)
+    @patch.object(CISAudit, "_get_processes", mock_chrony_processes_pass)
     def test_chrony_is_configure_pass(self):
         state = test.audit_chrony_is_configured()
         assert state == 0
 
     @patch.object(CISAudit, "_shellexec", mock_chrony_configured_fail)
+    @patch.object(CISAudit, "_grepfile", mock_chrony_conf_fail)
+    @patch.object(CISAudit, "_get_processes", mock_chrony_processes_fail)
     def test_chrony_is_configure_fail(self):
         state = test.audit_chrony_is_configured()
         assert state == 15
@@ -5,15 +5,15 @@ from unittest.mock import patch
 
 import pytest
 
-from cis_audit import CISAudit
+from cis_audit import CISAudit, patterns
 
 
-def mock_core_dumps_pass(self, cmd):
-    if 'limits.conf' in cmd:
+def mock_core_dumps_pass(self, cmd, *args, **kwargs):
+    if cmd is patterns['core_dumps_hard_limit']:
         stdout = ['* hard core 0']
         stderr = ['']
         returncode = 0
-    elif 'sysctl' in cmd:
+    else:
         stdout = ['fs.suid_dumpable = 0']
         stderr = ['']
         returncode = 0
@@ -21,7 +21,7 @@ def mock_core_dumps_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_core_dumps_fail(self, cmd):
+def mock_core_dumps_fail(self, cmd, *args, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -33,11 +33,13 @@ class TestCoreDumpsRestricted:
     test = CISAudit()
 
     @patch.object(CISAudit, "_shellexec", mock_core_dumps_pass)
+    @patch.object(CISAudit, "_grepfile", mock_core_dumps_pass)
     def test_mock_core_dumps_pass(self):
         state = self.test.audit_core_dumps_restricted()
         assert state == 0
 
     @patch.object(CISAudit, "_shellexec", mock_core_dumps_fail)
+    @patch.object(CISAudit, "_grepfile", mock_core_dumps_fail)
     def test_mock_core_dumps_fail(self):
         state = self.test.audit_core_dumps_restricted()
         assert state == 7
@@ -10,29 +10,29 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_default_group_for_root_pass(self, cmd):
+def mock_default_group_for_root_pass(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
-    stdout = ['0']
+    stdout = ['root:x:0:0:root:/root:/bin/bash']
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_default_group_for_root_fail(self, cmd):
+def mock_default_group_for_root_fail(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
-    stdout = ['1']
+    stdout = ['root:x:0:1:root:/root:/bin/bash']
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_default_group_for_root_pass)
+@patch.object(CISAudit, "_grepfile", mock_default_group_for_root_pass)
 def test_audit_default_group_for_root_pass():
     state = test.audit_default_group_for_root()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_default_group_for_root_fail)
+@patch.object(CISAudit, "_grepfile", mock_default_group_for_root_fail)
 def test_audit_default_group_for_root_fail():
     state = test.audit_default_group_for_root()
     assert state == 1
@@ -10,7 +10,7 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_etc_passwd_accounts_use_shadowed_passwords_pass(self, cmd):
+def mock_etc_passwd_accounts_use_shadowed_passwords_pass(self, pattern, files, **kwargs):
     returncode = 1
     stderr = ['']
     stdout = ['']
@@ -18,7 +18,7 @@ def mock_etc_passwd_accounts_use_shadowed_passwords_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_etc_passwd_accounts_use_shadowed_passwords_fail(self, cmd):
+def mock_etc_passwd_accounts_use_shadowed_passwords_fail(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
     stdout = ['pytest:!!:1000:1000::/home/pytest:/bin/bash']
@@ -26,13 +26,13 @@ def mock_etc_passwd_accounts_use_shadowed_passwords_fail(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_etc_passwd_accounts_use_shadowed_passwords_pass)
+@patch.object(CISAudit, "_grepfile", mock_etc_passwd_accounts_use_shadowed_passwords_pass)
 def test_audit_etc_passwd_accounts_use_shadowed_passwords_pass():
     state = test.audit_etc_passwd_accounts_use_shadowed_passwords()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_etc_passwd_accounts_use_shadowed_passwords_fail)
+@patch.object(CISAudit, "_grepfile", mock_etc_passwd_accounts_use_shadowed_passwords_fail)
 def test_audit_etc_passwd_accounts_use_shadowed_passwords_fail():
     state = test.audit_etc_passwd_accounts_use_shadowed_passwords()
     assert state == 1
@@ -10,7 +10,7 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_etc_shadow_password_fields_are_not_empty_pass(self, cmd):
+def mock_etc_shadow_password_fields_are_not_empty_pass(self, pattern, files, **kwargs):
     returncode = 1
     stderr = ['']
     stdout = ['']
@@ -18,7 +18,7 @@ def mock_etc_shadow_password_fields_are_not_empty_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_etc_shadow_password_fields_are_not_empty_fail(self, cmd):
+def mock_etc_shadow_password_fields_are_not_empty_fail(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
     stdout = ['pytest::18925::::::']
@@ -26,13 +26,13 @@ def mock_etc_shadow_password_fields_are_not_empty_fail(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_etc_shadow_password_fields_are_not_empty_pass)
+@patch.object(CISAudit, "_grepfile", mock_etc_shadow_password_fields_are_not_empty_pass)
 def test_audit_etc_shadow_password_fields_are_not_empty_pass():
     state = test.audit_etc_shadow_password_fields_are_not_empty()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_etc_shadow_password_fields_are_not_empty_fail)
+@patch.object(CISAudit, "_grepfile", mock_etc_shadow_password_fields_are_not_empty_fail)
 def test_audit_etc_shadow_password_fields_are_not_empty_fail():
     state = test.audit_etc_shadow_password_fields_are_not_empty()
     assert state == 1
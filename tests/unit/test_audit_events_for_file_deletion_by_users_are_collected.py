@@ -10,7 +10,7 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_audit_events_for_file_deletion_by_users_are_collected_pass(self, cmd):
+def mock_audit_events_for_file_deletion_by_users_are_collected_pass(self, cmd, *args, **kwargs):
     if 'auditctl' in cmd:
         stdout = [
             "-a always,exit -F arch=b64 -S rename,unlink,unlinkat,renameat -F auid>=1000 -F auid!=-1 -F key=delete",
@@ -27,7 +27,7 @@ def mock_audit_events_for_file_deletion_by_users_are_collected_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_events_for_file_deletion_by_users_are_collected_fail(self, cmd):
+def mock_audit_events_for_file_deletion_by_users_are_collected_fail(self, cmd, *args, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -36,12 +36,14 @@ def mock_audit_events_for_file_deletion_by_users_are_collected_fail(self, cmd):
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_for_file_deletion_by_users_are_collected_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_for_file_deletion_by_users_are_collected_pass)
 def test_audit_events_for_file_deletion_by_users_are_collected_pass():
     state = test.audit_events_for_file_deletion_by_users_are_collected()
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_for_file_deletion_by_users_are_collected_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_for_file_deletion_by_users_are_collected_fail)
 def test_audit_events_for_file_deletion_by_users_are_collected_fail():
     state = test.audit_events_for_file_deletion_by_users_are_collected()
     assert state == 3
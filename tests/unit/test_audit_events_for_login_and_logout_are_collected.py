@@ -10,7 +10,7 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_audit_events_for_login_and_logout_are_collected_pass(self, cmd):
+def mock_audit_events_for_login_and_logout_are_collected_pass(self, cmd, *args, **kwargs):
     stdout = [
         '-w /var/log/lastlog -p wa -k logins',
         '-w /var/run/faillock -p wa -k logins',
@@ -22,7 +22,7 @@ def mock_audit_events_for_login_and_logout_are_collected_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_events_for_login_and_logout_are_collected_fail(self, cmd):
+def mock_audit_events_for_login_and_logout_are_collected_fail(self, cmd, *args, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -31,12 +31,14 @@ def mock_audit_events_for_login_and_logout_are_collected_fail(self, cmd):
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_for_login_and_logout_are_collected_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_for_login_and_logout_are_collected_pass)
 def test_audit_events_for_login_and_logout_are_collected_pass():
     state = test.audit_events_for_login_and_logout_are_collected()
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_for_login_and_logout_are_collected_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_for_login_and_logout_are_collected_fail)
 def test_audit_events_for_login_and_logout_are_collected_fail():
     state = test.audit_events_for_login_and_logout_are_collected()
     assert state == 3
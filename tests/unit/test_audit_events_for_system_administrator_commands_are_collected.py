@@ -10,7 +10,7 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_audit_events_for_system_administrator_commands_are_collected_pass(self, cmd):
+def mock_audit_events_for_system_administrator_commands_are_collected_pass(self, cmd, *args, **kwargs):
     if 'auditctl' in cmd:
         stdout = [
             '-a always,exit -F arch=b64 -S execve -C uid!=euid -F euid=0 -F auid>=1000 -F auid!=-1 -F key=actions',
@@ -28,7 +28,7 @@ def mock_audit_events_for_system_administrator_commands_are_collected_pass(self,
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_events_for_system_administrator_commands_are_collected_fail(self, cmd):
+def mock_audit_events_for_system_administrator_commands_are_collected_fail(self, cmd, *args, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -37,12 +37,14 @@ def mock_audit_events_for_system_administrator_commands_are_collected_fail(self,
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_for_system_administrator_commands_are_collected_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_for_system_administrator_commands_are_collected_pass)
 def test_audit_events_for_system_administrator_commands_are_collected_pass():
     state = test.audit_events_for_system_administrator_commands_are_collected()
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_for_system_administrator_commands_are_collected_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_for_system_administrator_commands_are_collected_fail)
 def test_audit_events_for_system_administrator_commands_are_collected_fail():
     state = test.audit_events_for_system_administrator_commands_are_collected()
     assert state == 3
@@ -10,7 +10,7 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_audit_events_that_modify_mandatory_access_controls_are_collected_pass(self, cmd):
+def mock_audit_events_that_modify_mandatory_access_controls_are_collected_pass(self, cmd, *args, **kwargs):
     stdout = [
         '-w /etc/selinux -p wa -k MAC-policy',
         '-w /usr/share/selinux -p wa -k MAC-policy',
@@ -21,7 +21,7 @@ def mock_audit_events_that_modify_mandatory_access_controls_are_collected_pass(s
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_events_that_modify_mandatory_access_controls_are_collected_fail(self, cmd):
+def mock_audit_events_that_modify_mandatory_access_controls_are_collected_fail(self, cmd, *args, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -30,12 +30,14 @@ def mock_audit_events_that_modify_mandatory_access_controls_are_collected_fail(s
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_that_modify_mandatory_access_controls_are_collected_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_that_modify_mandatory_access_controls_are_collected_pass)
 def test_audit_events_that_modify_mandatory_access_controls_are_collected_pass():
     state = test.audit_events_that_modify_mandatory_access_controls_are_collected()
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_that_modify_mandatory_access_controls_are_collected_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_that_modify_mandatory_access_controls_are_collected_fail)
 def test_audit_events_that_modify_mandatory_access_controls_are_collected_fail():
     state = test.audit_events_that_modify_mandatory_access_controls_are_collected()
     assert state == 3
@@ -10,7 +10,7 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_audit_events_that_modify_network_environment_are_collected_pass(self, cmd):
+def mock_audit_events_that_modify_network_environment_are_collected_pass(self, cmd, *args, **kwargs):
     if 'auditctl' in cmd:
         stdout = [
             '-a always,exit -F arch=b64 -S sethostname,setdomainname -F key=system-locale',
@@ -35,7 +35,7 @@ def mock_audit_events_that_modify_network_environment_are_collected_pass(self, c
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_events_that_modify_network_environment_are_collected_fail(self, cmd):
+def mock_audit_events_that_modify_network_environment_are_collected_fail(self, cmd, *args, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -44,12 +44,14 @@ def mock_audit_events_that_modify_network_environment_are_collected_fail(self, c
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_that_modify_network_environment_are_collected_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_that_modify_network_environment_are_collected_pass)
 def test_audit_events_that_modify_network_environment_are_collected_pass():
     state = test.audit_events_that_modify_network_environment_are_collected()
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_that_modify_network_environment_are_collected_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_that_modify_network_environment_are_collected_fail)
 def test_audit_events_that_modify_network_environment_are_collected_fail():
     state = test.audit_events_that_modify_network_environment_are_collected()
     assert state == 3
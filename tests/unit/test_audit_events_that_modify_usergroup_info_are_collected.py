@@ -10,7 +10,7 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_audit_events_that_modify_usergroup_info_are_collected_pass(self, cmd):
+def mock_audit_events_that_modify_usergroup_info_are_collected_pass(self, cmd, *args, **kwargs):
     stdout = [
         '-w /etc/group -p wa -k identity',
         '-w /etc/passwd -p wa -k identity',
@@ -24,7 +24,7 @@ def mock_audit_events_that_modify_usergroup_info_are_collected_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_events_that_modify_usergroup_info_are_collected_fail(self, cmd):
+def mock_audit_events_that_modify_usergroup_info_are_collected_fail(self, cmd, *args, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -33,12 +33,14 @@ def mock_audit_events_that_modify_usergroup_info_are_collected_fail(self, cmd):
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_that_modify_usergroup_info_are_collected_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_that_modify_usergroup_info_are_collected_pass)
 def test_audit_events_that_modify_usergroup_info_are_collected_pass():
     state = test.audit_events_that_modify_usergroup_info_are_collected()
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_audit_events_that_modify_usergroup_info_are_collected_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_events_that_modify_usergroup_info_are_collected_fail)
 def test_audit_events_that_modify_usergroup_info_are_collected_fail():
     state = test.audit_events_that_modify_usergroup_info_are_collected()
     assert state == 3
@@ -8,8 +8,8 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_filesystem_integrity_pass_cron(self, cmd):
-    output = ['/etc/cron.d/aide-check']
+def mock_filesystem_integrity_pass_cron(self, pattern, files, **kwargs):
+    output = ['/etc/cron.d/aide-check:0 5 * * * root /usr/sbin/aide --check']
     error = ['']
     returncode = 0
 
@@ -33,7 +33,7 @@ def mock_filesystem_integrity_pass_systemd(self, cmd, *args, **kwargs):
     return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
 
 
-def mock_filesystem_integrity_fail(self, cmd):
+def mock_filesystem_integrity_fail(self, cmd, *args, **kwargs):
     output = ['']
     error = ['']
     returncode = 1
@@ -45,19 +45,21 @@ def mock_filesystem_integrity_error(self, cmd):
     raise Exception
 
 
-@patch.object(CISAudit, "_shellexec", mock_filesystem_integrity_pass_cron)
+@patch.object(CISAudit, "_grepfile", mock_filesystem_integrity_pass_cron)
 def test_filesystem_integrity_pass_crond():
     state = CISAudit().audit_filesystem_integrity_regularly_checked()
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_filesystem_integrity_pass_systemd)
+@patch.object(CISAudit, "_grepfile", mock_filesystem_integrity_fail)
 def test_filesystem_integrity_pass_systemd():
     state = CISAudit().audit_filesystem_integrity_regularly_checked()
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_filesystem_integrity_fail)
+@patch.object(CISAudit, "_grepfile", mock_filesystem_integrity_fail)
 def test_filesystem_integrity_fail():
     state = CISAudit().audit_filesystem_integrity_regularly_checked()
     assert state == 1
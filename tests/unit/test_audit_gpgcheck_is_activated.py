@@ -8,13 +8,13 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_gpgcheck_activated_pass(self, cmd):
-    if 'yum.conf' in cmd:
+def mock_gpgcheck_activated_pass(self, pattern, files, **kwargs):
+    if '/etc/yum.conf' in files:
         output = ['gpgcheck=1']
         error = ['']
         returncode = 0
 
-    elif 'yum.repos.d' in cmd:
+    elif '/etc/yum.repos.d/*.repo' in files:
         output = ['']
         error = ['']
         returncode = 0
@@ -22,13 +22,13 @@ def mock_gpgcheck_activated_pass(self, cmd):
     return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
 
 
-def mock_gpgcheck_activated_fail_state_1(self, cmd):
-    if 'yum.conf' in cmd:
+def mock_gpgcheck_activated_fail_state_1(self, pattern, files, **kwargs):
+    if '/etc/yum.conf' in files:
         output = ['gpgcheck=0']
         error = ['']
         returncode = 0
 
-    elif 'yum.repos.d' in cmd:
+    elif '/etc/yum.repos.d/*.repo' in files:
         output = ['']
         error = ['']
         returncode = 0
@@ -36,13 +36,13 @@ def mock_gpgcheck_activated_fail_state_1(self, cmd):
     return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
 
 
-def mock_gpgcheck_activated_fail_state_2(self, cmd):
-    if 'yum.conf' in cmd:
+def mock_gpgcheck_activated_fail_state_2(self, pattern, files, **kwargs):
+    if '/etc/yum.conf' in files:
         output = ['gpgcheck=1']
         error = ['']
         returncode = 0
 
-    elif 'yum.repos.d' in cmd:
+    elif '/etc/yum.repos.d/*.repo' in files:
         output = ['base does not have gpgcheck enabled']
         error = ['']
         returncode = 0
@@ -50,13 +50,13 @@ def mock_gpgcheck_activated_fail_state_2(self, cmd):
     return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
 
 
-def mock_gpgcheck_activated_fail_state_3(self, cmd):
-    if 'yum.conf' in cmd:
+def mock_gpgcheck_activated_fail_state_3(self, pattern, files, **kwargs):
+    if '/etc/yum.conf' in files:
         output = ['gpgcheck=0']
         error = ['']
         returncode = 0
 
-    elif 'yum.repos.d' in cmd:
+    elif '/etc/yum.repos.d/*.repo' in files:
         output = ['base does not have gpgcheck enabled.']
         error = ['']
         returncode = 0
@@ -68,22 +68,22 @@ class TestGPGCheckActivated:
     test = CISAudit()
     test_id = '1.1'
 
-    @patch.object(CISAudit, "_shellexec", mock_gpgcheck_activated_pass)
+    @patch.object(CISAudit, "_grepfile", mock_gpgcheck_activated_pass)
     def test_check_gpgcheck_is_activated_pass(self):
         state = self.test.audit_gpgcheck_is_activated()
         assert state == 0
 
-    @patch.object(CISAudit, "_shellexec", mock_gpgcheck_activated_fail_state_1)
+    @patch.object(CISAudit, "_grepfile", mock_gpgcheck_activated_fail_state_1)
     def test_check_gpgcheck_is_activated_fail_state_1(self):
         state = self.test.audit_gpgcheck_is_activated()
         assert state == 1
 
-    @patch.object(CISAudit, "_shellexec", mock_gpgcheck_activated_fail_state_2)
+    @patch.object(CISAudit, "_grepfile", mock_gpgcheck_activated_fail_state_2)
     def test_check_gpgcheck_is_activated_fail_state_2(self):
         state = self.test.audit_gpgcheck_is_activated()
         assert state == 2
 
-    @patch.object(CISAudit, "_shellexec", mock_gpgcheck_activated_fail_state_3)
+    @patch.object(CISAudit, "_grepfile", mock_gpgcheck_activated_fail_state_3)
     def test_check_gpgcheck_is_activated_fail_state_3(self):
         state = self.test.audit_gpgcheck_is_activated()
         assert state == 3
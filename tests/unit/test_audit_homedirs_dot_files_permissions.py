@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import stat
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+
+def mock_homedirs_data(self):
+    data = [
+        'root 0 /root',
+        'pytest 1000 /home/pytest',
+    ]
+
+    for row in data:
+        user, uid, homedir = row.split(' ')
+
+        yield user, int(uid), homedir
+
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+def test_audit_homedirs_dot_files_permissions_pass(fs):
+    fs.create_file('/root/.bashrc', st_mode=stat.S_IFREG | 0o644)
+    fs.create_file('/home/pytest/.bashrc', st_mode=stat.S_IFREG | 0o600)
+    fs.create_file('/home/pytest/shared', st_mode=stat.S_IFREG | 0o666)
+    fs.create_symlink('/home/pytest/.link', '/home/pytest/shared')
+
+    state = CISAudit().audit_homedirs_dot_files_permissions()
+    assert state == 0
+
+
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+def test_audit_homedirs_dot_files_permissions_fail_group(fs):
+    fs.create_file('/root/.bashrc', st_mode=stat.S_IFREG | 0o644)
+    fs.create_file('/home/pytest/.bashrc', st_mode=stat.S_IFREG | 0o664)
+
+    state = CISAudit().audit_homedirs_dot_files_permissions()
+    assert state == 1
+
+
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+def test_audit_homedirs_dot_files_permissions_fail_world(fs):
+    fs.create_file('/root/.bashrc', st_mode=stat.S_IFREG | 0o646)
+    fs.create_dir('/home/pytest')
+
+    state = CISAudit().audit_homedirs_dot_files_permissions()
+    assert state == 1
+
+
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+def test_audit_homedirs_dot_files_permissions_first_violation(fs, caplog):
+    fs.create_file('/root/.bashrc', st_mode=stat.S_IFREG | 0o666)
+    fs.create_file('/root/.profile', st_mode=stat.S_IFREG | 0o666)
+    fs.create_file('/home/pytest/.bashrc', st_mode=stat.S_IFREG | 0o666)
+
+    state = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', first_violation=True)).audit_homedirs_dot_files_permissions()
+    assert state == 1
+    assert len([record for record in caplog.records if record.levelname == 'WARNING']) == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
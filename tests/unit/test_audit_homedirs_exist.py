@@ -7,6 +7,7 @@
 ##          https://jmcgeheeiv.github.io/pyfakefs/release/modules.html#pyfakefs.fake_filesystem.FakeFilesystem.create_dir
 ##          https://jmcgeheeiv.github.io/pyfakefs/release/modules.html#pyfakefs.fake_filesystem.set_uid
 
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -30,12 +31,11 @@ def mock_homedirs_data(self):
 ## I know that pyfakefs automatically creates the 'fs' fixture for pytest for us, however stating it
 ##   explicitly helps demonstrate where it's come from for those less familar with it.
 fs = fake_filesystem.FakeFilesystem()
-test = CISAudit()
 
 
 @patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
 def test_audit_homedirs_exist_fail_all(fs):
-    state = test.audit_homedirs_exist()
+    state = CISAudit().audit_homedirs_exist()
     assert state == 1
 
 
@@ -43,7 +43,7 @@ def test_audit_homedirs_exist_fail_all(fs):
 def test_audit_homedirs_exist_fail_one(fs):
     fs.create_dir('/root')
 
-    state = test.audit_homedirs_exist()
+    state = CISAudit().audit_homedirs_exist()
     assert state == 1
 
 
@@ -52,9 +52,16 @@ def test_audit_homedirs_exist_pass(fs):
     fs.create_dir('/root')
     fs.create_dir('/home/pytest')
 
-    state = test.audit_homedirs_exist()
+    state = CISAudit().audit_homedirs_exist()
     assert state == 0
 
 
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+def test_audit_homedirs_exist_first_violation(fs, caplog):
+    state = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', first_violation=True)).audit_homedirs_exist()
+    assert state == 1
+    assert [record.msg for record in caplog.records if record.levelname == 'WARNING'] == ['The homedir /root does not exist']
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+
+def mock_homedirs_data(self):
+    data = [
+        'root 0 /root',
+        'pytest 1000 /home/pytest',
+    ]
+
+    for row in data:
+        user, uid, homedir = row.split(' ')
+
+        yield user, int(uid), homedir
+
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+@pytest.mark.parametrize('file', ['.forward', '.netrc', '.rhosts'])
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+def test_audit_homedirs_file_does_not_exist_pass(fs, file):
+    fs.create_file('/root/.bashrc')
+    fs.create_dir('/home/pytest')
+
+    state = CISAudit().audit_homedirs_file_does_not_exist(file=file)
+    assert state == 0
+
+
+@pytest.mark.parametrize('file', ['.forward', '.netrc', '.rhosts'])
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+def test_audit_homedirs_file_does_not_exist_fail(fs, file):
+    fs.create_file('/root/.bashrc')
+    fs.create_file(f'/home/pytest/{file}')
+
+    state = CISAudit().audit_homedirs_file_does_not_exist(file=file)
+    assert state == 1
+
+
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+def test_audit_homedirs_file_does_not_exist_first_violation(fs, caplog):
+    fs.create_file('/root/.netrc')
+    fs.create_file('/home/pytest/.netrc')
+
+    state = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', first_violation=True)).audit_homedirs_file_does_not_exist(file='.netrc')
+    assert state == 1
+    assert [record.msg for record in caplog.records if record.levelname == 'WARNING'] == ['root(0) has a .netrc file in /root']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -16,25 +16,24 @@ from pyfakefs import fake_filesystem
 from cis_audit import CISAudit
 
 
-def mock_homedirs_data(self, cmd):
-    output = [
+def mock_homedirs_data(self):
+    data = [
         'root 0 /root',
         'pytest 1000 /home/pytest',
-        '',
     ]
-    error = ['']
-    returncode = 0
 
-    return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
+    for row in data:
+        user, uid, homedir = row.split(' ')
+
+        yield user, int(uid), homedir
 
 
 ## I know that pyfakefs automatically creates the 'fs' fixture for pytest for us, however stating it
 ##   explicitly helps demonstrate where it's come from for those less familar with it.
 fs = fake_filesystem.FakeFilesystem()
-test = CISAudit()
 
 
-@patch.object(CISAudit, "_shellexec", mock_homedirs_data)
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
 def test_audit_homedirs_ownership_fail(fs):
     ## Create /root and /home/pytest as root:root
     fake_filesystem.set_uid(0)
@@ -42,11 +41,11 @@ def test_audit_homedirs_ownership_fail(fs):
     fs.create_dir('/root')
     fs.create_dir('/home/pytest')
 
-    state = test.audit_homedirs_ownership()
+    state = CISAudit().audit_homedirs_ownership()
     assert state == 1
 
 
-@patch.object(CISAudit, "_shellexec", mock_homedirs_data)
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
 def test_audit_homedirs_ownership_pass(fs):
     ## Create /root homedir as root:root
     fake_filesystem.set_uid(0)
@@ -58,9 +57,21 @@ def test_audit_homedirs_ownership_pass(fs):
     fake_filesystem.set_gid(1000)
     fs.create_dir('/home/pytest')
 
-    state = test.audit_homedirs_ownership()
+    state = CISAudit().audit_homedirs_ownership()
     assert state == 0
 
 
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+def test_audit_homedirs_ownership_first_violation(fs, caplog):
+    fake_filesystem.set_uid(1000)
+    fs.create_dir('/root')
+    fake_filesystem.set_uid(0)
+    fs.create_dir('/home/pytest')
+
+    state = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', first_violation=True)).audit_homedirs_ownership()
+    assert state == 1
+    assert [record.msg for record in caplog.records if record.levelname == 'WARNING'] == ['root(0) does not own /root']
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -7,6 +7,7 @@
 ##          https://jmcgeheeiv.github.io/pyfakefs/release/modules.html#pyfakefs.fake_filesystem.FakeFilesystem.create_dir
 ##          https://jmcgeheeiv.github.io/pyfakefs/release/modules.html#pyfakefs.fake_filesystem.set_uid
 
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -30,7 +31,6 @@ def mock_homedirs_data(self):
 ## I know that pyfakefs automatically creates the 'fs' fixture for pytest for us, however stating it
 ##   explicitly helps demonstrate where it's come from for those less familar with it.
 fs = fake_filesystem.FakeFilesystem()
-test = CISAudit()
 
 
 @patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
@@ -38,7 +38,7 @@ def test_audit_homedirs_permissions_pass_750(fs):
     fs.create_dir('/root', perm_bits=0o750)
     fs.create_dir('/home/pytest', perm_bits=0o750)
 
-    state = test.audit_homedirs_permissions()
+    state = CISAudit().audit_homedirs_permissions()
     assert state == 0
 
 
@@ -47,7 +47,7 @@ def test_audit_homedirs_permissions_pass_700(fs):
     fs.create_dir('/root', perm_bits=0o700)
     fs.create_dir('/home/pytest', perm_bits=0o700)
 
-    state = test.audit_homedirs_permissions()
+    state = CISAudit().audit_homedirs_permissions()
     assert state == 0
 
 
@@ -56,7 +56,7 @@ def test_audit_homedirs_permissions_fail_755(fs):
     fs.create_dir('/root', perm_bits=0o755)
     fs.create_dir('/home/pytest', perm_bits=0o755)
 
-    state = test.audit_homedirs_permissions()
+    state = CISAudit().audit_homedirs_permissions()
     assert state == 1
 
 
@@ -65,9 +65,19 @@ def test_audit_homedirs_permissions_fail_770(fs):
     fs.create_dir('/root', perm_bits=0o770)
     fs.create_dir('/home/pytest', perm_bits=0o770)
 
-    state = test.audit_homedirs_permissions()
+    state = CISAudit().audit_homedirs_permissions()
     assert state == 1
 
 
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+def test_audit_homedirs_permissions_first_violation(fs, caplog):
+    fs.create_dir('/root', perm_bits=0o755)
+    fs.create_dir('/home/pytest', perm_bits=0o755)
+
+    state = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', first_violation=True)).audit_homedirs_permissions()
+    assert state == 1
+    assert [record.msg for record in caplog.records if record.levelname == 'WARNING'] == ['Homedir /root is not 0750 or more restrictive']
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
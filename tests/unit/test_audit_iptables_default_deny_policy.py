@@ -8,60 +8,62 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_iptables_default_deny_pass(self, cmd):
-    returncode = 0
-    stderr = ['']
+def mock_iptables_default_deny_pass(self, ip_version):
+    chains = {
+        'INPUT': SimpleNamespace(policy='DROP', rules=[]),
+        'FORWARD': SimpleNamespace(policy='DROP', rules=[]),
+        'OUTPUT': SimpleNamespace(policy='DROP', rules=[]),
+    }
 
-    if 'INPUT' in cmd:
-        stdout = ['-P INPUT DROP']
-    elif 'FORWARD' in cmd:
-        stdout = ['-P FORWARD DROP']
-    elif 'OUTPUT' in cmd:
-        stdout = ['-P OUTPUT DROP']
+    return SimpleNamespace(returncode=0, lines=[], chains=chains)
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
+def mock_iptables_default_deny_fail(self, ip_version):
+    chains = {
+        'INPUT': SimpleNamespace(policy='ACCEPT', rules=[]),
+        'FORWARD': SimpleNamespace(policy='ACCEPT', rules=[]),
+        'OUTPUT': SimpleNamespace(policy='ACCEPT', rules=[]),
+    }
 
-def mock_iptables_default_deny_fail(self, cmd):
-    stderr = ['']
-    returncode = 1
+    return SimpleNamespace(returncode=0, lines=[], chains=chains)
 
-    if 'INPUT' in cmd:
-        stdout = ['-P INPUT ACCEPT']
-    elif 'FORWARD' in cmd:
-        stdout = ['-P FORWARD ACCEPT']
-    elif 'OUTPUT' in cmd:
-        stdout = ['-P OUTPUT ACCEPT']
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+def mock_iptables_default_deny_missing(self, ip_version):
+    return SimpleNamespace(returncode=127, lines=[''], chains={})
 
 
 test = CISAudit()
 
 
-@patch.object(CISAudit, "_shellexec", mock_iptables_default_deny_pass)
+@patch.object(CISAudit, "_get_iptables_ruleset", mock_iptables_default_deny_pass)
 def test_audit_iptables_default_deny_pass_ipv4():
     state = test.audit_iptables_default_deny_policy(ip_version='ipv4')
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_iptables_default_deny_fail)
+@patch.object(CISAudit, "_get_iptables_ruleset", mock_iptables_default_deny_fail)
 def test_audit_iptables_default_deny_fail_ipv4():
     state = test.audit_iptables_default_deny_policy(ip_version='ipv4')
     assert state == 7
 
 
-@patch.object(CISAudit, "_shellexec", mock_iptables_default_deny_pass)
+@patch.object(CISAudit, "_get_iptables_ruleset", mock_iptables_default_deny_pass)
 def test_audit_iptables_default_deny_pass_ipv6():
     state = test.audit_iptables_default_deny_policy(ip_version='ipv6')
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_iptables_default_deny_fail)
+@patch.object(CISAudit, "_get_iptables_ruleset", mock_iptables_default_deny_fail)
 def test_audit_iptables_default_deny_fail_ipv6():
     state = test.audit_iptables_default_deny_policy(ip_version='ipv6')
     assert state == 7
 
 
+@patch.object(CISAudit, "_get_iptables_ruleset", mock_iptables_default_deny_missing)
+def test_audit_iptables_default_deny_fail_not_installed():
+    state = test.audit_iptables_default_deny_policy(ip_version='ipv4')
+    assert state == 7
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '--no-cov'])
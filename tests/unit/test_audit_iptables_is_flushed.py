@@ -8,38 +8,57 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_iptables_is_flushed_pass(self, cmd, **kwargs):
-    output = ['']
-    error = ['']
-    returncode = 0
+def mock_iptables_is_flushed_pass(self, ip_version):
+    chains = {
+        'INPUT': SimpleNamespace(policy='ACCEPT', rules=[]),
+        'FORWARD': SimpleNamespace(policy='ACCEPT', rules=[]),
+        'OUTPUT': SimpleNamespace(policy='ACCEPT', rules=[]),
+    }
 
-    return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
+    return SimpleNamespace(returncode=0, lines=[], chains=chains)
 
 
-def mock_iptables_is_flushed_fail(self, cmd, **kwargs):
-    output = [
-        '-A INPUT -i lo -j ACCEPT',
-    ]
-    error = ['']
-    returncode = 1
+def mock_iptables_is_flushed_fail(self, ip_version):
+    chains = {
+        'INPUT': SimpleNamespace(policy='ACCEPT', rules=['-A INPUT -i lo -j ACCEPT']),
+        'FORWARD': SimpleNamespace(policy='ACCEPT', rules=[]),
+        'OUTPUT': SimpleNamespace(policy='ACCEPT', rules=[]),
+    }
 
-    return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
+    return SimpleNamespace(returncode=0, lines=[], chains=chains)
+
+
+def mock_iptables_is_flushed_fail_ipv6_chain(self, ip_version):
+    chains = {
+        'INPUT': SimpleNamespace(policy='ACCEPT', rules=[]),
+    }
+
+    if ip_version == 'ipv6':
+        chains['pytest'] = SimpleNamespace(policy=None, rules=[])
+
+    return SimpleNamespace(returncode=0, lines=[], chains=chains)
 
 
 test = CISAudit()
 
 
-@patch.object(CISAudit, "_shellexec", mock_iptables_is_flushed_pass)
+@patch.object(CISAudit, "_get_iptables_ruleset", mock_iptables_is_flushed_pass)
 def test_iptables_is_flushed_pass():
     state = test.audit_iptables_is_flushed()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_iptables_is_flushed_fail)
+@patch.object(CISAudit, "_get_iptables_ruleset", mock_iptables_is_flushed_fail)
 def test_iptables_is_flushed_fail():
     state = test.audit_iptables_is_flushed()
     assert state == 3
 
 
+@patch.object(CISAudit, "_get_iptables_ruleset", mock_iptables_is_flushed_fail_ipv6_chain)
+def test_iptables_is_flushed_fail_user_defined_chain():
+    state = test.audit_iptables_is_flushed()
+    assert state == 2
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '--no-cov'])
@@ -8,7 +8,7 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_iptables_rules_are_saved_pass(self, cmd):
+def mock_iptables_rules_are_saved_pass(self, cmd, *args, **kwargs):
     stdout = [
         'COMMIT',
         '*filter',
@@ -23,7 +23,7 @@ def mock_iptables_rules_are_saved_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_iptables_rules_are_saved_fail_ipv4(self, cmd):
+def mock_iptables_rules_are_saved_fail_ipv4(self, cmd, *args, **kwargs):
     if 'iptables-save' in cmd:
         stdout = [
             'COMMIT',
@@ -42,7 +42,7 @@ def mock_iptables_rules_are_saved_fail_ipv4(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_iptables_rules_are_saved_fail_ipv6(self, cmd):
+def mock_iptables_rules_are_saved_fail_ipv6(self, cmd, *args, **kwargs):
     if 'ip6tables-save' in cmd:
         stdout = [
             'COMMIT',
@@ -61,32 +61,33 @@ def mock_iptables_rules_are_saved_fail_ipv6(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-test = CISAudit()
-
-
 ## IPv4
 @patch.object(CISAudit, "_shellexec", mock_iptables_rules_are_saved_pass)
+@patch.object(CISAudit, "_grepfile", mock_iptables_rules_are_saved_pass)
 def test_audit_iptables_rules_are_saved_pass():
-    state = test.audit_iptables_rules_are_saved(ip_version='ipv4')
+    state = CISAudit().audit_iptables_rules_are_saved(ip_version='ipv4')
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_iptables_rules_are_saved_fail_ipv4)
+@patch.object(CISAudit, "_grepfile", mock_iptables_rules_are_saved_fail_ipv4)
 def test_audit_iptables_rules_are_saved_fail():
-    state = test.audit_iptables_rules_are_saved(ip_version='ipv4')
+    state = CISAudit().audit_iptables_rules_are_saved(ip_version='ipv4')
     assert state == 1
 
 
 ## IPv6
 @patch.object(CISAudit, "_shellexec", mock_iptables_rules_are_saved_pass)
+@patch.object(CISAudit, "_grepfile", mock_iptables_rules_are_saved_pass)
 def test_audit_ip6tables_rules_are_saved_pass():
-    state = test.audit_iptables_rules_are_saved(ip_version='ipv6')
+    state = CISAudit().audit_iptables_rules_are_saved(ip_version='ipv6')
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_iptables_rules_are_saved_fail_ipv6)
+@patch.object(CISAudit, "_grepfile", mock_iptables_rules_are_saved_fail_ipv6)
 def test_audit_ip6tables_rules_are_saved_fail():
-    state = test.audit_iptables_rules_are_saved(ip_version='ipv6')
+    state = CISAudit().audit_iptables_rules_are_saved(ip_version='ipv6')
     assert state == 1
 
 
@@ -10,7 +10,7 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_audit_journald_configured_to_send_logs_to_rsyslog_pass(self, cmd):
+def mock_audit_journald_configured_to_send_logs_to_rsyslog_pass(self, pattern, files, **kwargs):
     stdout = [
         'ForwardToSyslog=yes',
         '',
@@ -21,7 +21,7 @@ def mock_audit_journald_configured_to_send_logs_to_rsyslog_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_journald_configured_to_send_logs_to_rsyslog_fail(self, cmd):
+def mock_audit_journald_configured_to_send_logs_to_rsyslog_fail(self, pattern, files, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -29,13 +29,13 @@ def mock_audit_journald_configured_to_send_logs_to_rsyslog_fail(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_journald_configured_to_send_logs_to_rsyslog_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_journald_configured_to_send_logs_to_rsyslog_pass)
 def test_audit_journald_configured_to_send_logs_to_rsyslog_pass():
     state = test.audit_journald_configured_to_send_logs_to_rsyslog()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_journald_configured_to_send_logs_to_rsyslog_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_journald_configured_to_send_logs_to_rsyslog_fail)
 def test_audit_journald_configured_to_send_logs_to_rsyslog_fail():
     state = test.audit_journald_configured_to_send_logs_to_rsyslog()
     assert state == 1
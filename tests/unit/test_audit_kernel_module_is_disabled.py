@@ -8,64 +8,75 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_module_disabled(self, cmd):
-    if 'modprobe' in cmd:
-        ## Modprobe output ends with a space, refer to https://github.com/finalduty/cis-benchmarks-audit/issues/36
-        output = ['install /bin/true ']
-        error = ['']
-        returncode = 0
-    elif 'lsmod' in cmd:
-        output = ['']
-        error = ['']
-        returncode = 1
-
-    return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
-
-
-def mock_module_enabled(self, cmd):
-    if 'modprobe' in cmd:
-        ## Modprobe output ends with a space, refer to https://github.com/finalduty/cis-benchmarks-audit/issues/36
-        output = ['insmod /lib/modules/3.10.0-1160.45.1.el7.x86_64/kernel/fs/fat/fat.ko.xz\ninsmod /lib/modules/3.10.0-1160.45.1.el7.x86_64/kernel/fs/fat/vfat.ko.xz ']
-        error = ['']
-        returncode = 0
-    elif 'lsmod' in cmd:
-        output = ['pytest                  584133  2']
-        error = ['']
-        returncode = 0
-
-    return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
-
-
-def mock_filesystem_not_found(self, cmd):
-    if 'modprobe' in cmd:
-        output = ['']
-        error = ['modprobe: FATAL: Module pytest not found.']
-        returncode = 1
-    elif 'lsmod' in cmd:
-        output = ['']
-        error = ['']
-        returncode = 1
-
-    return SimpleNamespace(stdout=output, stderr=error, returncode=returncode)
-
-
-@patch.object(CISAudit, "_shellexec", mock_module_disabled)
+def mock_module_disabled(self):
+    return SimpleNamespace(loaded=frozenset(), available=frozenset(['pytest']), install={'pytest': '/bin/true'}, blacklist=frozenset())
+
+
+def mock_module_enabled(self):
+    return SimpleNamespace(loaded=frozenset(['pytest']), available=frozenset(['pytest']), install={}, blacklist=frozenset())
+
+
+def mock_module_not_disabled(self):
+    return SimpleNamespace(loaded=frozenset(), available=frozenset(['pytest']), install={'pytest': '/bin/false'}, blacklist=frozenset(['pytest']))
+
+
+def mock_filesystem_not_found(self):
+    return SimpleNamespace(loaded=frozenset(), available=frozenset(['vfat']), install={}, blacklist=frozenset())
+
+
+def mock_modules_unknown(self):
+    return SimpleNamespace(loaded=frozenset(), available=None, install={}, blacklist=frozenset())
+
+
+def mock_module_similar_name_loaded(self):
+    return SimpleNamespace(loaded=frozenset(['pytest_udf']), available=frozenset(['udf', 'pytest_udf']), install={'udf': '/bin/true'}, blacklist=frozenset())
+
+
+def mock_module_with_underscore_loaded(self):
+    return SimpleNamespace(loaded=frozenset(['usb_storage']), available=frozenset(['usb_storage']), install={}, blacklist=frozenset())
+
+
+@patch.object(CISAudit, "_get_kernel_modules", mock_module_disabled)
 def test_audit_kernel_module_is_disabled_pass_disabled():
     state = CISAudit().audit_kernel_module_is_disabled(module='pytest')
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_filesystem_not_found)
+@patch.object(CISAudit, "_get_kernel_modules", mock_filesystem_not_found)
 def test_audit_kernel_module_is_disabled_pass_not_found():
     state = CISAudit().audit_kernel_module_is_disabled(module='pytest')
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_module_enabled)
+@patch.object(CISAudit, "_get_kernel_modules", mock_module_similar_name_loaded)
+def test_audit_kernel_module_is_disabled_pass_similar_name_loaded():
+    state = CISAudit().audit_kernel_module_is_disabled(module='udf')
+    assert state == 0
+
+
+@patch.object(CISAudit, "_get_kernel_modules", mock_module_not_disabled)
+def test_audit_kernel_module_is_disabled_fail_not_disabled():
+    state = CISAudit().audit_kernel_module_is_disabled(module='pytest')
+    assert state == 1
+
+
+@patch.object(CISAudit, "_get_kernel_modules", mock_modules_unknown)
+def test_audit_kernel_module_is_disabled_fail_modules_unknown():
+    state = CISAudit().audit_kernel_module_is_disabled(module='pytest')
+    assert state == 1
+
+
+@patch.object(CISAudit, "_get_kernel_modules", mock_module_enabled)
 def test_audit_kernel_module_is_disabled_fail():
     state = CISAudit().audit_kernel_module_is_disabled(module='pytest')
     assert state == 2
 
 
+@patch.object(CISAudit, "_get_kernel_modules", mock_module_with_underscore_loaded)
+def test_audit_kernel_module_is_disabled_fail_name_with_dash():
+    state = CISAudit().audit_kernel_module_is_disabled(module='usb-storage')
+    assert state == 2
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '--no-cov'])
@@ -8,36 +8,49 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_mta_pass(self, cmd):
-    stdout = ['']
-    stderr = ['']
-    returncode = 1
+def mock_sockets(*sockets):
+    by_port = {}
+    by_address = {}
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+    for protocol, address, port in sockets:
+        socket = SimpleNamespace(protocol=protocol, address=address, port=port)
+        by_port.setdefault(port, []).append(socket)
+        by_address.setdefault(address, []).append(socket)
 
+    return SimpleNamespace(by_port=by_port, by_address=by_address)
 
-def mock_mta_fail(self, cmd):
-    stdout = ['0.0.0.0:25']
-    stderr = ['']
-    returncode = 0
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+def mock_mta_pass(self):
+    return mock_sockets(('tcp', '127.0.0.1', 25), ('tcp6', '::1', 25), ('tcp', '0.0.0.0', 22))
+
+
+def mock_mta_fail(self):
+    return mock_sockets(('tcp', '0.0.0.0', 25))
+
+
+def mock_mta_fail_ipv6(self):
+    return mock_sockets(('tcp', '127.0.0.1', 25), ('tcp6', '::', 25))
 
 
 class TestMTAIsLocalhost:
     test = CISAudit()
     test_id = '1.1'
 
-    @patch.object(CISAudit, "_shellexec", mock_mta_pass)
+    @patch.object(CISAudit, "_get_listening_sockets", mock_mta_pass)
     def test_mta_is_localhost_pass(self):
         state = self.test.audit_mta_is_localhost_only()
         assert state == 0
 
-    @patch.object(CISAudit, "_shellexec", mock_mta_fail)
+    @patch.object(CISAudit, "_get_listening_sockets", mock_mta_fail)
     def test_mta_is_localhost_fail(self):
         state = self.test.audit_mta_is_localhost_only()
         assert state == 1
 
+    @patch.object(CISAudit, "_get_listening_sockets", mock_mta_fail_ipv6)
+    def test_mta_is_localhost_fail_ipv6(self):
+        state = self.test.audit_mta_is_localhost_only()
+        assert state == 1
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '--no-cov'])
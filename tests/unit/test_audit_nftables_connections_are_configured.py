@@ -8,47 +8,57 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_nftables_connections_are_configured_pass(self, cmd):
-    returncode = 0
-    stderr = ['']
-
-    if 'input' in cmd:
-        stdout = [
-            'ip protocol tcp ct state established accept',
-            'ip protocol udp ct state established accept',
-            'ip protocol icmp ct state established accept',
-        ]
-    elif 'output' in cmd:
-        stdout = [
-            'ip protocol tcp ct state established,related,new accept',
-            'ip protocol udp ct state established,related,new accept',
-            'ip protocol icmp ct state established,related,new accept',
-        ]
-    else:
-        stdout = ['']
-        returncode = 1
-
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
-
-
-def mock_nftables_connections_are_configured_fail(self, cmd):
-    stdout = ['']
-    stderr = ['']
-    returncode = 1
-
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+def mock_nftables_connections_are_configured_pass(self):
+    chains = [
+        SimpleNamespace(
+            family='inet',
+            table='filter',
+            name='input',
+            type='filter',
+            hook='input',
+            priority=0,
+            policy='drop',
+            rules=[
+                'iif "lo" accept',
+                'ip protocol tcp ct state established accept',
+                'ip protocol udp ct state established accept',
+                'ip protocol icmp ct state established accept',
+                'tcp dport ssh accept',
+            ],
+        ),
+        SimpleNamespace(
+            family='inet',
+            table='filter',
+            name='output',
+            type='filter',
+            hook='output',
+            priority=0,
+            policy='drop',
+            rules=[
+                'ip protocol tcp ct state established,related,new accept',
+                'ip protocol udp ct state established,related,new accept',
+                'ip protocol icmp ct state established,related,new accept',
+            ],
+        ),
+    ]
+
+    return SimpleNamespace(tables=[('inet', 'filter')], chains=chains)
+
+
+def mock_nftables_connections_are_configured_fail(self):
+    return SimpleNamespace(tables=[], chains=[])
 
 
 test = CISAudit()
 
 
-@patch.object(CISAudit, "_shellexec", mock_nftables_connections_are_configured_pass)
+@patch.object(CISAudit, "_get_nftables_ruleset", mock_nftables_connections_are_configured_pass)
 def test_audit_nftables_connections_are_configured_pass():
     state = test.audit_nftables_outbound_and_established_connections()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_nftables_connections_are_configured_fail)
+@patch.object(CISAudit, "_get_nftables_ruleset", mock_nftables_connections_are_configured_fail)
 def test_audit_nftables_connections_are_configured_fail_all():
     state = test.audit_nftables_outbound_and_established_connections()
     assert state == 3
@@ -8,42 +8,47 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_nftables_default_deny_policy_pass(self, cmd):
-    returncode = 0
-    stderr = ['']
+def mock_nftables_default_deny_policy_pass(self):
+    chains = [
+        SimpleNamespace(family='inet', table='filter', name='input', type='filter', hook='input', priority=0, policy='drop', rules=[]),
+        SimpleNamespace(family='inet', table='filter', name='forward', type='filter', hook='forward', priority='filter', policy='drop', rules=[]),
+        SimpleNamespace(family='inet', table='filter', name='output', type='filter', hook='output', priority=0, policy='drop', rules=[]),
+    ]
 
-    if 'input' in cmd:
-        stdout = ['type filter hook input priority 0; policy drop;']
-    elif 'forward' in cmd:
-        stdout = ['type filter hook forward priority 0; policy drop;']
-    elif 'output' in cmd:
-        stdout = ['type filter hook output priority 0; policy drop;']
-    else:
-        stdout = ['']
-        returncode = 1
+    return SimpleNamespace(tables=[('inet', 'filter')], chains=chains)
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
+def mock_nftables_default_deny_policy_fail(self):
+    chains = [
+        SimpleNamespace(family='inet', table='filter', name='input', type='filter', hook='input', priority=0, policy='accept', rules=[]),
+        SimpleNamespace(family='inet', table='filter', name='forward', type='filter', hook='forward', priority=0, policy='accept', rules=[]),
+        SimpleNamespace(family='inet', table='filter', name='output', type='filter', hook='output', priority=0, policy='accept', rules=[]),
+    ]
 
-def mock_nftables_default_deny_policy_fail(self, cmd):
-    stdout = ['']
-    stderr = ['']
-    returncode = 1
+    return SimpleNamespace(tables=[('inet', 'filter')], chains=chains)
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
+def mock_nftables_default_deny_policy_missing(self):
+    return SimpleNamespace(tables=[], chains=[])
 
-@patch.object(CISAudit, "_shellexec", mock_nftables_default_deny_policy_pass)
+
+@patch.object(CISAudit, "_get_nftables_ruleset", mock_nftables_default_deny_policy_pass)
 def test_audit_nftables_default_deny_policy_pass():
     state = CISAudit().audit_nftables_default_deny_policy()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_nftables_default_deny_policy_fail)
+@patch.object(CISAudit, "_get_nftables_ruleset", mock_nftables_default_deny_policy_fail)
 def test_audit_nftables_default_deny_policy_fail():
     state = CISAudit().audit_nftables_default_deny_policy()
     assert state == 7
 
 
+@patch.object(CISAudit, "_get_nftables_ruleset", mock_nftables_default_deny_policy_missing)
+def test_audit_nftables_default_deny_policy_fail_no_base_chains():
+    state = CISAudit().audit_nftables_default_deny_policy()
+    assert state == 7
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '--no-cov'])
@@ -8,38 +8,55 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_nftables_loopback_is_configured_pass(self, cmd):
-    returncode = 0
-    stderr = ['']
-
-    if 'accept' in cmd:
-        stdout = ['iif "lo" accept']
-    elif 'ip saddr' in cmd:
-        stdout = ['ip saddr 127.0.0.0/8 counter packets 99 bytes 99 drop']
-    elif 'ip6 saddr' in cmd:
-        stdout = ['ip6 saddr ::1 counter packets 0 bytes 0 drop']
-    else:
-        stdout = ['']
-        returncode = 1
-
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
-
-
-def mock_nftables_loopback_is_configured_fail(self, cmd):
-    stdout = ['']
-    stderr = ['']
-    returncode = 1
-
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
-
-
-@patch.object(CISAudit, "_shellexec", mock_nftables_loopback_is_configured_pass)
+def mock_nftables_loopback_is_configured_pass(self):
+    chains = [
+        SimpleNamespace(
+            family='inet',
+            table='filter',
+            name='input',
+            type='filter',
+            hook='input',
+            priority=0,
+            policy='drop',
+            rules=[
+                'iif "lo" accept',
+                'ip saddr 127.0.0.0/8 counter packets 99 bytes 99 drop',
+                'ip6 saddr ::1 counter packets 0 bytes 0 drop',
+            ],
+        ),
+    ]
+
+    return SimpleNamespace(tables=[('inet', 'filter')], chains=chains)
+
+
+def mock_nftables_loopback_is_configured_fail(self):
+    chains = [
+        SimpleNamespace(
+            family='inet',
+            table='filter',
+            name='output',
+            type='filter',
+            hook='output',
+            priority=0,
+            policy='drop',
+            rules=[
+                'iif "lo" accept',
+                'ip saddr 127.0.0.0/8 counter packets 99 bytes 99 drop',
+                'ip6 saddr ::1 counter packets 0 bytes 0 drop',
+            ],
+        ),
+    ]
+
+    return SimpleNamespace(tables=[('inet', 'filter')], chains=chains)
+
+
+@patch.object(CISAudit, "_get_nftables_ruleset", mock_nftables_loopback_is_configured_pass)
 def test_audit_nftables_loopback_is_configured_pass():
     state = CISAudit().audit_nftables_loopback_is_configured()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_nftables_loopback_is_configured_fail)
+@patch.object(CISAudit, "_get_nftables_ruleset", mock_nftables_loopback_is_configured_fail)
 def test_audit_nftables_loopback_is_configured_fail_all():
     state = CISAudit().audit_nftables_loopback_is_configured()
     assert state == 7
@@ -8,29 +8,21 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_nftables_table_exists_pass(self, cmd):
-    stdout = ['table inet filter']
-    stderr = ['']
-    returncode = 0
+def mock_nftables_table_exists_pass(self):
+    return SimpleNamespace(tables=[('inet', 'filter')], chains=[])
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
+def mock_nftables_table_exists_fail(self):
+    return SimpleNamespace(tables=[], chains=[])
 
-def mock_nftables_table_exists_fail(self, cmd):
-    stdout = ['']
-    stderr = ['']
-    returncode = 0
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
-
-
-@patch.object(CISAudit, "_shellexec", mock_nftables_table_exists_pass)
+@patch.object(CISAudit, "_get_nftables_ruleset", mock_nftables_table_exists_pass)
 def test_audit_nftables_table_exists_pass():
     state = CISAudit().audit_nftables_table_exists()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_nftables_table_exists_fail)
+@patch.object(CISAudit, "_get_nftables_ruleset", mock_nftables_table_exists_fail)
 def test_audit_nftables_table_exists_fail():
     state = CISAudit().audit_nftables_table_exists()
     assert state == 1
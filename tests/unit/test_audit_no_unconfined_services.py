@@ -8,29 +8,25 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_unconfined_services_pass(self, cmd):
-    stdout = ['']
-    stderr = ['']
-    returncode = 1
+def mock_unconfined_services_pass(self):
+    systemd = SimpleNamespace(pid=1, name='systemd', user='root', args=['/usr/lib/systemd/systemd'], context='system_u:system_r:init_t:s0')
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+    return SimpleNamespace(by_name={'systemd': [systemd]}, by_user={'root': [systemd]}, by_selinux_type={'init_t': [systemd]})
 
 
-def mock_unconfined_services_fail(self, cmd):
-    stdout = ['system_u:system_r:unconfined_service_t:s0 720 ? 00:03:07 VBoxService']
-    stderr = ['']
-    returncode = 0
+def mock_unconfined_services_fail(self):
+    vboxservice = SimpleNamespace(pid=720, name='VBoxService', user='root', args=['/usr/sbin/VBoxService'], context='system_u:system_r:unconfined_service_t:s0')
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+    return SimpleNamespace(by_name={'VBoxService': [vboxservice]}, by_user={'root': [vboxservice]}, by_selinux_type={'unconfined_service_t': [vboxservice]})
 
 
-@patch.object(CISAudit, "_shellexec", mock_unconfined_services_pass)
+@patch.object(CISAudit, "_get_processes", mock_unconfined_services_pass)
 def test_no_unconfined_services_pass():
     state = CISAudit().audit_no_unconfined_services()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_unconfined_services_fail)
+@patch.object(CISAudit, "_get_processes", mock_unconfined_services_fail)
 def test_no_unconfined_services_fail():
     state = CISAudit().audit_no_unconfined_services()
     assert state == 1
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from cis_audit import CISAudit
+
+test = CISAudit()
+
+
+def mock_audit_no_unowned_files_or_dirs_pass(self, paths=None):
+    return SimpleNamespace(unowned=[])
+
+
+def mock_audit_no_unowned_files_or_dirs_fail(self, paths=None):
+    return SimpleNamespace(unowned=['/pytest/orphan'])
+
+
+@patch.object(CISAudit, "_scan_filesystems", mock_audit_no_unowned_files_or_dirs_pass)
+def test_audit_no_unowned_files_or_dirs_pass():
+    state = test.audit_no_unowned_files_or_dirs()
+    assert state == 0
+
+
+@patch.object(CISAudit, "_scan_filesystems", mock_audit_no_unowned_files_or_dirs_fail)
+def test_audit_no_unowned_files_or_dirs_fail():
+    state = test.audit_no_unowned_files_or_dirs()
+    assert state == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from cis_audit import CISAudit
+
+test = CISAudit()
+
+
+def mock_audit_no_world_writable_files_pass(self, paths=None):
+    return SimpleNamespace(world_writable_files=[])
+
+
+def mock_audit_no_world_writable_files_fail(self, paths=None):
+    return SimpleNamespace(world_writable_files=['/pytest/world'])
+
+
+@patch.object(CISAudit, "_scan_filesystems", mock_audit_no_world_writable_files_pass)
+def test_audit_no_world_writable_files_pass():
+    state = test.audit_no_world_writable_files()
+    assert state == 0
+
+
+@patch.object(CISAudit, "_scan_filesystems", mock_audit_no_world_writable_files_fail)
+def test_audit_no_world_writable_files_fail():
+    state = test.audit_no_world_writable_files()
+    assert state == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
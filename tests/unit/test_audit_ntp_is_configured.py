@@ -13,12 +13,6 @@ def mock_ntp_configured_pass(self, cmd):
         stdout = ['enabled']
     elif 'is-active' in cmd:
         stdout = ['active']
-    elif 'server' in cmd:
-        stdout = ['server 0.centos.pool.ntp.org iburst', 'server 1.centos.pool.ntp.org iburst', 'server 2.centos.pool.ntp.org iburst', 'server 3.centos.pool.ntp.org iburst']
-    elif 'restrict' in cmd:
-        stdout = ['restrict -4 default kod nomodify notrap nopeer noquery', 'restrict -6 default kod nomodify notrap nopeer noquery']
-    elif 'ps aux' in cmd:
-        stdout = ['/usr/sbin/ntpd -u ntp:ntp -g']
 
     stderr = ['']
     returncode = 0
@@ -33,28 +27,53 @@ def mock_ntp_configured_fail(self, cmd):
     elif 'is-active' in cmd:
         stdout = ['inactive']
         returncode = 0
-    elif 'server' in cmd:
-        stdout = ['']
-        returncode = 1
-    elif 'restrict' in cmd:
-        stdout = ['']
-        returncode = 1
-    elif 'ps aux' in cmd:
-        stdout = ['']
-        returncode = 1
 
     stderr = ['']
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
+def mock_ntp_processes_pass(self):
+    ntpd = SimpleNamespace(pid=712, name='ntpd', user='ntp', args=['/usr/sbin/ntpd', '-u', 'ntp:ntp', '-g'], context=None)
+
+    return SimpleNamespace(by_name={'ntpd': [ntpd]}, by_user={'ntp': [ntpd]}, by_selinux_type={})
+
+
+def mock_ntp_processes_fail(self):
+    return SimpleNamespace(by_name={}, by_user={}, by_selinux_type={})
+
+
+def mock_ntp_conf_pass(self, pattern, files, **kwargs):
+    if 'server' in pattern.pattern:
+        stdout = ['server 0.centos.pool.ntp.org iburst', 'server 1.centos.pool.ntp.org iburst', 'server 2.centos.pool.ntp.org iburst', 'server 3.centos.pool.ntp.org iburst']
+    elif 'restrict' in pattern.pattern:
+        stdout = ['restrict -4 default kod nomodify notrap nopeer noquery', 'restrict -6 default kod nomodify notrap nopeer noquery']
+
+    stderr = ['']
+    returncode = 0
+
+    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+
+
+def mock_ntp_conf_fail(self, pattern, files, **kwargs):
+    stdout = ['']
+    stderr = ['']
+    returncode = 1
+
+    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+
+
 @patch.object(CISAudit, "_shellexec", mock_ntp_configured_pass)
+@patch.object(CISAudit, "_grepfile", mock_ntp_conf_pass)
+@patch.object(CISAudit, "_get_processes", mock_ntp_processes_pass)
 def test_ntp_is_configured_pass():
     state = CISAudit().audit_ntp_is_configured()
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_ntp_configured_fail)
+@patch.object(CISAudit, "_grepfile", mock_ntp_conf_fail)
+@patch.object(CISAudit, "_get_processes", mock_ntp_processes_fail)
 def test_ntp_is_configured_fail():
     state = CISAudit().audit_ntp_is_configured()
     assert state == 31
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -9,31 +8,25 @@ from cis_audit import CISAudit
 
 
 def mock_nxdx_support_pass(self, cmd):
-    stdout = ['[    0.000000] NX (Execute Disable) protection: active']
-    stderr = ['']
-    returncode = 0
-
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+    yield '[    0.000000] Linux version 3.10.0-1160.el7.x86_64'
+    yield '[    0.000000] NX (Execute Disable) protection: active'
+    raise AssertionError('Output was read past the matching line')
 
 
 def mock_nxdx_support_fail(self, cmd):
-    stdout = ['']
-    stderr = ['']
-    returncode = 1
-
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+    yield '[    0.000000] Linux version 3.10.0-1160.el7.x86_64'
 
 
 class TestNXDXSupportEnabled:
     test = CISAudit()
     test_id = '1.1'
 
-    @patch.object(CISAudit, "_shellexec", mock_nxdx_support_pass)
+    @patch.object(CISAudit, "_shellexec_lines", mock_nxdx_support_pass)
     def test_nxdx_support_enabled_pass(self):
         state = self.test.audit_nxdx_support_enabled()
         assert state == 0
 
-    @patch.object(CISAudit, "_shellexec", mock_nxdx_support_fail)
+    @patch.object(CISAudit, "_shellexec_lines", mock_nxdx_support_fail)
     def test_nxdx_support_enabled_fail(self):
         state = self.test.audit_nxdx_support_enabled()
         assert state == 1
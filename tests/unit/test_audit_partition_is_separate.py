@@ -9,7 +9,10 @@ from cis_audit import CISAudit
 
 
 def mock_parition_exists(self, cmd):
-    output = ['/dev/sda1            1014M  125M  890M  13% /boot']
+    output = [
+        'proc on /proc type proc (rw,nosuid,nodev,noexec,relatime)',
+        '/dev/sda1 on /boot type xfs (rw,relatime,seclabel,attr2,inode64,noquota)',
+    ]
     error = ['']
     returncode = 0
 
@@ -27,7 +30,7 @@ def mock_parititon_not_exists(self, cmd):
 class TestPartitionSeparate:
     test_id = '1.1'
     test_level = 1
-    partition = '/dev/sda1'
+    partition = '/boot'
     test = CISAudit()
 
     @patch.object(CISAudit, "_shellexec", mock_parition_exists)
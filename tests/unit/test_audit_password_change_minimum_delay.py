@@ -10,43 +10,43 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_password_expiration_min_days_is_configured_pass(self, cmd):
+def mock_password_expiration_min_days_is_configured_pass(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if 'PASS_MIN_DAYS' in cmd:
+    if '/etc/login.defs' in files:
         stdout = ['PASS_MIN_DAYS    1']
-    elif 'shadow' in cmd:
+    elif '/etc/shadow' in files:
         stdout = [
-            'root:1',
-            'vagrant:1',
+            'root:$6$hash:19000:1:99999:7:::',
+            'vagrant:$6$hash:19000:1:99999:7:::',
         ]
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_password_expiration_min_days_is_configured_fail(self, cmd):
+def mock_password_expiration_min_days_is_configured_fail(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if 'PASS_MIN_DAYS' in cmd:
+    if '/etc/login.defs' in files:
         stdout = ['PASS_MIN_DAYS    0']
-    elif 'shadow' in cmd:
+    elif '/etc/shadow' in files:
         stdout = [
-            'root:0',
-            'vagrant:0',
+            'root:$6$hash:19000:0:99999:7:::',
+            'vagrant:$6$hash:19000:0:99999:7:::',
         ]
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_password_expiration_min_days_is_configured_pass)
+@patch.object(CISAudit, "_grepfile", mock_password_expiration_min_days_is_configured_pass)
 def test_audit_password_expiration_min_days_is_configured_pass():
     state = test.audit_password_change_minimum_delay()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_password_expiration_min_days_is_configured_fail)
+@patch.object(CISAudit, "_grepfile", mock_password_expiration_min_days_is_configured_fail)
 def test_audit_password_expiration_min_days_is_configured_pass_fail():
     state = test.audit_password_change_minimum_delay()
     assert state == 3
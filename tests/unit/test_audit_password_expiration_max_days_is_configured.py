@@ -10,43 +10,43 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_password_expiration_max_days_is_configured_pass(self, cmd):
+def mock_password_expiration_max_days_is_configured_pass(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if 'PASS_MAX_DAYS' in cmd:
+    if '/etc/login.defs' in files:
         stdout = ['PASS_MAX_DAYS    365']
-    elif 'shadow' in cmd:
+    elif '/etc/shadow' in files:
         stdout = [
-            'root:365',
-            'vagrant:365',
+            'root:$6$hash:19000:0:365:7:::',
+            'vagrant:$6$hash:19000:0:365:7:::',
         ]
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_password_expiration_max_days_is_configured_fail(self, cmd):
+def mock_password_expiration_max_days_is_configured_fail(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if 'PASS_MAX_DAYS' in cmd:
+    if '/etc/login.defs' in files:
         stdout = ['PASS_MAX_DAYS    99999']
-    elif 'shadow' in cmd:
+    elif '/etc/shadow' in files:
         stdout = [
-            'root:99999',
-            'vagrant:99999',
+            'root:$6$hash:19000:0:99999:7:::',
+            'vagrant:$6$hash:19000:0:99999:7:::',
         ]
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_password_expiration_max_days_is_configured_pass)
+@patch.object(CISAudit, "_grepfile", mock_password_expiration_max_days_is_configured_pass)
 def test_audit_password_expiration_max_days_is_configured_pass():
     state = test.audit_password_expiration_max_days_is_configured()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_password_expiration_max_days_is_configured_fail)
+@patch.object(CISAudit, "_grepfile", mock_password_expiration_max_days_is_configured_fail)
 def test_audit_password_expiration_max_days_is_configured_pass_fail():
     state = test.audit_password_expiration_max_days_is_configured()
     assert state == 3
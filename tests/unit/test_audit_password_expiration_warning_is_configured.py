@@ -10,43 +10,43 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_password_expiration_warning_is_configured_pass(self, cmd):
+def mock_password_expiration_warning_is_configured_pass(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if 'PASS_WARN_AGE' in cmd:
+    if '/etc/login.defs' in files:
         stdout = ['PASS_WARN_AGE    7']
-    elif 'shadow' in cmd:
+    elif '/etc/shadow' in files:
         stdout = [
-            'root:7',
-            'vagrant:7',
+            'root:$6$hash:19000:0:99999:7:::',
+            'vagrant:$6$hash:19000:0:99999:7:::',
         ]
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_password_expiration_warning_is_configured_fail(self, cmd):
+def mock_password_expiration_warning_is_configured_fail(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if 'PASS_WARN_AGE' in cmd:
+    if '/etc/login.defs' in files:
         stdout = ['PASS_WARN_AGE    0']
-    elif 'shadow' in cmd:
+    elif '/etc/shadow' in files:
         stdout = [
-            'root:0',
-            'vagrant:0',
+            'root:$6$hash:19000:0:99999:0:::',
+            'vagrant:$6$hash:19000:0:99999:0:::',
         ]
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_password_expiration_warning_is_configured_pass)
+@patch.object(CISAudit, "_grepfile", mock_password_expiration_warning_is_configured_pass)
 def test_audit_password_expiration_warning_is_configured_pass():
     state = test.audit_password_expiration_warning_is_configured()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_password_expiration_warning_is_configured_fail)
+@patch.object(CISAudit, "_grepfile", mock_password_expiration_warning_is_configured_fail)
 def test_audit_password_expiration_warning_is_configured_pass_fail():
     state = test.audit_password_expiration_warning_is_configured()
     assert state == 3
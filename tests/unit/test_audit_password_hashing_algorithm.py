@@ -40,19 +40,19 @@ def mock_password_hashing_algorithm_fail(*args):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_password_hashing_algorithm_pass)
+@patch.object(CISAudit, "_grepfile", mock_password_hashing_algorithm_pass)
 def test_audit_password_hashing_algorithm_pass():
     state = test.audit_password_hashing_algorithm()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_password_hashing_algorithm_pass_regression1)
+@patch.object(CISAudit, "_grepfile", mock_password_hashing_algorithm_pass_regression1)
 def test_audit_password_hashing_algorithm_pass_regression1():
     state = test.audit_password_hashing_algorithm()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_password_hashing_algorithm_fail)
+@patch.object(CISAudit, "_grepfile", mock_password_hashing_algorithm_fail)
 def test_audit_password_hashing_algorithm_pass_fail_empty():
     state = test.audit_password_hashing_algorithm()
     assert state == 1
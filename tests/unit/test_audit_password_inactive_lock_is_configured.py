@@ -10,64 +10,85 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_password_inactive_lock_is_configured_pass(self, cmd):
+def mock_password_inactive_lock_is_configured_pass(self, cmd, *args, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if 'INACTIVE' in cmd:
-        stdout = ['INACTIVE=30']
-    elif 'shadow' in cmd:
+    if cmd == ['useradd', '-D']:
         stdout = [
-            'root:30',
-            'vagrant:30',
+            'GROUP=100',
+            'HOME=/home',
+            'INACTIVE=30',
+            'EXPIRE=',
+            'SHELL=/bin/bash',
+        ]
+    elif '/etc/shadow' in args[0]:
+        stdout = [
+            'root:$6$hash:19000:0:99999:7:30::',
+            'vagrant:$6$hash:19000:0:99999:7:30::',
         ]
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_password_inactive_lock_is_configured_fail(self, cmd):
+def mock_password_inactive_lock_is_configured_fail(self, cmd, *args, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if 'INACTIVE' in cmd:
-        stdout = ['INACTIVE=99999']
-    elif 'shadow' in cmd:
+    if cmd == ['useradd', '-D']:
+        stdout = [
+            'GROUP=100',
+            'HOME=/home',
+            'INACTIVE=99999',
+            'EXPIRE=',
+            'SHELL=/bin/bash',
+        ]
+    elif '/etc/shadow' in args[0]:
         stdout = [
-            'root:99999',
-            'vagrant:99999',
+            'root:$6$hash:19000:0:99999:7:99999::',
+            'vagrant:$6$hash:19000:0:99999:7:99999::',
         ]
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_password_inactive_lock_is_configured_fail_disabled(self, cmd):
+def mock_password_inactive_lock_is_configured_fail_disabled(self, cmd, *args, **kwargs):
     returncode = 0
     stderr = ['']
 
-    if 'INACTIVE' in cmd:
-        stdout = ['INACTIVE=-1']
-    elif 'shadow' in cmd:
+    if cmd == ['useradd', '-D']:
+        stdout = [
+            'GROUP=100',
+            'HOME=/home',
+            'INACTIVE=-1',
+            'EXPIRE=',
+            'SHELL=/bin/bash',
+        ]
+    elif '/etc/shadow' in args[0]:
         stdout = [
-            'root:',
-            'vagrant:',
+            'root:$6$hash:19000:0:99999:7:::',
+            'vagrant:$6$hash:19000:0:99999:7:::',
         ]
 
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
 @patch.object(CISAudit, "_shellexec", mock_password_inactive_lock_is_configured_pass)
+@patch.object(CISAudit, "_grepfile", mock_password_inactive_lock_is_configured_pass)
 def test_audit_password_inactive_lock_is_configured_pass():
     state = test.audit_password_inactive_lock_is_configured()
     assert state == 0
 
 
 @patch.object(CISAudit, "_shellexec", mock_password_inactive_lock_is_configured_fail)
+@patch.object(CISAudit, "_grepfile", mock_password_inactive_lock_is_configured_fail)
 def test_audit_password_inactive_lock_is_configured_fail():
     state = test.audit_password_inactive_lock_is_configured()
     assert state == 3
 
 
 @patch.object(CISAudit, "_shellexec", mock_password_inactive_lock_is_configured_fail_disabled)
+@patch.object(CISAudit, "_grepfile", mock_password_inactive_lock_is_configured_fail_disabled)
 def test_audit_password_inactive_lock_is_configured_fail_disabled():
     state = test.audit_password_inactive_lock_is_configured()
     assert state == 3
@@ -1,44 +1,68 @@
 #!/usr/bin/env python3
 
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import stat
 from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
+from pyfakefs import fake_filesystem
 
 from cis_audit import CISAudit
 
-test = CISAudit()
+fs = fake_filesystem.FakeFilesystem()
+
 
+def mock_local_mountpoints(self):
+    return ['/', '/var/log/audit']
 
-def mock_audit_permissions_on_log_files_are_configured_pass(self, cmd):
-    stdout = ['']
-    stderr = ['']
-    returncode = 0
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+def mock_audit_permissions_on_log_files_are_configured_pass(self, paths=None):
+    assert paths == ['/var/log']
 
+    return SimpleNamespace(log_files=[])
 
-def mock_audit_permissions_on_log_files_are_configured_fail(self, cmd):
-    stdout = [
-        '-rw-r--r--. 1 root root 0 Jan 1 0:00 /var/log/pytest',
-        '',
-    ]
-    stderr = ['']
-    returncode = 1
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+def mock_audit_permissions_on_log_files_are_configured_fail(self, paths=None):
+    return SimpleNamespace(log_files=['/var/log/pytest'])
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_permissions_on_log_files_are_configured_pass)
+@patch.object(CISAudit, "_get_local_mountpoints", lambda self: ['/', '/var'])
+@patch.object(CISAudit, "_scan_filesystems", mock_audit_permissions_on_log_files_are_configured_pass)
 def test_audit_permissions_on_log_files_are_configured_pass():
-    state = test.audit_permissions_on_log_files()
+    state = CISAudit().audit_permissions_on_log_files()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_permissions_on_log_files_are_configured_fail)
+@patch.object(CISAudit, "_get_local_mountpoints", mock_local_mountpoints)
+@patch.object(CISAudit, "_scan_filesystems", mock_audit_permissions_on_log_files_are_configured_fail)
 def test_audit_permissions_on_log_files_are_configured_fail():
+    state = CISAudit().audit_permissions_on_log_files()
+    assert state == 1
+
+
+def test_audit_permissions_on_log_files_are_configured_reuses_full_scan():
+    test = CISAudit()
+    test._filesystem_scan = SimpleNamespace(log_files=['/var/log/pytest'])
+
+    state = test.audit_permissions_on_log_files()
+    assert state == 1
+
+
+@patch.object(CISAudit, "_get_local_mountpoints", mock_local_mountpoints)
+def test_audit_permissions_on_log_files_are_configured_submount(fs):
+    ## /var/log/audit is usually a separate filesystem, which a walk of /var/log alone doesn't cross into
+    fs.create_file('/var/log/messages', st_mode=stat.S_IFREG | 0o600)
+    fs.create_dir('/var/log/audit', perm_bits=0o700)
+    fs.add_mount_point('/var/log/audit')
+    fs.create_file('/var/log/audit/audit.log', st_mode=stat.S_IFREG | 0o644)
+
+    test = CISAudit()
     state = test.audit_permissions_on_log_files()
     assert state == 1
+    assert test._filesystem_scan is None
 
 
 if __name__ == '__main__':
@@ -10,12 +10,12 @@ import cis_audit
 test = cis_audit.CISAudit()
 
 
-def mock_audit_file_permissions_pass(*args, **kwargs):
-    return 0
+def mock_check_file_permissions_pass(self, files, **kwargs):
+    return {file: 0 for file in files}
 
 
-def mock_audit_file_permissions_fail(*args, **kwargs):
-    return 1
+def mock_check_file_permissions_fail(self, files, **kwargs):
+    return {file: 1 for file in files}
 
 
 def mock_shellexec(self, cmd):
@@ -30,14 +30,14 @@ def mock_shellexec(self, cmd):
 
 
 @patch.object(cis_audit.CISAudit, "_shellexec", mock_shellexec)
-@patch.object(cis_audit.CISAudit, "audit_file_permissions", mock_audit_file_permissions_pass)
+@patch.object(cis_audit.CISAudit, "_check_file_permissions", mock_check_file_permissions_pass)
 def test_audit_permissions_on_public_host_key_files_pass():
     state = test.audit_permissions_on_public_host_key_files()
     assert state == 0
 
 
 @patch.object(cis_audit.CISAudit, "_shellexec", mock_shellexec)
-@patch.object(cis_audit.CISAudit, "audit_file_permissions", mock_audit_file_permissions_fail)
+@patch.object(cis_audit.CISAudit, "_check_file_permissions", mock_check_file_permissions_fail)
 def test_audit_permissions_on_public_host_key_files_fail():
     state = test.audit_permissions_on_public_host_key_files()
     assert state == 3
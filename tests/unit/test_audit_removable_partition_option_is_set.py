@@ -10,7 +10,11 @@ from cis_audit import CISAudit
 
 def mock_option_set(self, cmd):
     if 'lsblk' in cmd:
-        output = ['/mnt']
+        output = [
+            'RM MOUNTPOINT',
+            ' 0 /boot',
+            ' 1 /mnt',
+        ]
     else:
         output = ['']
 
@@ -22,7 +26,11 @@ def mock_option_set(self, cmd):
 
 def mock_option_not_set(self, cmd):
     if 'lsblk' in cmd:
-        output = ['/mnt']
+        output = [
+            'RM MOUNTPOINT',
+            ' 0 /boot',
+            ' 1 /mnt',
+        ]
     else:
         output = ['/mnt   /dev/sdb1 vfat ro,relatime']
 
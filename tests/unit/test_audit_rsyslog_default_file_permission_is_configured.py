@@ -10,7 +10,7 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_audit_rsyslog_default_file_permission_is_configured_pass(self, cmd):
+def mock_audit_rsyslog_default_file_permission_is_configured_pass(self, pattern, files, **kwargs):
     stdout = [
         '$FileCreateMode 0640',
         '',
@@ -21,7 +21,7 @@ def mock_audit_rsyslog_default_file_permission_is_configured_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_rsyslog_default_file_permission_is_configured_fail(self, cmd):
+def mock_audit_rsyslog_default_file_permission_is_configured_fail(self, pattern, files, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -29,13 +29,13 @@ def mock_audit_rsyslog_default_file_permission_is_configured_fail(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_rsyslog_default_file_permission_is_configured_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_rsyslog_default_file_permission_is_configured_pass)
 def test_audit_rsyslog_default_file_permission_is_configured_pass():
     state = test.audit_rsyslog_default_file_permission_is_configured()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_rsyslog_default_file_permission_is_configured_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_rsyslog_default_file_permission_is_configured_fail)
 def test_audit_rsyslog_default_file_permission_is_configured_fail():
     state = test.audit_rsyslog_default_file_permission_is_configured()
     assert state == 1
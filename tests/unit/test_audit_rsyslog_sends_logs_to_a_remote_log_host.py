@@ -10,12 +10,12 @@ from cis_audit import CISAudit
 test = CISAudit()
 
 
-def mock_audit_rsyslog_sends_logs_to_a_remote_log_host_pass1(self, cmd):
+def mock_audit_rsyslog_sends_logs_to_a_remote_log_host_pass1(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
     stdout = ['']
 
-    if 'action' in cmd:
+    if 'action' in pattern.pattern:
         stdout = [
             '*.* action(type="omfwd" target="192.168.2.100" port="514" protocol="tcp" action.resumeRetryCount="100" queue.type="LinkedList" queue.size="1000")',
             '',
@@ -24,11 +24,11 @@ def mock_audit_rsyslog_sends_logs_to_a_remote_log_host_pass1(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_rsyslog_sends_logs_to_a_remote_log_host_pass2(self, cmd):
+def mock_audit_rsyslog_sends_logs_to_a_remote_log_host_pass2(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
     stdout = ['']
-    if 'action' not in cmd:
+    if 'action' not in pattern.pattern:
         stdout = [
             '*.* @@192.168.2.100',
             '',
@@ -37,7 +37,7 @@ def mock_audit_rsyslog_sends_logs_to_a_remote_log_host_pass2(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_rsyslog_sends_logs_to_a_remote_log_host_fail(self, cmd):
+def mock_audit_rsyslog_sends_logs_to_a_remote_log_host_fail(self, pattern, files, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -45,19 +45,19 @@ def mock_audit_rsyslog_sends_logs_to_a_remote_log_host_fail(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_rsyslog_sends_logs_to_a_remote_log_host_pass1)
+@patch.object(CISAudit, "_grepfile", mock_audit_rsyslog_sends_logs_to_a_remote_log_host_pass1)
 def test_audit_rsyslog_sends_logs_to_a_remote_log_host_pass1():
     state = test.audit_rsyslog_sends_logs_to_a_remote_log_host()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_rsyslog_sends_logs_to_a_remote_log_host_pass2)
+@patch.object(CISAudit, "_grepfile", mock_audit_rsyslog_sends_logs_to_a_remote_log_host_pass2)
 def test_audit_rsyslog_sends_logs_to_a_remote_log_host_pass2():
     state = test.audit_rsyslog_sends_logs_to_a_remote_log_host()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_rsyslog_sends_logs_to_a_remote_log_host_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_rsyslog_sends_logs_to_a_remote_log_host_fail)
 def test_audit_rsyslog_sends_logs_to_a_remote_log_host_fail():
     state = test.audit_rsyslog_sends_logs_to_a_remote_log_host()
     assert state == 1
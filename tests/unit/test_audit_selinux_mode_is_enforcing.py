@@ -8,45 +8,33 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_selinux_mode_is_enforcing_enforcing(self, cmd):
-    stdout = ['enforcing']
-    stderr = ['']
-    returncode = 0
+def mock_selinux_mode_is_enforcing_enforcing(self):
+    return SimpleNamespace(current_mode='enforcing', config_mode='enforcing', config_policy='targeted', loaded_policy='targeted')
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
+def mock_selinux_mode_is_enforcing_permissive(self):
+    return SimpleNamespace(current_mode='permissive', config_mode='permissive', config_policy='targeted', loaded_policy='targeted')
 
-def mock_selinux_mode_is_enforcing_permissive(self, cmd):
-    stdout = ['permissive']
-    stderr = ['']
-    returncode = 0
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
-
-
-def mock_selinux_mode_is_enforcing_disabled(self, cmd):
-    stdout = ['disabled']
-    stderr = ['']
-    returncode = 0
-
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+def mock_selinux_mode_is_enforcing_disabled(self):
+    return SimpleNamespace(current_mode=None, config_mode='disabled', config_policy='targeted', loaded_policy=None)
 
 
 class TestSELinuxIsEnforcing:
     test = CISAudit()
     test_id = '1.1'
 
-    @patch.object(CISAudit, "_shellexec", mock_selinux_mode_is_enforcing_enforcing)
+    @patch.object(CISAudit, "_get_selinux_state", mock_selinux_mode_is_enforcing_enforcing)
     def test_selinux_is_enforcing_enforcing_pass(self):
         state = self.test.audit_selinux_mode_is_enforcing()
         assert state == 0
 
-    @patch.object(CISAudit, "_shellexec", mock_selinux_mode_is_enforcing_permissive)
+    @patch.object(CISAudit, "_get_selinux_state", mock_selinux_mode_is_enforcing_permissive)
     def test_selinux_is_enforcing_permissive_pass(self):
         state = self.test.audit_selinux_mode_is_enforcing()
         assert state == 3
 
-    @patch.object(CISAudit, "_shellexec", mock_selinux_mode_is_enforcing_disabled)
+    @patch.object(CISAudit, "_get_selinux_state", mock_selinux_mode_is_enforcing_disabled)
     def test_selinux_is_enforcing_disabled_fail(self):
         state = self.test.audit_selinux_mode_is_enforcing()
         assert state == 3
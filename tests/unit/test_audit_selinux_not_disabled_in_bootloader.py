@@ -11,7 +11,7 @@ import cis_audit
 test = cis_audit.CISAudit()
 
 
-def mock_shellexec_pass(self, cmd):
+def mock_grepfile_pass(self, pattern, files, **kwargs):
     returncode = 1
     stderr = ['']
     stdout = ['']
@@ -19,7 +19,7 @@ def mock_shellexec_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_shellexec_fail(self, cmd):
+def mock_grepfile_fail(self, pattern, files, **kwargs):
     returncode = 0
     stderr = ['']
     stdout = [
@@ -72,21 +72,21 @@ def mock_os_walk_no_match(top, topdown=True, onerror=None, followlinks=False):
 
 
 @patch.object(os, "walk", mock_os_walk)
-@patch.object(cis_audit.CISAudit, "_shellexec", mock_shellexec_pass)
+@patch.object(cis_audit.CISAudit, "_grepfile", mock_grepfile_pass)
 def test_audit_selinux_not_disabled_in_bootloader_pass():
     state = test.audit_selinux_not_disabled_in_bootloader()
     assert state == 0
 
 
 @patch.object(os, "walk", mock_os_walk)
-@patch.object(cis_audit.CISAudit, "_shellexec", mock_shellexec_fail)
+@patch.object(cis_audit.CISAudit, "_grepfile", mock_grepfile_fail)
 def test_audit_selinux_not_disabled_in_bootloader_fail():
     state = test.audit_selinux_not_disabled_in_bootloader()
     assert state == 2
 
 
 @patch.object(os, "walk", mock_os_walk_no_match)
-@patch.object(cis_audit.CISAudit, "_shellexec", mock_shellexec_fail)
+@patch.object(cis_audit.CISAudit, "_grepfile", mock_grepfile_fail)
 def test_audit_selinux_not_disabled_in_bootloader_fail_no_match():
     state = test.audit_selinux_not_disabled_in_bootloader()
     assert state == -1
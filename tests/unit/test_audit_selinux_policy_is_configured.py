@@ -8,36 +8,37 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_selinux_policy_configured_pass(self, cmd):
-    stdout = ['targeted']
-    stderr = ['']
-    returncode = 0
+def mock_selinux_policy_configured_pass(self):
+    return SimpleNamespace(current_mode='enforcing', config_mode='enforcing', config_policy='targeted', loaded_policy='targeted')
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
+def mock_selinux_policy_configured_fail(self):
+    return SimpleNamespace(current_mode=None, config_mode=None, config_policy=None, loaded_policy=None)
 
-def mock_selinux_policy_configured_fail(self, cmd):
-    stdout = ['']
-    stderr = ['']
-    returncode = 0
 
-    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+def mock_selinux_policy_configured_mls(self):
+    return SimpleNamespace(current_mode='enforcing', config_mode='enforcing', config_policy='targeted', loaded_policy='mls')
 
 
 class TestSELinuxPolicyConfigured:
     test = CISAudit()
     test_id = '1.1'
 
-    @patch.object(CISAudit, "_shellexec", mock_selinux_policy_configured_pass)
+    @patch.object(CISAudit, "_get_selinux_state", mock_selinux_policy_configured_pass)
     def test_selinux_policy_configured_pass(self):
         state = self.test.audit_selinux_policy_is_configured()
         assert state == 0
 
-    @patch.object(CISAudit, "_shellexec", mock_selinux_policy_configured_fail)
+    @patch.object(CISAudit, "_get_selinux_state", mock_selinux_policy_configured_fail)
     def test_selinux_policy_configured_fail(self):
         state = self.test.audit_selinux_policy_is_configured()
         assert state == 3
 
+    @patch.object(CISAudit, "_get_selinux_state", mock_selinux_policy_configured_mls)
+    def test_selinux_policy_configured_fail_loaded_policy(self):
+        state = self.test.audit_selinux_policy_is_configured()
+        assert state == 2
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '--no-cov'])
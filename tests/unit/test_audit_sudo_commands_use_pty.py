@@ -32,12 +32,12 @@ class TestSudoCommandUsePty:
     test = CISAudit()
     test_id = '1.1'
 
-    @patch.object(CISAudit, "_shellexec", mock_sudo_use_pty_pass)
+    @patch.object(CISAudit, "_grepfile", mock_sudo_use_pty_pass)
     def test_sudo_use_pty_pass(self):
         state = self.test.audit_sudo_commands_use_pty()
         assert state == 0
 
-    @patch.object(CISAudit, "_shellexec", mock_sudo_use_pty_fail)
+    @patch.object(CISAudit, "_grepfile", mock_sudo_use_pty_fail)
     def test_sudo_use_pty_fail(self):
         state = self.test.audit_sudo_commands_use_pty()
         assert state == 1
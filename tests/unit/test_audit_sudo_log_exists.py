@@ -28,12 +28,12 @@ class TestSudoCommandUsePty:
     test = CISAudit()
     test_id = '1.1'
 
-    @patch.object(CISAudit, "_shellexec", mock_sudo_log_exists_pass)
+    @patch.object(CISAudit, "_grepfile", mock_sudo_log_exists_pass)
     def test_sudo_log_exists_pass(self):
         state = self.test.audit_sudo_log_exists()
         assert state == 0
 
-    @patch.object(CISAudit, "_shellexec", mock_sudo_log_exists_fail)
+    @patch.object(CISAudit, "_grepfile", mock_sudo_log_exists_fail)
     def test_sudo_log_exists_fail(self):
         state = self.test.audit_sudo_log_exists()
         assert state == 1
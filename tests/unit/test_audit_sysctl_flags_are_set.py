@@ -20,7 +20,19 @@ def mock_sysctl_flags_are_set_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_sysctl_flags_are_set_fail(self, cmd):
+def mock_sysctl_conf_pass(self, pattern, files, **kwargs):
+    if 'all' in pattern:
+        stdout = ['net.ipv6.conf.all.disable_ipv6 = 1']
+    elif 'default' in pattern:
+        stdout = ['net.ipv6.conf.default.disable_ipv6 = 1']
+
+    stderr = ['']
+    returncode = 0
+
+    return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
+
+
+def mock_sysctl_flags_are_set_fail(self, cmd, *args, **kwargs):
     if 'grub' in cmd:
         stdout = ['pytest']
     else:
@@ -37,6 +49,7 @@ flags = ["net.ipv6.conf.all.disable_ipv6", "net.ipv6.conf.default.disable_ipv6"]
 
 
 @patch.object(CISAudit, "_shellexec", mock_sysctl_flags_are_set_pass)
+@patch.object(CISAudit, "_grepfile", mock_sysctl_conf_pass)
 def test_audit_sysctl_flags_are_set_pass():
     value = 1
     state = test.audit_sysctl_flags_are_set(flags, value)
@@ -44,6 +57,7 @@ def test_audit_sysctl_flags_are_set_pass():
 
 
 @patch.object(CISAudit, "_shellexec", mock_sysctl_flags_are_set_fail)
+@patch.object(CISAudit, "_grepfile", mock_sysctl_flags_are_set_fail)
 def test_audit_sysctl_flags_are_set_fail():
     value = 0
     state = test.audit_sysctl_flags_are_set(flags, value)
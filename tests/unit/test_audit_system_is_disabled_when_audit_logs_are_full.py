@@ -8,12 +8,12 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_audit_system_is_disabled_when_audit_logs_are_full_pass(self, cmd):
-    if '^space_left_action' in cmd:
+def mock_audit_system_is_disabled_when_audit_logs_are_full_pass(self, pattern, files, **kwargs):
+    if pattern.pattern.startswith('^space_left_action'):
         stdout = ['space_left_action = email']
-    elif '^action_mail_acct' in cmd:
+    elif pattern.pattern.startswith('^action_mail_acct'):
         stdout = ['action_mail_acct = root']
-    elif '^admin_space_left_action' in cmd:
+    elif pattern.pattern.startswith('^admin_space_left_action'):
         stdout = ['admin_space_left_action = halt']
 
     stderr = ['']
@@ -22,7 +22,7 @@ def mock_audit_system_is_disabled_when_audit_logs_are_full_pass(self, cmd):
     return SimpleNamespace(returncode=returncode, stderr=stderr, stdout=stdout)
 
 
-def mock_audit_system_is_disabled_when_audit_logs_are_full_fail(self, cmd):
+def mock_audit_system_is_disabled_when_audit_logs_are_full_fail(self, pattern, files, **kwargs):
     stdout = ['']
     stderr = ['']
     returncode = 1
@@ -33,13 +33,13 @@ def mock_audit_system_is_disabled_when_audit_logs_are_full_fail(self, cmd):
 test = CISAudit()
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_system_is_disabled_when_audit_logs_are_full_pass)
+@patch.object(CISAudit, "_grepfile", mock_audit_system_is_disabled_when_audit_logs_are_full_pass)
 def test_audit_system_is_disabled_when_audit_logs_are_full_pass():
     state = test.audit_system_is_disabled_when_audit_logs_are_full()
     assert state == 0
 
 
-@patch.object(CISAudit, "_shellexec", mock_audit_system_is_disabled_when_audit_logs_are_full_fail)
+@patch.object(CISAudit, "_grepfile", mock_audit_system_is_disabled_when_audit_logs_are_full_fail)
 def test_audit_system_is_disabled_when_audit_logs_are_full_fail():
     state = test.audit_system_is_disabled_when_audit_logs_are_full()
     assert state == 7
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from cis_audit import BenchmarkEntry, CISAudit
+
+
+def mock_function(self):
+    return 0
+
+
+def test_benchmark_entry_from_dict():
+    entry = {'_id': "1.1", 'description': "pytest", 'function': mock_function, 'kwargs': {'foo': 'bar'}, 'levels': {'server': 1, 'workstation': 2}}
+
+    assert BenchmarkEntry.from_dict(entry, 'server') == BenchmarkEntry('1.1', 'pytest', 'test', mock_function, {'foo': 'bar'}, 1)
+    assert BenchmarkEntry.from_dict(entry, 'workstation').level == 2
+
+
+def test_benchmark_entry_from_dict_header():
+    entry = {'_id': "1", 'description': "pytest", 'type': "header"}
+
+    assert BenchmarkEntry.from_dict(entry, 'server') == BenchmarkEntry('1', 'pytest', 'header', None, None, None)
+
+
+def test_benchmark_entry_from_dict_not_implemented():
+    entry = {'_id': "1.1", 'description': "pytest", 'function': None, 'levels': {'server': 1, 'workstation': 1}}
+
+    assert BenchmarkEntry.from_dict(entry, 'server').type == 'notimplemented'
+
+
+def test_benchmark_entry_from_dict_manual():
+    entry = {'_id': "1.1", 'description': "pytest", 'levels': {'server': 1, 'workstation': 1}, 'type': "manual"}
+
+    assert BenchmarkEntry.from_dict(entry, 'server').type == 'manual'
+
+
+def test_benchmark_entry_is_slotted():
+    entry = BenchmarkEntry('1', 'pytest')
+
+    assert not hasattr(entry, '__dict__')
+    assert not hasattr(CISAudit().run_tests([entry])[0], '__dict__')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
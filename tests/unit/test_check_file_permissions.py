@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import stat
+from types import SimpleNamespace
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def test_check_file_permissions(fs):
+    fs.create_file('/etc/ssh/ssh_host_rsa_key', st_mode=stat.S_IFREG | 0o600)
+    fs.create_file('/etc/ssh/ssh_host_ecdsa_key', st_mode=stat.S_IFREG | 0o640)
+    fs.create_file('/etc/ssh/ssh_host_ed25519_key', st_mode=stat.S_IFREG | 0o4777).st_uid = 99999
+
+    files = ['/etc/ssh/ssh_host_rsa_key', '/etc/ssh/ssh_host_ecdsa_key', '/etc/ssh/ssh_host_ed25519_key', '/etc/ssh/pytest']
+    results = CISAudit()._check_file_permissions(files=files, expected_mode='0600', expected_user='root', expected_group='root')
+
+    assert list(results) == files
+    assert results['/etc/ssh/ssh_host_rsa_key'] == 0
+    assert results['/etc/ssh/ssh_host_ecdsa_key'] == 256
+    assert results['/etc/ssh/ssh_host_ed25519_key'] == 1 + 4 + 128 + 256 + 512 + 1024 + 2048 + 4096 + 8192
+    assert results['/etc/ssh/pytest'] == -1
+
+
+def test_check_file_permissions_invalid_mode(fs):
+    with pytest.raises(ValueError) as e:
+        CISAudit()._check_file_permissions(files=['/etc/ssh/pytest'], expected_mode='00600')
+
+    assert str(e.value) == 'The "expected_mode" for /etc/ssh/pytest should be 3 or 4 characters long, not 5'
+
+
+def test_check_file_permissions_first_violation(fs):
+    fs.create_file('/etc/ssh/ssh_host_rsa_key', st_mode=stat.S_IFREG | 0o600)
+    fs.create_file('/etc/ssh/ssh_host_ecdsa_key', st_mode=stat.S_IFREG | 0o640)
+    fs.create_file('/etc/ssh/ssh_host_ed25519_key', st_mode=stat.S_IFREG | 0o640)
+
+    files = ['/etc/ssh/ssh_host_rsa_key', '/etc/ssh/ssh_host_ecdsa_key', '/etc/ssh/ssh_host_ed25519_key']
+    results = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', first_violation=True))._check_file_permissions(files=files, expected_mode='0600')
+
+    assert results == {'/etc/ssh/ssh_host_rsa_key': 0, '/etc/ssh/ssh_host_ecdsa_key': 256}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from cis_audit import CISAudit
+
+
+def test_close_coprocesses():
+    test = CISAudit()
+    shell = test._get_coprocess()
+
+    test._close_coprocesses()
+
+    assert shell.returncode == 0
+    assert test._coprocesses == []
+    assert test._get_coprocess() is not shell
+
+    test._close_coprocesses()
+
+
+def test_close_coprocesses_none():
+    test = CISAudit()
+    test._close_coprocesses()
+
+    assert test._coprocesses == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
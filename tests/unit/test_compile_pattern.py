@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+import re
+
+import pytest
+
+from cis_audit import compile_pattern
+
+
+def test_compile_pattern_plain():
+    assert compile_pattern('^root:').pattern == '^root:'
+
+
+def test_compile_pattern_flags():
+    assert compile_pattern('pytest', re.I).search('PYTEST')
+
+
+def test_compile_pattern_horizontal_whitespace():
+    regex = compile_pattern(R'^\h*Defaults\h+logfile')
+    assert regex.pattern == R'^[ \t]*Defaults[ \t]+logfile'
+    assert regex.search('\tDefaults logfile="/var/log/sudo.log"')
+    assert not regex.search('Defaults\nlogfile')
+
+
+def test_compile_pattern_non_horizontal_whitespace():
+    regex = compile_pattern(R'\H+')
+    assert regex.pattern == R'[^ \t]+'
+
+
+def test_compile_pattern_horizontal_whitespace_in_class():
+    assert compile_pattern(R'[^#\h]').pattern == R'[^# \t]'
+
+
+def test_compile_pattern_non_horizontal_whitespace_in_class():
+    with pytest.raises(ValueError):
+        compile_pattern(R'[\H]')
+
+
+def test_compile_pattern_literal_bracket_in_class():
+    assert compile_pattern(R'[]\h]\h').pattern == R'[] \t][ \t]'
+    assert compile_pattern(R'[^]\h]\h').pattern == R'[^] \t][ \t]'
+
+
+def test_compile_pattern_other_escapes():
+    assert compile_pattern(R'\s\.\b').pattern == R'\s\.\b'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from cis_audit import CISAudit
+
+
+@pytest.fixture
+def test():
+    test = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', persistent_shell=True))
+    yield test
+    test._close_coprocesses()
+
+
+def test_coprocess_exec_stdout_pass(test):
+    result = test._coprocess_exec('echo stdout')
+    assert result.stdout == b'stdout\n'
+    assert result.stderr == b''
+    assert result.returncode == 0
+
+
+def test_coprocess_exec_stderr_pass(test):
+    result = test._coprocess_exec('echo stderr | tee /dev/stderr 1>/dev/null; printf nonewline')
+    assert result.stdout == b'nonewline'
+    assert result.stderr == b'stderr\n'
+    assert result.returncode == 0
+
+
+def test_coprocess_exec_error(test):
+    result = test._coprocess_exec('error pytest')
+    assert result.stdout == b''
+    assert b'error' in result.stderr
+    assert result.returncode == 127
+
+
+def test_coprocess_exec_is_isolated(test):
+    ## Neither a syntax error, nor exiting or changing directory, affects the shell or the next command
+    assert test._coprocess_exec('echo "unbalanced').returncode == 2
+    assert test._coprocess_exec('cd /; exit 3').returncode == 3
+    assert test._coprocess_exec('cat').stdout == b''
+    assert test._coprocess_exec('pwd').stdout == test._shellexec(['pwd']).stdout[0].encode('UTF-8') + b'\n'
+    assert len(test._coprocesses) == 1
+
+
+def test_coprocess_exec_large_output(test):
+    ## Filling the stderr pipe while stdout is still being written to mustn't deadlock
+    result = test._coprocess_exec('seq 1 100000 >&2; seq 1 100000')
+    assert result.stdout.split(b'\n')[-2] == b'100000'
+    assert result.stderr.split(b'\n')[-2] == b'100000'
+
+
+def test_coprocess_exec_shell_exited(test, caplog, tmp_path):
+    ## Killing the shell mid-command returns an error, without running the command a second time
+    file = tmp_path / 'pytest'
+    shell = test._get_coprocess()
+    result = test._coprocess_exec(f'echo start >> {file}; kill -9 $$')
+
+    assert result.returncode == -9
+    assert b'exited' in result.stderr
+    assert file.read_text() == 'start\n'
+    assert f'Shell {shell.pid} exited while running' in caplog.text
+    assert test._coprocess_exec('echo stdout').stdout == b'stdout\n'
+    assert test._get_coprocess() is not shell
+
+
+def test_coprocess_exec_shell_gone(test, caplog):
+    ## A shell which goes before it is given the command means the command is run without it
+    shell = test._get_coprocess()
+    shell.kill()
+    shell.wait()
+
+    with patch.object(CISAudit, "_get_coprocess", return_value=shell):
+        result = test._coprocess_exec('echo stdout')
+
+    assert result.stdout == b'stdout\n'
+    assert result.returncode == 0
+    assert f'Could not run command in shell {shell.pid}' in caplog.text
+    assert test._get_coprocess() is not shell
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+
+import pytest
+
+from cis_audit import CISAudit
+
+test = CISAudit()
+
+
+def test_cut_whitespace():
+    data = SimpleNamespace(stdout=['RM MOUNTPOINT', ' 1 /mnt', ' 1'], stderr=[''], returncode=0)
+    result = test._cut(data, field=2)
+    assert result.stdout == ['MOUNTPOINT', '/mnt', '']
+    assert result.returncode == 0
+
+
+def test_cut_separator():
+    data = SimpleNamespace(stdout=['root:x:0:0:root:/root:/bin/bash'], stderr=[''], returncode=0)
+    result = test._cut(data, field=4, separator=':')
+    assert result.stdout == ['0']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
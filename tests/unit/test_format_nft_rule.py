@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from cis_audit import CISAudit
+
+test = CISAudit()
+
+
+@pytest.mark.parametrize(
+    "expr,expected",
+    [
+        (
+            [{'match': {'op': '==', 'left': {'meta': {'key': 'iif'}}, 'right': 'lo'}}, {'accept': None}],
+            'iif "lo" accept',
+        ),
+        (
+            [{'match': {'op': '==', 'left': {'payload': {'protocol': 'ip', 'field': 'saddr'}}, 'right': {'prefix': {'addr': '127.0.0.0', 'len': 8}}}}, {'counter': {'packets': 0, 'bytes': 0}}, {'drop': None}],
+            'ip saddr 127.0.0.0/8 counter packets 0 bytes 0 drop',
+        ),
+        (
+            [{'match': {'op': '==', 'left': {'payload': {'protocol': 'ip6', 'field': 'saddr'}}, 'right': '::1'}}, {'counter': {'packets': 12, 'bytes': 720}}, {'drop': None}],
+            'ip6 saddr ::1 counter packets 12 bytes 720 drop',
+        ),
+        (
+            [{'match': {'op': '==', 'left': {'payload': {'protocol': 'ip', 'field': 'protocol'}}, 'right': 'tcp'}}, {'match': {'op': 'in', 'left': {'ct': {'key': 'state'}}, 'right': ['established', 'related', 'new']}}, {'accept': None}],
+            'ip protocol tcp ct state established,related,new accept',
+        ),
+        (
+            [{'match': {'op': '!=', 'left': {'payload': {'protocol': 'tcp', 'field': 'dport'}}, 'right': 22}}, {'counter': 'named'}, {'jump': {'target': 'pytest'}}],
+            'tcp dport != 22 counter "named" jump {"target": "pytest"}',
+        ),
+        (
+            [{'match': {'op': '==', 'left': {'fib': {'result': 'type', 'flags': ['daddr']}}, 'right': {'set': ['local']}}}],
+            '{"fib": {"result": "type", "flags": ["daddr"]}} {"set": ["local"]}',
+        ),
+    ],
+)
+def test_format_nft_rule(expr, expected):
+    assert test._format_nft_rule(expr) == expected
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
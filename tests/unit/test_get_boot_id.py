@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def test_get_boot_id(fs):
+    fs.create_file('/proc/sys/kernel/random/boot_id', contents='0b3f9a4e-5c4f-4c8e-9d2a-1f6b7e0c3a21\n')
+
+    assert CISAudit()._get_boot_id() == '0b3f9a4e-5c4f-4c8e-9d2a-1f6b7e0c3a21'
+
+
+@pytest.mark.parametrize("contents", [None, ''])
+def test_get_boot_id_error(fs, caplog, contents):
+    if contents is not None:
+        fs.create_file('/proc/sys/kernel/random/boot_id', contents=contents)
+
+    assert CISAudit()._get_boot_id() is None
+    assert caplog.records[-1].msg.startswith('Could not read boot ID')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
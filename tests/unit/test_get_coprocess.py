@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+import threading
+
+import pytest
+
+from cis_audit import CISAudit
+
+
+def test_get_coprocess():
+    test = CISAudit()
+    test._current_test.id = '1.1'
+
+    shell = test._get_coprocess()
+    assert test._get_coprocess() is shell
+    assert test._process_counts == {}
+
+    ## Each thread has its own shell
+    shells = []
+    thread = threading.Thread(target=lambda: shells.append(test._get_coprocess()))
+    thread.start()
+    thread.join()
+
+    assert shells[0] is not shell
+    assert test._coprocesses == [shell, shells[0]]
+
+    ## An exited shell is replaced
+    shell.kill()
+    shell.wait()
+    assert test._get_coprocess() is not shell
+
+    test._close_coprocesses()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from cis_audit import TestResult, get_exit_code
+
+
+@pytest.mark.parametrize(
+    "outcomes,exit_code",
+    [
+        ([None, 'Pass', 'Manual', 'Skipped', 'Not Implemented'], 0),
+        ([None, 'Pass', 'Error'], 3),
+        ([None, 'Pass', 'Error', 'Fail'], 1),
+        ([], 0),
+    ],
+)
+def test_get_exit_code(outcomes, exit_code):
+    results = [TestResult(f'1.{i}', 'pytest', 1, outcome) for i, outcome in enumerate(outcomes)]
+
+    assert get_exit_code(results) == exit_code
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
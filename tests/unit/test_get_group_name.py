@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import cis_audit
+
+lookups = []
+
+
+def mock_read_file(self, file):
+    assert file == '/etc/group'
+
+    return [
+        'root:x:0:',
+        'pytest:x:1000:',
+    ]
+
+
+def mock_getgrgid(id):
+    lookups.append(id)
+
+    if id == 2000:
+        return SimpleNamespace(gr_name='ldapgroup')
+
+    raise KeyError(f'getgrgid(): gid not found: {id}')
+
+
+@patch.object(cis_audit.CISAudit, "_read_file", mock_read_file)
+@patch.object(cis_audit, "getgrgid", mock_getgrgid)
+def test_get_group_name_local():
+    test = cis_audit.CISAudit()
+    lookups.clear()
+
+    assert test._get_group_name(0) == 'root'
+    assert test._get_group_name(1000) == 'pytest'
+    assert lookups == []
+    assert test._name_cache_stats == {'hits': 2, 'misses': 0}
+
+
+@patch.object(cis_audit.CISAudit, "_read_file", mock_read_file)
+@patch.object(cis_audit, "getgrgid", mock_getgrgid)
+def test_get_group_name_nss():
+    test = cis_audit.CISAudit()
+    lookups.clear()
+
+    assert test._get_group_name(2000) == 'ldapgroup'
+    assert test._get_group_name(2000) == 'ldapgroup'
+    assert lookups == [2000]
+    assert test._name_cache_stats == {'hits': 1, 'misses': 1}
+
+
+@patch.object(cis_audit.CISAudit, "_read_file", mock_read_file)
+@patch.object(cis_audit, "getgrgid", mock_getgrgid)
+def test_get_group_name_not_found():
+    test = cis_audit.CISAudit()
+    lookups.clear()
+
+    assert test._get_group_name(99999) == '99999'
+    assert test._get_group_name(99999) == '99999'
+    assert lookups == [99999]
+    assert test._name_cache_stats == {'hits': 1, 'misses': 1}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
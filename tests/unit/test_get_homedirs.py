@@ -7,7 +7,7 @@
 ##          https://jmcgeheeiv.github.io/pyfakefs/release/modules.html#pyfakefs.fake_filesystem.FakeFilesystem.create_dir
 ##          https://jmcgeheeiv.github.io/pyfakefs/release/modules.html#pyfakefs.fake_filesystem.set_uid
 
-from types import GeneratorType, SimpleNamespace
+from types import GeneratorType
 from unittest.mock import patch
 
 import pytest
@@ -15,28 +15,29 @@ import pytest
 from cis_audit import CISAudit
 
 
-def mock_homedirs_data(self, cmd):
-    stderr = []
-    stdout = [
-        'root 0 /root',
-        'pytest 1000 /home/pytest',
+def mock_homedirs_data(self, file):
+    return [
+        'root:x:0:0:root:/root:/bin/bash',
+        'bin:x:1:1:bin:/bin:/sbin/nologin',
+        'sync:x:5:0:sync:/sbin:/bin/sync',
+        'halt:x:7:0:halt:/sbin:/sbin/halt',
+        'nobody:x:99:99:Nobody:/:/usr/sbin/nologin',
+        'pytest:x:1000:1000::/home/pytest:/bin/bash',
+        'pytest2:x:1001:1001::/home/pytest2:/usr/bin/false',
+        'malformed',
     ]
-    returncode = 0
-
-    return SimpleNamespace(stdout=stdout, stderr=stderr, returncode=returncode)
 
 
 test = CISAudit()
 
 
-@patch.object(CISAudit, "_shellexec", mock_homedirs_data)
+@patch.object(CISAudit, "_read_file", mock_homedirs_data)
 def test_get_homedirs_pass():
     homedirs = test._get_homedirs()
     homedirs_list = list(homedirs)
 
     assert isinstance(homedirs, GeneratorType)
-    assert homedirs_list[0] == ('root', 0, '/root')
-    assert homedirs_list[1] == ('pytest', 1000, '/home/pytest')
+    assert homedirs_list == [('root', 0, '/root'), ('pytest', 1000, '/home/pytest')]
 
 
 if __name__ == '__main__':
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from cis_audit import CISAudit
+
+
+def mock_iptables_save(self, cmd):
+    stdout = [
+        f'# Generated by {cmd[0]} v1.4.21 on Mon Jan  1 00:00:00 2024',
+        '*nat',
+        ':PREROUTING ACCEPT [0:0]',
+        '-A PREROUTING -p tcp --dport 8080 -j REDIRECT --to-ports 80',
+        'COMMIT',
+        '*filter',
+        ':INPUT DROP [0:0]',
+        ':FORWARD DROP [0:0]',
+        ':OUTPUT ACCEPT [12:720]',
+        ':pytest - [0:0]',
+        '-A INPUT -i lo -j ACCEPT',
+        '-A INPUT -s 127.0.0.0/8 -j DROP',
+        '-A OUTPUT -o lo -j ACCEPT',
+        '-A pytest -j RETURN',
+        'COMMIT',
+    ]
+
+    return SimpleNamespace(returncode=0, stderr=[''], stdout=stdout)
+
+
+def mock_iptables_save_missing(self, cmd):
+    return SimpleNamespace(returncode=127, stderr=[f"[Errno 2] No such file or directory: '{cmd[0]}'"], stdout=[''])
+
+
+@patch.object(CISAudit, "_shellexec", mock_iptables_save)
+def test_get_iptables_ruleset():
+    ruleset = CISAudit()._get_iptables_ruleset('ipv4')
+
+    assert ruleset.returncode == 0
+    assert ruleset.lines[0].startswith('# Generated by iptables-save')
+    assert sorted(ruleset.chains) == ['FORWARD', 'INPUT', 'OUTPUT', 'pytest']
+    assert ruleset.chains['INPUT'].policy == 'DROP'
+    assert ruleset.chains['INPUT'].rules == ['-A INPUT -i lo -j ACCEPT', '-A INPUT -s 127.0.0.0/8 -j DROP']
+    assert ruleset.chains['OUTPUT'].policy == 'ACCEPT'
+    assert ruleset.chains['pytest'].policy is None
+    assert ruleset.chains['pytest'].rules == ['-A pytest -j RETURN']
+
+
+@patch.object(CISAudit, "_shellexec", mock_iptables_save)
+def test_get_iptables_ruleset_ipv6():
+    ruleset = CISAudit()._get_iptables_ruleset('ipv6')
+
+    assert ruleset.lines[0].startswith('# Generated by ip6tables-save')
+
+
+@patch.object(CISAudit, "_shellexec", mock_iptables_save_missing)
+def test_get_iptables_ruleset_missing():
+    ruleset = CISAudit()._get_iptables_ruleset('ipv4')
+
+    assert ruleset.returncode == 127
+    assert ruleset.chains == {}
+
+
+def test_get_iptables_ruleset_is_kept_for_the_run():
+    test = CISAudit()
+
+    with patch.object(CISAudit, "_shellexec", side_effect=mock_iptables_save, autospec=True) as mock_shellexec:
+        test._get_iptables_ruleset('ipv4')
+        test._get_iptables_ruleset('ipv4')
+        test._get_iptables_ruleset('ipv6')
+
+    assert mock_shellexec.call_count == 2
+
+    test._reset_run_state()
+    assert test._firewall_rulesets == {}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
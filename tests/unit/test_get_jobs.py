@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import cis_audit
+from cis_audit import CISAudit
+
+
+def get_test(**kwargs):
+    return CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', **kwargs))
+
+
+def test_get_jobs_default():
+    assert CISAudit()._get_jobs() == 1
+
+
+def test_get_jobs_not_nice():
+    with patch.object(cis_audit.os, "getloadavg", lambda: (100.0, 100.0, 100.0)):
+        assert get_test(jobs=4, nice=False)._get_jobs() == 4
+
+
+def test_get_jobs_nice_idle():
+    with patch.object(cis_audit.os, "getloadavg", lambda: (0.5, 0.5, 0.5)):
+        assert get_test(jobs=4, nice=True, max_load=8.0)._get_jobs() == 4
+
+
+def test_get_jobs_nice_busy(caplog):
+    with patch.object(cis_audit.os, "getloadavg", lambda: (6.5, 6.0, 5.0)):
+        assert get_test(jobs=4, nice=True, max_load=8.0)._get_jobs() == 1
+
+    assert caplog.records[-1].msg == 'Host is busy, so only running 1 tests at the same time'
+
+
+def test_get_jobs_nice_overloaded():
+    with patch.object(cis_audit.os, "getloadavg", lambda: (16.0, 16.0, 16.0)):
+        assert get_test(jobs=4, nice=True, max_load=8.0)._get_jobs() == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+release = os.uname().release
+
+
+def create_files(fs):
+    fs.create_file('/proc/modules', contents='usb_storage 73728 0 - Live 0x0000000000000000\nvfat 20480 1 - Live 0x0000000000000000\n')
+    fs.create_file(f'/lib/modules/{release}/modules.dep', contents='kernel/fs/udf/udf.ko.xz: kernel/lib/crc-itu-t.ko.xz\nkernel/drivers/usb/storage/usb-storage.ko.xz:\n')
+    fs.create_file(f'/lib/modules/{release}/modules.builtin', contents='kernel/fs/vfat/vfat.ko\n')
+    fs.create_file('/etc/modprobe.d/CIS.conf', contents='# Disable udf\ninstall udf /bin/true\ninstall usb-storage /bin/true # USB\nblacklist usb-storage\n')
+    fs.create_file('/etc/modprobe.d/zz-pytest.conf', contents='install udf /bin/false\n')
+    fs.create_file('/lib/modprobe.d/CIS.conf', contents='install cramfs /bin/true\n')
+    fs.create_file('/lib/modprobe.d/dist.conf', contents='blacklist dccp\ninstall\n')
+
+
+def test_get_kernel_modules(fs):
+    create_files(fs)
+
+    modules = CISAudit()._get_kernel_modules()
+    assert modules.loaded == {'usb_storage', 'vfat'}
+    assert modules.available == {'udf', 'usb_storage', 'vfat'}
+    assert modules.install == {'udf': '/bin/true', 'usb_storage': '/bin/true'}
+    assert modules.blacklist == {'usb_storage', 'dccp'}
+
+
+def test_get_kernel_modules_is_kept_for_the_run(fs):
+    create_files(fs)
+    test = CISAudit()
+
+    modules = test._get_kernel_modules()
+    os.remove('/proc/modules')
+
+    assert test._get_kernel_modules() is modules
+
+
+def test_get_kernel_modules_unreadable(fs, caplog):
+    fs.create_file(f'/lib/modules/{release}/modules.dep', contents='kernel/fs/udf/udf.ko.xz:\n')
+    fs.create_file('/etc/modprobe.d/CIS.conf', contents='install udf /bin/true\n')
+    fs.create_file('/etc/modprobe.d/unreadable.conf', st_mode=0o100000)
+
+    test = CISAudit()
+    test._file_cache['/etc/modprobe.d/unreadable.conf'] = PermissionError(13, 'Permission denied', '/etc/modprobe.d/unreadable.conf')
+
+    modules = test._get_kernel_modules()
+    assert modules.loaded == frozenset()
+    assert modules.available == {'udf'}
+    assert modules.install == {'udf': '/bin/true'}
+    assert 'Could not read loaded kernel modules' in caplog.text
+    assert 'Could not read available kernel modules' in caplog.text
+    assert 'Could not read /etc/modprobe.d/unreadable.conf' in caplog.text
+
+
+def test_get_kernel_modules_unknown(fs):
+    modules = CISAudit()._get_kernel_modules()
+
+    assert modules.available is None
+    assert modules.install == {}
+
+
+def test_get_kernel_modules_in_parallel(fs):
+    create_files(fs)
+    read_file = CISAudit._read_file
+    reads = []
+
+    def mock_slow_read_file(self, file):
+        if file == '/proc/modules':
+            reads.append(file)
+            time.sleep(0.05)
+
+        return read_file(self, file)
+
+    test = CISAudit()
+
+    with patch.object(CISAudit, "_read_file", mock_slow_read_file):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            snapshots = list(executor.map(lambda _: test._get_kernel_modules(), range(4)))
+
+    assert reads == ['/proc/modules']
+    assert all(modules is snapshots[0] for modules in snapshots)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
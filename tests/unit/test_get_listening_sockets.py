@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from pyfakefs import fake_filesystem
+
+import cis_audit
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+header = '  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode\n'
+header6 = '  sl  local_address                         remote_address                        st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode\n'
+
+
+def create_files(fs):
+    ## Addresses as a little-endian kernel writes them
+    tcp = [
+        '   0: 0100007F:0019 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 18211 1 0000000000000000 100 0 0 10 0',
+        '   1: 00000000:0016 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 18212 1 0000000000000000 100 0 0 10 0',
+        '   2: 0F02000A:0016 0202000A:C350 01 00000000:00000000 02:0004F2C4 00000000     0        0 18213 4 0000000000000000 20 4 31 10 -1',
+    ]
+    tcp6 = [
+        '   0: 00000000000000000000000001000000:0019 00000000000000000000000000000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 18214 1 0000000000000000 100 0 0 10 0',
+    ]
+    udp = [
+        '   0: 00000000:0044 00000000:0000 07 00000000:00000000 00:00000000 00000000     0        0 18215 2 0000000000000000 0',
+        '   1: 0F02000A:A1B2 08080808:0035 01 00000000:00000000 00:00000000 00000000     0        0 18216 2 0000000000000000 0',
+    ]
+
+    fs.create_file('/proc/net/tcp', contents=header + '\n'.join(tcp) + '\n')
+    fs.create_file('/proc/net/tcp6', contents=header6 + '\n'.join(tcp6) + '\n')
+    fs.create_file('/proc/net/udp', contents=header + '\n'.join(udp) + '\n')
+
+
+def test_get_listening_sockets(fs, caplog):
+    create_files(fs)
+
+    sockets = CISAudit()._get_listening_sockets()
+    assert sorted(sockets.by_port) == [22, 25, 68]
+    assert [(socket.protocol, socket.address) for socket in sockets.by_port[25]] == [('tcp', '127.0.0.1'), ('tcp6', '::1')]
+    assert [(socket.protocol, socket.port) for socket in sockets.by_address['0.0.0.0']] == [('tcp', 22), ('udp', 68)]
+    assert '10.0.2.15' not in sockets.by_address
+    assert 'Could not read udp6 sockets' in caplog.text
+
+
+def test_get_listening_sockets_big_endian(fs):
+    fs.create_file('/proc/net/tcp', contents=header + '   0: 7F000001:0019 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 18211 1 0000000000000000 100 0 0 10 0\n')
+
+    with patch.object(cis_audit.sys, "byteorder", 'big'):
+        sockets = CISAudit()._get_listening_sockets()
+
+    assert sockets.by_port[25][0].address == '127.0.0.1'
+
+
+def test_get_listening_sockets_is_kept_for_the_run(fs):
+    create_files(fs)
+    test = CISAudit()
+
+    sockets = test._get_listening_sockets()
+    os.remove('/proc/net/tcp')
+
+    assert test._get_listening_sockets() is sockets
+
+
+def test_get_listening_sockets_in_parallel(fs):
+    create_files(fs)
+    read_file = CISAudit._read_file
+    reads = []
+
+    def mock_slow_read_file(self, file):
+        if file == '/proc/net/tcp':
+            reads.append(file)
+            time.sleep(0.05)
+
+        return read_file(self, file)
+
+    test = CISAudit()
+
+    with patch.object(CISAudit, "_read_file", mock_slow_read_file):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            snapshots = list(executor.map(lambda _: test._get_listening_sockets(), range(4)))
+
+    assert reads == ['/proc/net/tcp']
+    assert all(sockets is snapshots[0] for sockets in snapshots)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from cis_audit import CISAudit
+
+test = CISAudit()
+
+
+def mock_mounts(self, file):
+    return [
+        'sysfs /sys sysfs rw,seclabel,nosuid,nodev,noexec,relatime 0 0',
+        'proc /proc proc rw,nosuid,nodev,noexec,relatime 0 0',
+        '/dev/mapper/centos-root / xfs rw,seclabel,relatime,attr2,inode64,noquota 0 0',
+        'tmpfs /dev/shm tmpfs rw,seclabel,nosuid,nodev 0 0',
+        '/dev/sda1 /boot xfs rw,seclabel,relatime,attr2,inode64,noquota 0 0',
+        '/dev/sdb1 /srv/my\\040data ext4 rw,relatime 0 0',
+        '/dev/sdc1 /mnt/missing ext4 rw,relatime 0 0',
+        'nfs.example.com:/export /mnt/nfs nfs4 rw,relatime,vers=4.1 0 0',
+        '//fileserver/share /mnt/cifs cifs rw,relatime 0 0',
+        '/dev/mapper/centos-root / xfs rw,seclabel,relatime,attr2,inode64,noquota 0 0',
+    ]
+
+
+def mock_statvfs(path):
+    if path == '/mnt/missing':
+        raise FileNotFoundError(2, 'No such file or directory', path)
+    elif path in ['/sys', '/proc']:
+        return SimpleNamespace(f_blocks=0)
+    else:
+        return SimpleNamespace(f_blocks=1024)
+
+
+@patch.object(CISAudit, "_read_file", mock_mounts)
+@patch.object(os, "statvfs", mock_statvfs)
+def test_get_local_mountpoints():
+    assert test._get_local_mountpoints() == ['/', '/dev/shm', '/boot', '/srv/my data']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
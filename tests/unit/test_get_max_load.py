@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import cis_audit
+from cis_audit import CISAudit
+
+
+def test_get_max_load_configured():
+    test = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', max_load=2.5))
+    assert test._get_max_load() == 2.5
+
+
+def test_get_max_load_default():
+    with patch.object(cis_audit.os, "cpu_count", lambda: 8):
+        assert CISAudit()._get_max_load() == 8.0
+
+
+def test_get_max_load_unknown_cpu_count():
+    with patch.object(cis_audit.os, "cpu_count", lambda: None):
+        assert CISAudit()._get_max_load() == 1.0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from cis_audit import CISAudit
+
+ruleset_json = {
+    'nftables': [
+        {'metainfo': {'version': '1.0.4', 'release_name': 'Lester Gooch #3', 'json_schema_version': 1}},
+        {'table': {'family': 'inet', 'name': 'filter', 'handle': 1}},
+        {'chain': {'family': 'inet', 'table': 'filter', 'name': 'input', 'handle': 1, 'type': 'filter', 'hook': 'input', 'prio': 0, 'policy': 'drop'}},
+        {'chain': {'family': 'inet', 'table': 'filter', 'name': 'pytest', 'handle': 2}},
+        {'rule': {'family': 'inet', 'table': 'filter', 'chain': 'input', 'handle': 3, 'expr': [{'match': {'op': '==', 'left': {'meta': {'key': 'iif'}}, 'right': 'lo'}}, {'accept': None}]}},
+        {'rule': {'family': 'inet', 'table': 'filter', 'chain': 'missing', 'handle': 4, 'expr': [{'drop': None}]}},
+    ]
+}
+
+ruleset_text = [
+    'table inet filter {',
+    '\tset blocked {',
+    '\t\ttype ipv4_addr',
+    '\t}',
+    '',
+    '\tchain input {',
+    '\t\ttype filter hook input priority 0; policy drop;',
+    '\t\tiif "lo" accept',
+    '',
+    '\t}',
+    '',
+    '\tchain output {',
+    '\t\ttype filter hook output priority filter; policy accept;',
+    '\t}',
+    '',
+    '\tchain pytest {',
+    '\t\ttcp dport { 22, 80 } accept',
+    '\t}',
+    '}',
+]
+
+
+def mock_nft_json(self, cmd):
+    return SimpleNamespace(returncode=0, stderr=[''], stdout=json.dumps(ruleset_json).split('\n'))
+
+
+def mock_nft_text(self, cmd):
+    if '-j' in cmd:
+        return SimpleNamespace(returncode=1, stderr=['Error: syntax error, unexpected -j'], stdout=[''])
+
+    return SimpleNamespace(returncode=0, stderr=[''], stdout=ruleset_text)
+
+
+def mock_nft_invalid_json(self, cmd):
+    if '-j' in cmd:
+        return SimpleNamespace(returncode=0, stderr=[''], stdout=['pytest'])
+
+    return SimpleNamespace(returncode=0, stderr=[''], stdout=[''])
+
+
+def mock_nft_missing(self, cmd):
+    return SimpleNamespace(returncode=127, stderr=["[Errno 2] No such file or directory: 'nft'"], stdout=[''])
+
+
+@patch.object(CISAudit, "_shellexec", mock_nft_json)
+def test_get_nftables_ruleset_json():
+    ruleset = CISAudit()._get_nftables_ruleset()
+
+    assert ruleset.tables == [('inet', 'filter')]
+    assert [chain.name for chain in ruleset.chains] == ['input', 'pytest']
+    assert ruleset.chains[0].hook == 'input'
+    assert ruleset.chains[0].type == 'filter'
+    assert ruleset.chains[0].priority == 0
+    assert ruleset.chains[0].policy == 'drop'
+    assert ruleset.chains[0].rules == ['iif "lo" accept']
+    assert ruleset.chains[1].hook is None
+    assert ruleset.chains[1].rules == []
+
+
+@patch.object(CISAudit, "_shellexec", mock_nft_text)
+def test_get_nftables_ruleset_text():
+    ruleset = CISAudit()._get_nftables_ruleset()
+
+    assert ruleset.tables == [('inet', 'filter')]
+    assert [chain.name for chain in ruleset.chains] == ['input', 'output', 'pytest']
+    assert ruleset.chains[0].hook == 'input'
+    assert ruleset.chains[0].type == 'filter'
+    assert ruleset.chains[0].priority == 0
+    assert ruleset.chains[0].policy == 'drop'
+    assert ruleset.chains[0].rules == ['iif "lo" accept']
+    assert ruleset.chains[1].priority == 'filter'
+    assert ruleset.chains[1].policy == 'accept'
+    assert ruleset.chains[2].hook is None
+    assert ruleset.chains[2].rules == ['tcp dport { 22, 80 } accept']
+
+
+@patch.object(CISAudit, "_shellexec", mock_nft_invalid_json)
+def test_get_nftables_ruleset_invalid_json(caplog):
+    ruleset = CISAudit()._get_nftables_ruleset()
+
+    assert ruleset.tables == []
+    assert ruleset.chains == []
+    assert 'Could not parse nftables ruleset' in caplog.text
+
+
+def test_get_nftables_ruleset_missing():
+    with patch.object(CISAudit, "_shellexec", side_effect=mock_nft_missing, autospec=True) as mock_shellexec:
+        ruleset = CISAudit()._get_nftables_ruleset()
+
+    assert ruleset.tables == []
+    assert ruleset.chains == []
+    assert mock_shellexec.call_count == 1
+
+
+def test_get_nftables_ruleset_is_kept_for_the_run():
+    test = CISAudit()
+
+    with patch.object(CISAudit, "_shellexec", side_effect=mock_nft_json, autospec=True) as mock_shellexec:
+        ruleset = test._get_nftables_ruleset()
+        assert test._get_nftables_ruleset() is ruleset
+
+    assert mock_shellexec.call_count == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def test_get_pressure(fs):
+    fs.create_file(
+        '/proc/pressure/io',
+        contents='some avg10=12.50 avg60=3.10 avg300=0.80 total=123456\nfull avg10=6.25 avg60=1.00 avg300=0.20 total=65432\n',
+    )
+
+    assert CISAudit()._get_pressure('io') == 12.5
+
+
+def test_get_pressure_unavailable(fs):
+    assert CISAudit()._get_pressure('io') is None
+
+
+def test_get_pressure_malformed(fs):
+    fs.create_file('/proc/pressure/cpu', contents='some avg10\n')
+
+    assert CISAudit()._get_pressure('cpu') is None
+
+
+def test_get_pressure_no_some_line(fs):
+    fs.create_file('/proc/pressure/cpu', contents='full avg10=1.00 avg60=1.00 avg300=1.00 total=1\n')
+
+    assert CISAudit()._get_pressure('cpu') is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from pyfakefs import fake_filesystem
+
+import cis_audit
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def create_process(fs, pid, name, uid, cmdline, context=None):
+    fs.create_file(f'/proc/{pid}/status', contents=f'Name:\t{name}\nUmask:\t0022\nState:\tS (sleeping)\nUid:\t0\t{uid}\t{uid}\t{uid}\n')
+    fs.create_file(f'/proc/{pid}/cmdline', contents=cmdline)
+
+    if context is not None:
+        fs.create_file(f'/proc/{pid}/attr/current', contents=context)
+
+
+def create_processes(fs):
+    fs.create_file('/etc/passwd', contents='root:x:0:0:root:/root:/bin/bash\nchrony:x:995:993::/var/lib/chrony:/sbin/nologin\n')
+    fs.create_file('/proc/self/mounts')
+    create_process(fs, 1, 'systemd', 0, '/usr/lib/systemd/systemd\0--switched-root\0--system\0', 'system_u:system_r:init_t:s0\0')
+    create_process(fs, 2, 'kthreadd', 0, '', 'system_u:system_r:kernel_t:s0\0')
+    create_process(fs, 634, 'chronyd', 995, '/usr/sbin/chronyd\0', 'system_u:system_r:chronyd_t:s0\0')
+    create_process(fs, 720, 'VBoxService', 0, '/usr/sbin/VBoxService\0--pidfile\0/var/run/vboxadd-service.sh', 'system_u:system_r:unconfined_service_t:s0\0')
+    create_process(fs, 1042, 'pytest', 99999, 'pytest\0')
+
+    ## A process which exited while /proc was being scanned
+    fs.create_dir('/proc/1099')
+
+
+def test_get_processes(fs):
+    create_processes(fs)
+
+    processes = CISAudit()._get_processes()
+    assert sorted(processes.by_name) == ['VBoxService', 'chronyd', 'kthreadd', 'pytest', 'systemd']
+    assert [process.pid for process in processes.by_user['root']] == [1, 2, 720]
+    assert [process.name for process in processes.by_user['99999']] == ['pytest']
+    assert [process.name for process in processes.by_selinux_type['unconfined_service_t']] == ['VBoxService']
+    assert 'pytest' not in [process.name for processes in processes.by_selinux_type.values() for process in processes]
+
+    chronyd = processes.by_name['chronyd'][0]
+    assert chronyd.pid == 634
+    assert chronyd.user == 'chrony'
+    assert chronyd.args == ['/usr/sbin/chronyd']
+    assert chronyd.context == 'system_u:system_r:chronyd_t:s0'
+
+    assert processes.by_name['kthreadd'][0].args == []
+    assert processes.by_name['systemd'][0].args == ['/usr/lib/systemd/systemd', '--switched-root', '--system']
+    assert processes.by_name['VBoxService'][0].args == ['/usr/sbin/VBoxService', '--pidfile', '/var/run/vboxadd-service.sh']
+    assert processes.by_name['pytest'][0].context is None
+
+
+def test_get_processes_exited(fs, caplog):
+    create_processes(fs)
+
+    CISAudit()._get_processes()
+    assert 'Could not read process 1099' in caplog.text
+
+
+def test_get_processes_is_kept_for_the_run(fs):
+    create_processes(fs)
+    test = CISAudit()
+
+    processes = test._get_processes()
+    os.remove('/proc/634/status')
+
+    assert test._get_processes() is processes
+    assert 'chronyd' in processes.by_name
+
+
+def test_get_processes_no_proc(fs, caplog):
+    processes = CISAudit()._get_processes()
+
+    assert processes.by_name == {}
+    assert 'Could not list processes' in caplog.text
+
+
+def test_get_processes_in_parallel(fs):
+    create_processes(fs)
+    listdir = cis_audit.os.listdir
+    scans = []
+
+    def mock_slow_listdir(path):
+        if path == '/proc':
+            scans.append(path)
+            time.sleep(0.05)
+
+        return listdir(path)
+
+    test = CISAudit()
+
+    with patch.object(cis_audit.os, "listdir", mock_slow_listdir):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            snapshots = list(executor.map(lambda _: test._get_processes(), range(4)))
+
+    assert scans == ['/proc']
+    assert all(processes is snapshots[0] for processes in snapshots)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
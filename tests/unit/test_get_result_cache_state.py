@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import os
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import BenchmarkEntry, CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def mock_function(self):
+    return 0
+
+
+def test_get_result_cache_state(fs):
+    fs.create_file('/boot/efi/EFI/centos/grub.cfg')
+    os.utime('/boot/efi/EFI/centos/grub.cfg', (1000, 1000))
+    fs.create_file('/proc/sys/kernel/random/boot_id', contents='pytest-boot\n')
+    test = BenchmarkEntry('1.1', 'pytest', function=mock_function, kwargs={'foo': 'bar'}, cache={'boot': True, 'files': ['/boot/grub2/grub.cfg', '/boot/efi/EFI/*/grub.cfg']})
+
+    assert CISAudit()._get_result_cache_state(test) == {
+        'function': 'mock_function',
+        'kwargs': {'foo': 'bar'},
+        'boot_id': 'pytest-boot',
+        'mtimes': {'/boot/grub2/grub.cfg': None, '/boot/efi/EFI/centos/grub.cfg': 1000},
+    }
+
+
+def test_get_result_cache_state_ttl_only(fs):
+    test = BenchmarkEntry('1.1', 'pytest', function=mock_function, cache={'ttl': 60})
+
+    assert CISAudit()._get_result_cache_state(test) == {'function': 'mock_function', 'kwargs': None}
+
+
+def test_get_result_cache_state_no_boot_id(fs):
+    test = BenchmarkEntry('1.1', 'pytest', function=mock_function, cache={'boot': True})
+
+    assert CISAudit()._get_result_cache_state(test) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
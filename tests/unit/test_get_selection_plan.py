@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+
+import pytest
+
+from cis_audit import CISAudit
+
+
+def test_get_selection_plan():
+    config = SimpleNamespace(includes=['1.1', '5.2.10'], excludes=['1.1.2'], level=0, system_type='server', log_level='DEBUG')
+    test = CISAudit(config=config)
+
+    plan = test._get_selection_plan()
+    assert plan.includes == {'1.1', '5.2.10'}
+    assert plan.include_prefixes == {'1', '1.', '1.1', '5', '5.', '5.2', '5.2.', '5.2.1', '5.2.10'}
+    assert plan.excludes == {'1.1.2'}
+    assert test._get_selection_plan() is plan
+
+
+def test_get_selection_plan_empty():
+    plan = CISAudit()._get_selection_plan()
+    assert plan.includes == set()
+    assert plan.include_prefixes == set()
+    assert plan.excludes == set()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
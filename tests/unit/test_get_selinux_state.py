@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def mock_sestatus_enabled(self, cmd):
+    stdout = [
+        'SELinux status:                 enabled',
+        'SELinuxfs mount:                /selinux',
+        'SELinux root directory:         /etc/selinux',
+        'Loaded policy name:             targeted',
+        'Current mode:                   permissive',
+        'Mode from config file:          enforcing',
+    ]
+
+    return SimpleNamespace(returncode=0, stderr=[''], stdout=stdout)
+
+
+def mock_sestatus_disabled(self, cmd):
+    return SimpleNamespace(returncode=0, stderr=[''], stdout=['SELinux status:                 disabled'])
+
+
+def create_config(fs):
+    fs.create_file('/etc/selinux/config', contents='# This file controls the state of SELinux on the system.\nSELINUX=enforcing\nSELINUXTYPE=targeted\n')
+
+
+@pytest.mark.parametrize("enforce,mode", [('1', 'enforcing'), ('0', 'permissive')])
+def test_get_selinux_state(fs, enforce, mode):
+    create_config(fs)
+    fs.create_file('/sys/fs/selinux/enforce', contents=enforce)
+
+    with patch.object(CISAudit, "_shellexec") as mock_shellexec:
+        selinux = CISAudit()._get_selinux_state()
+
+    mock_shellexec.assert_not_called()
+    assert selinux.current_mode == mode
+    assert selinux.config_mode == 'enforcing'
+    assert selinux.config_policy == 'targeted'
+    assert selinux.loaded_policy == 'targeted'
+
+
+@patch.object(CISAudit, "_shellexec", mock_sestatus_enabled)
+def test_get_selinux_state_sestatus(fs, caplog):
+    create_config(fs)
+
+    selinux = CISAudit()._get_selinux_state()
+    assert selinux.current_mode == 'permissive'
+    assert selinux.config_mode == 'enforcing'
+    assert selinux.loaded_policy == 'targeted'
+    assert 'falling back to sestatus' in caplog.text
+
+
+@patch.object(CISAudit, "_shellexec", mock_sestatus_disabled)
+def test_get_selinux_state_disabled(fs, caplog):
+    selinux = CISAudit()._get_selinux_state()
+
+    assert selinux.current_mode is None
+    assert selinux.config_mode is None
+    assert selinux.config_policy is None
+    assert selinux.loaded_policy is None
+    assert 'Could not read SELinux config' in caplog.text
+
+
+def test_get_selinux_state_is_kept_for_the_run(fs):
+    create_config(fs)
+    fs.create_file('/sys/fs/selinux/enforce', contents='1')
+    test = CISAudit()
+
+    selinux = test._get_selinux_state()
+    os.remove('/sys/fs/selinux/enforce')
+
+    assert test._get_selinux_state() is selinux
+
+
+def test_get_selinux_state_in_parallel(fs):
+    create_config(fs)
+    commands = []
+
+    def mock_slow_sestatus(self, cmd):
+        commands.append(cmd)
+        time.sleep(0.05)
+        return mock_sestatus_enabled(self, cmd)
+
+    test = CISAudit()
+
+    with patch.object(CISAudit, "_shellexec", mock_slow_sestatus):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            states = list(executor.map(lambda _: test._get_selinux_state(), range(4)))
+
+    assert commands == [['sestatus']]
+    assert all(selinux is states[0] for selinux in states)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+from types import GeneratorType, SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import cis_audit
+from cis_audit import CISAudit
+
+mock_benchmarks = {
+    'pytest': {
+        '1.0.0': {
+            '1': lambda: [{'_id': "1", 'description': "Section 1", 'type': "header"}, {'_id': "1.1", 'description': "Test 1.1"}],
+            '2': lambda: [{'_id': "2", 'description': "Section 2", 'type': "header"}, {'_id': "2.1", 'description': "Test 2.1"}],
+            '12': lambda: [{'_id': "12", 'description': "Section 12", 'type': "header"}],
+        },
+    },
+}
+
+
+def get_test_ids(includes=None, excludes=None, level=0):
+    config = SimpleNamespace(includes=includes, excludes=excludes, level=level, system_type='server', log_level='DEBUG')
+    test = CISAudit(config=config)
+
+    return [entry.id for entry in test.get_tests_list('pytest', '1.0.0')]
+
+
+@patch.object(cis_audit, "benchmarks", mock_benchmarks)
+def test_get_tests_list_all():
+    assert isinstance(CISAudit().get_tests_list('pytest', '1.0.0'), GeneratorType)
+    assert get_test_ids() == ['1', '1.1', '2', '2.1', '12']
+
+
+@patch.object(cis_audit, "benchmarks", mock_benchmarks)
+def test_get_tests_list_include():
+    assert get_test_ids(includes=['2.1']) == ['2', '2.1']
+
+
+@patch.object(cis_audit, "benchmarks", mock_benchmarks)
+def test_get_tests_list_include_with_level():
+    assert get_test_ids(includes=['2.1'], level=1) == ['1', '1.1', '2', '2.1', '12']
+
+
+@patch.object(cis_audit, "benchmarks", mock_benchmarks)
+def test_get_tests_list_exclude():
+    assert get_test_ids(excludes=['2']) == ['1', '1.1', '12']
+
+
+@patch.object(cis_audit, "benchmarks", mock_benchmarks)
+def test_get_tests_list_exclude_child():
+    assert get_test_ids(excludes=['1.1']) == ['1', '1.1', '2', '2.1', '12']
+
+
+def test_get_tests_list_centos7():
+    assert len(list(CISAudit().get_tests_list('centos7', '3.1.2'))) > 0
+
+    for section_id, section in cis_audit.benchmarks['centos7']['3.1.2'].items():
+        for entry in section():
+            assert entry['_id'].split('.')[0] == section_id
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
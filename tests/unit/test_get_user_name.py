@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import cis_audit
+
+lookups = []
+
+
+def mock_read_file(self, file):
+    assert file == '/etc/passwd'
+
+    return [
+        'root:x:0:0:root:/root:/bin/bash',
+        'pytest:x:1000:1000::/home/pytest:/bin/bash',
+    ]
+
+
+def mock_getpwuid(id):
+    lookups.append(id)
+
+    if id == 2000:
+        return SimpleNamespace(pw_name='ldapuser')
+
+    raise KeyError(f'getpwuid(): uid not found: {id}')
+
+
+@patch.object(cis_audit.CISAudit, "_read_file", mock_read_file)
+@patch.object(cis_audit, "getpwuid", mock_getpwuid)
+def test_get_user_name_local():
+    test = cis_audit.CISAudit()
+    lookups.clear()
+
+    assert test._get_user_name(0) == 'root'
+    assert test._get_user_name(1000) == 'pytest'
+    assert lookups == []
+    assert test._name_cache_stats == {'hits': 2, 'misses': 0}
+
+
+@patch.object(cis_audit.CISAudit, "_read_file", mock_read_file)
+@patch.object(cis_audit, "getpwuid", mock_getpwuid)
+def test_get_user_name_nss():
+    test = cis_audit.CISAudit()
+    lookups.clear()
+
+    assert test._get_user_name(2000) == 'ldapuser'
+    assert test._get_user_name(2000) == 'ldapuser'
+    assert lookups == [2000]
+    assert test._name_cache_stats == {'hits': 1, 'misses': 1}
+
+
+@patch.object(cis_audit.CISAudit, "_read_file", mock_read_file)
+@patch.object(cis_audit, "getpwuid", mock_getpwuid)
+def test_get_user_name_not_found():
+    test = cis_audit.CISAudit()
+    lookups.clear()
+
+    assert test._get_user_name(99999) == '99999'
+    assert test._get_user_name(99999) == '99999'
+    assert lookups == [99999]
+    assert test._name_cache_stats == {'hits': 1, 'misses': 1}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
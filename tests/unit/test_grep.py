@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+
+import pytest
+
+from cis_audit import CISAudit
+
+test = CISAudit()
+
+data = SimpleNamespace(
+    stdout=[
+        'tcp   LISTEN 0      100        127.0.0.1:25        0.0.0.0:*',
+        'tcp   LISTEN 0      128          0.0.0.0:22        0.0.0.0:*',
+    ],
+    stderr=[''],
+    returncode=0,
+)
+
+
+def test_grep_match():
+    result = test._grep(data, R':25\s')
+    assert result.stdout == ['tcp   LISTEN 0      100        127.0.0.1:25        0.0.0.0:*']
+    assert result.returncode == 0
+
+
+def test_grep_invert():
+    result = test._grep(data, R':25\s', invert=True)
+    assert result.stdout == ['tcp   LISTEN 0      128          0.0.0.0:22        0.0.0.0:*']
+    assert result.returncode == 0
+
+
+def test_grep_no_match():
+    result = test._grep(data, 'pytest')
+    assert result.stdout == ['']
+    assert result.stderr == ['']
+    assert result.returncode == 1
+
+
+def test_grep_empty_input_invert():
+    result = test._grep(SimpleNamespace(stdout=[''], stderr=[''], returncode=0), 'pytest', invert=True)
+    assert result.stdout == ['']
+    assert result.returncode == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
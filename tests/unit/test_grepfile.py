@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import re
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def create_files(fs):
+    fs.create_file('/etc/sysctl.conf', contents='# sysctl settings\nnet.ipv4.ip_forward = 0\n')
+    fs.create_file('/etc/sysctl.d/10-pytest.conf', contents='net.ipv4.ip_forward = 1\nkernel.randomize_va_space = 2\n')
+    fs.create_file('/etc/cron.d/aide', contents='0 5 * * * root /usr/sbin/aide --check\n')
+    fs.create_file('/etc/cron.d/sub/pytest', contents='0 6 * * * root /usr/bin/true\n')
+
+
+def test_grepfile_single_file(fs):
+    create_files(fs)
+
+    result = CISAudit()._grepfile('ip_forward', ['/etc/sysctl.conf'])
+    assert result.stdout == ['net.ipv4.ip_forward = 0']
+    assert result.stderr == ['']
+    assert result.returncode == 0
+
+
+def test_grepfile_glob_prefixes_filename(fs):
+    create_files(fs)
+
+    result = CISAudit()._grepfile('ip_forward', ['/etc/sysctl.conf', '/etc/sysctl.d/*.conf'])
+    assert result.stdout == [
+        '/etc/sysctl.conf:net.ipv4.ip_forward = 0',
+        '/etc/sysctl.d/10-pytest.conf:net.ipv4.ip_forward = 1',
+    ]
+    assert result.returncode == 0
+
+
+def test_grepfile_no_filename(fs):
+    create_files(fs)
+
+    result = CISAudit()._grepfile(re.compile('ip_forward'), ['/etc/sysctl.conf', '/etc/sysctl.d/*.conf'], filename=False)
+    assert result.stdout == ['net.ipv4.ip_forward = 0', 'net.ipv4.ip_forward = 1']
+
+
+def test_grepfile_invert(fs):
+    create_files(fs)
+
+    result = CISAudit()._grepfile('^#', ['/etc/sysctl.conf'], invert=True)
+    assert result.stdout == ['net.ipv4.ip_forward = 0']
+    assert result.returncode == 0
+
+
+def test_grepfile_recursive(fs):
+    create_files(fs)
+
+    result = CISAudit()._grepfile('root', ['/etc/cron.*', '/etc/crontab'], recursive=True)
+    assert result.stdout == [
+        '/etc/cron.d/aide:0 5 * * * root /usr/sbin/aide --check',
+        '/etc/cron.d/sub/pytest:0 6 * * * root /usr/bin/true',
+    ]
+    assert result.stderr[0].startswith('grep: /etc/crontab: No such file or directory')
+    assert result.returncode == 2
+
+
+def test_grepfile_no_match(fs):
+    create_files(fs)
+
+    result = CISAudit()._grepfile('pytest', ['/etc/sysctl.conf'])
+    assert result.stdout == ['']
+    assert result.stderr == ['']
+    assert result.returncode == 1
+
+
+def test_grepfile_missing_file(fs):
+    result = CISAudit()._grepfile('pytest', ['/etc/pytest.conf'])
+    assert result.stdout == ['']
+    assert result.stderr[0].startswith('grep: /etc/pytest.conf: No such file or directory')
+    assert result.returncode == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
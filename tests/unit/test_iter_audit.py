@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+import logging
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from cis_audit import BenchmarkEntry, CISAudit, TestResult
+
+
+def mock_pass(self):
+    return 0
+
+
+def mock_read_file(self):
+    return len(self._read_file('/etc/pytest'))
+
+
+def get_config(**kwargs):
+    return SimpleNamespace(includes=None, excludes=['1.3'], level=0, system_type='server', log_level='DEBUG', **kwargs)
+
+
+tests = [
+    BenchmarkEntry('1', 'pytest', 'header'),
+    BenchmarkEntry('1.1', 'pytest', function=mock_pass, level=1),
+    BenchmarkEntry('1.2', 'pytest', 'manual', level=1),
+    BenchmarkEntry('1.3', 'pytest', function=mock_pass, level=1),
+    BenchmarkEntry('1.4', 'pytest', function=mock_pass, level=1),
+]
+
+
+def test_iter_audit():
+    results = CISAudit(config=get_config()).iter_audit(tests)
+
+    assert next(results) == TestResult('1', 'pytest')
+    assert next(results).id == '1.1'
+    assert [result.id for result in results] == ['1.2', '1.4']
+
+
+def test_iter_audit_jobs():
+    results = list(CISAudit(config=get_config(jobs=2)).iter_audit(tests))
+
+    assert [result.id for result in results[:2]] == ['1', '1.2']
+    assert sorted(result.id for result in results[2:]) == ['1.1', '1.4']
+
+
+def test_iter_audit_stopped_early():
+    ## Tests which haven't started when the caller stops iterating are not run
+    started = []
+    release = threading.Event()
+
+    def mock_wait(self):
+        started.append(self._current_test.id)
+
+        if self._current_test.id != '2.1':
+            release.wait(5)
+
+        return 0
+
+    slow_tests = [BenchmarkEntry(f'2.{i}', 'pytest', function=mock_wait, level=1) for i in range(1, 6)]
+    results = CISAudit(config=get_config(jobs=2)).iter_audit(slow_tests)
+
+    assert next(results).id == '2.1'
+
+    ## The running tests are released once the rest have been cancelled
+    threading.Timer(0.5, release.set).start()
+    results.close()
+
+    assert '2.4' not in started
+    assert '2.5' not in started
+
+
+def test_iter_audit_reused(fs):
+    ## A reused instance doesn't return results based on files read by an earlier run
+    fs.create_file('/etc/pytest', contents='one\n')
+    audit = CISAudit(config=get_config())
+    entry = [BenchmarkEntry('1.1', 'pytest', function=mock_read_file, level=1)]
+
+    assert [result.result for result in audit.iter_audit(entry)] == ['Fail']
+
+    with open('/etc/pytest', 'w') as f:
+        f.write('')
+
+    assert [result.result for result in audit.iter_audit(entry)] == ['Pass']
+
+
+def test_iter_audit_reused_with_new_selection():
+    ## Changes to the config between runs are used by the next run
+    config = get_config(jobs=1)
+    audit = CISAudit(config=config)
+    entries = [BenchmarkEntry(test_id, 'pytest', function=mock_pass, level=1) for test_id in ['1.1.1.1', '5.2.1']]
+
+    config.includes = ['1.1.1.1']
+    assert [result.id for result in audit.iter_audit(entries)] == ['1.1.1.1']
+
+    config.includes = ['5.2.1']
+    config.jobs = 2
+    assert [result.id for result in audit.iter_audit(entries)] == ['5.2.1']
+
+
+def test_iter_audit_reused_with_new_tests_list():
+    config = get_config()
+    audit = CISAudit(config=config)
+
+    config.includes = ['1.1.1.1']
+    assert [result.id for result in audit.iter_audit(audit.get_tests_list('centos7', '3.1.2')) if result.result is not None] == ['1.1.1.1']
+
+    ## Only whole sections are skipped by get_tests_list(), the rest is left to _is_test_included()
+    config.includes = ['5.2.1']
+    assert {test.id.split('.')[0] for test in audit.get_tests_list('centos7', '3.1.2')} == {'5'}
+
+
+def test_iter_audit_does_not_configure_logging():
+    handlers = list(logging.getLogger().handlers)
+
+    list(CISAudit().iter_audit(tests))
+
+    assert logging.getLogger().handlers == handlers
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
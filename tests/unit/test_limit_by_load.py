@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import cis_audit
+from cis_audit import CISAudit
+
+
+def get_test(**kwargs):
+    return CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', **kwargs))
+
+
+@pytest.mark.parametrize(
+    "nice,load,expected",
+    [
+        (False, 100.0, 4),
+        (True, 0.5, 4),
+        (True, 5.5, 2),
+        (True, 16.0, 1),
+    ],
+)
+def test_limit_by_load(nice, load, expected):
+    with patch.object(cis_audit.os, "getloadavg", lambda: (load, load, load)):
+        assert get_test(nice=nice, max_load=8.0)._limit_by_load(4) == expected
+
+
+def test_limit_by_load_single_worker():
+    with patch.object(cis_audit.os, "getloadavg") as mock_getloadavg:
+        assert get_test(nice=True, max_load=8.0)._limit_by_load(1) == 1
+
+    mock_getloadavg.assert_not_called()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
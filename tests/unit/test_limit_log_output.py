@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+
+import pytest
+
+from cis_audit import CISAudit
+
+
+def get_test(log_output_limit):
+    return CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', log_output_limit=log_output_limit))
+
+
+def test_limit_log_output():
+    assert get_test(10)._limit_log_output(['/pytest/file1', '/pytest/file2']) == "['/pytest/... (24 more characters)"
+
+
+def test_limit_log_output_short():
+    assert get_test(20)._limit_log_output(['/pytest']) == "['/pytest']"
+
+
+def test_limit_log_output_no_limit():
+    assert get_test(0)._limit_log_output('x' * 10000) == 'x' * 10000
+
+
+def test_limit_log_output_default():
+    assert len(CISAudit()._limit_log_output('x' * 10000)) == 2048 + len('... (7952 more characters)')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
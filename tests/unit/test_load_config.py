@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import json
+from argparse import ArgumentParser
+
+import pytest
+from pyfakefs import fake_filesystem
+
+import cis_audit
+
+fs = fake_filesystem.FakeFilesystem()
+
+ini_config = """
+[settings]
+jobs = 4
+exclude = 1.1 1.3.2
+nice = no
+debug = true
+server = false
+
+[profile db-servers]
+--level = 1
+include = 2.2, 5.2
+system-type = workstation
+"""
+
+json_config = {
+    'settings': {'jobs': 4, 'exclude': ['1.1', '1.3.2'], 'no-nice': True},
+    'profiles': {'db-servers': {'level': 1, 'includes': '2.2 5.2', 'outformat': 'json'}},
+}
+
+
+def get_parser():
+    parser = ArgumentParser()
+    parser.add_argument('--level', action='store', choices=[1, 2], default=0, type=int)
+    parser.add_argument('--include', action='store', nargs='+', dest='includes')
+    parser.add_argument('--exclude', action='store', nargs='+', dest='excludes')
+    parser.add_argument('-l', '--log-level', action='store', choices=['DEBUG', 'INFO'], default='INFO')
+    parser.add_argument('--debug', action='store_const', const='DEBUG', dest='log_level')
+    parser.add_argument('--nice', action='store_true', default=True)
+    parser.add_argument('--no-nice', action='store_false', dest='nice')
+    parser.add_argument('--system-type', action='store', choices=['server', 'workstation'], default='server')
+    parser.add_argument('--server', action='store_const', const='server', dest='system_type')
+    parser.add_argument('--outformat', action='store', default='text')
+    parser.add_argument('-c', '--config', action='store')
+    parser.add_argument('--profile-name', action='store')
+    parser.add_argument('-j', '--jobs', action='store', default=1, type=int)
+
+    return parser
+
+
+def test_load_config_ini(fs):
+    fs.create_file('/etc/cis-audit.ini', contents=ini_config)
+
+    config = cis_audit.load_config('/etc/cis-audit.ini', get_parser())
+    assert config == {'jobs': 4, 'excludes': ['1.1', '1.3.2'], 'nice': False, 'log_level': 'DEBUG'}
+
+
+def test_load_config_ini_profile(fs):
+    fs.create_file('/etc/cis-audit.ini', contents=ini_config)
+
+    config = cis_audit.load_config('/etc/cis-audit.ini', get_parser(), 'db-servers')
+    assert config == {'jobs': 4, 'excludes': ['1.1', '1.3.2'], 'nice': False, 'log_level': 'DEBUG', 'level': 1, 'includes': ['2.2', '5.2'], 'system_type': 'workstation'}
+
+
+def test_load_config_ini_no_settings(fs):
+    fs.create_file('/etc/cis-audit.ini', contents='[profile db-servers]\nlevel = 2\n')
+
+    assert cis_audit.load_config('/etc/cis-audit.ini', get_parser()) == {}
+    assert cis_audit.load_config('/etc/cis-audit.ini', get_parser(), 'db-servers') == {'level': 2}
+
+
+def test_load_config_json_profile(fs):
+    fs.create_file('/etc/cis-audit.json', contents=json.dumps(json_config))
+
+    config = cis_audit.load_config('/etc/cis-audit.json', get_parser(), 'db-servers')
+    assert config == {'jobs': 4, 'excludes': ['1.1', '1.3.2'], 'nice': False, 'level': 1, 'includes': ['2.2', '5.2'], 'outformat': 'json'}
+
+
+@pytest.mark.parametrize(
+    "contents,error",
+    [
+        ('[settings]\npytest = 1\n', 'Unknown option "pytest"'),
+        ('[settings]\nconfig = /etc/other.ini\n', 'Unknown option "config"'),
+        ('[settings]\nlevel = 3\n', 'Invalid value "3" for "level"'),
+        ('[settings]\njobs = many\n', 'Invalid value "many" for "jobs"'),
+        ('[settings]\nnice = maybe\n', 'Invalid value "maybe" for "nice"'),
+        ('[settings]\nlevel\n', 'Could not load config file'),
+    ],
+)
+def test_load_config_error(fs, capsys, contents, error):
+    fs.create_file('/etc/cis-audit.ini', contents=contents)
+
+    with pytest.raises(SystemExit):
+        cis_audit.load_config('/etc/cis-audit.ini', get_parser())
+
+    assert error in capsys.readouterr().err
+
+
+def test_load_config_json_error(fs, capsys):
+    fs.create_file('/etc/cis-audit.json', contents='["pytest"]')
+
+    with pytest.raises(SystemExit):
+        cis_audit.load_config('/etc/cis-audit.json', get_parser())
+
+    assert 'Could not load config file "/etc/cis-audit.json"' in capsys.readouterr().err
+
+
+def test_load_config_missing(fs, capsys):
+    with pytest.raises(SystemExit):
+        cis_audit.load_config('/etc/cis-audit.ini', get_parser())
+
+    assert 'Could not load config file "/etc/cis-audit.ini"' in capsys.readouterr().err
+
+
+def test_load_config_missing_profile(fs, capsys):
+    fs.create_file('/etc/cis-audit.ini', contents=ini_config)
+
+    with pytest.raises(SystemExit):
+        cis_audit.load_config('/etc/cis-audit.ini', get_parser(), 'web-servers')
+
+    assert 'Profile "web-servers" not found' in capsys.readouterr().err
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+from types import SimpleNamespace
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def get_test(result_cache):
+    return CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', result_cache=result_cache))
+
+
+def test_load_result_cache(fs):
+    fs.create_file('/var/cache/pytest.json', contents='{"1.5.2": {"result": 0}}')
+
+    assert get_test('/var/cache/pytest.json')._load_result_cache() == {'1.5.2': {'result': 0}}
+
+
+def test_load_result_cache_missing(fs):
+    assert get_test('/var/cache/pytest.json')._load_result_cache() == {}
+
+
+def test_load_result_cache_invalid(fs):
+    fs.create_file('/var/cache/pytest.json', contents='not json')
+
+    assert get_test('/var/cache/pytest.json')._load_result_cache() == {}
+
+
+def test_load_result_cache_not_configured(fs):
+    assert CISAudit()._load_result_cache() == {}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import cis_audit
+from cis_audit import CISAudit
+
+
+def mock_nice(increment):
+    return 19
+
+
+def mock_ionice_pass(self, cmd):
+    assert cmd[:3] == ['ionice', '-c', '3']
+    return SimpleNamespace(stdout=[''], stderr=[''], returncode=0)
+
+
+def mock_ionice_fail(self, cmd):
+    return SimpleNamespace(stdout=[''], stderr=['ionice: ioprio_set failed: Operation not permitted'], returncode=1)
+
+
+@patch.object(cis_audit.os, "nice", mock_nice)
+@patch.object(CISAudit, "_shellexec", mock_ionice_pass)
+def test_lower_priority_pass(caplog):
+    CISAudit()._lower_priority()
+
+    assert [record.msg for record in caplog.records] == ['Set CPU priority to nice 19', 'Set I/O scheduling class to idle']
+
+
+@patch.object(cis_audit.os, "nice", mock_nice)
+@patch.object(CISAudit, "_shellexec", mock_ionice_fail)
+def test_lower_priority_ionice_fail(caplog):
+    CISAudit()._lower_priority()
+
+    assert caplog.records[-1].msg == 'Could not set I/O scheduling class to idle: "ionice: ioprio_set failed: Operation not permitted"'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
@@ -2,16 +2,16 @@
 
 import pytest
 
-from cis_audit import CISAudit
+from cis_audit import CISAudit, TestResult
 
 results = [
-    ('1', 'section header'),
-    ('1.1', 'subsection header'),
-    ('1.1.1', 'test 1.1.1', 1, 'Pass', '1ms'),
-    ('2', 'section header'),
-    ('2.1', 'test 2.1', 1, 'Fail', '10ms'),
-    ('2.2', 'test 2.2', 2, 'Pass', '100ms'),
-    ('2.3', 'test 2.3', 1, 'Not Implemented'),
+    TestResult('1', 'section header'),
+    TestResult('1.1', 'subsection header'),
+    TestResult('1.1.1', 'test 1.1.1', 1, 'Pass', '1ms'),
+    TestResult('2', 'section header'),
+    TestResult('2.1', 'test 2.1', 1, 'Fail', '10ms'),
+    TestResult('2.2', 'test 2.2', 2, 'Pass', '100ms'),
+    TestResult('2.3', 'test 2.3', 1, 'Not Implemented'),
 ]
 
 
@@ -9,6 +9,29 @@ import cis_audit
 test = cis_audit.CISAudit()
 
 
+def test_parse_arg_config(fs, caplog):
+    """Test that settings from the config file are used, unless they are given on the command line"""
+    fs.create_file('/etc/cis-audit.ini', contents='[settings]\njobs = 4\nlevel = 2\n\n[profile db-servers]\ninclude = 2.2 5.2\n')
+    args = [path.relpath(__file__), '--debug', '--config', '/etc/cis-audit.ini', '--profile-name', 'db-servers', '--level', '1']
+
+    config = cis_audit.parse_arguments(argv=args)
+
+    assert config.jobs == 4
+    assert config.level == 1
+    assert config.includes == ['2.2', '5.2']
+    assert 'Loaded settings from config file "/etc/cis-audit.ini"' in caplog.text
+    assert 'Loaded profile "db-servers" from config file' in caplog.text
+
+
+def test_parse_arg_profile_name_without_config(capsys):
+    args = [path.relpath(__file__), '--profile-name', 'db-servers']
+
+    with pytest.raises(SystemExit):
+        cis_audit.parse_arguments(argv=args)
+
+    assert '--profile-name requires --config' in capsys.readouterr().err
+
+
 def test_parse_arg_debug(caplog):
     """Test that the '--debug' argument turns on debug logging"""
     args = [path.relpath(__file__), '--debug']
@@ -107,6 +130,45 @@ def test_parse_arg_nice(caplog):
     assert status
 
 
+def test_parse_arg_max_load(caplog):
+    args = [path.relpath(__file__), '--debug', '--max-load', '2.5']
+    cis_audit.parse_arguments(argv=args)
+    status = False
+
+    for record in caplog.records:
+        if record.msg == 'Scans and parallel tests will be held back while the load average is over 2.5':
+            status = True
+            break
+
+    assert status
+
+
+def test_parse_arg_max_pressure(caplog):
+    args = [path.relpath(__file__), '--debug', '--max-pressure', '25']
+    cis_audit.parse_arguments(argv=args)
+    status = False
+
+    for record in caplog.records:
+        if record.msg == 'Scans will be held back while CPU or I/O pressure is over 25.0%':
+            status = True
+            break
+
+    assert status
+
+
+def test_parse_arg_max_scan_wait(caplog):
+    args = [path.relpath(__file__), '--debug', '--max-scan-wait', '60']
+    cis_audit.parse_arguments(argv=args)
+    status = False
+
+    for record in caplog.records:
+        if record.msg == 'Filesystem scans will be held back for at most 60.0s in total':
+            status = True
+            break
+
+    assert status
+
+
 def test_parse_arg_no_nice(caplog):
     args = [path.relpath(__file__), '--debug', '--no-nice']
     cis_audit.parse_arguments(argv=args)
@@ -146,6 +208,58 @@ def test_parse_arg_no_colour(caplog):
     assert status
 
 
+def test_parse_arg_scan_cache(caplog):
+    args = [path.relpath(__file__), '--debug', '--scan-cache', '/var/cache/pytest.json']
+    cis_audit.parse_arguments(argv=args)
+    status = False
+
+    for record in caplog.records:
+        if record.msg == 'Filesystem scan will be cached in "/var/cache/pytest.json"':
+            status = True
+            break
+
+    assert status
+
+
+def test_parse_arg_homedir_threads(caplog):
+    args = [path.relpath(__file__), '--debug', '--homedir-threads', '4']
+    cis_audit.parse_arguments(argv=args)
+    status = False
+
+    for record in caplog.records:
+        if record.msg == 'Home directories will be scanned using 4 threads':
+            status = True
+            break
+
+    assert status
+
+
+def test_parse_arg_jobs(caplog):
+    args = [path.relpath(__file__), '--debug', '--jobs', '4']
+    cis_audit.parse_arguments(argv=args)
+    status = False
+
+    for record in caplog.records:
+        if record.msg == 'Tests will be run using 4 jobs':
+            status = True
+            break
+
+    assert status
+
+
+def test_parse_arg_stats_file(caplog):
+    args = [path.relpath(__file__), '--debug', '--stats-file', '/var/cache/pytest.json']
+    cis_audit.parse_arguments(argv=args)
+    status = False
+
+    for record in caplog.records:
+        if record.msg == 'Test durations will be recorded in "/var/cache/pytest.json"':
+            status = True
+            break
+
+    assert status
+
+
 def test_parse_arg_outformat_csv(caplog):
     args = [path.relpath(__file__), '--debug', '--outformat', 'csv']
     cis_audit.parse_arguments(argv=args)
@@ -224,5 +338,39 @@ def test_parse_arg_system_type_workstation(caplog):
     assert status
 
 
+def test_parse_arg_result_cache(caplog):
+    args = [path.relpath(__file__), '--debug', '--result-cache', '/var/cache/results.json']
+    config = cis_audit.parse_arguments(argv=args)
+
+    assert config.result_cache == '/var/cache/results.json'
+    assert 'Results of slow tests will be cached in "/var/cache/results.json"' in caplog.text
+
+
+def test_parse_arg_persistent_shell(caplog):
+    args = [path.relpath(__file__), '--debug', '--persistent-shell']
+    config = cis_audit.parse_arguments(argv=args)
+
+    assert config.persistent_shell
+    assert 'Shell commands will be run through a persistent shell' in caplog.text
+
+
+def test_parse_arg_log_output_limit(caplog):
+    args = [path.relpath(__file__), '--debug', '--log-output-limit', '100']
+    config = cis_audit.parse_arguments(argv=args)
+
+    assert config.log_output_limit == 100
+    assert 'Command output in debug messages will be truncated to 100 characters' in caplog.text
+
+
+def test_parse_arg_fail_fast(caplog):
+    args = [path.relpath(__file__), '--debug', '--fail-fast', '--first-violation']
+    config = cis_audit.parse_arguments(argv=args)
+
+    assert config.fail_fast
+    assert config.first_violation
+    assert 'Tests will stop at the first failure or error' in caplog.text
+    assert 'Checks will stop at the first violation' in caplog.text
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '--no-cov'])
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+from unittest.mock import patch
+
+import pytest
+
+from cis_audit import CISAudit
+
+test = CISAudit()
+
+
+def mock_read_file(self, file):
+    return [
+        'root:x:0:0:root:/root:/bin/bash',
+        'toor:x:0:0:root:/root:/bin/bash',
+        '+@netgroup::::::',
+        'pytest:x:1000:1000::/home/pytest:/bin/bash',
+        '',
+    ]
+
+
+def mock_read_file_error(self, file):
+    raise FileNotFoundError(2, 'No such file or directory', file)
+
+
+@patch.object(CISAudit, "_read_file", mock_read_file)
+def test_parse_id_names():
+    assert test._parse_id_names('/etc/passwd') == {0: 'root', 1000: 'pytest'}
+
+
+@patch.object(CISAudit, "_read_file", mock_read_file_error)
+def test_parse_id_names_error():
+    assert test._parse_id_names('/etc/passwd') == {}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import os
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def test_read_file(fs):
+    fs.create_file('/etc/pytest.conf', contents='first\n\nlast\n')
+
+    assert CISAudit()._read_file('/etc/pytest.conf') == ['first', '', 'last']
+
+
+def test_read_file_no_trailing_newline(fs):
+    fs.create_file('/etc/pytest.conf', contents='first\nlast')
+
+    assert CISAudit()._read_file('/etc/pytest.conf') == ['first', 'last']
+
+
+def test_read_file_is_cached(fs):
+    fs.create_file('/etc/pytest.conf', contents='first\n')
+    test = CISAudit()
+
+    assert test._read_file('/etc/pytest.conf') == ['first']
+
+    os.remove('/etc/pytest.conf')
+    assert test._read_file('/etc/pytest.conf') == ['first']
+
+
+def test_read_file_error_is_cached(fs):
+    test = CISAudit()
+
+    with pytest.raises(FileNotFoundError):
+        test._read_file('/etc/pytest.conf')
+
+    fs.create_file('/etc/pytest.conf', contents='first\n')
+    with pytest.raises(FileNotFoundError):
+        test._read_file('/etc/pytest.conf')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
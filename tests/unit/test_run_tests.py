@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 
+import json
+from concurrent.futures import Future
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -32,10 +35,51 @@ def mock_run_tests_exception(*args, **kwargs):
     raise Exception
 
 
+def mock_run_tests_throttled(self):
+    self._throttled_time[self._current_test.id] = 5
+    return 0
+
+
+def mock_run_tests_shellexec(self):
+    self._shellexec(['true'])
+    self._shellexec('true | true')
+    return 0
+
+
+def mock_run_tests_counted(self):
+    self.counted.append(self._current_test.id)
+    return 1
+
+
+def mock_run_tests_persistent_shell(self):
+    return self._shellexec('echo stdout').returncode
+
+
 def mock_datetime_utcnow(offset=0):
     return datetime(year=1, month=1, day=1)
 
 
+class MockThreadPoolExecutor:
+    """Runs tasks in the calling thread as they are submitted, recording the order they were submitted in"""
+
+    submitted = []
+
+    def __init__(self, max_workers=None):
+        MockThreadPoolExecutor.submitted = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def submit(self, function, item):
+        MockThreadPoolExecutor.submitted.append(item.id)
+        future = Future()
+        future.set_result(function(item))
+        return future
+
+
 @patch.object(cis_audit.CISAudit, '_get_utcnow', mock_datetime_utcnow)
 class TestRunTests:
     test = cis_audit.CISAudit()
@@ -50,36 +94,36 @@ class TestRunTests:
         test_args = self.test_args.copy()
         test_args['function'] = mock_run_tests_pass
 
-        result = self.test.run_tests([test_args])
-        assert result == [(test_args['_id'], test_args['description'], test_args['levels']['server'], 'Pass', '0ms')]
+        result = self.test.run_tests([cis_audit.BenchmarkEntry.from_dict(test_args, 'server')])
+        assert result == [cis_audit.TestResult(test_args['_id'], test_args['description'], test_args['levels']['server'], 'Pass', '0ms')]
 
     def test_run_tests_fail(self):
         test_args = self.test_args.copy()
         test_args['function'] = mock_run_tests_fail
 
-        result = self.test.run_tests([test_args])
-        assert result == [(test_args['_id'], test_args['description'], test_args['levels']['server'], 'Fail', '0ms')]
+        result = self.test.run_tests([cis_audit.BenchmarkEntry.from_dict(test_args, 'server')])
+        assert result == [cis_audit.TestResult(test_args['_id'], test_args['description'], test_args['levels']['server'], 'Fail', '0ms')]
 
     def test_run_tests_error(self):
         test_args = self.test_args.copy()
         test_args['function'] = mock_run_tests_error
 
-        result = self.test.run_tests([test_args])
-        assert result == [(test_args['_id'], test_args['description'], test_args['levels']['server'], 'Error', '0ms')]
+        result = self.test.run_tests([cis_audit.BenchmarkEntry.from_dict(test_args, 'server')])
+        assert result == [cis_audit.TestResult(test_args['_id'], test_args['description'], test_args['levels']['server'], 'Error', '0ms')]
 
     def test_run_tests_exception(self):
         test_args = self.test_args.copy()
         test_args['function'] = mock_run_tests_exception
 
-        result = self.test.run_tests([test_args])
-        assert result == [(test_args['_id'], test_args['description'], test_args['levels']['server'], 'Error', '0ms')]
+        result = self.test.run_tests([cis_audit.BenchmarkEntry.from_dict(test_args, 'server')])
+        assert result == [cis_audit.TestResult(test_args['_id'], test_args['description'], test_args['levels']['server'], 'Error', '0ms')]
 
     def test_run_tests_skipped(self):
         test_args = self.test_args.copy()
         test_args['function'] = mock_run_tests_skipped
 
-        result = self.test.run_tests([test_args])
-        assert result == [(test_args['_id'], test_args['description'], test_args['levels']['server'], 'Skipped', '0ms')]
+        result = self.test.run_tests([cis_audit.BenchmarkEntry.from_dict(test_args, 'server')])
+        assert result == [cis_audit.TestResult(test_args['_id'], test_args['description'], test_args['levels']['server'], 'Skipped', '0ms')]
 
     def test_run_tests_kwargs(self):
         test_args = self.test_args.copy()
@@ -87,46 +131,184 @@ class TestRunTests:
         test_args['kwargs'] = {'foo': 'bar'}
         test_args.pop('levels')
 
-        result = self.test.run_tests([test_args])
-        assert result == [(test_args['_id'], test_args['description'], None, 'Pass', '0ms')]
+        result = self.test.run_tests([cis_audit.BenchmarkEntry.from_dict(test_args, 'server')])
+        assert result == [cis_audit.TestResult(test_args['_id'], test_args['description'], None, 'Pass', '0ms')]
 
     def test_run_tests_type_header(self):
         test_args = self.test_args.copy()
         test_args['type'] = 'header'
 
-        result = self.test.run_tests([test_args])
-        assert result == [(test_args['_id'], test_args["description"])]
+        result = self.test.run_tests([cis_audit.BenchmarkEntry.from_dict(test_args, 'server')])
+        assert result == [cis_audit.TestResult(test_args['_id'], test_args["description"])]
 
     def test_run_tests_type_manual(self):
         test_args = self.test_args.copy()
         test_args['type'] = 'manual'
 
-        result = self.test.run_tests([test_args])
-        assert result == [(test_args['_id'], test_args["description"], test_args['levels']['server'], 'Manual')]
+        result = self.test.run_tests([cis_audit.BenchmarkEntry.from_dict(test_args, 'server')])
+        assert result == [cis_audit.TestResult(test_args['_id'], test_args["description"], test_args['levels']['server'], 'Manual')]
 
     def test_run_tests_type_none(self, caplog):
         test_args = self.test_args.copy()
         test_args.pop('type', None)
 
-        result = self.test.run_tests([test_args])
-        assert result == [('1.1', 'pytest', 1, 'Not Implemented')]
-        assert caplog.records[0].msg == "Test 1.1 does not explicitly define a type, so assuming it is a test"
-        assert caplog.records[1].msg == "Checking whether to run test 1.1"
-        assert caplog.records[2].msg == "Including test 1.1"
+        result = self.test.run_tests([cis_audit.BenchmarkEntry.from_dict(test_args, 'server')])
+        assert result == [cis_audit.TestResult('1.1', 'pytest', 1, 'Not Implemented')]
+        assert caplog.records[0].msg == "Checking whether to run test 1.1"
+        assert caplog.records[1].msg == "Including test 1.1"
 
     def test_run_tests_type_skip(self, caplog):
         test_args = self.test_args.copy()
         test_args['type'] = 'skip'
 
-        result = self.test.run_tests([test_args])
-        assert result == [(test_args['_id'], test_args["description"], test_args['levels']['server'], 'Skipped')]
+        result = self.test.run_tests([cis_audit.BenchmarkEntry.from_dict(test_args, 'server')])
+        assert result == [cis_audit.TestResult(test_args['_id'], test_args["description"], test_args['levels']['server'], 'Skipped')]
 
     def test_run_tests_error_not_implemented(self, caplog):
         test_args = self.test_args.copy()
         test_args.pop('type')
 
-        result = self.test.run_tests([test_args])
-        assert result == [(test_args['_id'], test_args["description"], test_args['levels']['server'], 'Not Implemented')]
+        result = self.test.run_tests([cis_audit.BenchmarkEntry.from_dict(test_args, 'server')])
+        assert result == [cis_audit.TestResult(test_args['_id'], test_args["description"], test_args['levels']['server'], 'Not Implemented')]
+
+
+@patch.object(cis_audit.CISAudit, '_get_utcnow', mock_datetime_utcnow)
+@patch.object(cis_audit, 'ThreadPoolExecutor', MockThreadPoolExecutor)
+def test_run_tests_jobs_longest_first(fs):
+    fs.create_file('/var/cache/pytest.json', contents=json.dumps({'1.1': 0.1, '1.2': 5.0, '1.3': 1.0}))
+    config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', jobs=2, stats_file='/var/cache/pytest.json')
+    test = cis_audit.CISAudit(config=config)
+
+    tests = [{'_id': "1", 'description': "pytest", 'type': "header"}]
+    tests += [{'_id': test_id, 'description': "pytest", 'function': mock_run_tests_pass, 'levels': {'server': 1}} for test_id in ['1.1', '1.2', '1.3', '1.4']]
+
+    result = test.run_tests([cis_audit.BenchmarkEntry.from_dict(entry, 'server') for entry in tests])
+
+    assert MockThreadPoolExecutor.submitted == ['1.4', '1.2', '1.3', '1.1']
+    assert [row.id for row in result] == ['1', '1.1', '1.2', '1.3', '1.4']
+
+    with open('/var/cache/pytest.json') as f:
+        assert json.load(f) == {'1.1': 0.0, '1.2': 0.0, '1.3': 0.0, '1.4': 0.0}
+
+
+@patch.object(cis_audit.CISAudit, '_get_utcnow', mock_datetime_utcnow)
+def test_run_tests_jobs(fs):
+    config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', jobs=2)
+    test = cis_audit.CISAudit(config=config)
+
+    tests = [{'_id': test_id, 'description': "pytest", 'function': mock_run_tests_fail, 'levels': {'server': 1}} for test_id in ['1.1', '1.2', '1.3']]
+
+    result = test.run_tests([cis_audit.BenchmarkEntry.from_dict(entry, 'server') for entry in tests])
+    assert result == [cis_audit.TestResult(test_id, 'pytest', 1, 'Fail', '0ms') for test_id in ['1.1', '1.2', '1.3']]
+
+
+@patch.object(cis_audit.CISAudit, '_get_utcnow', mock_datetime_utcnow)
+def test_run_tests_process_counts(process_budget):
+    test = cis_audit.CISAudit()
+    tests = [{'_id': test_id, 'description': "pytest", 'function': function, 'levels': {'server': 1}} for test_id, function in [('1.1', mock_run_tests_shellexec), ('1.2', mock_run_tests_pass)]]
+
+    test.run_tests([cis_audit.BenchmarkEntry.from_dict(entry, 'server') for entry in tests])
+
+    assert test._process_counts == {'1.1': 2}
+    assert test._current_test.id is None
+    process_budget(test, total=2, per_test=2)
+
+
+@patch.object(cis_audit.CISAudit, '_get_utcnow', mock_datetime_utcnow)
+def test_run_tests_throttled(caplog):
+    test = cis_audit.CISAudit()
+    tests = [{'_id': "1.1", 'description': "pytest", 'function': mock_run_tests_throttled, 'levels': {'server': 1}}]
+
+    result = test.run_tests([cis_audit.BenchmarkEntry.from_dict(entry, 'server') for entry in tests])
+
+    assert result == [cis_audit.TestResult('1.1', 'pytest', 1, 'Pass', '0ms')]
+    assert 'Test 1.1 was throttled for 5s while the host was busy' in [record.msg for record in caplog.records]
+
+
+@patch.object(cis_audit.CISAudit, '_get_utcnow', mock_datetime_utcnow)
+def test_run_tests_result_cache(fs, caplog):
+    fs.create_file('/proc/sys/kernel/random/boot_id', contents='pytest-boot\n')
+    config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', result_cache='/var/cache/results.json')
+    tests = [
+        {'_id': "1.1", 'description': "pytest", 'function': mock_run_tests_counted, 'levels': {'server': 1}, 'cache': {'boot': True}},
+        {'_id': "1.2", 'description': "pytest", 'function': mock_run_tests_counted, 'levels': {'server': 1}, 'cache': {'ttl': 60}},
+        {'_id': "1.3", 'description': "pytest", 'function': mock_run_tests_exception, 'levels': {'server': 1}, 'cache': {'ttl': 60}},
+    ]
+    fs.create_dir('/var/cache')
+
+    test = cis_audit.CISAudit(config=config)
+    test.counted = []
+    with patch.object(cis_audit.time, 'time', return_value=1000):
+        test.run_tests([cis_audit.BenchmarkEntry.from_dict(entry, 'server') for entry in tests])
+
+    with open('/var/cache/results.json') as f:
+        cache = json.load(f)
+
+    assert cache['1.1'] == {'result': 1, 'time': 1000, 'expires': None, 'state_of': {'function': 'mock_run_tests_counted', 'kwargs': None, 'boot_id': 'pytest-boot'}}
+    assert cache['1.2']['expires'] == 1060
+    assert '1.3' not in cache
+
+    ## Both results are reused within the TTL, without running the tests
+    test = cis_audit.CISAudit(config=config)
+    test.counted = []
+    with patch.object(cis_audit.time, 'time', return_value=1030):
+        result = test.run_tests([cis_audit.BenchmarkEntry.from_dict(entry, 'server') for entry in tests[:2]])
+
+    assert [row.result for row in result] == ['Fail', 'Fail']
+    assert test.counted == []
+    assert 'Using the result of test 1.2 from 30s ago' in caplog.text
+
+    ## After the TTL only 1.2 is run again, and after a reboot 1.1 is as well
+    test = cis_audit.CISAudit(config=config)
+    test.counted = []
+    with patch.object(cis_audit.time, 'time', return_value=1090):
+        test.run_tests([cis_audit.BenchmarkEntry.from_dict(entry, 'server') for entry in tests[:2]])
+
+    assert test.counted == ['1.2']
+
+    with open('/proc/sys/kernel/random/boot_id', 'w') as f:
+        f.write('pytest-reboot\n')
+
+    test = cis_audit.CISAudit(config=config)
+    test.counted = []
+    with patch.object(cis_audit.time, 'time', return_value=1100):
+        test.run_tests([cis_audit.BenchmarkEntry.from_dict(entry, 'server') for entry in tests[:2]])
+
+    assert test.counted == ['1.1']
+
+
+@patch.object(cis_audit.CISAudit, '_get_utcnow', mock_datetime_utcnow)
+def test_run_tests_persistent_shell():
+    config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', persistent_shell=True)
+    test = cis_audit.CISAudit(config=config)
+    tests = [{'_id': test_id, 'description': "pytest", 'function': mock_run_tests_persistent_shell, 'levels': {'server': 1}} for test_id in ['1.1', '1.2']]
+
+    result = test.run_tests([cis_audit.BenchmarkEntry.from_dict(entry, 'server') for entry in tests])
+
+    assert [row.result for row in result] == ['Pass', 'Pass']
+    assert test._coprocesses == []
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+@patch.object(cis_audit.CISAudit, '_get_utcnow', mock_datetime_utcnow)
+@patch.object(cis_audit, 'ThreadPoolExecutor', MockThreadPoolExecutor)
+def test_run_tests_fail_fast(caplog, jobs):
+    config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', jobs=jobs, fail_fast=True)
+    test = cis_audit.CISAudit(config=config)
+    tests = [{'_id': "1", 'description': "pytest", 'type': "header"}]
+    tests += [{'_id': test_id, 'description': "pytest", 'function': function, 'levels': {'server': 1}} for test_id, function in [('1.1', mock_run_tests_pass), ('1.2', mock_run_tests_error), ('1.3', mock_run_tests_fail)]]
+
+    result = test.run_tests([cis_audit.BenchmarkEntry.from_dict(entry, 'server') for entry in tests])
+
+    ## With more than one job, the tests finish in any order, but nothing is returned after the first failure or error
+    outcomes = [row.result for row in result]
+    assert outcomes[0] is None
+    assert outcomes[-1] in ['Error', 'Fail']
+    assert outcomes.count('Error') + outcomes.count('Fail') == 1
+    assert f'Stopping after test {result[-1].id} with result {outcomes[-1]}, as fail_fast is set' in caplog.text
+
+    if jobs == 1:
+        assert outcomes == [None, 'Pass', 'Error']
 
 
 if __name__ == '__main__':
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def get_test(result_cache):
+    test = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', result_cache=result_cache))
+    test._result_cache = {'1.5.2': {'result': 0}}
+
+    return test
+
+
+def test_save_result_cache(fs):
+    fs.create_dir('/var/cache')
+
+    get_test('/var/cache/pytest.json')._save_result_cache()
+
+    with open('/var/cache/pytest.json') as f:
+        assert json.load(f) == {'1.5.2': {'result': 0}}
+    assert not os.path.exists('/var/cache/pytest.json.tmp')
+
+
+def test_save_result_cache_error(fs, caplog):
+    get_test('/var/cache/pytest.json')._save_result_cache()
+
+    assert not os.path.exists('/var/cache/pytest.json')
+    assert caplog.records[-1].msg.startswith('Could not save result cache /var/cache/pytest.json')
+
+
+def test_save_result_cache_not_configured(fs):
+    CISAudit()._save_result_cache()
+
+    assert os.listdir('/') == ['tmp']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+from pyfakefs import fake_filesystem
+
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def get_test(stats_file):
+    return CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', stats_file=stats_file))
+
+
+def test_save_test_stats(fs):
+    fs.create_dir('/var/cache')
+
+    get_test('/var/cache/pytest.json')._save_test_stats({'1.1': 0.5})
+
+    with open('/var/cache/pytest.json') as f:
+        assert json.load(f) == {'1.1': 0.5}
+    assert not os.path.exists('/var/cache/pytest.json.tmp')
+
+
+def test_save_test_stats_error(fs, caplog):
+    get_test('/var/cache/pytest.json')._save_test_stats({'1.1': 0.5})
+
+    assert not os.path.exists('/var/cache/pytest.json')
+    assert caplog.records[-1].msg.startswith('Could not save test stats /var/cache/pytest.json')
+
+
+def test_save_test_stats_not_configured(fs):
+    CISAudit()._save_test_stats({'1.1': 0.5})
+
+    assert os.listdir('/') == ['tmp']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import json
+import os
+import stat
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from pyfakefs import fake_filesystem
+
+import cis_audit
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def mock_local_mountpoints(self):
+    return ['/', '/home']
+
+
+def create_files(fs):
+    fs.create_dir('/home')
+    fs.add_mount_point('/home')
+    fs.create_file('/var/log/messages', st_mode=stat.S_IFREG | 0o600)
+    fs.create_file('/var/log/pytest.log', st_mode=stat.S_IFREG | 0o644)
+    fs.create_file('/usr/bin/sudo', st_mode=stat.S_IFREG | 0o4111)
+    fs.create_file('/usr/bin/write', st_mode=stat.S_IFREG | 0o2755)
+    fs.create_file('/home/pytest/world', st_mode=stat.S_IFREG | 0o666)
+    fs.create_dir('/home/pytest/shared')
+    fs.create_file('/home/pytest/orphan', st_mode=stat.S_IFREG | 0o644).st_uid = 99999
+    fs.create_file('/home/pytest/nogroup', st_mode=stat.S_IFREG | 0o644).st_gid = 99999
+    olddir = fs.create_dir('/home/olduser', perm_bits=0o700)
+    olddir.st_uid = 99999
+    olddir.st_gid = 99999
+
+    for path in ['/', '/usr', '/usr/bin', '/var', '/var/log', '/home', '/home/pytest']:
+        os.chmod(path, 0o755)
+
+    os.chmod('/tmp', 0o1777)
+    os.chmod('/home/pytest/shared', 0o777)
+
+
+@patch.object(CISAudit, "_get_local_mountpoints", mock_local_mountpoints)
+def test_scan_filesystems(fs):
+    create_files(fs)
+
+    scan = CISAudit()._scan_filesystems()
+    assert scan.log_files == ['/var/log/pytest.log']
+    assert scan.sgid == ['/usr/bin/write']
+    assert scan.suid == ['/usr/bin/sudo']
+    assert scan.ungrouped == ['/home/olduser', '/home/pytest/nogroup']
+    assert scan.unowned == ['/home/olduser', '/home/pytest/orphan']
+    assert scan.world_writable_dirs_without_sticky_bit == ['/home/pytest/shared']
+    assert scan.world_writable_files == ['/home/pytest/world']
+
+
+@patch.object(CISAudit, "_get_local_mountpoints", mock_local_mountpoints)
+def test_scan_filesystems_is_kept_for_the_run(fs):
+    create_files(fs)
+    test = CISAudit()
+
+    scan = test._scan_filesystems()
+    os.chmod('/home/pytest/shared', 0o1777)
+
+    assert test._scan_filesystems() is scan
+    assert scan.world_writable_dirs_without_sticky_bit == ['/home/pytest/shared']
+
+
+def test_scan_filesystems_paths(fs):
+    create_files(fs)
+    test = CISAudit()
+
+    scan = test._scan_filesystems(['/var/log'])
+    assert scan.log_files == ['/var/log/pytest.log']
+    assert scan.suid == []
+    assert test._filesystem_scan is None
+
+
+@patch.object(CISAudit, "_get_local_mountpoints", mock_local_mountpoints)
+def test_scan_filesystems_cache(fs):
+    create_files(fs)
+    config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', scan_cache='/var/cache/scan.json')
+    fs.create_dir('/var/cache', perm_bits=0o755)
+
+    CISAudit(config=config)._scan_filesystems()
+
+    with open('/var/cache/scan.json') as f:
+        cache = json.load(f)
+
+    assert '/home/pytest' in cache['dirs']
+
+    ## An unchanged directory isn't listed again, so the cached results for it are returned
+    cache['dirs']['/home/pytest'][4] = {'suid': ['/home/pytest/cached']}
+    with open('/var/cache/scan.json', 'w') as f:
+        json.dump(cache, f)
+
+    scan = CISAudit(config=config)._scan_filesystems()
+    assert scan.suid == ['/home/pytest/cached', '/usr/bin/sudo']
+    assert scan.world_writable_dirs_without_sticky_bit == ['/home/pytest/shared']
+
+
+@patch.object(CISAudit, "_get_local_mountpoints", mock_local_mountpoints)
+def test_scan_filesystems_cache_discarded_when_users_change(fs):
+    create_files(fs)
+    config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', scan_cache='/var/cache/scan.json')
+    fs.create_file('/var/cache/scan.json', contents=json.dumps({'uids': [], 'gids': [], 'dirs': {'/home/pytest': [0, 0, 0, [], {'suid': ['/home/pytest/cached']}]}}))
+
+    scan = CISAudit(config=config)._scan_filesystems()
+    assert scan.suid == ['/usr/bin/sudo']
+
+
+@patch.object(CISAudit, "_get_local_mountpoints", mock_local_mountpoints)
+def test_scan_filesystems_cache_unreadable(fs, caplog):
+    create_files(fs)
+    config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', scan_cache='/var/cache/scan.json')
+    fs.create_file('/var/cache/scan.json', contents='pytest')
+
+    scan = CISAudit(config=config)._scan_filesystems()
+    assert scan.suid == ['/usr/bin/sudo']
+    assert 'Could not load filesystem scan cache' in caplog.text
+
+
+@patch.object(CISAudit, "_get_local_mountpoints", mock_local_mountpoints)
+def test_scan_filesystems_cache_unwritable(fs, caplog):
+    create_files(fs)
+    config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', scan_cache='/pytest/scan.json')
+
+    scan = CISAudit(config=config)._scan_filesystems()
+    assert scan.suid == ['/usr/bin/sudo']
+    assert 'Could not save filesystem scan cache' in caplog.text
+
+
+@pytest.mark.parametrize("load,workers", [(0.5, 2), (7.5, 1)])
+@patch.object(CISAudit, "_get_local_mountpoints", mock_local_mountpoints)
+def test_scan_filesystems_nice(fs, caplog, load, workers):
+    ## With the nice option, filesystems are still scanned in parallel while there is spare load
+    create_files(fs)
+    config = SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', nice=True, max_load=8.0)
+
+    with patch.object(cis_audit.os, "getloadavg", lambda: (load, load, load)):
+        with patch.object(cis_audit, "ThreadPoolExecutor", wraps=cis_audit.ThreadPoolExecutor) as mock_executor:
+            with patch.object(CISAudit, "_wait_for_idle"):
+                scan = CISAudit(config=config)._scan_filesystems()
+
+    mock_executor.assert_called_once_with(max_workers=workers)
+    assert scan.suid == ['/usr/bin/sudo']
+    assert ('Host is busy, so only scanning 1 filesystems at the same time' in caplog.text) == (workers == 1)
+
+
+@patch.object(CISAudit, "_get_local_mountpoints", mock_local_mountpoints)
+def test_scan_filesystems_worker_test_id(fs):
+    create_files(fs)
+    test = CISAudit()
+    test._current_test.id = '1.1.22'
+    worker_test_ids = []
+    worker_pacing = []
+
+    def mock_scan_tree(self, top, known_uids, known_gids, cached_dirs, pacing=None):
+        worker_test_ids.append(self._current_test.id)
+        worker_pacing.append(pacing)
+        return {}, {}
+
+    with patch.object(CISAudit, "_scan_tree", mock_scan_tree):
+        test._scan_filesystems()
+
+    assert worker_test_ids == ['1.1.22', '1.1.22']
+
+    ## Both filesystems share the scan's budget for pacing
+    assert worker_pacing[0] is worker_pacing[1]
+    assert worker_pacing[0].remaining == 300
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import stat
+from unittest.mock import patch
+
+import pytest
+from pyfakefs import fake_filesystem
+
+import cis_audit
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+
+
+def mock_scandir_error(path):
+    raise PermissionError(13, 'Permission denied', path)
+
+
+def test_scan_homedir(fs):
+    fs.create_dir('/home/pytest', perm_bits=0o700)
+    fs.create_file('/home/pytest/.bashrc', st_mode=stat.S_IFREG | 0o644)
+    fs.create_file('/home/pytest/notes.txt')
+    fs.create_dir('/home/pytest/.ssh')
+    fs.create_symlink('/home/pytest/.netrc', '/home/pytest/notes.txt')
+
+    home = CISAudit()._scan_homedir('pytest', 1000, '/home/pytest')
+    assert home.user == 'pytest'
+    assert home.uid == 1000
+    assert home.exists
+    assert stat.S_IMODE(home.stat.st_mode) == 0o700
+    assert list(home.dotfiles) == ['.bashrc']
+    assert stat.S_IMODE(home.dotfiles['.bashrc'].st_mode) == 0o644
+
+
+def test_scan_homedir_empty(fs):
+    home = CISAudit()._scan_homedir('pytest', 1000, '')
+    assert not home.exists
+    assert home.stat is None
+    assert home.dotfiles == {}
+
+
+def test_scan_homedir_missing(fs):
+    home = CISAudit()._scan_homedir('pytest', 1000, '/home/pytest')
+    assert not home.exists
+    assert home.stat is None
+
+
+def test_scan_homedir_not_a_directory(fs):
+    fs.create_file('/home/pytest')
+
+    home = CISAudit()._scan_homedir('pytest', 1000, '/home/pytest')
+    assert not home.exists
+    assert home.stat is not None
+    assert home.dotfiles == {}
+
+
+def test_scan_homedir_scandir_error(fs):
+    fs.create_file('/home/pytest/.bashrc')
+
+    with patch.object(cis_audit.os, "scandir", mock_scandir_error):
+        home = CISAudit()._scan_homedir('pytest', 1000, '/home/pytest')
+
+    assert home.exists
+    assert home.dotfiles == {}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from cis_audit import CISAudit
+
+
+def mock_homedirs_data(self):
+    data = [
+        'root 0 /root',
+        'pytest 1000 /home/pytest',
+    ]
+
+    for row in data:
+        user, uid, homedir = row.split(' ')
+
+        yield user, int(uid), homedir
+
+
+def mock_scan_homedir(self, user, uid, homedir):
+    return SimpleNamespace(user=user, uid=uid, homedir=homedir)
+
+
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+@patch.object(CISAudit, "_scan_homedir", mock_scan_homedir)
+def test_scan_homedirs():
+    test = CISAudit()
+
+    homes = test._scan_homedirs()
+    assert [(home.user, home.uid, home.homedir) for home in homes] == [('root', 0, '/root'), ('pytest', 1000, '/home/pytest')]
+    assert test._scan_homedirs() is homes
+
+
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+@patch.object(CISAudit, "_scan_homedir", mock_scan_homedir)
+def test_scan_homedirs_threaded():
+    test = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', homedir_threads=2))
+
+    homes = test._scan_homedirs()
+    assert [(home.user, home.uid, home.homedir) for home in homes] == [('root', 0, '/root'), ('pytest', 1000, '/home/pytest')]
+
+
+@patch.object(CISAudit, "_get_homedirs", mock_homedirs_data)
+@patch.object(CISAudit, "_scan_homedir", mock_scan_homedir)
+def test_scan_homedirs_during_filesystem_scan():
+    ## With the jobs option, the home directory checks shouldn't wait for the filesystem scan to finish
+    test = CISAudit()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with test._scan_lock:
+            homes = executor.submit(test._scan_homedirs).result(timeout=5)
+
+    assert len(homes) == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
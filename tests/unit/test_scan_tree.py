@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+## Tests in this file use pyfakefs to fake elements of the filesystem in order to perform the tests.
+## Refer to https://jmcgeheeiv.github.io/pyfakefs/release/usage.html#patch-using-the-pytest-plugin
+
+import os
+import stat
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from pyfakefs import fake_filesystem
+
+import cis_audit
+from cis_audit import CISAudit
+
+fs = fake_filesystem.FakeFilesystem()
+test = CISAudit()
+
+
+class MockDirEntry:
+    ## Stands in for a file which is removed between being listed and being stat'ed
+    name = 'removed'
+    path = '/srv/data/removed'
+
+    def stat(self, follow_symlinks=True):
+        raise FileNotFoundError(2, 'No such file or directory', self.path)
+
+
+class MockScandir:
+    def __init__(self, entries):
+        self.entries = [MockDirEntry()] + list(entries)
+
+    def __enter__(self):
+        return iter(self.entries)
+
+    def __exit__(self, *args):
+        pass
+
+
+def create_files(fs):
+    fs.create_dir('/srv/data', perm_bits=0o755)
+    fs.create_dir('/srv/mnt', perm_bits=0o777)
+    fs.add_mount_point('/srv/mnt')
+    fs.create_file('/srv/mnt/world', st_mode=stat.S_IFREG | 0o666)
+    fs.create_file('/srv/data/world', st_mode=stat.S_IFREG | 0o666)
+    os.chmod('/srv', 0o755)
+
+
+def test_scan_tree(fs):
+    create_files(fs)
+
+    findings, dirs = test._scan_tree('/srv', {0}, {0}, {})
+    assert findings == {'world_writable_files': ['/srv/data/world']}
+    assert sorted(dirs) == ['/srv', '/srv/data']
+    assert dirs['/srv'][3] == ['data']
+
+
+def test_scan_tree_missing(fs):
+    assert test._scan_tree('/pytest', {0}, {0}, {}) == ({}, {})
+
+
+def test_scan_tree_cached(fs):
+    create_files(fs)
+
+    findings, dirs = test._scan_tree('/srv', {0}, {0}, {})
+
+    ## A cached subdirectory which has since been removed is skipped
+    dirs['/srv'][3].append('removed')
+    dirs['/srv/data'][4] = {'suid': ['/srv/data/cached']}
+
+    findings, dirs = test._scan_tree('/srv', {0}, {0}, dirs)
+    assert findings == {'suid': ['/srv/data/cached']}
+
+
+def test_scan_tree_unreadable(fs, caplog):
+    create_files(fs)
+    scandir = cis_audit.os.scandir
+
+    def mock_scandir(path):
+        if path == '/srv/data':
+            raise PermissionError(13, 'Permission denied', path)
+
+        return scandir(path)
+
+    with patch.object(cis_audit.os, "scandir", mock_scandir):
+        findings, dirs = test._scan_tree('/srv', {0}, {0}, {})
+
+    assert findings == {}
+    assert sorted(dirs) == ['/srv']
+    assert 'Could not scan /srv/data' in caplog.text
+
+
+def test_scan_tree_removed_entry(fs):
+    create_files(fs)
+    scandir = cis_audit.os.scandir
+
+    with patch.object(cis_audit.os, "scandir", lambda path: MockScandir(scandir(path))):
+        findings, dirs = test._scan_tree('/srv', {0}, {0}, {})
+
+    assert findings == {'world_writable_files': ['/srv/data/world']}
+
+
+def test_scan_tree_paced(fs):
+    for i in range(1500):
+        fs.create_dir(f'/srv/dir{i}')
+
+    with patch.object(CISAudit, "_wait_for_idle", return_value=0) as mock_wait_for_idle:
+        CISAudit()._scan_tree('/srv', {0}, {0}, {})
+
+    mock_wait_for_idle.assert_called_once_with(max_wait=1, interval=1)
+
+
+def test_scan_tree_paced_budget(fs, caplog):
+    for i in range(5500):
+        fs.create_dir(f'/srv/dir{i}')
+
+    pacing = SimpleNamespace(remaining=1.5)
+
+    ## The host stays busy, so each pause waits for as long as it is allowed to
+    with patch.object(CISAudit, "_wait_for_idle", side_effect=lambda max_wait, interval: max_wait) as mock_wait_for_idle:
+        CISAudit()._scan_tree('/srv', {0}, {0}, {}, pacing=pacing)
+
+    assert [call.kwargs['max_wait'] for call in mock_wait_for_idle.call_args_list] == [1, 0.5]
+    assert pacing.remaining == 0
+    assert 'the scan has already waited as long as max_scan_wait allows' in caplog.text
+
+
+def mock_getpwuid(uid):
+    if uid == 5000:
+        return SimpleNamespace(pw_name='ldapuser')
+
+    raise KeyError(f'getpwuid(): uid not found: {uid}')
+
+
+def mock_getgrgid(gid):
+    if gid == 5000:
+        return SimpleNamespace(gr_name='ldapgroup')
+
+    raise KeyError(f'getgrgid(): gid not found: {gid}')
+
+
+@patch.object(cis_audit, "getpwuid", mock_getpwuid)
+@patch.object(cis_audit, "getgrgid", mock_getgrgid)
+def test_scan_tree_nss_ids(fs):
+    ## Owners which getpwall() and getgrall() don't list, e.g. sssd users with enumerate = false, are only unowned if they can't be looked up either
+    fs.create_dir('/srv/ldap', perm_bits=0o755)
+    os.chown('/srv/ldap', 5000, 5000)
+    fs.create_file('/srv/ldap/file', st_mode=stat.S_IFREG | 0o644)
+    os.chown('/srv/ldap/file', 5000, 5000)
+    fs.create_file('/srv/ldap/orphan', st_mode=stat.S_IFREG | 0o644)
+    os.chown('/srv/ldap/orphan', 5001, 5001)
+    os.chmod('/srv', 0o755)
+    test = CISAudit()
+
+    findings, dirs = test._scan_tree('/srv', {0}, {0}, {})
+    assert findings == {'unowned': ['/srv/ldap/orphan'], 'ungrouped': ['/srv/ldap/orphan']}
+    assert test._user_names[5000] == 'ldapuser'
+    assert test._group_names[5000] == 'ldapgroup'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 
 from cis_audit import CISAudit
@@ -28,5 +31,70 @@ def test_shellexec_sterr_error():
     assert result.stdout[0] == ''
 
 
+def test_shellexec_argv_stdout_pass():
+    result = test._shellexec(['echo', 'stdout | grep pytest'])
+    assert result.returncode == 0
+    assert result.stdout[0] == 'stdout | grep pytest'
+    assert result.stderr[0] == ''
+
+
+def test_shellexec_argv_error():
+    result = test._shellexec(['error', 'pytest'])
+    assert result.returncode == 127
+    assert result.stderr[0] == "[Errno 2] No such file or directory: 'error'"
+    assert result.stdout[0] == ''
+
+
+def test_shellexec_process_counts(process_budget):
+    test = CISAudit()
+
+    test._shellexec('echo outside a test')
+    test._current_test.id = '1.1'
+    test._shellexec(['echo', 'stdout'])
+    test._shellexec('echo stdout | cat')
+
+    assert test._process_counts == {None: 1, '1.1': 2}
+    process_budget(test, total=3, per_test=2)
+
+    with pytest.raises(AssertionError, match='3 processes were started, the budget is 2'):
+        process_budget(test, total=2)
+
+    with pytest.raises(AssertionError, match="Tests started more than 1 processes: {'1.1': 2}"):
+        process_budget(test, per_test=1)
+
+
+def test_shellexec_persistent_shell():
+    test = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', persistent_shell=True))
+
+    result = test._shellexec('echo stdout; echo stderr >&2; exit 3')
+    assert result.stdout == ['stdout']
+    assert result.stderr == ['stderr']
+    assert result.returncode == 3
+
+    ## Only shell commands go through the persistent shell
+    result = test._shellexec(['error', 'pytest'])
+    assert result.returncode == 127
+    assert result.stderr[0] == "[Errno 2] No such file or directory: 'error'"
+
+    assert len(test._coprocesses) == 1
+    test._close_coprocesses()
+
+
+def test_shellexec_log_output_limit(caplog):
+    test = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', log_output_limit=20))
+
+    test._shellexec('seq 1 1000')
+    assert caplog.records[-1].msg.startswith("'seq 1 1000', namespace(stdout=['1... (")
+
+
+def test_shellexec_not_formatted_without_debug(caplog):
+    test = CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='INFO'))
+
+    with patch.object(CISAudit, "_limit_log_output") as mock_limit_log_output:
+        assert test._shellexec('echo stdout').stdout == ['stdout']
+
+    mock_limit_log_output.assert_not_called()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '--no-cov'])
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import time
+
+import pytest
+
+from cis_audit import CISAudit
+
+test = CISAudit()
+
+
+def test_shellexec_lines():
+    assert list(test._shellexec_lines('echo line1; echo line2 >&2; printf line3')) == ['line1', 'line3']
+
+
+def test_shellexec_lines_argv():
+    assert list(test._shellexec_lines(['echo', 'line1 | grep pytest'])) == ['line1 | grep pytest']
+
+
+def test_shellexec_lines_argv_error(caplog):
+    assert list(CISAudit()._shellexec_lines(['error', 'pytest'])) == []
+    assert "No such file or directory: 'error'" in caplog.records[-1].msg
+
+
+def test_shellexec_lines_stopped_early(caplog):
+    ## Stopping after the first line kills the whole pipeline, rather than waiting for it to finish
+    start = time.monotonic()
+    lines = CISAudit()._shellexec_lines('yes | head -n 1000000; sleep 30')
+
+    assert next(lines) == 'y'
+    lines.close()
+
+    assert time.monotonic() - start < 10
+    assert caplog.records[-1].msg == "'yes | head -n 1000000; sleep 30', stopped after 1 lines"
+
+
+def test_shellexec_lines_process_counts():
+    test = CISAudit()
+    test._current_test.id = '1.1'
+
+    list(test._shellexec_lines('echo stdout | cat'))
+    assert test._process_counts == {'1.1': 1}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])
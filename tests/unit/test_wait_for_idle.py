@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import cis_audit
+from cis_audit import CISAudit
+
+
+def get_test(nice):
+    return CISAudit(config=SimpleNamespace(includes=None, excludes=None, level=0, system_type='server', log_level='DEBUG', nice=nice, max_load=4.0, max_pressure=10.0))
+
+
+class MockValues:
+    ## Value which drops by 2 each time it is read
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, *args):
+        value = self.value
+        self.value -= 2
+
+        return value
+
+
+def mock_pressure_unavailable(self, resource):
+    return None
+
+
+class MockLoadAverage(MockValues):
+    def __call__(self):
+        load = super().__call__()
+
+        return (load, load, load)
+
+
+@patch.object(CISAudit, "_get_pressure", mock_pressure_unavailable)
+def test_wait_for_idle_not_nice():
+    with patch.object(cis_audit.os, "getloadavg", MockLoadAverage(10.0)), patch.object(cis_audit.time, "sleep") as mock_sleep:
+        assert get_test(nice=False)._wait_for_idle() == 0
+
+    mock_sleep.assert_not_called()
+
+
+@patch.object(CISAudit, "_get_pressure", mock_pressure_unavailable)
+def test_wait_for_idle_idle():
+    test = get_test(nice=True)
+
+    with patch.object(cis_audit.os, "getloadavg", MockLoadAverage(1.0)), patch.object(cis_audit.time, "sleep") as mock_sleep:
+        test._wait_for_idle()
+
+    mock_sleep.assert_not_called()
+    assert test._throttled_time == {}
+
+
+@patch.object(CISAudit, "_get_pressure", mock_pressure_unavailable)
+def test_wait_for_idle_busy_load(caplog):
+    test = get_test(nice=True)
+    test._current_test.id = '1.1'
+
+    with patch.object(cis_audit.os, "getloadavg", MockLoadAverage(8.0)), patch.object(cis_audit.time, "sleep") as mock_sleep:
+        assert test._wait_for_idle() == 15
+
+    ## 8.0 -> 6.0 -> 4.0 -> 2.0
+    assert mock_sleep.call_count == 3
+    assert test._throttled_time == {'1.1': 15}
+    assert caplog.records[-1].msg == 'Host is busy (load average 8.0, CPU pressure 0.0%, I/O pressure 0.0%), waiting up to 60s'
+
+
+def test_wait_for_idle_busy_pressure():
+    test = get_test(nice=True)
+
+    with patch.object(cis_audit.os, "getloadavg", lambda: (1.0, 1.0, 1.0)), patch.object(CISAudit, "_get_pressure", MockValues(13.0)), patch.object(cis_audit.time, "sleep") as mock_sleep:
+        test._wait_for_idle(interval=1)
+
+    ## CPU 13.0, I/O 11.0 -> CPU 9.0, I/O 7.0
+    assert mock_sleep.call_count == 1
+    assert test._throttled_time == {None: 1}
+
+
+@patch.object(CISAudit, "_get_pressure", mock_pressure_unavailable)
+def test_wait_for_idle_max_wait():
+    test = get_test(nice=True)
+
+    with patch.object(cis_audit.os, "getloadavg", MockLoadAverage(100.0)), patch.object(cis_audit.time, "sleep") as mock_sleep:
+        test._wait_for_idle(max_wait=10, interval=5)
+        test._wait_for_idle(max_wait=10, interval=5)
+
+    assert mock_sleep.call_count == 4
+    assert test._throttled_time == {None: 20}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '--no-cov'])